@@ -0,0 +1,42 @@
+"""
+2계층 캐시 (프로세스 내 LRU → Redis).
+서비스는 CacheNamespace를 모듈 수준에서 정의해 두고 get/set/incr/invalidate만 호출한다.
+키 형식, Redis 오류 처리, TTL, 적중률 지표, 프로세스 간 로컬 계층 무효화(pub/sub)는 이 패키지가 담당한다.
+"""
+from app.core.cache.invalidation import INVALIDATION_CHANNEL, InvalidationBus, invalidation_bus
+from app.core.cache.lru import LocalLRU
+from app.core.cache.namespace import CacheNamespace, cache_stats, get_namespace
+from app.core.cache.serializers import (
+    DATETIME,
+    INT,
+    JSON,
+    STR,
+    DateTimeSerializer,
+    IntSerializer,
+    JsonSerializer,
+    Serializer,
+    StrSerializer,
+    UTC_DATETIME,
+    UtcDateTimeSerializer,
+)
+
+__all__ = [
+    "CacheNamespace",
+    "DATETIME",
+    "DateTimeSerializer",
+    "INT",
+    "INVALIDATION_CHANNEL",
+    "IntSerializer",
+    "InvalidationBus",
+    "JSON",
+    "JsonSerializer",
+    "LocalLRU",
+    "STR",
+    "Serializer",
+    "StrSerializer",
+    "UTC_DATETIME",
+    "UtcDateTimeSerializer",
+    "cache_stats",
+    "get_namespace",
+    "invalidation_bus",
+]
@@ -0,0 +1,131 @@
+"""
+프로세스 간 캐시 무효화 버스 (Redis pub/sub).
+한 프로세스가 키를 쓰거나 지우면 cache:invalidate 채널로 알리고,
+다른 프로세스의 구독 스레드가 해당 네임스페이스 핸들러를 호출해 로컬 계층에서 키를 제거한다.
+
+- 자신이 보낸 메시지는 무시한다 (발행 전에 로컬에서 이미 반영).
+- 구독이 끊겼다가 다시 연결되면 그 사이 놓친 메시지가 있을 수 있으므로 모든 로컬 계층을 비운다.
+- Redis를 쓸 수 없으면 발행은 생략되고, 로컬 계층은 각 네임스페이스의 로컬 TTL 안에서만 어긋난다.
+"""
+import json
+import logging
+import os
+import socket
+import threading
+import uuid
+from typing import Callable, Optional
+
+from app.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "cache:invalidate"
+RECONNECT_MAX_SECONDS = 30.0
+
+# keys가 None이면 네임스페이스 전체 무효화
+InvalidationHandler = Callable[[Optional[list[str]]], None]
+
+
+class InvalidationBus:
+    def __init__(self, channel: str = INVALIDATION_CHANNEL) -> None:
+        self.channel = channel
+        self.instance_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._handlers: dict[str, list[InvalidationHandler]] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.received = 0
+
+    def register(self, namespace: str, handler: InvalidationHandler) -> None:
+        self._handlers.setdefault(namespace, []).append(handler)
+
+    def publish(self, namespace: str, keys: Optional[list[str]] = None) -> None:
+        """다른 프로세스에 무효화를 알린다. 실패해도 예외를 올리지 않는다."""
+        client = get_redis()
+        if client is None:
+            return
+        try:
+            client.publish(self.channel, self._encode(namespace, keys))
+        except Exception:
+            logger.warning("캐시 무효화 발행 실패 ns=%s", namespace, exc_info=True)
+
+    async def publish_async(self, client, namespace: str, keys: Optional[list[str]] = None) -> None:
+        try:
+            await client.publish(self.channel, self._encode(namespace, keys))
+        except Exception:
+            logger.warning("캐시 무효화 발행 실패 ns=%s", namespace, exc_info=True)
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="cache-invalidation", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=3)
+            self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _encode(self, namespace: str, keys: Optional[list[str]]) -> str:
+        return json.dumps({"origin": self.instance_id, "ns": namespace, "keys": keys})
+
+    def _run(self) -> None:
+        backoff = 1.0
+        while not self._stop.is_set():
+            client = get_redis()
+            if client is None:
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, RECONNECT_MAX_SECONDS)
+                continue
+            pubsub = None
+            try:
+                pubsub = client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.channel)
+                backoff = 1.0
+                self._dispatch_all(None)
+                logger.info("캐시 무효화 구독 시작 (channel=%s)", self.channel)
+                while not self._stop.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message is not None:
+                        self._handle(message.get("data"))
+            except Exception:
+                logger.warning("캐시 무효화 구독 끊김 — %.0f초 후 재연결", backoff, exc_info=True)
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, RECONNECT_MAX_SECONDS)
+            finally:
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+
+    def _handle(self, data) -> None:
+        try:
+            payload = json.loads(data)
+        except (TypeError, ValueError):
+            return
+        if payload.get("origin") == self.instance_id:
+            return
+        self.received += 1
+        for handler in self._handlers.get(payload.get("ns"), []):
+            self._call(handler, payload.get("keys"))
+
+    def _dispatch_all(self, keys: Optional[list[str]]) -> None:
+        for handlers in self._handlers.values():
+            for handler in handlers:
+                self._call(handler, keys)
+
+    @staticmethod
+    def _call(handler: InvalidationHandler, keys: Optional[list[str]]) -> None:
+        try:
+            handler(keys)
+        except Exception:
+            logger.exception("캐시 무효화 핸들러 실패")
+
+
+invalidation_bus = InvalidationBus()
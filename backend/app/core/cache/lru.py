@@ -0,0 +1,51 @@
+"""
+프로세스 내 LRU+TTL 캐시 (2계층 캐시의 로컬 계층).
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Generic, Iterable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class LocalLRU(Generic[T]):
+    """최대 max_size 항목을 유지하는 스레드 세이프 LRU. 항목마다 만료 시각을 가진다."""
+
+    def __init__(self, max_size: int) -> None:
+        self._max_size = max(1, max_size)
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, T]] = OrderedDict()
+
+    def get(self, key: str) -> Optional[T]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: T, ttl_seconds: float) -> None:
+        if ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, keys: Iterable[str]) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,479 @@
+"""
+2계층 캐시 네임스페이스 (프로세스 내 LRU → Redis).
+네임스페이스마다 키 템플릿, 직렬화기, Redis TTL, 로컬 TTL·크기를 정하고,
+조회·저장·증감·무효화와 Redis 오류 처리, 적중률 지표, 프로세스 간 무효화 발행을 한곳에서 처리한다.
+
+TTL은 정의 시 기본값을 주고 환경 변수로 네임스페이스별 재정의할 수 있다.
+    CACHE_<NAME>_TTL_SECONDS          Redis TTL (0 이하: 만료 없음)
+    CACHE_<NAME>_LOCAL_TTL_SECONDS    로컬 계층 TTL (0: 로컬 계층 사용 안 함)
+    CACHE_<NAME>_LOCAL_MAX_SIZE       로컬 계층 최대 항목 수
+"""
+import logging
+import os
+import threading
+from typing import Any, Callable, Generic, Iterator, Mapping, Optional, TypeVar
+
+from app.core.cache.invalidation import invalidation_bus
+from app.core.cache.lru import LocalLRU
+from app.core.cache.serializers import Serializer
+from app.core.redis import get_async_redis, get_redis
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# MGET 1회당 최대 키 수
+MGET_CHUNK_SIZE = 1000
+DEFAULT_LOCAL_MAX_SIZE = 10_000
+
+# 네임스페이스 기본 TTL을 사용한다는 표시 (None은 '만료 없음')
+_DEFAULT = object()
+
+# 키가 있을 때만 증감 (없는 키를 0에서 시작하면 누적값이 틀어진다)
+_INCR_IF_EXISTS_SCRIPT = """
+if redis.call('exists', KEYS[1]) == 1 then
+    return redis.call('incrby', KEYS[1], ARGV[1])
+end
+return nil
+"""
+# 현재 값이 기대값과 같을 때만 교체 (그 사이 반영된 쓰기를 덮어쓰지 않는다)
+_COMPARE_AND_SET_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    redis.call('set', KEYS[1], ARGV[2], 'KEEPTTL')
+    return 1
+end
+return 0
+"""
+
+# 현재 값보다 클 때만 교체 (문자열 비교). 동시에 쓰는 요청이 더 최근 값을 과거로 되돌리지 않는다.
+_SET_IF_GREATER_SCRIPT = """
+local current = redis.call('get', KEYS[1])
+if current and current >= ARGV[1] then
+    return 0
+end
+if ARGV[2] == '' then
+    redis.call('set', KEYS[1], ARGV[1])
+else
+    redis.call('set', KEYS[1], ARGV[1], 'EX', ARGV[2])
+end
+return 1
+"""
+
+_registry: dict[str, "CacheNamespace"] = {}
+
+
+def _env_number(name: str, option: str, default: float) -> float:
+    raw = os.getenv(f"CACHE_{name.upper()}_{option}")
+    return float(raw) if raw not in (None, "") else default
+
+
+class _Metrics:
+    FIELDS = ("local_hits", "remote_hits", "misses", "writes", "invalidations", "remote_invalidations", "errors")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counts = dict.fromkeys(self.FIELDS, 0)
+
+    def add(self, field: str, n: int = 1) -> None:
+        if n:
+            with self._lock:
+                self._counts[field] += n
+
+    def snapshot(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._counts)
+
+
+def _chunks(items: list, size: int = MGET_CHUNK_SIZE) -> list[list]:
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+class CacheNamespace(Generic[T]):
+    """
+    key_template은 식별자 자리에 {id}를 둔다 (예: "user:{id}:miss_count").
+    ttl_seconds=None 이면 Redis 키가 만료되지 않는다 (증분 카운터 등).
+    remote_enabled가 False를 반환하면 Redis 계층 없이 로컬 계층만 사용한다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        key_template: str,
+        serializer: Serializer[T],
+        ttl_seconds: Optional[int],
+        local_ttl_seconds: float = 0,
+        local_max_size: int = DEFAULT_LOCAL_MAX_SIZE,
+        remote_enabled: Optional[Callable[[], bool]] = None,
+    ) -> None:
+        if key_template.count("{id}") != 1:
+            raise ValueError(f"key_template에는 {{id}}가 정확히 1개 있어야 합니다: {key_template}")
+        ttl = _env_number(name, "TTL_SECONDS", ttl_seconds if ttl_seconds is not None else 0)
+        self.name = name
+        self.serializer = serializer
+        self.ttl_seconds: Optional[int] = int(ttl) if ttl > 0 else None
+        self.local_ttl_seconds = _env_number(name, "LOCAL_TTL_SECONDS", local_ttl_seconds)
+        self._prefix, self._suffix = key_template.split("{id}")
+        self._remote_enabled = remote_enabled or (lambda: True)
+        max_size = int(_env_number(name, "LOCAL_MAX_SIZE", local_max_size))
+        self._local: Optional[LocalLRU[T]] = LocalLRU(max_size) if self.local_ttl_seconds > 0 else None
+        self._metrics = _Metrics()
+        _registry[name] = self
+        invalidation_bus.register(name, self._on_remote_invalidate)
+
+    # ── 키 ────────────────────────────────────────────────
+
+    def key(self, ident: Any) -> str:
+        return f"{self._prefix}{ident}{self._suffix}"
+
+    def ident(self, key: str) -> Optional[str]:
+        if key.startswith(self._prefix) and key.endswith(self._suffix):
+            return key[len(self._prefix):len(key) - len(self._suffix)]
+        return None
+
+    @property
+    def pattern(self) -> str:
+        return f"{self._prefix}*{self._suffix}"
+
+    # ── 조회 ──────────────────────────────────────────────
+
+    def get(self, ident: Any, use_local: bool = True) -> Optional[T]:
+        return self.get_many([ident], use_local=use_local)[0]
+
+    def get_many(self, idents: list, use_local: bool = True) -> list[Optional[T]]:
+        """로컬 계층에서 찾지 못한 키만 MGET 파이프라인 1회로 조회한다. 입력 순서대로 값(없으면 None)을 반환한다."""
+        keys = [self.key(ident) for ident in idents]
+        values, pending = self._read_local(keys, use_local)
+        client = self._client()
+        if pending and client is not None:
+            try:
+                pipe = client.pipeline(transaction=False)
+                for chunk in _chunks([keys[i] for i in pending]):
+                    pipe.mget(chunk)
+                raws = [raw for chunk_raws in pipe.execute() for raw in chunk_raws]
+                self._fill_remote(keys, values, pending, raws)
+            except Exception:
+                self._error("조회", len(pending))
+        self._metrics.add("misses", sum(1 for v in values if v is None))
+        return values
+
+    async def aget(self, ident: Any, use_local: bool = True) -> Optional[T]:
+        return (await self.aget_many([ident], use_local=use_local))[0]
+
+    async def aget_many(self, idents: list, use_local: bool = True) -> list[Optional[T]]:
+        keys = [self.key(ident) for ident in idents]
+        values, pending = self._read_local(keys, use_local)
+        client = await self._async_client()
+        if pending and client is not None:
+            try:
+                pipe = client.pipeline(transaction=False)
+                for chunk in _chunks([keys[i] for i in pending]):
+                    pipe.mget(chunk)
+                raws = [raw for chunk_raws in await pipe.execute() for raw in chunk_raws]
+                self._fill_remote(keys, values, pending, raws)
+            except Exception:
+                self._error("조회", len(pending))
+        self._metrics.add("misses", sum(1 for v in values if v is None))
+        return values
+
+    # ── 저장 ──────────────────────────────────────────────
+
+    def set(self, ident: Any, value: T, ttl: Any = _DEFAULT, nx: bool = False) -> bool:
+        return self.set_many({ident: value}, ttl=ttl, nx=nx) > 0
+
+    def set_many(self, mapping: Mapping[Any, T], ttl: Any = _DEFAULT, nx: bool = False) -> int:
+        """
+        파이프라인 1회로 저장한다. nx=True 이면 키가 없을 때만 저장하여 다른 요청이 먼저 쓴 값을 보존한다.
+        Returns: 저장된 키 수
+        """
+        if not mapping:
+            return 0
+        ttl = self.ttl_seconds if ttl is _DEFAULT else ttl
+        items = [(self.key(ident), value) for ident, value in mapping.items()]
+        client = self._client()
+        if client is None:
+            return self._write_local_only(items, ttl, nx)
+        try:
+            pipe = client.pipeline(transaction=False)
+            for key, value in items:
+                pipe.set(key, self.serializer.dumps(value), ex=ttl, nx=nx)
+            results = pipe.execute()
+        except Exception:
+            self._error("저장", len(items))
+            self._drop_local([key for key, _ in items])
+            return 0
+        return self._after_write(items, results, ttl, nx)
+
+    async def aset(self, ident: Any, value: T, ttl: Any = _DEFAULT, nx: bool = False) -> bool:
+        return await self.aset_many({ident: value}, ttl=ttl, nx=nx) > 0
+
+    async def aset_many(self, mapping: Mapping[Any, T], ttl: Any = _DEFAULT, nx: bool = False) -> int:
+        if not mapping:
+            return 0
+        ttl = self.ttl_seconds if ttl is _DEFAULT else ttl
+        items = [(self.key(ident), value) for ident, value in mapping.items()]
+        client = await self._async_client()
+        if client is None:
+            return self._write_local_only(items, ttl, nx)
+        try:
+            pipe = client.pipeline(transaction=False)
+            for key, value in items:
+                pipe.set(key, self.serializer.dumps(value), ex=ttl, nx=nx)
+            results = await pipe.execute()
+        except Exception:
+            self._error("저장", len(items))
+            self._drop_local([key for key, _ in items])
+            return 0
+        written = self._after_write(items, results, ttl, nx, publish=False)
+        if self._local is not None and not nx:
+            await invalidation_bus.publish_async(client, self.name, [key for key, _ in items])
+        return written
+
+    def set_max_many(self, mapping: Mapping[Any, T], ttl: Any = _DEFAULT) -> int:
+        """
+        저장된 값보다 클 때만 저장한다 (단조 증가 값: 마지막 이벤트 시각 등). 저장된 키는 TTL을 새로 건다.
+        Redis에서는 직렬화한 문자열로 비교하므로 serializer.dumps가 순서를 보존해야 한다 (UTC_DATETIME 등).
+        Returns: 저장된 키 수
+        """
+        if not mapping:
+            return 0
+        ttl = self.ttl_seconds if ttl is _DEFAULT else ttl
+        items = [(self.key(ident), value) for ident, value in mapping.items()]
+        client = self._client()
+        if client is None:
+            return self._write_local_max(items, ttl)
+        try:
+            pipe = client.pipeline(transaction=False)
+            for key, value in items:
+                pipe.eval(_SET_IF_GREATER_SCRIPT, 1, key, self.serializer.dumps(value), ttl or "")
+            results = pipe.execute()
+        except Exception:
+            self._error("저장", len(items))
+            self._drop_local([key for key, _ in items])
+            return 0
+        return self._after_write_max(items, results, ttl)
+
+    async def aset_max_many(self, mapping: Mapping[Any, T], ttl: Any = _DEFAULT) -> int:
+        if not mapping:
+            return 0
+        ttl = self.ttl_seconds if ttl is _DEFAULT else ttl
+        items = [(self.key(ident), value) for ident, value in mapping.items()]
+        client = await self._async_client()
+        if client is None:
+            return self._write_local_max(items, ttl)
+        try:
+            pipe = client.pipeline(transaction=False)
+            for key, value in items:
+                pipe.eval(_SET_IF_GREATER_SCRIPT, 1, key, self.serializer.dumps(value), ttl or "")
+            results = await pipe.execute()
+        except Exception:
+            self._error("저장", len(items))
+            self._drop_local([key for key, _ in items])
+            return 0
+        written = self._after_write_max(items, results, ttl, publish=False)
+        if self._local is not None and written:
+            await invalidation_bus.publish_async(
+                client, self.name, [key for (key, _), ok in zip(items, results) if ok]
+            )
+        return written
+
+    def incr(self, deltas: Mapping[Any, int], only_if_exists: bool = True) -> None:
+        """
+        정수 값을 증감한다. only_if_exists=True 이면 이미 적재된 키만 증감한다.
+        로컬 계층의 해당 키는 버리고 다른 프로세스에도 무효화를 알린다.
+        """
+        deltas = {self.key(ident): delta for ident, delta in deltas.items() if delta}
+        if not deltas:
+            return
+        client = self._client()
+        if client is not None:
+            try:
+                pipe = client.pipeline(transaction=False)
+                for key, delta in deltas.items():
+                    if only_if_exists:
+                        pipe.eval(_INCR_IF_EXISTS_SCRIPT, 1, key, delta)
+                    else:
+                        pipe.incrby(key, delta)
+                pipe.execute()
+                self._metrics.add("writes", len(deltas))
+            except Exception:
+                self._error("증감", len(deltas))
+        # 증감 후에 버려야 그 사이 조회가 이전 값을 로컬에 다시 올려 두지 않는다
+        self._drop_local(list(deltas), publish=True)
+
+    def compare_and_set(self, items: list[tuple[Any, T, T]]) -> int:
+        """
+        (식별자, 기대값, 새 값) 목록에서 Redis 값이 기대값과 같은 키만 교체한다 (TTL 유지).
+        Returns: 교체된 키 수
+        """
+        client = self._client()
+        if client is None or not items:
+            return 0
+        keys = [self.key(ident) for ident, _, _ in items]
+        try:
+            pipe = client.pipeline(transaction=False)
+            for key, (_, expected, new) in zip(keys, items):
+                pipe.eval(
+                    _COMPARE_AND_SET_SCRIPT, 1, key, self.serializer.dumps(expected), self.serializer.dumps(new)
+                )
+            results = pipe.execute()
+        except Exception:
+            self._error("비교 교체", len(items))
+            return 0
+        changed = [key for key, ok in zip(keys, results) if ok]
+        self._drop_local(changed, publish=True)
+        self._metrics.add("writes", len(changed))
+        return len(changed)
+
+    # ── 무효화 ────────────────────────────────────────────
+
+    def invalidate(self, *idents: Any) -> None:
+        """Redis·로컬 계층에서 키를 지우고 다른 프로세스의 로컬 계층에도 알린다."""
+        if not idents:
+            return
+        keys = [self.key(ident) for ident in idents]
+        self._metrics.add("invalidations", len(keys))
+        client = self._client()
+        if client is not None:
+            try:
+                client.delete(*keys)
+            except Exception:
+                self._error("무효화", len(keys))
+        self._drop_local(keys, publish=True)
+
+    def clear_local(self) -> None:
+        if self._local is not None:
+            self._local.clear()
+
+    def scan_idents(self, count: int = 500) -> Iterator[str]:
+        """Redis에 적재된 이 네임스페이스의 식별자를 SCAN으로 순회한다 (정합성 보정용)."""
+        client = self._client()
+        if client is None:
+            return
+        for key in client.scan_iter(match=self.pattern, count=count):
+            ident = self.ident(key)
+            if ident is not None:
+                yield ident
+
+    # ── 지표 ──────────────────────────────────────────────
+
+    def stats(self) -> dict[str, Any]:
+        counts = self._metrics.snapshot()
+        lookups = counts["local_hits"] + counts["remote_hits"] + counts["misses"]
+        return {
+            "name": self.name,
+            "ttl_seconds": self.ttl_seconds,
+            "local_ttl_seconds": self.local_ttl_seconds,
+            "local_size": len(self._local) if self._local is not None else 0,
+            **counts,
+            "hit_ratio": round((counts["local_hits"] + counts["remote_hits"]) / lookups, 4) if lookups else None,
+        }
+
+    # ── 내부 ──────────────────────────────────────────────
+
+    def _client(self):
+        return get_redis() if self._remote_enabled() else None
+
+    async def _async_client(self):
+        return await get_async_redis() if self._remote_enabled() else None
+
+    def _read_local(self, keys: list[str], use_local: bool) -> tuple[list[Optional[T]], list[int]]:
+        values: list[Optional[T]] = [None] * len(keys)
+        pending: list[int] = []
+        for i, key in enumerate(keys):
+            value = self._local.get(key) if use_local and self._local is not None else None
+            if value is None:
+                pending.append(i)
+            else:
+                values[i] = value
+        self._metrics.add("local_hits", len(keys) - len(pending))
+        return values, pending
+
+    def _fill_remote(self, keys: list[str], values: list[Optional[T]], pending: list[int], raws: list) -> None:
+        hits = 0
+        for i, raw in zip(pending, raws):
+            if raw is None:
+                continue
+            values[i] = self.serializer.loads(raw)
+            hits += 1
+            if self._local is not None:
+                self._local.put(keys[i], values[i], self.local_ttl_seconds)
+        self._metrics.add("remote_hits", hits)
+
+    def _after_write(self, items: list, results: list, ttl: Optional[int], nx: bool, publish: bool = True) -> int:
+        written = [(key, value) for (key, value), ok in zip(items, results) if ok]
+        self._metrics.add("writes", len(written))
+        if self._local is not None:
+            if nx:
+                # 이미 있던 값은 알 수 없으므로 로컬에 두지 않는다
+                self._local.delete(key for (key, _), ok in zip(items, results) if not ok)
+            else:
+                self._drop_local([key for key, _ in items], publish=publish)
+            for key, value in written:
+                self._local.put(key, value, self._local_ttl(ttl))
+        return len(written)
+
+    def _after_write_max(self, items: list, results: list, ttl: Optional[int], publish: bool = True) -> int:
+        written = [(key, value) for (key, value), ok in zip(items, results) if ok]
+        self._metrics.add("writes", len(written))
+        if self._local is not None:
+            # 교체되지 않은 키는 Redis에 더 큰 값이 있으므로 로컬 값을 버린다
+            self._local.delete(key for (key, _), ok in zip(items, results) if not ok)
+            self._drop_local([key for key, _ in written], publish=publish)
+            for key, value in written:
+                self._local.put(key, value, self._local_ttl(ttl))
+        return len(written)
+
+    def _write_local_max(self, items: list, ttl: Optional[int]) -> int:
+        if self._local is None:
+            return 0
+        written = 0
+        for key, value in items:
+            current = self._local.get(key)
+            if current is not None and current >= value:
+                continue
+            self._local.put(key, value, self._local_ttl(ttl))
+            written += 1
+        return written
+
+    def _write_local_only(self, items: list, ttl: Optional[int], nx: bool) -> int:
+        if self._local is None:
+            return 0
+        written = 0
+        for key, value in items:
+            if nx and self._local.get(key) is not None:
+                continue
+            self._local.put(key, value, self._local_ttl(ttl))
+            written += 1
+        return written
+
+    def _local_ttl(self, ttl: Optional[int]) -> float:
+        return self.local_ttl_seconds if ttl is None else min(self.local_ttl_seconds, ttl)
+
+    def _drop_local(self, keys: list[str], publish: bool = False) -> None:
+        if self._local is None or not keys:
+            return
+        self._local.delete(keys)
+        if publish:
+            invalidation_bus.publish(self.name, keys)
+
+    def _on_remote_invalidate(self, keys: Optional[list[str]]) -> None:
+        if self._local is None:
+            return
+        if keys is None:
+            self._local.clear()
+        else:
+            self._local.delete(keys)
+            self._metrics.add("remote_invalidations", len(keys))
+
+    def _error(self, action: str, n: int) -> None:
+        self._metrics.add("errors")
+        logger.warning("캐시 %s 실패 ns=%s keys=%d", action, self.name, n, exc_info=True)
+
+
+def get_namespace(name: str) -> Optional[CacheNamespace]:
+    return _registry.get(name)
+
+
+def cache_stats() -> list[dict[str, Any]]:
+    """등록된 모든 네임스페이스의 적중률·크기 지표."""
+    return [namespace.stats() for namespace in _registry.values()]
@@ -0,0 +1,89 @@
+"""
+캐시 값 직렬화기.
+Redis에는 문자열로 저장하고, 읽을 때 네임스페이스에 지정된 타입으로 복원한다.
+"""
+import json
+from datetime import datetime, timezone
+from typing import Any, Iterable, Protocol, TypeVar
+
+T = TypeVar("T")
+
+
+class Serializer(Protocol[T]):
+    def dumps(self, value: T) -> str:
+        ...
+
+    def loads(self, raw: str) -> T:
+        ...
+
+
+class IntSerializer:
+    def dumps(self, value: int) -> str:
+        return str(int(value))
+
+    def loads(self, raw: str) -> int:
+        return int(raw)
+
+
+class StrSerializer:
+    def dumps(self, value: str) -> str:
+        return value
+
+    def loads(self, raw: str) -> str:
+        return raw
+
+
+class DateTimeSerializer:
+    """ISO 8601 문자열 ↔ datetime. tz 정보가 있으면 그대로 보존한다."""
+
+    def dumps(self, value: datetime) -> str:
+        return value.isoformat()
+
+    def loads(self, raw: str) -> datetime:
+        return datetime.fromisoformat(raw)
+
+
+class UtcDateTimeSerializer:
+    """
+    UTC로 바꾼 고정 폭 ISO 8601 문자열 (마이크로초까지) ↔ datetime.
+    문자열 순서가 시각 순서와 같으므로 Redis에서 문자열 비교로 대소를 판단할 수 있다 (set_max_many).
+    """
+
+    def dumps(self, value: datetime) -> str:
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc).isoformat(timespec="microseconds")
+
+    def loads(self, raw: str) -> datetime:
+        return datetime.fromisoformat(raw)
+
+
+class JsonSerializer:
+    """dict/list JSON. datetime_fields로 지정한 최상위 필드는 ISO 문자열 ↔ datetime으로 변환한다."""
+
+    def __init__(self, datetime_fields: Iterable[str] = ()) -> None:
+        self._datetime_fields = frozenset(datetime_fields)
+
+    def dumps(self, value: Any) -> str:
+        return json.dumps(value, ensure_ascii=False, default=_encode_default)
+
+    def loads(self, raw: str) -> Any:
+        data = json.loads(raw)
+        if self._datetime_fields and isinstance(data, dict):
+            for key in self._datetime_fields:
+                if data.get(key) is not None:
+                    data[key] = datetime.fromisoformat(data[key])
+        return data
+
+
+def _encode_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"JSON 직렬화 불가 타입: {type(value).__name__}")
+
+
+INT = IntSerializer()
+STR = StrSerializer()
+DATETIME = DateTimeSerializer()
+UTC_DATETIME = UtcDateTimeSerializer()
+JSON = JsonSerializer()
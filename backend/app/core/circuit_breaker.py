@@ -0,0 +1,139 @@
+"""
+서킷 브레이커.
+외부 의존성(Redis 등)이 연속으로 실패하면 일정 시간 호출을 차단(open)하여,
+장애 동안 요청마다 소켓 타임아웃을 기다리지 않고 즉시 대체 경로(DB 직접 조회 등)로 가도록 한다.
+
+- closed: 정상. 연속 실패가 failure_threshold에 도달하면 open.
+- open: 호출 차단. reset_seconds가 지나면 half_open으로 전환하여 시험 호출 1회를 허용한다.
+- half_open: 시험 호출이 성공하면 closed, 실패하면 다시 open.
+백그라운드 헬스 체크가 성공을 기록하면 대기 시간과 무관하게 즉시 closed로 돌아간다.
+"""
+import logging
+import threading
+import time
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """브레이커가 열려 있어 호출하지 않았다."""
+
+
+class CircuitBreaker:
+    """
+    failures로 지정한 예외 타입만 실패로 센다 (응답 오류 등 서버가 살아 있다는 뜻의 예외는 제외).
+    스레드 세이프하게 동작한다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int,
+        reset_seconds: float,
+        failures: tuple[type[BaseException], ...] = (Exception,),
+    ) -> None:
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_seconds = max(0.0, reset_seconds)
+        self.failures = failures
+        self._lock = threading.Lock()
+        self._state = STATE_CLOSED
+        self._consecutive_failures = 0
+        self._retry_at = 0.0
+        self._opened_total = 0
+        self._short_circuited = 0
+        self._last_error: Optional[str] = None
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def allow(self) -> bool:
+        """호출 가능 여부. open 상태에서 대기 시간이 지났으면 half_open으로 전환하고 시험 호출 1회를 허용한다."""
+        with self._lock:
+            if self._state == STATE_CLOSED:
+                return True
+            now = time.monotonic()
+            if now >= self._retry_at:
+                self._state = STATE_HALF_OPEN
+                self._retry_at = now + self.reset_seconds
+                return True
+            self._short_circuited += 1
+            return False
+
+    def reject_if_open(self) -> None:
+        """이미 받아 둔 클라이언트로 호출하는 경로용. open 상태면 네트워크 없이 CircuitOpenError."""
+        if self._state == STATE_OPEN:
+            with self._lock:
+                self._short_circuited += 1
+            raise CircuitOpenError(f"{self.name} circuit open")
+
+    def record_success(self) -> None:
+        if self._state == STATE_CLOSED and self._consecutive_failures == 0:
+            return
+        with self._lock:
+            if self._state != STATE_CLOSED:
+                logger.info("서킷 브레이커 %s 복구 (closed)", self.name)
+            self._state = STATE_CLOSED
+            self._consecutive_failures = 0
+
+    def record_failure(self, error: BaseException) -> None:
+        with self._lock:
+            self._consecutive_failures += 1
+            self._last_error = f"{type(error).__name__}: {error}"
+            if self._state == STATE_HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+                self._open()
+
+    def trip(self, error: BaseException) -> None:
+        """연속 실패 횟수와 무관하게 즉시 open (기동 시 연결 실패 등)."""
+        with self._lock:
+            self._last_error = f"{type(error).__name__}: {error}"
+            self._open()
+
+    def call(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        self.reject_if_open()
+        try:
+            result = fn(*args, **kwargs)
+        except self.failures as e:
+            self.record_failure(e)
+            raise
+        self.record_success()
+        return result
+
+    async def acall(self, fn: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+        self.reject_if_open()
+        try:
+            result = await fn(*args, **kwargs)
+        except self.failures as e:
+            self.record_failure(e)
+            raise
+        self.record_success()
+        return result
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            retry_in = max(0.0, self._retry_at - time.monotonic()) if self._state != STATE_CLOSED else None
+            return {
+                "state": self._state,
+                "consecutive_failures": self._consecutive_failures,
+                "opened_total": self._opened_total,
+                "short_circuited": self._short_circuited,
+                "retry_in_seconds": round(retry_in, 3) if retry_in is not None else None,
+                "last_error": self._last_error,
+            }
+
+    def _open(self) -> None:
+        if self._state != STATE_OPEN:
+            self._opened_total += 1
+            logger.warning(
+                "서킷 브레이커 %s open — %.0f초 동안 호출 차단 (%s)", self.name, self.reset_seconds, self._last_error
+            )
+        self._state = STATE_OPEN
+        self._retry_at = time.monotonic() + self.reset_seconds
@@ -1,12 +1,39 @@
 """
 SQLAlchemy 동기 엔진 및 세션 팩토리.
 DATABASE_URL 환경 변수가 없으면 프로젝트 루트의 SQLite 파일을 기본값으로 사용한다.
+DATABASE_ASYNC_ENABLED=true 이면 동일 DB에 대한 비동기 엔진(aiosqlite / asyncpg)과
+AsyncSession 의존성을 함께 제공한다. 비동기 드라이버는 선택 의존성이다.
+풀 크기·재활용·pre-ping 및 SQLite PRAGMA는 app.core.db_pool 의 환경 변수 설정을 따른다.
+
+요청 단위 세션(unit of work): get_db()가 요청마다 세션 1개를 열어 인증 의존성·라우터가 공유하고,
+서비스·Repository는 session_scope()로 같은 세션을 재사용한다. 요청 안에서는 flush만 하고
+커밋은 라우터가 응답을 반환하기 전에 명시적으로 db.commit() 1회로 모은다.
+get_db()의 종료 처리는 응답을 보낸 뒤에 실행되므로 커밋하지 않는다 — 커밋되지 않은 쓰기는 롤백하고 경고를 남긴다.
 """
+import logging
 import os
+from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import ORMExecuteState, Session, declarative_base, sessionmaker
+
+from app.core.db_pool import (
+    EngineSettings,
+    InstrumentedQueuePool,
+    is_sqlite_memory,
+    pool_stats,
+    register_sqlite_pragmas,
+)
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, declarative_base, sessionmaker
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+logger = logging.getLogger(__name__)
 
 _DEFAULT_DB_PATH = Path(__file__).resolve().parents[2] / "data" / "100pro.db"
 
@@ -17,18 +44,52 @@ Base = declarative_base()
 
 _engine = None
 _SessionLocal: sessionmaker[Session] | None = None
+_async_engine: "AsyncEngine | None" = None
+_AsyncSessionLocal: "async_sessionmaker[AsyncSession] | None" = None
+
+# 현재 요청에 바인딩된 세션. get_db()가 설정하고 session_scope()가 재사용한다.
+_request_session: ContextVar[Session | None] = ContextVar("request_session", default=None)
+# 세션에 아직 커밋되지 않은 쓰기가 있는지 표시하는 session.info 키
+_PENDING_WRITES = "pending_writes"
+
+# 동기 드라이버 URL 스킴 → 비동기 드라이버 URL 스킴
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "postgres": "postgresql+asyncpg",
+}
 
 
 def _get_url() -> str:
     return os.getenv("DATABASE_URL", f"sqlite:///{_DEFAULT_DB_PATH}")
 
 
+def _get_async_url() -> str:
+    """DATABASE_ASYNC_URL이 있으면 그대로, 없으면 DATABASE_URL의 드라이버를 비동기 드라이버로 바꿔 사용한다."""
+    explicit = os.getenv("DATABASE_ASYNC_URL")
+    if explicit:
+        return explicit
+    url = _get_url()
+    scheme, sep, rest = url.partition("://")
+    return f"{_ASYNC_DRIVERS.get(scheme, scheme)}{sep}{rest}"
+
+
+def is_async_enabled() -> bool:
+    """비동기 엔진·서비스 사용 여부 (DATABASE_ASYNC_ENABLED)."""
+    return os.getenv("DATABASE_ASYNC_ENABLED", "false").lower() in ("true", "1", "yes")
+
+
 def get_engine():
     global _engine
     if _engine is None:
         url = _get_url()
+        settings = EngineSettings.from_env()
         connect_args = {"check_same_thread": False} if url.startswith("sqlite") else {}
-        _engine = create_engine(url, echo=False, connect_args=connect_args)
+        pool_kwargs = {} if is_sqlite_memory(url) else {**settings.pool_kwargs(), "poolclass": InstrumentedQueuePool}
+        _engine = create_engine(url, echo=False, connect_args=connect_args, **pool_kwargs)
+        if url.startswith("sqlite"):
+            register_sqlite_pragmas(_engine, settings)
     return _engine
 
 
@@ -36,11 +97,152 @@ def get_session_factory() -> sessionmaker[Session]:
     global _SessionLocal
     if _SessionLocal is None:
         _SessionLocal = sessionmaker(bind=get_engine(), autocommit=False, autoflush=False)
+        _track_pending_writes(_SessionLocal)
     return _SessionLocal
 
 
-def init_db() -> None:
-    """모든 모델 테이블을 생성한다. 앱 시작 시 1회 호출."""
+def _track_pending_writes(factory: sessionmaker[Session]) -> None:
+    """flush·bulk DML 시 미커밋 쓰기를 표시하고, commit/rollback 시 표시를 지운다."""
+
+    def _mark(session: Session, *_args) -> None:
+        session.info[_PENDING_WRITES] = True
+
+    def _clear(session: Session, *_args) -> None:
+        session.info.pop(_PENDING_WRITES, None)
+
+    def _mark_dml(state: ORMExecuteState) -> None:
+        if state.is_insert or state.is_update or state.is_delete:
+            _mark(state.session)
+
+    event.listen(factory, "after_flush", _mark)
+    event.listen(factory, "do_orm_execute", _mark_dml)
+    event.listen(factory, "after_commit", _clear)
+    event.listen(factory, "after_rollback", _clear)
+
+
+def _has_pending_writes(session: Session) -> bool:
+    return bool(session.info.get(_PENDING_WRITES))
+
+
+async def get_db() -> AsyncIterator[Session]:
+    """
+    FastAPI 의존성. 요청 단위 세션을 열어 인증 의존성·라우터·서비스가 공유하게 한다.
+    같은 요청 안에서 Depends(get_db)는 캐시되며, 세션을 요청 동안 커넥션 1개에 바인딩하여
+    commit 이후의 refresh·지연 로딩도 풀에서 커넥션을 다시 꺼내지 않는다.
+    커밋은 라우터가 명시적으로 한다. 종료 처리는 응답 전송 후에 실행되어 실패를 클라이언트에 알릴 수 없으므로,
+    커밋되지 않은 쓰기가 남아 있으면 커밋하지 않고 롤백한 뒤 경고를 남긴다. 예외 시에도 롤백한다.
+    """
+    connection = await run_in_threadpool(get_engine().connect)
+    session = get_session_factory()(bind=connection)
+    _request_session.set(session)
+    try:
+        yield session
+        if _has_pending_writes(session):
+            logger.warning("요청 세션에 커밋되지 않은 쓰기가 남아 롤백합니다 — 라우터에서 db.commit()이 필요합니다.")
+            await run_in_threadpool(session.rollback)
+    except Exception:
+        await run_in_threadpool(session.rollback)
+        raise
+    finally:
+        _request_session.set(None)
+        await run_in_threadpool(_close_request_session, session, connection)
+
+
+def _close_request_session(session: Session, connection) -> None:
+    session.close()
+    connection.close()
+
+
+@contextmanager
+def session_scope() -> Iterator[Session]:
+    """
+    서비스·Repository용 세션 컨텍스트.
+    요청 세션이 있으면 재사용하며 블록 종료 시 flush만 한다 (커밋은 라우터가 요청 단위로 1회).
+    요청 밖(스케줄러·lifespan·직접 호출)에서는 새 세션을 열어 쓰기가 있을 때만 커밋하고 닫는다.
+    이 경우 expire_on_commit=False 이므로 반환된 객체는 세션 종료 후에도 읽을 수 있다.
+    """
+    shared = _request_session.get()
+    if shared is not None:
+        yield shared
+        shared.flush()
+        return
+    with get_session_factory()(expire_on_commit=False) as session:
+        yield session
+        if session.new or session.dirty or session.deleted or _has_pending_writes(session):
+            session.commit()
+
+
+def get_async_engine() -> "AsyncEngine":
+    """
+    비동기 엔진을 반환한다. 최초 호출 시 생성한다.
+    sqlalchemy[asyncio](greenlet)와 aiosqlite / asyncpg 가 설치되어 있지 않으면
+    생성 시점에 ImportError가 발생한다. 동기 경로만 사용할 때는 import되지 않는다.
+    """
+    global _async_engine
+    if _async_engine is None:
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        url = _get_async_url()
+        settings = EngineSettings.from_env()
+        pool_kwargs = {} if is_sqlite_memory(url) else settings.pool_kwargs()
+        _async_engine = create_async_engine(url, echo=False, **pool_kwargs)
+        if url.startswith("sqlite"):
+            register_sqlite_pragmas(_async_engine.sync_engine, settings)
+    return _async_engine
+
+
+def get_async_session_factory() -> "async_sessionmaker[AsyncSession]":
+    global _AsyncSessionLocal
+    if _AsyncSessionLocal is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker
+
+        _AsyncSessionLocal = async_sessionmaker(
+            bind=get_async_engine(),
+            autoflush=False,
+            expire_on_commit=False,
+        )
+    return _AsyncSessionLocal
+
+
+async def get_async_db() -> AsyncIterator["AsyncSession"]:
+    """FastAPI 의존성. 요청 단위 AsyncSession을 열고 종료 시 닫는다."""
+    async with get_async_session_factory()() as session:
+        yield session
+
+
+async def dispose_async_engine() -> None:
+    """비동기 엔진 커넥션 풀을 정리한다. 앱 종료 시 호출."""
+    global _async_engine, _AsyncSessionLocal
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+        _AsyncSessionLocal = None
+
+
+def dialect_insert(dialect_name: str, table):
+    """
+    ON CONFLICT(DO NOTHING / DO UPDATE)를 지원하는 방언별 insert() 구성을 반환한다.
+    SQLite·PostgreSQL 외의 DB면 None (호출자가 대체 경로를 쓴다).
+    """
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        return None
+    return insert(table)
+
+
+def get_pool_stats() -> dict:
+    """동기(및 생성된 경우 비동기) 엔진의 커넥션 풀 상태를 반환한다."""
+    stats = {"sync": pool_stats(get_engine())}
+    if _async_engine is not None:
+        stats["async"] = pool_stats(_async_engine.sync_engine)
+    return stats
+
+
+def import_models() -> None:
+    """모든 모델 모듈을 import하여 Base.metadata에 테이블을 등록한다."""
     import app.domains.auth.models  # noqa: F401
     import app.domains.task.models  # noqa: F401
     import app.domains.TodayFocus.today_focus.session_log  # noqa: F401 [PM-TF-INF-01]
@@ -49,4 +251,4 @@ def init_db() -> None:
     import app.infrastructure.task_params.models  # noqa: F401
     import app.infrastructure.experiment_config.config  # noqa: F401
     import app.infrastructure.trigger_config.settings  # noqa: F401
-    Base.metadata.create_all(bind=get_engine())
+
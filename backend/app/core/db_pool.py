@@ -0,0 +1,150 @@
+"""
+DB 커넥션 풀·SQLite PRAGMA 설정.
+DB_POOL_* / SQLITE_* 환경 변수로 풀 크기, 대기 시간, 재활용 주기, pre-ping,
+SQLite WAL·synchronous·busy_timeout·mmap 설정을 조정한다.
+커넥션 획득 대기 시간을 측정하는 QueuePool을 제공하여 풀 고갈 여부를 관측할 수 있게 한다.
+"""
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+logger = logging.getLogger(__name__)
+
+
+def _env_int(key: str, default: int) -> int:
+    return int(os.getenv(key, str(default)))
+
+
+def _env_bool(key: str, default: bool) -> bool:
+    return os.getenv(key, str(default)).lower() in ("true", "1", "yes")
+
+
+@dataclass(frozen=True)
+class EngineSettings:
+    """엔진 생성 시 적용할 풀·PRAGMA 설정."""
+
+    pool_size: int
+    max_overflow: int
+    pool_timeout: int
+    pool_recycle: int
+    pool_pre_ping: bool
+    sqlite_journal_mode: str
+    sqlite_synchronous: str
+    sqlite_busy_timeout_ms: int
+    sqlite_mmap_size: int
+
+    @staticmethod
+    def from_env() -> "EngineSettings":
+        return EngineSettings(
+            pool_size=_env_int("DB_POOL_SIZE", 5),
+            max_overflow=_env_int("DB_MAX_OVERFLOW", 10),
+            pool_timeout=_env_int("DB_POOL_TIMEOUT", 30),
+            pool_recycle=_env_int("DB_POOL_RECYCLE", 1800),
+            pool_pre_ping=_env_bool("DB_POOL_PRE_PING", True),
+            sqlite_journal_mode=os.getenv("SQLITE_JOURNAL_MODE", "WAL"),
+            sqlite_synchronous=os.getenv("SQLITE_SYNCHRONOUS", "NORMAL"),
+            sqlite_busy_timeout_ms=_env_int("SQLITE_BUSY_TIMEOUT_MS", 5000),
+            sqlite_mmap_size=_env_int("SQLITE_MMAP_SIZE", 256 * 1024 * 1024),
+        )
+
+    def pool_kwargs(self) -> dict:
+        """QueuePool 계열 풀에 전달할 create_engine 인자."""
+        return {
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "pool_timeout": self.pool_timeout,
+            "pool_recycle": self.pool_recycle,
+            "pool_pre_ping": self.pool_pre_ping,
+        }
+
+    def sqlite_pragmas(self) -> list[str]:
+        """새 SQLite 커넥션마다 실행할 PRAGMA 목록."""
+        return [
+            f"PRAGMA journal_mode={self.sqlite_journal_mode}",
+            f"PRAGMA synchronous={self.sqlite_synchronous}",
+            f"PRAGMA busy_timeout={self.sqlite_busy_timeout_ms}",
+            f"PRAGMA mmap_size={self.sqlite_mmap_size}",
+        ]
+
+
+def is_sqlite_memory(url: str) -> bool:
+    """인메모리 SQLite는 단일 커넥션 풀을 쓰므로 풀 크기 설정을 적용하지 않는다."""
+    return url.startswith("sqlite") and (":memory:" in url or url.split("://", 1)[-1] in ("", "/"))
+
+
+def register_sqlite_pragmas(engine: Engine, settings: EngineSettings) -> None:
+    """connect 이벤트에 PRAGMA 적용 리스너를 등록한다. 비동기 엔진은 sync_engine을 넘긴다."""
+    pragmas = settings.sqlite_pragmas()
+
+    @event.listens_for(engine, "connect")
+    def _apply_pragmas(dbapi_connection, _connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+    logger.info("SQLite PRAGMA 적용: %s", "; ".join(pragmas))
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    커넥션 획득(checkout) 대기 시간과 타임아웃 횟수를 집계하는 QueuePool.
+    connect()는 풀이 비었을 때의 대기, 신규 커넥션 생성, pre-ping을 모두 포함한다.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self._checkout_count = 0
+        self._timeout_count = 0
+        self._wait_total_ms = 0.0
+        self._wait_max_ms = 0.0
+
+    def connect(self):
+        start_ns = time.perf_counter_ns()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            with self._stats_lock:
+                self._timeout_count += 1
+            raise
+        finally:
+            waited_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+            with self._stats_lock:
+                self._checkout_count += 1
+                self._wait_total_ms += waited_ms
+                self._wait_max_ms = max(self._wait_max_ms, waited_ms)
+
+    def wait_stats(self) -> dict:
+        with self._stats_lock:
+            avg = self._wait_total_ms / self._checkout_count if self._checkout_count else 0.0
+            return {
+                "checkout_count": self._checkout_count,
+                "timeout_count": self._timeout_count,
+                "avg_wait_ms": round(avg, 3),
+                "max_wait_ms": round(self._wait_max_ms, 3),
+            }
+
+
+def pool_stats(engine: Engine) -> dict:
+    """풀 상태(크기, 사용 중, 유휴, overflow)와 대기 시간 집계를 반환한다."""
+    pool = engine.pool
+    stats: dict = {"pool_class": type(pool).__name__, "status": pool.status()}
+    if isinstance(pool, QueuePool):
+        stats.update({
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+        })
+    if isinstance(pool, InstrumentedQueuePool):
+        stats.update(pool.wait_stats())
+    return stats
@@ -0,0 +1,84 @@
+"""
+외부 API 호출용 공유 httpx.AsyncClient.
+lifespan 시작 시 init_http_client()로 1회 생성하고 종료 시 close_http_client()로 닫는다.
+keep-alive 커넥션 풀을 재사용하여 요청마다 TLS 핸드셰이크를 반복하지 않는다.
+HTTP/2는 h2 패키지(httpx[http2])가 설치된 경우에만 활성화되며, 없으면 HTTP/1.1로 동작한다.
+재시도는 커넥션 수립 실패(ConnectError/ConnectTimeout)에 한해 transport 레벨에서 수행하므로
+인가 코드 교환처럼 멱등하지 않은 POST도 서버에 도달하지 않은 요청만 다시 보낸다.
+"""
+import logging
+import os
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+_client: httpx.AsyncClient | None = None
+
+
+def _env_float(key: str, default: float) -> float:
+    return float(os.getenv(key, str(default)))
+
+
+def _env_int(key: str, default: int) -> int:
+    return int(os.getenv(key, str(default)))
+
+
+def _http2_enabled() -> bool:
+    if os.getenv("HTTP_CLIENT_HTTP2", "true").lower() not in ("true", "1", "yes"):
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        logger.info("h2 패키지가 없어 HTTP/1.1로 동작합니다 (HTTP/2 사용 시 httpx[http2] 설치).")
+        return False
+    return True
+
+
+def _build_client() -> httpx.AsyncClient:
+    http2 = _http2_enabled()
+    limits = httpx.Limits(
+        max_connections=_env_int("HTTP_CLIENT_MAX_CONNECTIONS", 100),
+        max_keepalive_connections=_env_int("HTTP_CLIENT_MAX_KEEPALIVE", 20),
+        keepalive_expiry=_env_float("HTTP_CLIENT_KEEPALIVE_EXPIRY", 30.0),
+    )
+    timeout = httpx.Timeout(
+        connect=_env_float("HTTP_CLIENT_CONNECT_TIMEOUT", 3.0),
+        read=_env_float("HTTP_CLIENT_READ_TIMEOUT", 5.0),
+        write=_env_float("HTTP_CLIENT_WRITE_TIMEOUT", 5.0),
+        pool=_env_float("HTTP_CLIENT_POOL_TIMEOUT", 2.0),
+    )
+    transport = httpx.AsyncHTTPTransport(
+        http2=http2,
+        limits=limits,
+        retries=_env_int("HTTP_CLIENT_RETRIES", 2),
+    )
+    logger.info("공유 HTTP 클라이언트 생성 (http2=%s, max_connections=%d)", http2, limits.max_connections)
+    return httpx.AsyncClient(transport=transport, timeout=timeout, http2=http2)
+
+
+def init_http_client() -> httpx.AsyncClient:
+    """공유 클라이언트를 생성한다. 이미 있으면 그대로 반환한다. 앱 시작 시 호출."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = _build_client()
+    return _client
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """공유 클라이언트를 반환한다. lifespan 밖(스크립트 등)에서는 최초 호출 시 생성한다."""
+    return init_http_client()
+
+
+def set_http_client(client: httpx.AsyncClient | None) -> None:
+    """공유 클라이언트를 교체한다. 테스트에서 스텁 transport를 주입할 때 사용."""
+    global _client
+    _client = client
+
+
+async def close_http_client() -> None:
+    """공유 클라이언트의 커넥션 풀을 닫는다. 앱 종료 시 호출."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -0,0 +1,348 @@
+"""
+스케줄러 리더 선출.
+uvicorn 워커가 여러 개여도 주기 작업은 리더로 선출된 프로세스 1개에서만 실행되도록 한다.
+백그라운드 스레드가 SCHEDULER_LEADER_RENEW_SECONDS 주기로 리더십을 획득·갱신하며,
+리더 프로세스가 죽으면 다른 프로세스가 다음 시도에서 이어받는다.
+
+백엔드 (SCHEDULER_LEADER_BACKEND):
+- redis: SET NX PX 리스(lease) + 소유자 확인 후 갱신. 리더가 죽으면 TTL 만료 후 이양.
+- postgres: 전용 커넥션의 세션 advisory lock. 프로세스·커넥션이 끊기면 즉시 해제된다.
+- file: 로컬 파일 flock. 같은 호스트의 워커 간에만 유효하다.
+- none: 항상 리더 (단일 프로세스 배포).
+- auto(기본): REDIS_URL 설정 → redis, DATABASE_URL이 PostgreSQL → postgres, 그 외 → file.
+  설정만으로 정하므로 같은 설정의 워커는 항상 같은 락 도메인을 쓴다. 기동 시점에 Redis가 닿지 않아도
+  다른 백엔드로 넘어가지 않고, 연결될 때까지 리더가 되지 않는다.
+"""
+import logging
+import os
+import socket
+import tempfile
+import threading
+import uuid
+from typing import Callable, Optional, Protocol
+
+from sqlalchemy import text
+
+from app.core.database import get_engine
+from app.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+BACKEND_AUTO = "auto"
+BACKEND_REDIS = "redis"
+BACKEND_POSTGRES = "postgres"
+BACKEND_FILE = "file"
+BACKEND_NONE = "none"
+
+DEFAULT_LEASE_SECONDS = 15
+DEFAULT_RENEW_SECONDS = 5
+
+REDIS_LEADER_KEY = "scheduler:leader"
+# pg advisory lock 키 (임의의 고정 값, 마이그레이션 락과 구분)
+PG_LEADER_LOCK_KEY = 1_000_014
+
+# 소유자 토큰이 일치할 때만 TTL 연장 / 삭제
+_RENEW_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('pexpire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+def get_backend_name() -> str:
+    backend = os.getenv("SCHEDULER_LEADER_BACKEND", BACKEND_AUTO).strip().lower()
+    valid = (BACKEND_AUTO, BACKEND_REDIS, BACKEND_POSTGRES, BACKEND_FILE, BACKEND_NONE)
+    return backend if backend in valid else BACKEND_AUTO
+
+
+def get_lease_seconds() -> int:
+    """Redis 리스 TTL. 리더가 죽은 뒤 다른 프로세스가 이어받기까지의 최대 지연."""
+    return max(3, int(os.getenv("SCHEDULER_LEADER_LEASE_SECONDS", str(DEFAULT_LEASE_SECONDS))))
+
+
+def get_renew_seconds() -> float:
+    """획득·갱신 시도 주기. 리스 TTL의 1/2 이하로 제한한다."""
+    renew = float(os.getenv("SCHEDULER_LEADER_RENEW_SECONDS", str(DEFAULT_RENEW_SECONDS)))
+    return max(0.5, min(renew, get_lease_seconds() / 2))
+
+
+def _instance_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class LeaderBackend(Protocol):
+    name: str
+
+    def try_acquire(self) -> bool:
+        """리더십을 획득(이미 보유 중이면 갱신)한다. 보유 중이면 True."""
+        ...
+
+    def release(self) -> None:
+        ...
+
+    def current_leader(self) -> Optional[str]:
+        """현재 리더의 인스턴스 ID. 알 수 없으면 None."""
+        ...
+
+
+class RedisLeaseBackend:
+    name = BACKEND_REDIS
+
+    def __init__(self, key: str, instance_id: str) -> None:
+        self._key = key
+        self._instance_id = instance_id
+        self._held = False
+
+    def try_acquire(self) -> bool:
+        client = get_redis()
+        if client is None:
+            self._held = False
+            return False
+        lease_ms = get_lease_seconds() * 1000
+        if self._held and client.eval(_RENEW_SCRIPT, 1, self._key, self._instance_id, lease_ms):
+            return True
+        self._held = bool(client.set(self._key, self._instance_id, nx=True, px=lease_ms))
+        return self._held
+
+    def release(self) -> None:
+        client = get_redis()
+        if self._held and client is not None:
+            client.eval(_RELEASE_SCRIPT, 1, self._key, self._instance_id)
+        self._held = False
+
+    def current_leader(self) -> Optional[str]:
+        client = get_redis()
+        return client.get(self._key) if client is not None else None
+
+
+class PostgresAdvisoryLockBackend:
+    """세션 advisory lock을 잡은 전용 커넥션을 리더 임기 동안 유지한다. 소유자는 application_name으로 표시한다."""
+
+    name = BACKEND_POSTGRES
+
+    def __init__(self, lock_key: int, instance_id: str) -> None:
+        self._lock_key = lock_key
+        self._instance_id = instance_id
+        self._conn = None
+
+    def try_acquire(self) -> bool:
+        if self._conn is not None:
+            try:
+                self._conn.execute(text("SELECT 1"))
+                return True
+            except Exception:
+                logger.warning("리더 advisory lock 커넥션 유실", exc_info=True)
+                self._close()
+        conn = get_engine().connect().execution_options(isolation_level="AUTOCOMMIT")
+        try:
+            conn.execute(text("SELECT set_config('application_name', :name, false)"), {"name": self._instance_id})
+            if conn.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": self._lock_key}).scalar():
+                self._conn = conn
+                return True
+        except Exception:
+            logger.warning("리더 advisory lock 획득 실패", exc_info=True)
+        conn.close()
+        return False
+
+    def release(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": self._lock_key})
+            except Exception:
+                pass
+            self._close()
+
+    def current_leader(self) -> Optional[str]:
+        with get_engine().connect() as conn:
+            return conn.execute(
+                text(
+                    "SELECT a.application_name FROM pg_locks l JOIN pg_stat_activity a ON a.pid = l.pid "
+                    "WHERE l.locktype = 'advisory' AND l.granted "
+                    "AND ((l.classid::bigint << 32) | l.objid::bigint) = :key"
+                ),
+                {"key": self._lock_key},
+            ).scalar()
+
+    def _close(self) -> None:
+        conn, self._conn = self._conn, None
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+class FileLockBackend:
+    """비차단 flock. 잠금 보유 중 파일 내용에 인스턴스 ID를 기록한다."""
+
+    name = BACKEND_FILE
+
+    def __init__(self, path: str, instance_id: str) -> None:
+        self._path = path
+        self._instance_id = instance_id
+        self._fd: Optional[int] = None
+
+    def try_acquire(self) -> bool:
+        if self._fd is not None:
+            return True
+        try:
+            import fcntl
+        except ImportError:
+            logger.warning("fcntl을 사용할 수 없는 플랫폼 — 파일 락 없이 리더로 동작합니다.")
+            return True
+        fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        os.ftruncate(fd, 0)
+        os.pwrite(fd, self._instance_id.encode("utf-8"), 0)
+        self._fd = fd
+        return True
+
+    def release(self) -> None:
+        if self._fd is not None:
+            fd, self._fd = self._fd, None
+            os.ftruncate(fd, 0)
+            os.close(fd)  # 닫으면 flock도 해제된다
+
+    def current_leader(self) -> Optional[str]:
+        if self._fd is not None:
+            return self._instance_id
+        try:
+            import fcntl
+
+            with open(self._path, encoding="utf-8") as f:
+                try:
+                    # 공유 락이 잡히면 보유자가 없는 것 (죽은 리더가 남긴 내용은 무시)
+                    fcntl.flock(f, fcntl.LOCK_SH | fcntl.LOCK_NB)
+                    fcntl.flock(f, fcntl.LOCK_UN)
+                    return None
+                except OSError:
+                    return f.read().strip() or None
+        except (ImportError, OSError):
+            return None
+
+
+class AlwaysLeaderBackend:
+    name = BACKEND_NONE
+
+    def __init__(self, instance_id: str) -> None:
+        self._instance_id = instance_id
+
+    def try_acquire(self) -> bool:
+        return True
+
+    def release(self) -> None:
+        pass
+
+    def current_leader(self) -> Optional[str]:
+        return self._instance_id
+
+
+def resolve_backend_name(name: str) -> str:
+    """auto를 설정(REDIS_URL, DATABASE_URL)만으로 구체 백엔드로 바꾼다. 런타임 연결 상태는 보지 않는다."""
+    if name != BACKEND_AUTO:
+        return name
+    if os.getenv("REDIS_URL"):
+        return BACKEND_REDIS
+    if get_engine().dialect.name == "postgresql":
+        return BACKEND_POSTGRES
+    return BACKEND_FILE
+
+
+def _build_backend(name: str, instance_id: str) -> LeaderBackend:
+    name = resolve_backend_name(name)
+    if name == BACKEND_REDIS:
+        return RedisLeaseBackend(REDIS_LEADER_KEY, instance_id)
+    if name == BACKEND_POSTGRES:
+        return PostgresAdvisoryLockBackend(PG_LEADER_LOCK_KEY, instance_id)
+    if name == BACKEND_FILE:
+        path = os.getenv("SCHEDULER_LEADER_LOCK_FILE") or os.path.join(
+            tempfile.gettempdir(), "100pro-scheduler-leader.lock"
+        )
+        return FileLockBackend(path, instance_id)
+    return AlwaysLeaderBackend(instance_id)
+
+
+class LeaderElector:
+    """
+    백그라운드 스레드에서 리더십을 획득·갱신하고, 상태가 바뀌면 on_elected / on_revoked 콜백을 호출한다.
+    갱신 중 백엔드 오류가 나면 중복 실행을 막기 위해 리더십을 내려놓는다.
+    """
+
+    def __init__(
+        self,
+        on_elected: Callable[[], None],
+        on_revoked: Callable[[], None],
+        backend: Optional[LeaderBackend] = None,
+    ) -> None:
+        self.instance_id = _instance_id()
+        self._backend = backend
+        self._on_elected = on_elected
+        self._on_revoked = on_revoked
+        self._is_leader = False
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def backend(self) -> LeaderBackend:
+        if self._backend is None:
+            self._backend = _build_backend(get_backend_name(), self.instance_id)
+        return self._backend
+
+    @property
+    def is_leader(self) -> bool:
+        return self._is_leader
+
+    def start(self) -> None:
+        logger.info("리더 선출 시작 (backend=%s, instance=%s)", self.backend.name, self.instance_id)
+        self._tick()
+        self._thread = threading.Thread(target=self._run, name="scheduler-leader", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=get_renew_seconds() + 1)
+        if self._is_leader:
+            self._set_leader(False)
+        try:
+            self.backend.release()
+        except Exception:
+            logger.warning("리더십 해제 실패", exc_info=True)
+
+    def current_leader(self) -> Optional[str]:
+        try:
+            return self.backend.current_leader()
+        except Exception:
+            logger.warning("현재 리더 조회 실패", exc_info=True)
+            return None
+
+    def _run(self) -> None:
+        while not self._stop.wait(get_renew_seconds()):
+            self._tick()
+
+    def _tick(self) -> None:
+        try:
+            acquired = self.backend.try_acquire()
+        except Exception:
+            logger.warning("리더십 획득·갱신 실패", exc_info=True)
+            acquired = False
+        if acquired != self._is_leader:
+            self._set_leader(acquired)
+
+    def _set_leader(self, leader: bool) -> None:
+        self._is_leader = leader
+        logger.info("스케줄러 리더 %s (instance=%s)", "선출" if leader else "해제", self.instance_id)
+        try:
+            (self._on_elected if leader else self._on_revoked)()
+        except Exception:
+            logger.exception("리더 상태 전환 콜백 실패")
@@ -0,0 +1,22 @@
+"""
+버전 기반 스키마 마이그레이션.
+CLI: python -m app.core.migrations {upgrade,current,history,check}
+"""
+from app.core.migrations.runner import (
+    current_version,
+    ensure_schema,
+    latest_version,
+    pending_migrations,
+    upgrade,
+)
+from app.core.migrations.versions import MIGRATIONS, Migration
+
+__all__ = [
+    "MIGRATIONS",
+    "Migration",
+    "current_version",
+    "ensure_schema",
+    "latest_version",
+    "pending_migrations",
+    "upgrade",
+]
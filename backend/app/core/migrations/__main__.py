@@ -0,0 +1,53 @@
+"""
+마이그레이션 CLI (backend 디렉토리에서 실행).
+    python -m app.core.migrations upgrade [--target N]   미적용 마이그레이션 적용 + 기본 파라미터 시드
+    python -m app.core.migrations current                현재/최신 버전 출력
+    python -m app.core.migrations history                적용 이력 출력
+    python -m app.core.migrations check                  미적용 버전이 있으면 종료 코드 1
+"""
+import argparse
+import logging
+import sys
+
+from app.config.env import load_env
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.core.migrations", description="DB 스키마 마이그레이션")
+    sub = parser.add_subparsers(dest="command", required=True)
+    upgrade_parser = sub.add_parser("upgrade", help="미적용 마이그레이션 적용")
+    upgrade_parser.add_argument("--target", type=int, default=None, help="적용할 최대 버전 (기본: 최신)")
+    sub.add_parser("current", help="현재/최신 버전 출력")
+    sub.add_parser("history", help="적용 이력 출력")
+    sub.add_parser("check", help="미적용 버전이 있으면 종료 코드 1")
+    args = parser.parse_args()
+
+    load_env()
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(name)s — %(message)s")
+
+    from app.core.migrations.runner import (
+        applied_migrations,
+        current_version,
+        latest_version,
+        pending_migrations,
+        upgrade,
+    )
+
+    if args.command == "upgrade":
+        applied = upgrade(target=args.target)
+        print(f"적용 {len(applied)}건, 현재 버전 {current_version()}")
+    elif args.command == "current":
+        print(f"현재 {current_version()} / 최신 {latest_version()}")
+    elif args.command == "history":
+        for row in applied_migrations():
+            print(f"{row['version']:04d}_{row['name']}  {row['applied_at']}")
+    elif args.command == "check":
+        pending = pending_migrations()
+        for m in pending:
+            print(f"미적용: {m.version:04d}_{m.name}")
+        return 1 if pending else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+"""
+버전 기반 스키마 마이그레이션 실행기.
+적용된 버전은 schema_migrations 테이블에 기록하고, 미적용 버전만 순서대로 각각 한 트랜잭션에서 실행한다.
+배포 시 CLI(python -m app.core.migrations upgrade)로 1회 실행하는 것을 기본으로 하며,
+워커 시작 시에는 ensure_schema()가 현재 버전만 조회한다 (DDL·스키마 조회 없음).
+
+동시 실행 보호:
+- PostgreSQL: 트랜잭션 단위 advisory lock으로 직렬화한 뒤 버전을 다시 확인한다.
+- SQLite: 버전 행을 먼저 INSERT하여 쓰기 락을 잡고, 다른 프로세스가 먼저 적용했으면 PK 충돌로 건너뛴다.
+"""
+import logging
+import os
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, func, insert, select, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import IntegrityError, OperationalError, ProgrammingError
+from sqlalchemy.orm import Session
+
+from app.core.database import get_engine
+from app.core.migrations.versions import MIGRATIONS, Migration
+
+logger = logging.getLogger(__name__)
+
+# pg_advisory_xact_lock 키 (임의의 고정 값)
+_PG_LOCK_KEY = 1_000_013
+
+_metadata = MetaData()
+schema_migrations = Table(
+    "schema_migrations",
+    _metadata,
+    Column("version", Integer, primary_key=True, autoincrement=False),
+    Column("name", String(100), nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+def is_auto_migrate_enabled() -> bool:
+    """DB_AUTO_MIGRATE=true 이면 워커 시작 시 미적용 마이그레이션을 직접 실행한다 (로컬 개발용)."""
+    return os.getenv("DB_AUTO_MIGRATE", "true").lower() in ("true", "1", "yes")
+
+
+def latest_version() -> int:
+    return MIGRATIONS[-1].version if MIGRATIONS else 0
+
+
+def current_version(engine: Engine | None = None) -> int:
+    """적용된 최신 버전. schema_migrations 테이블이 없으면 0."""
+    engine = engine or get_engine()
+    try:
+        with engine.connect() as conn:
+            return conn.execute(select(func.max(schema_migrations.c.version))).scalar() or 0
+    except (OperationalError, ProgrammingError):
+        return 0
+
+
+def applied_migrations(engine: Engine | None = None) -> list[dict]:
+    """적용 이력 (version, name, applied_at) 목록."""
+    engine = engine or get_engine()
+    try:
+        with engine.connect() as conn:
+            rows = conn.execute(select(schema_migrations).order_by(schema_migrations.c.version)).mappings()
+            return [dict(row) for row in rows]
+    except (OperationalError, ProgrammingError):
+        return []
+
+
+def pending_migrations(engine: Engine | None = None) -> list[Migration]:
+    current = current_version(engine)
+    return [m for m in MIGRATIONS if m.version > current]
+
+
+def _lock(conn: Connection) -> None:
+    if conn.dialect.name == "postgresql":
+        conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _PG_LOCK_KEY})
+
+
+def _apply(engine: Engine, migration: Migration) -> bool:
+    """마이그레이션 1건을 한 트랜잭션에서 적용한다. 이미 적용되어 있으면 False."""
+    try:
+        with engine.begin() as conn:
+            _lock(conn)
+            exists = conn.execute(
+                select(schema_migrations.c.version).where(schema_migrations.c.version == migration.version)
+            ).first()
+            if exists is not None:
+                return False
+            conn.execute(insert(schema_migrations).values(
+                version=migration.version,
+                name=migration.name,
+                applied_at=datetime.now(timezone.utc),
+            ))
+            migration.upgrade(conn)
+    except IntegrityError:
+        # 다른 프로세스가 같은 버전을 먼저 적용함
+        return False
+    return True
+
+
+def run_seeds(engine: Engine) -> int:
+    """
+    기본 파라미터 시드. 없는 키만 삽입하므로 매 upgrade마다 실행하여
+    코드에 새로 추가된 기본값을 반영한다 (운영 중 변경된 값은 보호).
+    """
+    from app.infrastructure.experiment_config.defaults import seed_experiment_config
+    from app.infrastructure.task_params.defaults import seed_defaults
+    from app.infrastructure.trigger_config.defaults import seed_trigger_config  # [PRO-B-25]
+
+    with Session(bind=engine) as session:
+        return (
+            seed_defaults(session)
+            + seed_experiment_config(session)
+            + seed_trigger_config(session)  # [PRO-B-25]
+        )
+
+
+def upgrade(engine: Engine | None = None, target: int | None = None) -> list[Migration]:
+    """
+    target 버전(기본: 최신)까지 미적용 마이그레이션을 실행한 뒤 시드를 반영한다.
+    Returns: 이번 실행에서 적용한 마이그레이션 목록
+    """
+    engine = engine or get_engine()
+    _metadata.create_all(bind=engine)
+    applied: list[Migration] = []
+    for migration in pending_migrations(engine):
+        if target is not None and migration.version > target:
+            break
+        if _apply(engine, migration):
+            logger.info("마이그레이션 적용: %04d_%s", migration.version, migration.name)
+            applied.append(migration)
+    run_seeds(engine)
+    logger.info("스키마 버전: %d (최신 %d)", current_version(engine), latest_version())
+    return applied
+
+
+def ensure_schema(engine: Engine | None = None) -> None:
+    """
+    워커 시작 시 호출. 스키마가 최신이면 버전 조회 1회로 끝난다.
+    미적용 버전이 있으면 DB_AUTO_MIGRATE=true 일 때만 upgrade()를 실행하고, 아니면 기동을 중단한다.
+    """
+    engine = engine or get_engine()
+    current = current_version(engine)
+    if current >= latest_version():
+        logger.info("스키마 최신 상태 (version=%d)", current)
+        return
+    if not is_auto_migrate_enabled():
+        raise RuntimeError(
+            f"DB 스키마가 최신이 아닙니다 (현재 {current}, 최신 {latest_version()}). "
+            "배포 단계에서 'python -m app.core.migrations upgrade'를 실행하세요."
+        )
+    logger.info("미적용 마이그레이션 감지 (현재 %d → %d) — 자동 적용", current, latest_version())
+    upgrade(engine)
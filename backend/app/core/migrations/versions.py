@@ -0,0 +1,59 @@
+"""
+스키마 마이그레이션 목록.
+버전은 1부터 단조 증가하며, 한 번 배포된 마이그레이션은 수정하지 않고 새 버전을 추가한다.
+0001은 현재 모델 기준 create_all(없는 테이블만 생성)이므로 이후 마이그레이션은
+"이미 반영된 상태"에서도 안전하도록 존재 여부를 확인한 뒤 변경해야 한다.
+"""
+from dataclasses import dataclass
+from typing import Callable
+
+from sqlalchemy.engine import Connection
+
+from app.core.database import Base, import_models
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    upgrade: Callable[[Connection], None]
+
+
+def _initial_schema(conn: Connection) -> None:
+    """기준 스키마. 기존 DB의 테이블은 건드리지 않고 없는 테이블만 생성한다."""
+    import_models()
+    Base.metadata.create_all(bind=conn)
+
+
+def _task_composite_indexes(conn: Connection) -> None:
+    """tasks 복합/partial 인덱스 추가 및 대체된 단일 컬럼 인덱스 제거."""
+    from app.core.schema import sync_indexes
+
+    import_models()
+    sync_indexes(conn)
+
+
+def _behavior_log_task_event_index(conn: Connection) -> None:
+    """behavior_logs (task_id, event_at) 복합 인덱스 추가 및 task_id 단일 컬럼 인덱스 제거."""
+    from app.core.schema import sync_indexes
+
+    import_models()
+    sync_indexes(conn)
+
+
+def _behavior_summary_rollup(conn: Connection) -> None:
+    """behavior_summaries 롤업 테이블 생성 후 기존 behavior_logs로 백필."""
+    from app.infrastructure.task_tracking.models import BehaviorSummary
+    from app.infrastructure.task_tracking.rollup import rebuild_rollup
+
+    import_models()
+    BehaviorSummary.__table__.create(bind=conn, checkfirst=True)
+    rebuild_rollup(conn)
+
+
+MIGRATIONS: tuple[Migration, ...] = (
+    Migration(1, "initial_schema", _initial_schema),
+    Migration(2, "task_composite_indexes", _task_composite_indexes),
+    Migration(3, "behavior_log_task_event_index", _behavior_log_task_event_index),
+    Migration(4, "behavior_summary_rollup", _behavior_summary_rollup),
+)
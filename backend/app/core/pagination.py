@@ -0,0 +1,92 @@
+"""
+Keyset(커서) 페이지네이션 공통 유틸.
+정렬 키 (예: (due_date, id))의 마지막 값을 불투명 커서(base64url JSON)로 인코딩하고,
+다음 페이지는 OFFSET 없이 "정렬 키가 커서보다 뒤인 행" 조건으로 조회한다.
+조회 비용이 이력 크기와 무관하게 페이지 크기에 비례하도록 한다.
+"""
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Callable, Sequence, TypeVar
+
+from sqlalchemy import and_, or_
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+# 목록을 배열 그대로 반환하는 엔드포인트는 다음 페이지 커서를 이 응답 헤더로 전달한다
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+T = TypeVar("T")
+
+
+class InvalidCursorError(ValueError):
+    """디코드할 수 없거나 정렬 키 개수가 맞지 않는 커서."""
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict) and "dt" in value:
+        return datetime.fromisoformat(value["dt"])
+    return value
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """정렬 키 값 목록을 불투명 커서 문자열로 인코딩한다."""
+    raw = json.dumps([_encode_value(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> tuple[Any, ...]:
+    """커서를 정렬 키 값 튜플로 복원한다. 형식이 잘못되면 InvalidCursorError."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise InvalidCursorError("잘못된 커서입니다.") from e
+    if not isinstance(values, list) or len(values) != size:
+        raise InvalidCursorError("잘못된 커서입니다.")
+    try:
+        return tuple(_decode_value(v) for v in values)
+    except (TypeError, ValueError) as e:
+        raise InvalidCursorError("잘못된 커서입니다.") from e
+
+
+def clamp_limit(limit: int | None) -> int:
+    """페이지 크기를 1 ~ MAX_PAGE_SIZE 범위로 보정한다. None이면 기본값."""
+    if limit is None:
+        return DEFAULT_PAGE_SIZE
+    return max(1, min(limit, MAX_PAGE_SIZE))
+
+
+def after_cursor(columns: Sequence[Any], values: Sequence[Any], descending: bool = False) -> Any:
+    """
+    (c1, c2, ...) 가 커서 값보다 뒤(내림차순이면 앞)인 행 조건.
+    row-value 비교 대신 OR 전개형으로 생성하여 SQLite/PostgreSQL 모두에서 인덱스를 사용할 수 있게 한다.
+    """
+    clauses = []
+    for i, column in enumerate(columns):
+        prefix = [columns[j] == values[j] for j in range(i)]
+        step = column < values[i] if descending else column > values[i]
+        clauses.append(and_(*prefix, step))
+    return or_(*clauses)
+
+
+def order_by(columns: Sequence[Any], descending: bool = False) -> list[Any]:
+    return [c.desc() if descending else c.asc() for c in columns]
+
+
+def split_page(rows: list[T], limit: int, key: Callable[[T], Sequence[Any]]) -> tuple[list[T], str | None]:
+    """
+    limit + 1 건으로 조회한 결과를 (페이지, 다음 커서)로 나눈다.
+    다음 페이지가 없으면 커서는 None.
+    """
+    if len(rows) <= limit:
+        return rows, None
+    page = rows[:limit]
+    return page, encode_cursor(key(page[-1]))
@@ -2,42 +2,254 @@
 Redis 클라이언트 싱글톤.
 REDIS_URL 환경 변수가 없으면 localhost:6379/0 을 기본값으로 사용한다.
 Redis 연결 실패 시에도 애플리케이션은 정상 구동되며, 캐시 미스로 처리된다.
+비동기 서비스용으로 redis.asyncio 클라이언트(get_async_redis)를 함께 제공한다.
+
+- 커넥션 풀: 크기 제한(REDIS_MAX_CONNECTIONS) BlockingConnectionPool. 풀이 가득 차면
+  REDIS_POOL_TIMEOUT_MS 동안만 기다린다. 모든 명령에 소켓 타임아웃(REDIS_SOCKET_TIMEOUT_MS)을 둔다.
+- 서킷 브레이커: 연결·타임아웃 오류가 연속 REDIS_BREAKER_FAILURE_THRESHOLD회 나면 open.
+  open 동안 get_redis()/get_async_redis()는 None을 반환하여 호출부가 곧바로 DB 경로로 가고,
+  이미 받아 둔 클라이언트의 명령도 네트워크 없이 실패한다.
+- 헬스 체크: 백그라운드 스레드가 REDIS_HEALTH_CHECK_SECONDS 주기로 PING하여,
+  장애를 요청보다 먼저 감지하고 복구되면 브레이커를 닫아 Redis 사용을 재개한다.
+  기동 시 Redis가 없어도 복구 후 자동으로 연결된다.
 """
 import logging
 import os
+import threading
+from typing import Any, Optional
 
 import redis
+import redis.asyncio as aioredis
+from redis.asyncio.client import Pipeline as AsyncPipeline
+from redis.client import Pipeline
+
+from app.core.circuit_breaker import STATE_OPEN, CircuitBreaker
 
 logger = logging.getLogger(__name__)
 
-_client: redis.Redis | None = None
-_available: bool = False
+DEFAULT_MAX_CONNECTIONS = 50
+DEFAULT_POOL_TIMEOUT_MS = 200
+DEFAULT_SOCKET_TIMEOUT_MS = 500
+DEFAULT_CONNECT_TIMEOUT_MS = 2000
+DEFAULT_HEALTH_CHECK_SECONDS = 5.0
+DEFAULT_BREAKER_FAILURE_THRESHOLD = 3
+DEFAULT_BREAKER_RESET_SECONDS = 10.0
 
+_client: Optional[redis.Redis] = None
+_probe_client: Optional[redis.Redis] = None
+_async_client: Optional[aioredis.Redis] = None
+_init_lock = threading.Lock()
+_health_stop = threading.Event()
+_health_thread: Optional[threading.Thread] = None
 
-def get_redis() -> redis.Redis | None:
-    """Redis 클라이언트를 반환한다. 연결 불가 시 None."""
-    global _client, _available
-    if _client is None:
-        url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
-        try:
-            _client = redis.from_url(url, decode_responses=True, socket_connect_timeout=2)
-            _client.ping()
-            _available = True
-            logger.info("Redis 연결 성공: %s", url)
-        except Exception:
-            logger.warning("Redis 연결 실패 — 캐시 없이 동작합니다.")
-            _client = None
-            _available = False
-    return _client if _available else None
+
+def _get_url() -> str:
+    return os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+
+def get_max_connections() -> int:
+    """프로세스당 최대 Redis 커넥션 수 (동기·비동기 풀 각각)."""
+    return max(1, int(os.getenv("REDIS_MAX_CONNECTIONS", str(DEFAULT_MAX_CONNECTIONS))))
+
+
+def get_pool_timeout_ms() -> int:
+    """풀이 가득 찼을 때 커넥션을 기다리는 최대 시간(ms)."""
+    return max(0, int(os.getenv("REDIS_POOL_TIMEOUT_MS", str(DEFAULT_POOL_TIMEOUT_MS))))
+
+
+def get_socket_timeout_ms() -> int:
+    """명령 응답 대기 최대 시간(ms). 장애 시 요청이 기다리는 시간의 상한."""
+    return max(1, int(os.getenv("REDIS_SOCKET_TIMEOUT_MS", str(DEFAULT_SOCKET_TIMEOUT_MS))))
+
+
+def get_connect_timeout_ms() -> int:
+    return max(1, int(os.getenv("REDIS_CONNECT_TIMEOUT_MS", str(DEFAULT_CONNECT_TIMEOUT_MS))))
+
+
+def get_health_check_seconds() -> float:
+    """헬스 체크 PING 주기(초). 0 이하이면 헬스 체크 스레드를 띄우지 않는다."""
+    return float(os.getenv("REDIS_HEALTH_CHECK_SECONDS", str(DEFAULT_HEALTH_CHECK_SECONDS)))
+
+
+def get_breaker_failure_threshold() -> int:
+    return max(1, int(os.getenv("REDIS_BREAKER_FAILURE_THRESHOLD", str(DEFAULT_BREAKER_FAILURE_THRESHOLD))))
+
+
+def get_breaker_reset_seconds() -> float:
+    """브레이커가 열린 뒤 시험 호출을 허용하기까지의 시간(초)."""
+    return max(0.0, float(os.getenv("REDIS_BREAKER_RESET_SECONDS", str(DEFAULT_BREAKER_RESET_SECONDS))))
+
+
+# 연결·타임아웃 오류만 장애로 센다 (ResponseError 등은 Redis가 응답했다는 뜻)
+breaker = CircuitBreaker(
+    "redis",
+    failure_threshold=get_breaker_failure_threshold(),
+    reset_seconds=get_breaker_reset_seconds(),
+    failures=(redis.ConnectionError, redis.TimeoutError),
+)
+
+
+class _GuardedPipeline(Pipeline):
+    def execute(self, raise_on_error: bool = True) -> list[Any]:
+        return breaker.call(super().execute, raise_on_error)
+
+
+class _GuardedRedis(redis.Redis):
+    """모든 명령·파이프라인 결과를 서킷 브레이커에 기록하는 클라이언트."""
+
+    def execute_command(self, *args, **options):
+        return breaker.call(super().execute_command, *args, **options)
+
+    def pipeline(self, transaction: bool = True, shard_hint: Optional[str] = None) -> Pipeline:
+        return _GuardedPipeline(self.connection_pool, self.response_callbacks, transaction, shard_hint)
+
+
+class _GuardedAsyncPipeline(AsyncPipeline):
+    async def execute(self, raise_on_error: bool = True) -> list[Any]:
+        return await breaker.acall(super().execute, raise_on_error)
+
+
+class _GuardedAsyncRedis(aioredis.Redis):
+    async def execute_command(self, *args, **options):
+        return await breaker.acall(super().execute_command, *args, **options)
+
+    def pipeline(self, transaction: bool = True, shard_hint: Optional[str] = None) -> AsyncPipeline:
+        return _GuardedAsyncPipeline(self.connection_pool, self.response_callbacks, transaction, shard_hint)
+
+
+def _pool_kwargs() -> dict[str, Any]:
+    return {
+        "decode_responses": True,
+        "max_connections": get_max_connections(),
+        "timeout": get_pool_timeout_ms() / 1000,
+        "socket_timeout": get_socket_timeout_ms() / 1000,
+        "socket_connect_timeout": get_connect_timeout_ms() / 1000,
+    }
+
+
+def _ensure_client() -> redis.Redis:
+    """클라이언트를 만든다 (최초 1회 PING, 실패 시 브레이커 open). 브레이커 상태와 무관하게 호출된다."""
+    global _client, _probe_client
+    if _client is not None:
+        return _client
+    with _init_lock:
+        if _client is None:
+            url = _get_url()
+            pool = redis.BlockingConnectionPool.from_url(url, **_pool_kwargs())
+            # 헬스 체크용: 같은 풀을 쓰되 브레이커를 거치지 않는다
+            _probe_client = redis.Redis(connection_pool=pool)
+            _client = _GuardedRedis(connection_pool=pool)
+            try:
+                _probe_client.ping()
+                logger.info("Redis 연결 성공: %s (max_connections=%d)", url, get_max_connections())
+            except Exception as e:
+                breaker.trip(e)
+                logger.warning("Redis 연결 실패 — 복구될 때까지 캐시 없이 동작합니다.")
+    return _client
+
+
+def get_redis() -> Optional[redis.Redis]:
+    """Redis 클라이언트를 반환한다. 연결 불가(브레이커 open) 시 None."""
+    if not breaker.allow():
+        return None
+    client = _ensure_client()
+    # 최초 연결에서 PING이 실패했으면 이번 호출부터 곧바로 DB 경로로 보낸다
+    return client if breaker.state != STATE_OPEN else None
 
 
 def close_redis() -> None:
-    """Redis 연결을 종료한다."""
-    global _client, _available
+    """헬스 체크를 멈추고 Redis 연결을 종료한다."""
+    global _client, _probe_client
+    stop_health_check()
     if _client is not None:
         try:
             _client.close()
+            _client.connection_pool.disconnect()
         except Exception:
             pass
         _client = None
-        _available = False
+        _probe_client = None
+
+
+async def get_async_redis() -> Optional[aioredis.Redis]:
+    """비동기 Redis 클라이언트를 반환한다. 연결 불가(브레이커 open) 시 None. 상태는 동기 클라이언트와 공유한다."""
+    global _async_client
+    if not breaker.allow():
+        return None
+    if _async_client is None:
+        pool = aioredis.BlockingConnectionPool.from_url(_get_url(), **_pool_kwargs())
+        _async_client = _GuardedAsyncRedis(connection_pool=pool)
+    return _async_client
+
+
+async def close_async_redis() -> None:
+    """비동기 Redis 연결을 종료한다."""
+    global _async_client
+    if _async_client is not None:
+        try:
+            await _async_client.aclose()
+            await _async_client.connection_pool.disconnect()
+        except Exception:
+            pass
+        _async_client = None
+
+
+def check_health() -> bool:
+    """브레이커를 거치지 않고 PING하여 결과를 브레이커에 기록한다. Returns: 정상 여부"""
+    _ensure_client()
+    probe = _probe_client
+    if probe is None:
+        # 테스트 등에서 _client를 직접 주입한 경우
+        probe = _client
+    try:
+        probe.ping()
+    except Exception as e:
+        breaker.record_failure(e)
+        return False
+    breaker.record_success()
+    return True
+
+
+def start_health_check() -> None:
+    """헬스 체크 스레드를 시작한다. 앱 lifespan에서 호출."""
+    global _health_thread
+    interval = get_health_check_seconds()
+    if interval <= 0 or _health_thread is not None:
+        return
+    _health_stop.clear()
+    _health_thread = threading.Thread(target=_health_loop, args=(interval,), name="redis-health", daemon=True)
+    _health_thread.start()
+
+
+def stop_health_check() -> None:
+    global _health_thread
+    _health_stop.set()
+    if _health_thread is not None:
+        _health_thread.join(timeout=3)
+        _health_thread = None
+
+
+def _health_loop(interval: float) -> None:
+    while not _health_stop.wait(interval):
+        try:
+            check_health()
+        except Exception:
+            logger.warning("Redis 헬스 체크 실패", exc_info=True)
+
+
+def get_redis_stats() -> dict[str, Any]:
+    """브레이커 상태와 동기 풀 사용량."""
+    pool_stats: dict[str, Any] = {"max_connections": get_max_connections(), "created": None, "in_use": None}
+    pool = getattr(_client, "connection_pool", None)
+    if isinstance(pool, redis.BlockingConnectionPool):
+        try:
+            created = len(pool._connections)
+            idle = sum(1 for conn in list(pool.pool.queue) if conn is not None)
+            pool_stats.update(created=created, in_use=created - idle)
+        except Exception:
+            pass
+    return {
+        **breaker.snapshot(),
+        "health_check_running": _health_thread is not None and _health_thread.is_alive(),
+        "pool": pool_stats,
+    }
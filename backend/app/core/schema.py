@@ -0,0 +1,48 @@
+"""
+기존 DB 스키마 보정 유틸.
+create_all은 이미 존재하는 테이블에 새 인덱스를 추가하지 않으므로,
+모델에 선언된 인덱스 중 DB에 없는 것을 생성하고 복합 인덱스로 대체된 인덱스(OBSOLETE_INDEXES)를 제거한다.
+모든 작업은 존재 여부를 확인한 뒤 수행하므로 여러 번 실행해도 결과가 같다.
+"""
+import logging
+
+from sqlalchemy import Index, inspect
+from sqlalchemy.engine import Connection
+from sqlalchemy.schema import DropIndex
+
+from app.core.database import Base
+
+logger = logging.getLogger(__name__)
+
+# 테이블별로 더 이상 모델에 없는(복합 인덱스가 대신하는) 인덱스
+OBSOLETE_INDEXES: dict[str, tuple[str, ...]] = {
+    # ix_tasks_user_due(user_id, due_date, is_archived, status)가 대체
+    "tasks": ("ix_tasks_user_id", "ix_tasks_is_archived", "ix_tasks_status"),
+    # ix_behavior_logs_task_event(task_id, event_at)가 대체
+    "behavior_logs": ("ix_behavior_logs_task_id",),
+}
+
+
+def sync_indexes(conn: Connection) -> list[str]:
+    """
+    모델 인덱스를 DB에 반영한다. 존재하지 않는 테이블은 건너뛴다(create_all 대상).
+    호출자의 트랜잭션 안에서 실행된다.
+    Returns: 수행한 작업 목록 (예: "create ix_tasks_user_due", "drop ix_tasks_user_id")
+    """
+    applied: list[str] = []
+    inspector = inspect(conn)
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {ix["name"] for ix in inspector.get_indexes(table.name)}
+        for name in OBSOLETE_INDEXES.get(table.name, ()):
+            if name in existing:
+                conn.execute(DropIndex(Index(name)))
+                applied.append(f"drop {name}")
+        for index in table.indexes:
+            if index.name not in existing:
+                index.create(conn)
+                applied.append(f"create {index.name}")
+    for action in applied:
+        logger.info("인덱스 보정: %s", action)
+    return applied
@@ -0,0 +1,178 @@
+"""
+캐시 스탬피드(동시 미스) 방지 도구.
+캐시 키가 한꺼번에 비워졌을 때 동시에 들어온 요청이 각자 집계하지 않도록 한다.
+
+- SingleFlight / AsyncSingleFlight: 프로세스 내 같은 키의 동시 호출을 1회 실행으로 합친다.
+- acquire_short_lock / release_short_lock: Redis SET NX PX 단기 락으로 프로세스 간 집계를 1회로 제한한다.
+  락을 얻지 못한 쪽은 wait_for_value로 캐시가 채워지기를 기다리고, 락 TTL이 지나면 직접 집계한다.
+- should_refresh_early: 만료 전 확률적 조기 갱신 (XFetch). 남은 TTL이 집계 시간에 비해 짧을수록
+  조기 갱신 확률이 올라가, 만료 시점에 요청이 몰려도 미리 1회만 재집계된다.
+"""
+import asyncio
+import logging
+import math
+import os
+import random
+import threading
+import time
+import uuid
+from typing import Awaitable, Callable, Generic, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_LOCK_TTL_MS = 3000
+DEFAULT_EARLY_REFRESH_BETA = 1.0
+WAIT_INTERVAL_SECONDS = 0.05
+
+# 소유자 토큰이 일치할 때만 삭제 (TTL 만료 후 다른 프로세스가 잡은 락을 지우지 않는다)
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+def get_lock_ttl_ms() -> int:
+    """집계 단기 락 TTL(ms). 락을 얻지 못한 요청의 최대 대기 시간이기도 하다."""
+    return max(100, int(os.getenv("CACHE_LOCK_TTL_MS", str(DEFAULT_LOCK_TTL_MS))))
+
+
+def get_early_refresh_beta() -> float:
+    """조기 갱신 강도. 0이면 조기 갱신하지 않고, 클수록 더 일찍 갱신한다."""
+    return max(0.0, float(os.getenv("CACHE_EARLY_REFRESH_BETA", str(DEFAULT_EARLY_REFRESH_BETA))))
+
+
+class _Call(Generic[T]):
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Optional[T] = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight(Generic[T]):
+    """스레드 간 같은 키의 동시 호출을 합친다. 먼저 들어온 호출만 fn을 실행하고 나머지는 결과를 공유한다."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[str, _Call[T]] = {}
+
+    def do(self, key: str, fn: Callable[[], T]) -> tuple[T, bool]:
+        """Returns: (결과, 다른 호출의 결과를 공유했는지 여부)"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True  # type: ignore[return-value]
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.result, False
+
+
+class AsyncSingleFlight(Generic[T]):
+    """이벤트 루프 내 같은 키의 동시 호출을 합친다."""
+
+    def __init__(self) -> None:
+        self._calls: dict[str, asyncio.Future] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> tuple[T, bool]:
+        future = self._calls.get(key)
+        if future is not None:
+            return await asyncio.shield(future), True
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await fn()
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # 대기자가 없어도 미회수 예외 경고가 나지 않도록 표시
+            raise
+        finally:
+            self._calls.pop(key, None)
+        future.set_result(result)
+        return result, False
+
+
+def acquire_short_lock(client, key: str, ttl_ms: Optional[int] = None) -> Optional[str]:
+    """단기 락을 시도한다. 획득하면 해제용 토큰, 이미 다른 프로세스가 보유 중이면 None."""
+    token = uuid.uuid4().hex
+    try:
+        if client.set(key, token, nx=True, px=ttl_ms or get_lock_ttl_ms()):
+            return token
+        return None
+    except Exception:
+        logger.warning("단기 락 획득 실패 key=%s — 락 없이 진행", key, exc_info=True)
+        return token
+
+
+def release_short_lock(client, key: str, token: str) -> None:
+    try:
+        client.eval(_RELEASE_SCRIPT, 1, key, token)
+    except Exception:
+        logger.warning("단기 락 해제 실패 key=%s", key, exc_info=True)
+
+
+async def acquire_short_lock_async(client, key: str, ttl_ms: Optional[int] = None) -> Optional[str]:
+    token = uuid.uuid4().hex
+    try:
+        if await client.set(key, token, nx=True, px=ttl_ms or get_lock_ttl_ms()):
+            return token
+        return None
+    except Exception:
+        logger.warning("단기 락 획득 실패 key=%s — 락 없이 진행", key, exc_info=True)
+        return token
+
+
+async def release_short_lock_async(client, key: str, token: str) -> None:
+    try:
+        await client.eval(_RELEASE_SCRIPT, 1, key, token)
+    except Exception:
+        logger.warning("단기 락 해제 실패 key=%s", key, exc_info=True)
+
+
+def wait_for_value(read: Callable[[], Optional[T]], timeout_ms: Optional[int] = None) -> Optional[T]:
+    """락 보유자가 캐시를 채울 때까지 폴링한다. 시간 내에 채워지지 않으면 None."""
+    deadline = time.monotonic() + (timeout_ms or get_lock_ttl_ms()) / 1000
+    while time.monotonic() < deadline:
+        time.sleep(WAIT_INTERVAL_SECONDS)
+        value = read()
+        if value is not None:
+            return value
+    return None
+
+
+async def wait_for_value_async(
+    read: Callable[[], Awaitable[Optional[T]]], timeout_ms: Optional[int] = None
+) -> Optional[T]:
+    deadline = time.monotonic() + (timeout_ms or get_lock_ttl_ms()) / 1000
+    while time.monotonic() < deadline:
+        await asyncio.sleep(WAIT_INTERVAL_SECONDS)
+        value = await read()
+        if value is not None:
+            return value
+    return None
+
+
+def should_refresh_early(ttl_remaining_ms: float, compute_ms: float, beta: Optional[float] = None) -> bool:
+    """
+    XFetch: compute_ms * beta * -ln(U) >= 남은 TTL 이면 만료 전에 미리 재집계한다.
+    집계가 오래 걸리는 키일수록, 만료가 가까울수록 갱신 확률이 높다.
+    """
+    beta = get_early_refresh_beta() if beta is None else beta
+    if beta <= 0 or compute_ms <= 0 or ttl_remaining_ms < 0:
+        return False
+    return compute_ms * beta * -math.log(1.0 - random.random()) >= ttl_remaining_ms
@@ -0,0 +1,164 @@
+"""2계층 캐시 네임스페이스·무효화 버스 단위 테스트 — 로컬/Redis 계층 일관성, 조건부 쓰기, 장애 시 로컬 대체, pub/sub."""
+
+import threading
+import time
+
+import pytest
+import redis
+
+from app.core import redis as redis_module
+from app.core.cache import INT, CacheNamespace, InvalidationBus
+
+counter = CacheNamespace("test_counter", "test:{id}:count", INT, ttl_seconds=100, local_ttl_seconds=60)
+
+
+@pytest.fixture(autouse=True)
+def _clear_local():
+    counter.clear_local()
+    yield
+    counter.clear_local()
+
+
+def _local(ident):
+    return counter._local.get(counter.key(ident))
+
+
+def test_set_nx_keeps_tiers_consistent(fake_redis):
+    fake_redis.set(counter.key(1), "10")  # 다른 프로세스가 먼저 쓴 값
+
+    assert counter.set_many({1: 1, 2: 2}, nx=True) == 1
+
+    assert _local(1) is None
+    assert _local(2) == 2
+    assert counter.get_many([1, 2]) == [10, 2]
+    assert fake_redis.get(counter.key(2)) == "2"
+
+
+def test_set_nx_drops_stale_local_value(fake_redis):
+    counter.set(1, 1)
+    fake_redis.set(counter.key(1), "7")  # 로컬은 1을 들고 있는 채로 다른 프로세스가 갱신
+
+    assert counter.set(1, 2, nx=True) is False
+
+    assert _local(1) is None
+    assert counter.get(1) == 7
+
+
+def test_incr_only_if_exists_skips_missing_keys(fake_redis):
+    counter.set(1, 5)
+
+    counter.incr({1: 2, 2: 3})
+
+    assert counter.get_many([1, 2]) == [7, None]
+    assert fake_redis.exists(counter.key(2)) == 0
+
+    counter.incr({2: 3}, only_if_exists=False)
+    assert counter.get(2) == 3
+
+
+def test_compare_and_set_preserves_ttl(fake_redis):
+    counter.set_many({1: 5, 2: 5}, ttl=100)
+    fake_redis.expire(counter.key(2), 30)
+
+    assert counter.compare_and_set([(1, 5, 9), (2, 4, 9)]) == 1
+
+    assert counter.get_many([1, 2]) == [9, 5]
+    assert 0 < fake_redis.ttl(counter.key(1)) <= 100
+    assert 0 < fake_redis.ttl(counter.key(2)) <= 30
+
+
+def test_set_max_keeps_greater_value(fake_redis):
+    counter.set(1, 5)
+
+    assert counter.set_max_many({1: 3, 2: 4}) == 1
+    assert counter.get_many([1, 2]) == [5, 4]
+    assert counter.set_max_many({1: 8}) == 1
+    assert counter.get(1, use_local=False) == 8
+
+
+def test_writes_fall_back_to_local_tier_only_when_redis_is_down(fake_redis):
+    redis_module.breaker.trip(redis.ConnectionError("down"))
+
+    assert counter.set(1, 3) is True
+    assert counter.set(1, 4, nx=True) is False
+    assert counter.get(1) == 3
+    assert fake_redis.exists(counter.key(1)) == 0
+
+
+def test_remote_error_does_not_write_local_tier(fake_redis, monkeypatch):
+    """Redis가 살아 있는데 쓰기가 실패하면 로컬에만 쓰지 않는다 (다른 프로세스와 어긋난 값이 남지 않도록)."""
+    counter.set(1, 1)
+
+    def broken_pipeline(*args, **kwargs):
+        raise redis.ResponseError("OOM command not allowed")
+
+    monkeypatch.setattr(fake_redis, "pipeline", broken_pipeline)
+
+    assert counter.set(1, 2) is False
+    assert _local(1) is None
+    assert counter.stats()["errors"] >= 1
+
+
+def test_invalidate_removes_both_tiers(fake_redis):
+    counter.set_many({1: 1, 2: 2})
+
+    counter.invalidate(1)
+
+    assert _local(1) is None
+    assert fake_redis.exists(counter.key(1)) == 0
+    assert counter.get(2) == 2
+
+
+def test_remote_invalidation_drops_local_keys():
+    counter._write_local_only([(counter.key(1), 1), (counter.key(2), 2)], ttl=100, nx=False)
+
+    counter._on_remote_invalidate([counter.key(1)])
+    assert (_local(1), _local(2)) == (None, 2)
+
+    counter._on_remote_invalidate(None)
+    assert _local(2) is None
+
+
+def test_bus_ignores_its_own_messages():
+    bus, other = InvalidationBus(), InvalidationBus()
+    received = []
+    bus.register("ns", received.append)
+
+    bus._handle(bus._encode("ns", ["k1"]))
+    bus._handle("not json")
+    assert received == []
+    assert bus.received == 0
+
+    bus._handle(other._encode("ns", ["k2"]))
+    bus._handle(other._encode("unknown", ["k3"]))
+    assert received == [["k2"]]
+    assert bus.received == 2
+
+
+def test_bus_delivers_published_keys_to_other_process(fake_redis):
+    publisher, subscriber = InvalidationBus("test:invalidate"), InvalidationBus("test:invalidate")
+    received: list = []
+    arrived = threading.Event()
+
+    def handler(keys):
+        received.append(keys)
+        if keys is not None:
+            arrived.set()
+
+    subscriber.register("ns", handler)
+    publisher.register("ns", handler)
+    subscriber.start()
+    try:
+        # 구독 시작 시 놓친 메시지 대비로 모든 로컬 계층을 비운다 (keys=None)
+        for _ in range(100):
+            if received:
+                break
+            time.sleep(0.02)
+        assert received == [None]
+
+        publisher.publish("ns", ["k1"])
+
+        assert arrived.wait(timeout=5)
+        assert received == [None, ["k1"]]
+    finally:
+        subscriber.stop()
@@ -0,0 +1,156 @@
+"""서킷 브레이커 단위 테스트 — 상태 전이(closed → open → half_open → closed), 실패 분류, Redis 클라이언트 연동."""
+
+import asyncio
+
+import pytest
+import redis
+
+from app.core import redis as redis_module
+from app.core.circuit_breaker import (
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+)
+
+
+def _breaker(failure_threshold: int = 2, reset_seconds: float = 60) -> CircuitBreaker:
+    return CircuitBreaker("test", failure_threshold, reset_seconds, failures=(ConnectionError,))
+
+
+def _fail() -> None:
+    raise ConnectionError("down")
+
+
+def _trip(breaker: CircuitBreaker) -> None:
+    for _ in range(breaker.failure_threshold):
+        with pytest.raises(ConnectionError):
+            breaker.call(_fail)
+
+
+def test_opens_after_consecutive_failures():
+    breaker = _breaker(failure_threshold=3)
+
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            breaker.call(_fail)
+    assert breaker.state == STATE_CLOSED
+
+    with pytest.raises(ConnectionError):
+        breaker.call(_fail)
+    assert breaker.state == STATE_OPEN
+    assert breaker.snapshot()["opened_total"] == 1
+
+
+def test_success_resets_consecutive_failures():
+    breaker = _breaker(failure_threshold=2)
+
+    with pytest.raises(ConnectionError):
+        breaker.call(_fail)
+    assert breaker.call(lambda: "ok") == "ok"
+    with pytest.raises(ConnectionError):
+        breaker.call(_fail)
+
+    assert breaker.state == STATE_CLOSED
+    assert breaker.snapshot()["consecutive_failures"] == 1
+
+
+def test_other_exceptions_are_not_failures():
+    breaker = _breaker(failure_threshold=1)
+
+    def bad_reply() -> None:
+        raise ValueError("bad reply")
+
+    with pytest.raises(ValueError):
+        breaker.call(bad_reply)
+
+    assert breaker.state == STATE_CLOSED
+    assert breaker.snapshot()["consecutive_failures"] == 0
+
+
+def test_open_breaker_short_circuits_without_calling():
+    breaker = _breaker()
+    _trip(breaker)
+    calls = []
+
+    assert breaker.allow() is False
+    with pytest.raises(CircuitOpenError):
+        breaker.call(lambda: calls.append(True))
+
+    assert calls == []
+    assert breaker.snapshot()["short_circuited"] == 2
+    assert breaker.snapshot()["retry_in_seconds"] > 0
+
+
+def test_half_open_success_closes():
+    breaker = _breaker(reset_seconds=0)
+    _trip(breaker)
+
+    assert breaker.allow() is True
+    assert breaker.state == STATE_HALF_OPEN
+    assert breaker.call(lambda: "ok") == "ok"
+
+    assert breaker.state == STATE_CLOSED
+    assert breaker.snapshot()["consecutive_failures"] == 0
+
+
+def test_half_open_failure_reopens_immediately():
+    breaker = _breaker(failure_threshold=5, reset_seconds=0)
+    breaker.trip(ConnectionError("startup"))
+
+    assert breaker.allow() is True
+    with pytest.raises(ConnectionError):
+        breaker.call(_fail)
+
+    assert breaker.state == STATE_OPEN
+    assert breaker.snapshot()["opened_total"] == 2
+
+
+def test_async_call_is_recorded():
+    breaker = _breaker(failure_threshold=1)
+
+    async def fail():
+        raise ConnectionError("down")
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(breaker.acall(fail))
+    assert breaker.state == STATE_OPEN
+
+
+@pytest.fixture
+def redis_breaker(monkeypatch):
+    breaker = CircuitBreaker(
+        "redis", failure_threshold=2, reset_seconds=60, failures=(redis.ConnectionError, redis.TimeoutError)
+    )
+    monkeypatch.setattr(redis_module, "breaker", breaker)
+    return breaker
+
+
+def test_unreachable_redis_opens_breaker_and_get_redis_returns_none(monkeypatch, redis_breaker):
+    pool = redis.ConnectionPool.from_url("redis://127.0.0.1:1/0", socket_connect_timeout=0.05)
+    client = redis_module._GuardedRedis(connection_pool=pool)
+    monkeypatch.setattr(redis_module, "_client", client)
+    monkeypatch.setattr(redis_module, "_probe_client", redis.Redis(connection_pool=pool))
+
+    assert redis_module.get_redis() is client
+    for _ in range(2):
+        with pytest.raises(redis.ConnectionError):
+            client.get("key")
+
+    assert redis_breaker.state == STATE_OPEN
+    assert redis_module.get_redis() is None
+    with pytest.raises(CircuitOpenError):
+        client.get("key")
+    assert redis_module.check_health() is False
+    assert redis_breaker.state == STATE_OPEN
+
+
+def test_health_check_success_closes_open_breaker(fake_redis):
+    redis_module.breaker.trip(redis.ConnectionError("down"))
+    assert redis_module.get_redis() is None
+
+    assert redis_module.check_health() is True
+
+    assert redis_module.breaker.state == STATE_CLOSED
+    assert redis_module.get_redis() is fake_redis
@@ -0,0 +1,74 @@
+"""요청 단위 세션(get_db·session_scope) 단위 테스트 — 세션 공유, 명시적 커밋, 미커밋 쓰기 롤백."""
+
+import logging
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db, session_scope
+from app.infrastructure.task_tracking.models import BehaviorSummary
+
+
+def _summary(user_id: str) -> BehaviorSummary:
+    return BehaviorSummary(user_id=user_id, event_type="keep", count=1, latency_sum=0.0, latency_count=0)
+
+
+def _stored(user_id: str) -> int:
+    with session_scope() as session:
+        return session.scalar(select(func.count()).where(BehaviorSummary.user_id == user_id))
+
+
+@pytest.fixture
+def app_client(migrated_db):
+    app = FastAPI()
+
+    @app.post("/commit")
+    def write_and_commit(db: Session = Depends(get_db)):
+        with session_scope() as session:
+            shared = session is db
+            session.add(_summary("committed"))
+        db.commit()
+        return {"shared": shared}
+
+    @app.post("/forgot-commit")
+    def write_without_commit(db: Session = Depends(get_db)):
+        with session_scope() as session:
+            session.add(_summary("uncommitted"))
+        return {"ok": True}
+
+    @app.post("/fail")
+    def write_then_fail(db: Session = Depends(get_db)):
+        db.add(_summary("failed"))
+        db.flush()
+        raise RuntimeError("boom")
+
+    with TestClient(app, raise_server_exceptions=False) as client:
+        yield client
+
+
+def test_services_share_request_session_and_router_commits(app_client):
+    assert app_client.post("/commit").json() == {"shared": True}
+    assert _stored("committed") == 1
+
+
+def test_uncommitted_request_writes_are_rolled_back(app_client, caplog):
+    with caplog.at_level(logging.WARNING, logger="app.core.database"):
+        assert app_client.post("/forgot-commit").status_code == 200
+
+    assert _stored("uncommitted") == 0
+    assert "db.commit()" in caplog.text
+
+
+def test_exception_rolls_back(app_client):
+    assert app_client.post("/fail").status_code == 500
+    assert _stored("failed") == 0
+
+
+def test_session_scope_outside_request_commits(migrated_db):
+    with session_scope() as session:
+        session.add(_summary("background"))
+
+    assert _stored("background") == 1
@@ -0,0 +1,102 @@
+"""스케줄러 리더 선출 단위 테스트 — 백엔드 선택, 리더 이양."""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.core import leader
+from app.core.leader import (
+    BACKEND_FILE,
+    BACKEND_NONE,
+    BACKEND_POSTGRES,
+    BACKEND_REDIS,
+    FileLockBackend,
+    LeaderElector,
+    RedisLeaseBackend,
+    resolve_backend_name,
+)
+
+
+def _wait_until(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return predicate()
+
+
+@pytest.fixture
+def dialect(monkeypatch):
+    """get_engine().dialect.name을 바꾼다 (드라이버 없이 PostgreSQL 설정을 흉내)."""
+
+    def use(name: str) -> None:
+        engine = SimpleNamespace(dialect=SimpleNamespace(name=name))
+        monkeypatch.setattr(leader, "get_engine", lambda: engine)
+
+    use("sqlite")
+    return use
+
+
+def test_auto_uses_redis_when_redis_url_is_configured(monkeypatch, dialect):
+    monkeypatch.setenv("REDIS_URL", "redis://cache:6379/0")
+    dialect("postgresql")
+
+    assert resolve_backend_name("auto") == BACKEND_REDIS
+
+
+def test_auto_without_redis_url_uses_database(monkeypatch, dialect):
+    monkeypatch.delenv("REDIS_URL", raising=False)
+
+    assert resolve_backend_name("auto") == BACKEND_FILE
+    dialect("postgresql")
+    assert resolve_backend_name("auto") == BACKEND_POSTGRES
+
+
+def test_explicit_backend_is_kept(monkeypatch, dialect):
+    monkeypatch.setenv("REDIS_URL", "redis://cache:6379/0")
+
+    for name in (BACKEND_REDIS, BACKEND_POSTGRES, BACKEND_FILE, BACKEND_NONE):
+        assert resolve_backend_name(name) == name
+
+
+def test_unreachable_redis_does_not_fall_back(monkeypatch, dialect):
+    """REDIS_URL이 설정되어 있으면 Redis가 닿지 않아도 redis 백엔드를 유지하고 리더가 되지 않는다."""
+    monkeypatch.setenv("SCHEDULER_LEADER_BACKEND", "auto")
+    monkeypatch.setattr(leader, "get_redis", lambda: None)
+    elected = []
+    elector = LeaderElector(on_elected=lambda: elected.append(True), on_revoked=lambda: None)
+
+    elector._tick()
+
+    assert isinstance(elector.backend, RedisLeaseBackend)
+    assert not elector.is_leader
+    assert elected == []
+
+
+def test_file_lock_hands_over_when_leader_stops(tmp_path, monkeypatch):
+    monkeypatch.setenv("SCHEDULER_LEADER_RENEW_SECONDS", "0.5")
+    path = str(tmp_path / "leader.lock")
+    events: list[str] = []
+
+    def elector(name: str) -> LeaderElector:
+        return LeaderElector(
+            on_elected=lambda: events.append(f"{name}+"),
+            on_revoked=lambda: events.append(f"{name}-"),
+            backend=FileLockBackend(path, name),
+        )
+
+    first, second = elector("a"), elector("b")
+    first.start()
+    second.start()
+    try:
+        assert first.is_leader and not second.is_leader
+        assert second.current_leader() == "a"
+
+        first.stop()
+        assert _wait_until(lambda: second.is_leader)
+        assert second.current_leader() == "b"
+        assert events == ["a+", "a-", "b+"]
+    finally:
+        second.stop()
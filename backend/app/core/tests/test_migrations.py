@@ -0,0 +1,86 @@
+"""버전 기반 마이그레이션 실행기 단위 테스트 — 버전 순서, 멱등성, target, 기동 시 버전 확인."""
+
+import pytest
+from sqlalchemy import inspect, text
+
+from app.core.database import get_engine
+from app.core.migrations import MIGRATIONS, current_version, ensure_schema, latest_version, pending_migrations, upgrade
+from app.core.migrations.runner import _apply, applied_migrations
+
+
+def test_versions_start_at_one_and_increase_by_one():
+    assert [m.version for m in MIGRATIONS] == list(range(1, len(MIGRATIONS) + 1))
+    assert len({m.name for m in MIGRATIONS}) == len(MIGRATIONS)
+    assert latest_version() == MIGRATIONS[-1].version
+
+
+def test_empty_database_is_version_zero(database_url):
+    assert current_version() == 0
+    assert [m.version for m in pending_migrations()] == [m.version for m in MIGRATIONS]
+
+
+def test_upgrade_applies_all_once(database_url):
+    applied = upgrade()
+
+    assert [m.version for m in applied] == [m.version for m in MIGRATIONS]
+    assert current_version() == latest_version()
+    assert pending_migrations() == []
+    assert upgrade() == []
+    assert [row["version"] for row in applied_migrations()] == [m.version for m in MIGRATIONS]
+
+
+def test_upgrade_to_target_then_rest(database_url):
+    assert [m.version for m in upgrade(target=2)] == [1, 2]
+    assert current_version() == 2
+    assert [m.version for m in pending_migrations()] == [m.version for m in MIGRATIONS[2:]]
+
+    assert [m.version for m in upgrade()] == [m.version for m in MIGRATIONS[2:]]
+    assert current_version() == latest_version()
+
+
+def test_already_applied_version_is_skipped(migrated_db):
+    assert _apply(get_engine(), MIGRATIONS[0]) is False
+    assert len(applied_migrations()) == len(MIGRATIONS)
+
+
+def test_legacy_schema_is_upgraded_in_place(database_url):
+    """runner 도입 전 create_all로 만든 DB: 기존 테이블·데이터를 유지한 채 인덱스를 교체하고 롤업을 백필한다."""
+    with get_engine().begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE behavior_logs (id INTEGER PRIMARY KEY, task_id INTEGER NOT NULL, "
+            "user_id VARCHAR(100) NOT NULL, event_type VARCHAR(50) NOT NULL, experiment_id VARCHAR(100), "
+            "experiment_group VARCHAR(50), event_at DATETIME NOT NULL, previous_event_at DATETIME, "
+            "latency_ms FLOAT, metadata_json TEXT, created_at DATETIME DEFAULT CURRENT_TIMESTAMP)"
+        ))
+        conn.execute(text("CREATE INDEX ix_behavior_logs_task_id ON behavior_logs (task_id)"))
+        conn.execute(text(
+            "INSERT INTO behavior_logs (task_id, user_id, event_type, event_at, latency_ms) VALUES "
+            "(1, 'u1', 'keep', '2025-01-01 00:00:00', NULL), (1, 'u1', 'keep', '2025-01-01 00:00:01', 1000.0)"
+        ))
+
+    upgrade()
+
+    indexes = {index["name"] for index in inspect(get_engine()).get_indexes("behavior_logs")}
+    assert "ix_behavior_logs_task_event" in indexes
+    assert "ix_behavior_logs_task_id" not in indexes
+    with get_engine().connect() as conn:
+        assert conn.execute(
+            text("SELECT count, latency_sum, latency_count FROM behavior_summaries WHERE user_id = 'u1'")
+        ).one() == (2, 1000.0, 1)
+
+
+def test_ensure_schema_refuses_outdated_database_without_auto_migrate(database_url, monkeypatch):
+    monkeypatch.setenv("DB_AUTO_MIGRATE", "false")
+
+    with pytest.raises(RuntimeError):
+        ensure_schema()
+    assert current_version() == 0
+
+
+def test_ensure_schema_auto_migrates_then_only_checks_version(database_url, monkeypatch):
+    monkeypatch.setenv("DB_AUTO_MIGRATE", "true")
+    ensure_schema()
+    assert current_version() == latest_version()
+
+    monkeypatch.setenv("DB_AUTO_MIGRATE", "false")
+    ensure_schema()
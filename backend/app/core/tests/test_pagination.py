@@ -0,0 +1,70 @@
+"""Keyset 페이지네이션 유틸 단위 테스트 — 커서 인코딩·디코딩, 페이지 경계."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from app.core.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    InvalidCursorError,
+    clamp_limit,
+    decode_cursor,
+    encode_cursor,
+    split_page,
+)
+
+
+def test_cursor_round_trip_keeps_types():
+    values = (datetime(2025, 3, 1, 9, 30, 15, 123456, tzinfo=timezone.utc), 42, "abc", None)
+
+    cursor = encode_cursor(values)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor, len(values)) == values
+
+
+def test_cursor_round_trip_naive_datetime():
+    values = (datetime(2025, 3, 1, 9, 30), 7)
+
+    assert decode_cursor(encode_cursor(values), 2) == values
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!!", "", encode_cursor([1])[:-1] + "@", "e30"])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, 1)
+
+
+def test_cursor_with_wrong_key_size_is_rejected():
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(encode_cursor((1, 2)), 3)
+
+
+def test_cursor_with_bad_datetime_is_rejected():
+    import base64
+
+    cursor = base64.urlsafe_b64encode(b'[{"dt":"yesterday"},1]').decode().rstrip("=")
+
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, 2)
+
+
+def test_clamp_limit():
+    assert clamp_limit(None) == DEFAULT_PAGE_SIZE
+    assert clamp_limit(0) == 1
+    assert clamp_limit(-5) == 1
+    assert clamp_limit(10) == 10
+    assert clamp_limit(MAX_PAGE_SIZE + 1) == MAX_PAGE_SIZE
+
+
+def test_split_page_boundaries():
+    rows = [(i, f"row{i}") for i in range(5)]
+
+    assert split_page(rows[:3], 3, lambda r: (r[0],)) == (rows[:3], None)
+    assert split_page(rows[:2], 3, lambda r: (r[0],)) == (rows[:2], None)
+    assert split_page([], 3, lambda r: (r[0],)) == ([], None)
+
+    page, cursor = split_page(rows[:4], 3, lambda r: (r[0],))
+    assert page == rows[:3]
+    assert decode_cursor(cursor, 1) == (2,)
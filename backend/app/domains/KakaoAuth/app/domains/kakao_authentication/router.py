@@ -35,13 +35,13 @@ def request_oauth_link() -> OAuthLinkResponse:
 
 
 @router.get("/request-access-token-after-redirection", response_model=TokenAndUserResponse)
-def request_access_token_after_redirection(
+async def request_access_token_after_redirection(
     code: str = Query(..., description="Kakao 인증 후 리다이렉트된 인가 코드"),
 ) -> TokenAndUserResponse:
     """인가 코드로 액세스 토큰을 발급하고, 해당 토큰으로 사용자 정보를 조회하여 반환한다."""
     service = get_service()
     try:
-        return service.request_access_token_after_redirection(code)
+        return await service.request_access_token_after_redirection(code)
     except KakaoOAuthConfigError as e:
         raise HTTPException(status_code=500, detail=e.detail or e.message)
     except KakaoTokenError as e:
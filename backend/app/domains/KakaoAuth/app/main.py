@@ -6,15 +6,18 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
+from app.core.http_client import close_http_client, init_http_client
 from app.domains.KakaoAuth.app.core.env import load_env
 ##from app.domains.kakao_authentication import router as kakao_router
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """앱 시작 시 .env 1회 로드."""
+    """앱 시작 시 .env 1회 로드 및 공유 HTTP 클라이언트(app.core.http_client) 생성, 종료 시 클라이언트 정리."""
     load_env()
+    init_http_client()
     yield
+    await close_http_client()
 
 
 app = FastAPI(
@@ -1,5 +1,8 @@
 """TodayFocus repository."""
-from app.domains.TodayFocus.today_focus.repository.home_task_repository import HomeTaskRepository
+from app.domains.TodayFocus.today_focus.repository.home_task_repository import (
+    AsyncHomeTaskRepository,
+    HomeTaskRepository,
+)
 from app.domains.TodayFocus.today_focus.repository.session_log_repository import SessionLogRepository
 
-__all__ = ["HomeTaskRepository", "SessionLogRepository"]
+__all__ = ["AsyncHomeTaskRepository", "HomeTaskRepository", "SessionLogRepository"]
@@ -2,13 +2,14 @@
 TodayFocus 홈 할 일 조회 Repository [PM-TF-PAR-01].
 Scope에 따라 당일만 또는 전체 활성 할일을 조회한다.
 today 범위는 KST(Asia/Seoul) 기준 오늘 00:00 ~ 다음날 00:00을 UTC로 변환해 반개구간으로 적용한다.
+AsyncHomeTaskRepository는 동일 조건을 AsyncSession으로 조회한다 (DATABASE_ASYNC_ENABLED=true).
 """
 from datetime import datetime, timezone, timedelta
 from zoneinfo import ZoneInfo
 
-from sqlalchemy import and_
+from sqlalchemy import and_, select
 
-from app.core.database import get_session_factory
+from app.core.database import get_async_session_factory, session_scope
 from app.domains.task.models import Task
 
 KST = ZoneInfo("Asia/Seoul")
@@ -36,8 +37,7 @@ class HomeTaskRepository:
         scope == "today" 이면 due_date가 KST 기준 오늘인 할일만 (반개구간 >= start_utc AND < end_utc),
         그 외에는 is_archived=False 전체. 오늘 할 일이 없으면 빈 리스트 반환.
         """
-        session_factory = get_session_factory()
-        with session_factory() as session:
+        with session_scope() as session:
             base = session.query(Task).filter(
                 and_(Task.user_id == user_id, Task.is_archived == False)  # noqa: E712
             )
@@ -47,5 +47,20 @@ class HomeTaskRepository:
                     and_(Task.due_date >= start_utc, Task.due_date < end_utc)
                 )
             tasks = base.order_by(Task.due_date.asc()).all()
-            session.expunge_all()
         return list(tasks)
+
+
+class AsyncHomeTaskRepository:
+    """HomeTaskRepository의 비동기 버전."""
+
+    async def get_tasks_for_home(self, user_id: str, scope: str) -> list[Task]:
+        """[PM-TF-PAR-01] HomeTaskRepository.get_tasks_for_home과 동일한 조건으로 조회한다."""
+        stmt = select(Task).where(
+            and_(Task.user_id == user_id, Task.is_archived == False)  # noqa: E712
+        )
+        if scope == "today":
+            start_utc, end_utc = _today_range_utc()
+            stmt = stmt.where(and_(Task.due_date >= start_utc, Task.due_date < end_utc))
+        async with get_async_session_factory()() as session:
+            tasks = await session.scalars(stmt.order_by(Task.due_date.asc()))
+            return list(tasks)
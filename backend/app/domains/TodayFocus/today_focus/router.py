@@ -5,7 +5,9 @@ TodayFocus API 라우터 [PM-TF-PAR-01, PM-TF-INF-01 STEP 2].
 from datetime import datetime, timezone
 
 from fastapi import APIRouter, Path
+from fastapi.concurrency import run_in_threadpool
 
+from app.core.database import is_async_enabled
 from app.domains.task.schemas import TaskResponse
 from app.domains.TodayFocus.today_focus.schemas import (
     ActionRequest,
@@ -70,12 +72,15 @@ def app_close(body: AppCloseRequest) -> None:
     response_model=ActiveTaskListResponse,
     summary="[PRO-B-21] 활성 과업 목록 조회 (보관 제외, PM-TF-PAR-01 today 범위 적용)",
 )
-def get_active_tasks(
+async def get_active_tasks(
     user_id: str = Path(..., description="사용자 식별자"),
 ) -> ActiveTaskListResponse:
     """TaskDisplayScope(today)에 따라 홈에 표시할 과업만 반환. 오늘 할 일 없으면 빈 리스트."""
     service = _get_today_focus_service()
-    tasks = service.get_home_tasks(user_id)
+    if is_async_enabled():
+        tasks = await service.get_home_tasks_async(user_id)
+    else:
+        tasks = await run_in_threadpool(service.get_home_tasks, user_id)
     task_dtos = [TaskResponse.model_validate(t) for t in tasks]
     return ActiveTaskListResponse(
         user_id=user_id,
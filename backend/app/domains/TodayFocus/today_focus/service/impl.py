@@ -5,7 +5,11 @@ app_open 이벤트 시 SessionLogRepository로 세션 생성(experiment_group="A
 """
 from datetime import datetime
 
-from app.domains.TodayFocus.today_focus.repository import HomeTaskRepository, SessionLogRepository
+from app.domains.TodayFocus.today_focus.repository import (
+    AsyncHomeTaskRepository,
+    HomeTaskRepository,
+    SessionLogRepository,
+)
 from app.domains.TodayFocus.today_focus.service.interface import TodayFocusServiceProtocol
 from app.domains.TodayFocus.today_focus.session_log import SessionLog
 from app.domains.TodayFocus.today_focus.settings import TodayFocusSettings
@@ -17,6 +21,7 @@ class TodayFocusServiceImpl(TodayFocusServiceProtocol):
 
     def __init__(self) -> None:
         self._repository = HomeTaskRepository()
+        self._async_repository = AsyncHomeTaskRepository()
         self._session_log_repository = SessionLogRepository()
 
     def get_home_tasks(self, user_id: str) -> list[Task]:
@@ -24,6 +29,11 @@ class TodayFocusServiceImpl(TodayFocusServiceProtocol):
         scope = TodayFocusSettings.task_display_scope()
         return self._repository.get_tasks_for_home(user_id, scope)
 
+    async def get_home_tasks_async(self, user_id: str) -> list[Task]:
+        """get_home_tasks의 비동기 버전. AsyncHomeTaskRepository로 조회한다."""
+        scope = TodayFocusSettings.task_display_scope()
+        return await self._async_repository.get_tasks_for_home(user_id, scope)
+
     def record_app_open(self, user_id: str, app_open_at: datetime) -> SessionLog:
         """[PM-TF-INF-01 STEP 2] app_open 이벤트 시 세션 생성. experiment_group은 "A"로 저장."""
         return self._session_log_repository.create_session(user_id, app_open_at)
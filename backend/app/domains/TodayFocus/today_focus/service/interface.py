@@ -12,6 +12,10 @@ class TodayFocusServiceProtocol:
         """TaskDisplayScope에 따라 홈에 표시할 과업 목록을 반환한다."""
         ...
 
+    async def get_home_tasks_async(self, user_id: str) -> list[Task]:
+        """get_home_tasks의 비동기 버전."""
+        ...
+
     def record_app_open(self, user_id: str, app_open_at: datetime) -> SessionLog:
         """[PM-TF-INF-01] app_open 이벤트 수신 시 세션 생성. experiment_group="A" 저장."""
         ...
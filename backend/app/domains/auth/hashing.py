@@ -0,0 +1,106 @@
+"""
+비밀번호 해시 전용 워커 풀.
+bcrypt는 의도적으로 느린 연산이라 공용 스레드풀에서 실행하면 로그인 폭주 시 다른 엔드포인트가 굶는다.
+전용 ThreadPoolExecutor(bcrypt는 GIL을 해제하므로 스레드로 병렬 실행된다)에서 실행하고,
+대기+실행 중인 작업 수가 AUTH_HASH_MAX_PENDING을 넘으면 PasswordHasherBusy로 즉시 거절한다.
+bcrypt cost는 AUTH_BCRYPT_ROUNDS로 설정하며, 기존 해시의 cost가 다르면 needs_rehash()가 True를 반환한다.
+"""
+import asyncio
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+import bcrypt
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BCRYPT_ROUNDS = 12
+DEFAULT_WORKERS = 2
+DEFAULT_MAX_PENDING = 32
+
+T = TypeVar("T")
+
+
+def get_bcrypt_rounds() -> int:
+    """bcrypt cost factor (4~31). 범위를 벗어나면 경계값으로 보정한다."""
+    rounds = int(os.getenv("AUTH_BCRYPT_ROUNDS", str(DEFAULT_BCRYPT_ROUNDS)))
+    return min(31, max(4, rounds))
+
+
+def get_workers() -> int:
+    """해시 전용 워커 스레드 수."""
+    return max(1, int(os.getenv("AUTH_HASH_WORKERS", str(DEFAULT_WORKERS))))
+
+
+def get_max_pending() -> int:
+    """대기+실행 중 허용 작업 수. 초과 시 요청을 거절한다."""
+    return max(1, int(os.getenv("AUTH_HASH_MAX_PENDING", str(DEFAULT_MAX_PENDING))))
+
+
+class PasswordHasherBusy(Exception):
+    """해시 워커 큐가 가득 차 작업을 받을 수 없음."""
+
+
+def hash_password(password: str) -> str:
+    salt = bcrypt.gensalt(rounds=get_bcrypt_rounds())
+    return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
+
+
+def check_password(plain_password: str, hashed_password: str) -> bool:
+    return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("utf-8"))
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    """해시($2b$<cost>$...)의 cost가 현재 설정과 다르면 True."""
+    try:
+        return int(hashed_password.split("$")[2]) != get_bcrypt_rounds()
+    except (IndexError, ValueError):
+        return False
+
+
+class PasswordHasher:
+    """bcrypt 작업을 전용 스레드풀에서 실행하고 대기 작업 수를 제한한다."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending = 0
+
+    async def hash(self, password: str) -> str:
+        return await self._submit(hash_password, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._submit(check_password, plain_password, hashed_password)
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _submit(self, fn: Callable[..., T], *args) -> T:
+        with self._lock:
+            if self._pending >= get_max_pending():
+                logger.warning("비밀번호 해시 큐 포화 (pending=%d) — 요청 거절", self._pending)
+                raise PasswordHasherBusy()
+            self._pending += 1
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=get_workers(),
+                    thread_name_prefix="password-hash",
+                )
+            executor = self._executor
+        try:
+            return await asyncio.get_running_loop().run_in_executor(executor, fn, *args)
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+
+password_hasher = PasswordHasher()
@@ -0,0 +1,63 @@
+"""
+Kakao OAuth 로컬 스텁 서버 (개발·테스트용).
+실제 Kakao 서버 대신 토큰 교환(/oauth/token)과 사용자 조회(/v2/user/me)를 흉내 낸다.
+
+별도 프로세스로 실행:
+    uvicorn app.domains.auth.kakao_stub:app --port 8081
+    KAKAO_AUTH_BASE_URL=http://localhost:8081 KAKAO_API_BASE_URL=http://localhost:8081
+
+프로세스 내 테스트:
+    set_http_client(httpx.AsyncClient(transport=httpx.ASGITransport(app=kakao_stub.app)))
+
+인가 코드 규칙: "invalid"로 시작하면 400(invalid_grant), 그 외 코드는 "stub-<code>" 토큰을 발급한다.
+사용자 id는 코드 문자열에서 결정적으로 만들어지므로 같은 코드는 같은 사용자로 조회된다.
+"""
+import zlib
+from urllib.parse import parse_qs
+
+from fastapi import FastAPI, Header, Request
+from fastapi.responses import JSONResponse
+
+app = FastAPI(title="Kakao OAuth Stub")
+
+_TOKEN_PREFIX = "stub-"
+
+
+def _social_id(code: str) -> int:
+    return zlib.crc32(code.encode("utf-8")) or 1
+
+
+@app.post("/oauth/token")
+async def issue_token(request: Request):
+    # python-multipart 의존 없이 form-urlencoded 본문을 직접 파싱한다
+    form = {k: v[0] for k, v in parse_qs((await request.body()).decode("utf-8")).items()}
+    code = form.get("code", "")
+    if form.get("grant_type") != "authorization_code" or not code or code.startswith("invalid"):
+        return JSONResponse(
+            status_code=400,
+            content={"error": "invalid_grant", "error_description": "authorization code not found"},
+        )
+    return {
+        "token_type": "bearer",
+        "access_token": f"{_TOKEN_PREFIX}{code}",
+        "expires_in": 21599,
+        "refresh_token": f"{_TOKEN_PREFIX}refresh-{code}",
+        "refresh_token_expires_in": 5183999,
+    }
+
+
+@app.get("/v2/user/me")
+def get_user(authorization: str = Header("")):
+    token = authorization.removeprefix("Bearer ").strip()
+    if not token.startswith(_TOKEN_PREFIX):
+        return JSONResponse(status_code=401, content={"msg": "this access token does not exist", "code": -401})
+    code = token[len(_TOKEN_PREFIX):]
+    social_id = _social_id(code)
+    return {
+        "id": social_id,
+        "properties": {"nickname": f"stub-{social_id}"},
+        "kakao_account": {
+            "email": f"{social_id}@kakao-stub.example.com",
+            "profile": {"nickname": f"stub-{social_id}"},
+        },
+    }
@@ -1,26 +1,31 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from typing import Optional
 
-from app.core.database import get_session_factory
+from app.core.database import get_db
 from app.domains.auth import models, schemas, security
+from app.domains.auth.user_cache import user_cache
+from app.infrastructure.task_miss.counter import drop_miss_counts
 
 router = APIRouter()
 
-def get_db():
-    db = get_session_factory()()
-    try:
-        yield db
-    finally:
-        db.close()
+def _find_user(db: Session, *criteria) -> Optional[models.User]:
+    return db.query(models.User).filter(*criteria).first()
 
+def _commit_and_refresh(db: Session, instance) -> None:
+    db.commit()
+    db.refresh(instance)
+
+# Password hashing runs on the dedicated hash pool (security.*_async) and DB work on the shared
+# threadpool, so a login burst cannot occupy the threads that serve the task endpoints.
 @router.post("/signup", response_model=schemas.UserOut, status_code=status.HTTP_201_CREATED)
-def signup(user: schemas.UserCreate, db: Session = Depends(get_db)):
-    db_user = db.query(models.User).filter(models.User.email == user.email).first()
+async def signup(user: schemas.UserCreate, db: Session = Depends(get_db)):
+    db_user = await run_in_threadpool(_find_user, db, models.User.email == user.email)
     if db_user:
         raise HTTPException(status_code=400, detail="Email already registered")
     
-    hashed_password = security.get_password_hash(user.password)
+    hashed_password = await security.get_password_hash_async(user.password)
     new_user = models.User(
         email=user.email,
         password_hash=hashed_password,
@@ -28,25 +33,30 @@ def signup(user: schemas.UserCreate, db: Session = Depends(get_db)):
         provider="email"
     )
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await run_in_threadpool(_commit_and_refresh, db, new_user)
     return new_user
 
 @router.post("/login", response_model=schemas.TokenWithUser)
-def login(user_credentials: schemas.UserLogin, db: Session = Depends(get_db)):
-    user = db.query(models.User).filter(models.User.email == user_credentials.email).first()
+async def login(user_credentials: schemas.UserLogin, db: Session = Depends(get_db)):
+    user = await run_in_threadpool(_find_user, db, models.User.email == user_credentials.email)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid Credentials"
         )
 
-    if not user.password_hash or not security.verify_password(user_credentials.password, user.password_hash):
+    if not user.password_hash or not await security.verify_password_async(user_credentials.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid Credentials"
         )
 
+    # Transparently upgrade the stored hash when AUTH_BCRYPT_ROUNDS has changed
+    if security.password_needs_rehash(user.password_hash):
+        user.password_hash = await security.get_password_hash_async(user_credentials.password)
+        await run_in_threadpool(_commit_and_refresh, db, user)
+        user_cache.invalidate(user.id)
+
     access_token = security.create_access_token(data={"sub": str(user.id)})
     return {"access_token": access_token, "token_type": "bearer", "user": user}
 
@@ -58,13 +68,20 @@ def logout():
 
 @router.delete("/withdraw")
 def withdraw(db: Session = Depends(get_db), current_user: models.User = Depends(security.get_current_user)):
+    user_id = current_user.id
     db.delete(current_user)
     db.commit()
+    user_cache.invalidate(user_id)
+    drop_miss_counts(user_id)
     return {"message": "User account successfully deleted."}
 
-import httpx
 import os
 
+from app.core.http_client import get_http_client
+
+KAKAO_AUTH_BASE_URL = os.getenv("KAKAO_AUTH_BASE_URL", "https://kauth.kakao.com")
+KAKAO_API_BASE_URL = os.getenv("KAKAO_API_BASE_URL", "https://kapi.kakao.com")
+
 @router.post("/kakao", response_model=schemas.TokenWithUser)
 async def kakao_login(
     kakao_data: schemas.KakaoLogin,
@@ -88,12 +105,13 @@ async def kakao_login(
     if kakao_client_secret:
         token_payload["client_secret"] = kakao_client_secret
 
-    async with httpx.AsyncClient() as client:
-        token_res = await client.post(
-            "https://kauth.kakao.com/oauth/token",
-            data=token_payload,
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-        )
+    # Shared pooled client (created in lifespan) keeps the TLS connection to Kakao alive across logins
+    client = get_http_client()
+    token_res = await client.post(
+        f"{KAKAO_AUTH_BASE_URL}/oauth/token",
+        data=token_payload,
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
 
     if token_res.status_code != 200:
         error_msg = token_res.text
@@ -103,11 +121,10 @@ async def kakao_login(
     kakao_access_token = token_res.json().get("access_token")
 
     # 2. S2S: Kakao access token → user info
-    async with httpx.AsyncClient() as client:
-        user_res = await client.get(
-            "https://kapi.kakao.com/v2/user/me",
-            headers={"Authorization": f"Bearer {kakao_access_token}"},
-        )
+    user_res = await client.get(
+        f"{KAKAO_API_BASE_URL}/v2/user/me",
+        headers={"Authorization": f"Bearer {kakao_access_token}"},
+    )
 
     if user_res.status_code != 200:
         raise HTTPException(status_code=400, detail="Failed to retrieve user info from Kakao")
@@ -124,8 +141,7 @@ async def kakao_login(
         if existing and existing.id != current_user.id:
             raise HTTPException(status_code=409, detail="이 카카오 계정은 이미 다른 사용자에 연동되어 있습니다.")
         
-        # Merge the user object from the security dependency's session into the current route's session
-        current_user = db.merge(current_user)
+        # current_user is loaded through the same request-scoped session, so it can be updated directly
         current_user.social_id = social_id
         current_user.provider = "kakao"
         
@@ -134,6 +150,7 @@ async def kakao_login(
             current_user.name = name
             
         db.commit()
+        user_cache.invalidate(current_user.id)
         db.refresh(current_user)
         access_token = security.create_access_token(data={"sub": str(current_user.id)})
         return {"access_token": access_token, "token_type": "bearer", "user": current_user}
@@ -171,7 +188,7 @@ async def kakao_login(
     return {"access_token": access_token, "token_type": "bearer", "user": user}
 
 @router.post("/link-account", response_model=schemas.TokenWithUser)
-def link_account(data: schemas.LinkAccountRequest, db: Session = Depends(get_db)):
+async def link_account(data: schemas.LinkAccountRequest, db: Session = Depends(get_db)):
     payload = security.verify_temp_token(data.temp_token)
     if not payload:
         raise HTTPException(status_code=401, detail="임시 토큰이 만료되었거나 유효하지 않습니다.")
@@ -179,18 +196,20 @@ def link_account(data: schemas.LinkAccountRequest, db: Session = Depends(get_db)
     user_id_str = payload.get("sub")
     social_id = payload.get("social_id")
     
-    user = db.query(models.User).filter(models.User.id == int(user_id_str)).first()
+    user = await run_in_threadpool(_find_user, db, models.User.id == int(user_id_str))
     if not user:
         raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
         
-    if not user.password_hash or not security.verify_password(data.password, user.password_hash):
+    if not user.password_hash or not await security.verify_password_async(data.password, user.password_hash):
         raise HTTPException(status_code=401, detail="비밀번호가 일치하지 않습니다.")
         
     # Link account
     user.social_id = social_id
     user.provider = "kakao"
-    db.commit()
-    db.refresh(user)
+    if security.password_needs_rehash(user.password_hash):
+        user.password_hash = await security.get_password_hash_async(data.password)
+    await run_in_threadpool(_commit_and_refresh, db, user)
+    user_cache.invalidate(user.id)
     
     access_token = security.create_access_token(data={"sub": str(user.id)})
     return {"access_token": access_token, "token_type": "bearer", "user": user}
@@ -6,10 +6,18 @@ from jose import jwt, JWTError
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
-import bcrypt
 
-from app.core.database import get_session_factory
+from app.core.database import get_db
+from app.domains.auth.hashing import (
+    PasswordHasherBusy,
+    check_password,
+    hash_password,
+    needs_rehash,
+    password_hasher,
+)
 from app.domains.auth.models import User
+from app.domains.auth.tokens import token_cache
+from app.domains.auth.user_cache import user_cache
 
 # Configuration
 SECRET_KEY = os.getenv("JWT_SECRET_KEY")
@@ -22,11 +30,34 @@ ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 * 7  # 7 days
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
+    return check_password(plain_password, hashed_password)
 
 def get_password_hash(password: str) -> str:
-    salt = bcrypt.gensalt()
-    return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+    return hash_password(password)
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    return needs_rehash(hashed_password)
+
+def _hasher_busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Too many authentication requests. Please retry shortly.",
+        headers={"Retry-After": "1"},
+    )
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Runs bcrypt on the dedicated hash pool. Raises 503 when the pool queue is full."""
+    try:
+        return await password_hasher.verify(plain_password, hashed_password)
+    except PasswordHasherBusy:
+        raise _hasher_busy()
+
+async def get_password_hash_async(password: str) -> str:
+    """Runs bcrypt on the dedicated hash pool. Raises 503 when the pool queue is full."""
+    try:
+        return await password_hasher.hash(password)
+    except PasswordHasherBusy:
+        raise _hasher_busy()
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
@@ -54,13 +85,6 @@ def verify_temp_token(token: str):
     except JWTError:
         return None
 
-def get_db():
-    db = get_session_factory()()
-    try:
-        yield db
-    finally:
-        db.close()
-
 async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> User:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -68,14 +92,14 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = De
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = token_cache.decode(token, SECRET_KEY, ALGORITHM)
         user_id_str: str = payload.get("sub")
         if user_id_str is None:
             raise credentials_exception
     except JWTError:
         raise credentials_exception
     
-    user = db.query(User).filter(User.id == int(user_id_str)).first()
+    user = user_cache.get_user(db, int(user_id_str))
     if user is None:
         raise credentials_exception
     return user
@@ -86,12 +110,12 @@ async def get_current_user_optional(token: Optional[str] = Depends(oauth2_scheme
     if not token:
         return None
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = token_cache.decode(token, SECRET_KEY, ALGORITHM)
         user_id_str: str = payload.get("sub")
         if user_id_str is None:
             return None
     except JWTError:
         return None
     
-    user = db.query(User).filter(User.id == int(user_id_str)).first()
+    user = user_cache.get_user(db, int(user_id_str))
     return user
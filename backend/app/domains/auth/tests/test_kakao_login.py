@@ -0,0 +1,68 @@
+"""POST /auth/kakao 단위 테스트 — 로컬 Kakao 스텁(kakao_stub)을 공유 HTTP 클라이언트로 주입하여 토큰 교환·사용자 조회를 거친다."""
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core import http_client
+from app.domains.auth import kakao_stub
+
+
+@pytest.fixture
+def kakao_client(client, monkeypatch):
+    """lifespan이 만든 공유 클라이언트를 스텁 앱으로 요청을 보내는 클라이언트로 바꾼다."""
+    monkeypatch.setenv("KAKAO_CLIENT_ID", "test-client")
+    monkeypatch.setenv("KAKAO_REDIRECT_URI", "http://localhost/callback")
+    original = http_client.get_http_client()
+    http_client.set_http_client(httpx.AsyncClient(transport=httpx.ASGITransport(app=kakao_stub.app)))
+    yield client
+    http_client.set_http_client(original)
+
+
+def _stub_email(code: str) -> str:
+    return f"{kakao_stub._social_id(code)}@kakao-stub.example.com"
+
+
+def test_kakao_login_creates_then_reuses_user(kakao_client):
+    first = kakao_client.post("/auth/kakao", json={"code": "abc"})
+
+    assert first.status_code == 200
+    body = first.json()
+    assert body["access_token"]
+    assert body["user"]["email"] == _stub_email("abc")
+    assert body["user"]["provider"] == "kakao"
+    assert body["user"]["name"] == f"stub-{kakao_stub._social_id('abc')}"
+
+    again = kakao_client.post("/auth/kakao", json={"code": "abc"})
+    assert again.status_code == 200
+    assert again.json()["user"]["id"] == body["user"]["id"]
+
+
+def test_rejected_authorization_code_is_400(kakao_client):
+    response = kakao_client.post("/auth/kakao", json={"code": "invalid-code"})
+
+    assert response.status_code == 400
+    assert "invalid_grant" in response.json()["detail"]
+
+
+def test_existing_email_account_requires_password(kakao_client):
+    signup = kakao_client.post(
+        "/auth/signup", json={"name": "u1", "email": _stub_email("collide"), "password": "pw-123456"}
+    )
+    assert signup.status_code == 201
+
+    response = kakao_client.post("/auth/kakao", json={"code": "collide"})
+
+    assert response.status_code == 409
+    assert response.json()["detail"]["code"] == "ACCOUNT_COLLISION_REQUIRE_PASSWORD"
+
+
+def test_kakao_sub_app_lifespan_manages_shared_client():
+    from app.domains.KakaoAuth.app.main import app as kakao_app
+
+    http_client.set_http_client(None)
+    with TestClient(kakao_app):
+        shared = http_client.get_http_client()
+        assert not shared.is_closed
+    assert shared.is_closed
+    assert http_client._client is None
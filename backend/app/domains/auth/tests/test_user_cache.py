@@ -0,0 +1,60 @@
+"""인증 사용자 캐시 단위 테스트 — 스냅샷에서 자격 증명 제외, 캐시에서 붙인 객체의 지연 로딩."""
+
+import json
+
+import pytest
+from sqlalchemy import inspect
+
+from app.core.database import get_session_factory, session_scope
+from app.domains.auth.models import User
+from app.domains.auth.user_cache import user_cache
+
+
+@pytest.fixture
+def user_id(migrated_db, monkeypatch) -> int:
+    monkeypatch.setenv("AUTH_USER_CACHE_TTL_SECONDS", "60")
+    with session_scope() as session:
+        user = User(email="u1@example.com", name="u1", password_hash="$argon2id$secret")
+        session.add(user)
+        session.flush()
+        return user.id
+
+
+def _load_from_cache(session, user_id: int) -> User:
+    """별도 세션의 첫 조회로 캐시에 적재한 뒤, session에는 캐시 스냅샷으로 붙인다."""
+    with get_session_factory()() as first:
+        user_cache.get_user(first, user_id)
+    return user_cache.get_user(session, user_id)
+
+
+def test_snapshot_excludes_password_hash(user_id):
+    with get_session_factory()() as session:
+        cached = _load_from_cache(session, user_id)
+
+        assert cached.email == "u1@example.com"
+        assert "password_hash" in inspect(cached).unloaded
+        assert cached.password_hash == "$argon2id$secret"
+    assert "password_hash" not in user_cache._namespace.get(user_id)
+
+
+def test_redis_tier_never_stores_password_hash(user_id, monkeypatch, fake_redis):
+    monkeypatch.setenv("AUTH_USER_CACHE_REDIS", "true")
+
+    with get_session_factory()() as session:
+        _load_from_cache(session, user_id)
+
+    stored = json.loads(fake_redis.get(f"auth:user:{user_id}"))
+    assert stored["email"] == "u1@example.com"
+    assert "password_hash" not in stored
+
+
+def test_legacy_snapshot_with_password_hash_is_not_attached(user_id):
+    with get_session_factory()() as session:
+        user_cache.get_user(session, user_id)
+    snapshot = dict(user_cache._namespace.get(user_id), password_hash="stale")
+    user_cache._namespace.set(user_id, snapshot)
+
+    with get_session_factory()() as session:
+        cached = user_cache.get_user(session, user_id)
+        assert "password_hash" in inspect(cached).unloaded
+        assert cached.password_hash == "$argon2id$secret"
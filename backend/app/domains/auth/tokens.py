@@ -0,0 +1,109 @@
+"""
+액세스 토큰 검증 캐시.
+같은 토큰(기본 7일 만료)이 매 요청마다 HMAC 검증되는 비용을 줄이기 위해
+검증에 성공한 토큰의 SHA-256 digest → claims를 LRU로 보관하고, exp가 지나면 버린다.
+JWT_BACKEND=pyjwt 이면 python-jose 대신 PyJWT로 디코드한다 (선택 의존성, 미설치 시 jose로 대체).
+"""
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+from jose import JWTError, jwt
+
+logger = logging.getLogger(__name__)
+
+BACKEND_JOSE = "jose"
+BACKEND_PYJWT = "pyjwt"
+DEFAULT_CACHE_SIZE = 10_000
+
+_Decoder = Callable[[str, str, str], dict[str, Any]]
+
+
+def get_backend() -> str:
+    """JWT 디코드 백엔드 (jose | pyjwt). 알 수 없는 값이면 jose."""
+    backend = os.getenv("JWT_BACKEND", BACKEND_JOSE).strip().lower()
+    return backend if backend in (BACKEND_JOSE, BACKEND_PYJWT) else BACKEND_JOSE
+
+
+def get_cache_size() -> int:
+    """검증 캐시 최대 항목 수. 0 이하이면 캐시하지 않는다."""
+    return int(os.getenv("AUTH_TOKEN_CACHE_SIZE", str(DEFAULT_CACHE_SIZE)))
+
+
+def _decode_jose(token: str, secret: str, algorithm: str) -> dict[str, Any]:
+    return jwt.decode(token, secret, algorithms=[algorithm])
+
+
+def _load_decoder() -> _Decoder:
+    if get_backend() != BACKEND_PYJWT:
+        return _decode_jose
+    try:
+        import jwt as pyjwt
+    except ImportError:
+        logger.warning("JWT_BACKEND=pyjwt 이지만 PyJWT가 설치되어 있지 않아 python-jose를 사용합니다.")
+        return _decode_jose
+
+    def _decode_pyjwt(token: str, secret: str, algorithm: str) -> dict[str, Any]:
+        try:
+            return pyjwt.decode(token, secret, algorithms=[algorithm])
+        except pyjwt.PyJWTError as e:
+            # 호출부가 백엔드와 무관하게 JWTError만 처리하도록 변환한다
+            raise JWTError(str(e)) from e
+
+    return _decode_pyjwt
+
+
+class VerifiedTokenCache:
+    """검증된 토큰 digest → (exp, claims) LRU. 스레드 세이프하게 동작한다."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[bytes, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._decoder: _Decoder | None = None
+
+    def decode(self, token: str, secret: str, algorithm: str) -> dict[str, Any]:
+        """
+        토큰을 검증하고 claims를 반환한다. 검증 실패·만료 시 JWTError.
+        캐시 HIT이면 exp만 확인하고 서명 검증을 생략한다. exp가 없는 토큰은 캐시하지 않는다.
+        """
+        max_size = get_cache_size()
+        if max_size <= 0:
+            return self._get_decoder()(token, secret, algorithm)
+
+        digest = hashlib.sha256(token.encode("utf-8")).digest()
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is not None:
+                exp, claims = entry
+                if exp > now:
+                    self._entries.move_to_end(digest)
+                    return dict(claims)
+                del self._entries[digest]
+
+        claims = self._get_decoder()(token, secret, algorithm)
+        exp = claims.get("exp")
+        if isinstance(exp, (int, float)):
+            with self._lock:
+                self._entries[digest] = (float(exp), claims)
+                self._entries.move_to_end(digest)
+                while len(self._entries) > max_size:
+                    self._entries.popitem(last=False)
+        return dict(claims)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._decoder = None
+
+    def _get_decoder(self) -> _Decoder:
+        if self._decoder is None:
+            self._decoder = _load_decoder()
+        return self._decoder
+
+
+token_cache = VerifiedTokenCache()
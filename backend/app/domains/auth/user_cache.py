@@ -0,0 +1,98 @@
+"""
+인증 사용자 캐시.
+get_current_user가 매 요청마다 실행하던 users PK 조회를 줄이기 위해
+user_id → 컬럼 스냅샷을 2계층 캐시 네임스페이스(auth_user)에 보관한다.
+AUTH_USER_CACHE_REDIS=true 이면 Redis를 2차 계층으로 사용하여 워커 간에 공유한다.
+비밀번호 해시 등 자격 증명 컬럼은 스냅샷에 넣지 않는다 (Redis·로컬 계층에 남지 않도록).
+캐시에서 붙인 객체의 해당 속성은 unloaded 상태로, 접근하면 DB에서 읽는다.
+회원 탈퇴·카카오 연동·계정 연결 시 invalidate()로 즉시 무효화하며,
+다른 워커의 로컬 계층도 캐시 무효화 버스(pub/sub)로 함께 비워진다.
+"""
+import os
+from typing import Any
+
+from sqlalchemy import DateTime
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from app.core.cache import CacheNamespace, JsonSerializer
+from app.domains.auth.models import User
+
+DEFAULT_TTL_SECONDS = 60
+DEFAULT_MAX_SIZE = 10_000
+
+# get_current_user에 필요 없는 자격 증명. 로그인·계정 연결은 DB에서 읽은 사용자로 검증한다.
+_CREDENTIAL_COLUMNS = frozenset({"password_hash"})
+_COLUMNS = [column.key for column in User.__table__.columns if column.key not in _CREDENTIAL_COLUMNS]
+_DATETIME_COLUMNS = {column.key for column in User.__table__.columns if isinstance(column.type, DateTime)}
+
+
+def get_ttl_seconds() -> int:
+    """캐시 TTL(초). 0 이하이면 캐시를 사용하지 않는다."""
+    return int(os.getenv("AUTH_USER_CACHE_TTL_SECONDS", str(DEFAULT_TTL_SECONDS)))
+
+
+def get_max_size() -> int:
+    """로컬 LRU 캐시 최대 항목 수."""
+    return max(1, int(os.getenv("AUTH_USER_CACHE_MAX_SIZE", str(DEFAULT_MAX_SIZE))))
+
+
+def is_redis_tier_enabled() -> bool:
+    """Redis 2차 캐시 사용 여부 (AUTH_USER_CACHE_REDIS)."""
+    return os.getenv("AUTH_USER_CACHE_REDIS", "false").lower() in ("true", "1", "yes")
+
+
+def _snapshot(user: User) -> dict[str, Any]:
+    return {key: getattr(user, key) for key in _COLUMNS}
+
+
+class UserCache:
+    """user_id → 컬럼 스냅샷 캐시. 로컬 LRU+TTL → (선택) Redis 순으로 조회한다."""
+
+    def __init__(self) -> None:
+        ttl = max(0, get_ttl_seconds())
+        self._namespace: CacheNamespace[dict[str, Any]] = CacheNamespace(
+            "auth_user",
+            "auth:user:{id}",
+            JsonSerializer(datetime_fields=_DATETIME_COLUMNS),
+            ttl_seconds=ttl or None,
+            local_ttl_seconds=ttl,
+            local_max_size=get_max_size(),
+            remote_enabled=is_redis_tier_enabled,
+        )
+
+    def get_user(self, db: Session, user_id: int) -> User | None:
+        """
+        캐시된 스냅샷이 있으면 SELECT 없이 요청 세션에 persistent 객체로 붙여 반환한다.
+        없으면 DB에서 조회하여 캐시에 저장한다. 사용자가 없으면 None.
+        """
+        if get_ttl_seconds() <= 0:
+            return db.query(User).filter(User.id == user_id).first()
+
+        snapshot = self._namespace.get(user_id)
+        if snapshot is not None:
+            return self._attach(db, snapshot)
+
+        user = db.query(User).filter(User.id == user_id).first()
+        if user is not None:
+            self._namespace.set(user_id, _snapshot(user))
+        return user
+
+    def invalidate(self, user_id: int) -> None:
+        """로컬·Redis 캐시와 다른 워커의 로컬 캐시에서 사용자를 제거한다. 사용자 정보 변경·삭제 후 호출."""
+        self._namespace.invalidate(user_id)
+
+    def clear(self) -> None:
+        self._namespace.clear_local()
+
+    @staticmethod
+    def _attach(db: Session, snapshot: dict[str, Any]) -> User:
+        """
+        스냅샷을 detached 상태의 User로 만든 뒤 load=False merge로 세션에 붙인다 (SELECT 없음).
+        스냅샷에 없는 컬럼(자격 증명, 이전 버전이 저장한 값 포함)은 넣지 않아 unloaded로 남는다.
+        """
+        user = User(**{key: snapshot[key] for key in _COLUMNS if key in snapshot})
+        make_transient_to_detached(user)
+        return db.merge(user, load=False)
+
+
+user_cache = UserCache()
@@ -0,0 +1,187 @@
+"""
+tasks 인덱스 전/후 쿼리 플랜·지연 비교 벤치마크.
+기존 단일 컬럼 인덱스만 있는 상태로 데이터를 적재한 뒤 핫 쿼리의 실행 계획과 중앙값 지연을 측정하고,
+sync_indexes()로 복합/partial 인덱스를 반영한 후 같은 쿼리를 다시 측정한다.
+
+실행 (backend 디렉토리에서):
+    python -m app.domains.task.index_bench --rows 200000 --users 2000
+    python -m app.domains.task.index_bench --url postgresql://user:pw@localhost/bench
+
+--url을 생략하면 임시 SQLite 파일 DB를 사용한다. 지정한 DB의 tasks/users 테이블은 초기화된다.
+"""
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import and_, create_engine, event, func, insert, select, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.schema import DropIndex
+
+from app.core.database import Base, import_models
+from app.core.schema import OBSOLETE_INDEXES, sync_indexes
+from app.domains.task.models import Task, TaskStatus, open_status_clause
+from app.domains.task.stats import _count_if
+
+_STATUS_WEIGHTS = (
+    (TaskStatus.COMPLETED, 45),
+    (TaskStatus.TASK_MISS, 35),
+    (TaskStatus.PENDING, 15),
+    (TaskStatus.IN_PROGRESS, 5),
+)
+
+
+def _hot_queries(user_id: int, start_of_day: datetime, end_of_day: datetime, now: datetime) -> dict:
+    """서비스 코드의 핫 쿼리와 같은 조건의 SELECT 문."""
+    not_archived = Task.is_archived == False  # noqa: E712
+    in_today = and_(Task.due_date >= start_of_day, Task.due_date < end_of_day)
+    return {
+        # HomeTaskRepository.get_tasks_for_home
+        "home_tasks": select(Task.id, Task.title, Task.status)
+        .where(Task.user_id == user_id, not_archived, in_today)
+        .order_by(Task.due_date.asc()),
+        # create_task 일일 생성 한도
+        "daily_limit_count": select(func.count(Task.id)).where(Task.user_id == user_id, in_today),
+        # stats.aggregate_dashboard (오늘 통계)
+        "dashboard_today": select(
+            _count_if(in_today),
+            _count_if(in_today, Task.status == TaskStatus.COMPLETED),
+            _count_if(not_archived),
+        ).where(Task.user_id == user_id),
+        # task_miss 누적 미스 카운트
+        "miss_count": select(func.count(Task.id)).where(
+            Task.user_id == user_id, Task.status == TaskStatus.TASK_MISS
+        ),
+        # task_miss 배치 (incremental 구간)
+        "miss_batch": select(Task.id, Task.user_id).where(
+            Task.due_date < now, Task.due_date >= now - timedelta(hours=1), open_status_clause()
+        ),
+    }
+
+
+def _seed(engine: Engine, rows: int, users: int, now: datetime) -> None:
+    from app.domains.auth.models import User
+
+    Base.metadata.drop_all(engine, tables=[Task.__table__])
+    Base.metadata.create_all(engine)
+    rng = random.Random(42)
+    statuses = [s for s, _ in _STATUS_WEIGHTS]
+    weights = [w for _, w in _STATUS_WEIGHTS]
+    with engine.begin() as conn:
+        conn.execute(User.__table__.delete())
+        conn.execute(
+            insert(User),
+            [{"id": i, "name": f"u{i}", "email": f"u{i}@bench.example.com"} for i in range(1, users + 1)],
+        )
+        batch = []
+        for i in range(rows):
+            due = now - timedelta(minutes=rng.randint(-60 * 24 * 7, 60 * 24 * 180))
+            status = rng.choices(statuses, weights)[0]
+            if due > now:
+                status = TaskStatus.PENDING
+            batch.append({
+                "title": f"task-{i}",
+                "status": status,
+                "user_id": rng.randint(1, users),
+                "due_date": due,
+                "is_archived": rng.random() < 0.2,
+            })
+            if len(batch) >= 10_000:
+                conn.execute(insert(Task), batch)
+                batch.clear()
+        if batch:
+            conn.execute(insert(Task), batch)
+
+
+def _use_legacy_indexes(engine: Engine) -> None:
+    """tasks 인덱스를 변경 전 상태(단일 컬럼 인덱스)로 되돌린다."""
+    with engine.begin() as conn:
+        for index in Task.__table__.indexes:
+            conn.execute(DropIndex(index, if_exists=True))
+        for name in OBSOLETE_INDEXES["tasks"]:
+            column = name.removeprefix("ix_tasks_")
+            conn.execute(text(f"CREATE INDEX {name} ON tasks ({column})"))
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_tasks_due_date ON tasks (due_date)"))
+
+
+def _analyze(engine: Engine) -> None:
+    with engine.begin() as conn:
+        conn.execute(text("ANALYZE"))
+
+
+def _plan(conn: Connection, stmt) -> str:
+    """드라이버에 전달되는 최종 SQL/파라미터 그대로 EXPLAIN을 실행해 실행 계획을 반환한다."""
+    sqlite = conn.dialect.name == "sqlite"
+    captured: list = []
+
+    def _explain(_conn, cursor, statement, parameters, _context, _executemany):
+        cursor.execute(("EXPLAIN QUERY PLAN " if sqlite else "EXPLAIN ") + statement, parameters)
+        captured.extend(cursor.fetchall())
+
+    event.listen(conn, "before_cursor_execute", _explain)
+    try:
+        conn.execute(stmt).all()
+    finally:
+        event.remove(conn, "before_cursor_execute", _explain)
+    return " / ".join(str(row[-1] if sqlite else row[0]).strip() for row in captured)
+
+
+def _median_ms(conn: Connection, stmt, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start_ns = time.perf_counter_ns()
+        conn.execute(stmt).all()
+        samples.append((time.perf_counter_ns() - start_ns) / 1_000_000)
+    return statistics.median(samples)
+
+
+def _measure(engine: Engine, queries: dict, repeat: int) -> dict[str, tuple[str, float]]:
+    with engine.connect() as conn:
+        return {name: (_plan(conn, stmt), _median_ms(conn, stmt, repeat)) for name, stmt in queries.items()}
+
+
+def run(url: str | None, rows: int, users: int, repeat: int) -> None:
+    import_models()
+    if url is None:
+        url = f"sqlite:///{tempfile.mkdtemp()}/index_bench.db"
+    engine = create_engine(url)
+    now = datetime.now().replace(microsecond=0)
+    start_of_day = now.replace(hour=0, minute=0, second=0)
+    end_of_day = start_of_day + timedelta(days=1)
+
+    print(f"DB={engine.url.render_as_string(hide_password=True)} rows={rows} users={users} repeat={repeat}")
+    _seed(engine, rows, users, now)
+    queries = _hot_queries(users // 2, start_of_day, end_of_day, now)
+
+    _use_legacy_indexes(engine)
+    _analyze(engine)
+    before = _measure(engine, queries, repeat)
+
+    with engine.begin() as conn:
+        applied = sync_indexes(conn)
+    _analyze(engine)
+    after = _measure(engine, queries, repeat)
+
+    print(f"sync_indexes: {', '.join(applied)}\n")
+    for name in queries:
+        (plan_before, ms_before), (plan_after, ms_after) = before[name], after[name]
+        print(f"[{name}] {ms_before:.3f} ms -> {ms_after:.3f} ms")
+        print(f"  before: {plan_before}")
+        print(f"  after : {plan_after}")
+    engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="tasks 인덱스 전/후 쿼리 플랜 비교")
+    parser.add_argument("--url", default=None, help="대상 DB URL (기본: 임시 SQLite 파일)")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--users", type=int, default=2_000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+    run(args.url, args.rows, args.users, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,7 @@ Task 도메인 모델.
 import enum
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, Enum, Integer, String, Text, func
+from sqlalchemy import Boolean, Column, DateTime, Enum, Index, Integer, String, Text, bindparam, func
 
 from app.core.database import Base
 
@@ -19,6 +19,10 @@ class TaskStatus(str, enum.Enum):
     TASK_MISS = "task_miss"
 
 
+# 더 이상 상태가 바뀌지 않는 상태. 미스 배치 대상에서 제외된다.
+TERMINAL_STATUSES = (TaskStatus.COMPLETED, TaskStatus.TASK_MISS)
+
+
 class Task(Base):
     """과업 테이블."""
 
@@ -31,16 +35,45 @@ class Task(Base):
         Enum(TaskStatus),
         nullable=False,
         default=TaskStatus.PENDING,
-        index=True,
     )
     from sqlalchemy import ForeignKey
     user_id = Column(
         Integer,
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     due_date = Column(DateTime, nullable=False, index=True)
-    is_archived = Column(Boolean, nullable=False, default=False, index=True)  # [PRO-B-21]
+    is_archived = Column(Boolean, nullable=False, default=False)  # [PRO-B-21]
     created_at = Column(DateTime, nullable=False, server_default=func.now())
     updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        # 사용자별 조회(홈 목록, 일일 생성 한도, 오늘/대시보드 통계, 누적 미스 수):
+        # user_id 동등 + due_date 범위로 탐색하고, is_archived/status는 인덱스 안에서 판정한다.
+        # 일일 한도·대시보드 집계는 is_archived 조건이 없으므로 due_date를 두 번째 키로 둔다.
+        Index("ix_tasks_user_due", user_id, due_date, is_archived, status),
+        # 미스 배치: 미완료 과업만 담는 partial index로 기한 만료 구간을 범위 탐색한다.
+        Index(
+            "ix_tasks_open_due_date",
+            due_date,
+            sqlite_where=status.notin_(TERMINAL_STATUSES),
+            postgresql_where=status.notin_(TERMINAL_STATUSES),
+        ),
+    )
+
+
+def open_status_clause():
+    """
+    ix_tasks_open_due_date의 WHERE와 같은 "미완료 상태" 조건.
+    값이 바인드 파라미터로 전달되면 planner가 partial index 조건과 일치함을 증명하지 못하므로
+    상태 값을 SQL에 상수로 렌더링한다.
+    """
+    return Task.status.notin_(
+        bindparam(
+            "terminal_statuses",
+            value=list(TERMINAL_STATUSES),
+            type_=Task.status.type,
+            expanding=True,
+            literal_execute=True,
+        )
+    )
@@ -1,16 +1,33 @@
 from datetime import datetime, timezone, timedelta
 import zoneinfo
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 
-from app.core.database import get_session_factory
+from app.core.database import get_db
+from app.core.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    NEXT_CURSOR_HEADER,
+    InvalidCursorError,
+    after_cursor,
+    decode_cursor,
+    order_by,
+    split_page,
+)
 from app.domains.task import models, schemas
+from app.domains.task.stats import (
+    MAX_HISTORY_DAYS,
+    invalidate_dashboard_cache,
+    load_dashboard,
+)
 from app.domains.auth.security import get_current_user
 from app.domains.auth.models import User
 from app.domains.TodayFocus.today_focus.service import TodayFocusServiceImpl
+from app.infrastructure.task_miss.counter import apply_miss_delta, miss_delta
+from app.infrastructure.task_miss.due_timer import due_timer
 
 router = APIRouter()
 
@@ -23,57 +40,75 @@ def _get_today_focus_service() -> TodayFocusServiceImpl:
         _today_focus_service = TodayFocusServiceImpl()
     return _today_focus_service
 
-def get_db():
-    db = get_session_factory()()
-    try:
-        yield db
-    finally:
-        db.close()
-
 def get_today_bounds():
     now = datetime.now()
     start_of_day = now.replace(hour=0, minute=0, second=0, microsecond=0)
     end_of_day = start_of_day + timedelta(days=1)
     return start_of_day, end_of_day
 
+_TASK_PAGE_KEY = (models.Task.due_date, models.Task.id)
+
+def _paginate_tasks(query, response: Response, cursor: Optional[str], limit: int, descending: bool):
+    """(due_date, id) keyset 페이지를 반환하고, 다음 페이지가 있으면 X-Next-Cursor 헤더를 설정한다."""
+    if cursor:
+        try:
+            values = decode_cursor(cursor, len(_TASK_PAGE_KEY))
+        except InvalidCursorError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        query = query.filter(after_cursor(_TASK_PAGE_KEY, values, descending))
+    rows = query.order_by(*order_by(_TASK_PAGE_KEY, descending)).limit(limit + 1).all()
+    page, next_cursor = split_page(rows, limit, lambda t: (t.due_date, t.id))
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return page
+
 @router.get("", response_model=List[schemas.TaskResponse])
 def list_my_tasks(
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 헤더 값"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """자신의 활성 할 일 조회 (보관되지 않은 것)"""
-    tasks = db.query(models.Task).filter(
+    """자신의 활성 할 일 조회 (보관되지 않은 것, due_date 오름차순 커서 페이지)"""
+    query = db.query(models.Task).filter(
         models.Task.user_id == current_user.id,
         models.Task.is_archived == False
-    ).order_by(models.Task.due_date.asc()).all()
-    return tasks
+    )
+    return _paginate_tasks(query, response, cursor, limit, descending=False)
 
 @router.get("/archive", response_model=List[schemas.TaskResponse])
 def list_archived_tasks(
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 헤더 값"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """보관함 조회"""
-    tasks = db.query(models.Task).filter(
+    """보관함 조회 (due_date 내림차순 커서 페이지)"""
+    query = db.query(models.Task).filter(
         models.Task.user_id == current_user.id,
         models.Task.is_archived == True
-    ).order_by(models.Task.due_date.desc()).all()
-    return tasks
+    )
+    return _paginate_tasks(query, response, cursor, limit, descending=True)
 
 @router.get("/past-incomplete", response_model=List[schemas.TaskResponse])
 def list_past_incomplete_tasks(
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 헤더 값"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """과거 미완료 할 일 조회"""
+    """과거 미완료 할 일 조회 (due_date 내림차순 커서 페이지)"""
     start_of_day, _ = get_today_bounds()
-    tasks = db.query(models.Task).filter(
+    query = db.query(models.Task).filter(
         models.Task.user_id == current_user.id,
         models.Task.is_archived == False,
         models.Task.due_date < start_of_day,
         models.Task.status != models.TaskStatus.COMPLETED
-    ).order_by(models.Task.due_date.desc()).all()
-    return tasks
+    )
+    return _paginate_tasks(query, response, cursor, limit, descending=True)
 
 @router.post("", response_model=schemas.TaskResponse, status_code=status.HTTP_201_CREATED)
 def create_task(
@@ -117,11 +152,14 @@ def create_task(
         status=models.TaskStatus.PENDING
     )
     db.add(new_task)
-    db.commit()
-    db.refresh(new_task)
+    # session_log 갱신도 같은 요청 세션에서 flush되므로 과업 생성과 함께 1회 커밋된다
     if task_data.session_id:
         now_utc = datetime.now(timezone.utc).replace(tzinfo=None)
         _get_today_focus_service().record_action(task_data.session_id, now_utc)
+    db.commit()
+    invalidate_dashboard_cache(current_user.id)
+    db.refresh(new_task)
+    due_timer.schedule(new_task.id, new_task.due_date)
     return new_task
 
 @router.patch("/{task_id}", response_model=schemas.TaskResponse)
@@ -139,6 +177,7 @@ def update_task(
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
 
+    previous_status = task.status
     if task_data.title is not None:
         task.title = task_data.title
     if task_data.description is not None:
@@ -148,11 +187,17 @@ def update_task(
     if task_data.is_archived is not None:
         task.is_archived = task_data.is_archived
 
-    db.commit()
-    db.refresh(task)
     if task_data.session_id:
         now_utc = datetime.now(timezone.utc).replace(tzinfo=None)
         _get_today_focus_service().record_action(task_data.session_id, now_utc)
+    db.commit()
+    invalidate_dashboard_cache(current_user.id)
+    db.refresh(task)
+    apply_miss_delta(current_user.id, miss_delta(previous_status, task.status))
+    if task.status in models.TERMINAL_STATUSES:
+        due_timer.cancel(task.id)
+    else:
+        due_timer.schedule(task.id, task.due_date)
     return task
 
 @router.delete("/{task_id}")
@@ -169,8 +214,12 @@ def delete_task(
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
         
+    previous_status = task.status
     db.delete(task)
     db.commit()
+    invalidate_dashboard_cache(current_user.id)
+    apply_miss_delta(current_user.id, miss_delta(previous_status, None))
+    due_timer.cancel(task_id)
     return {"message": "Task permanently deleted"}
 
 @router.post("/batch-action")
@@ -191,15 +240,24 @@ def batch_action_past_tasks(
         return {"message": "No valid tasks found for the operation"}
 
     if action_data.action == "archive":
+        delta = 0
         for t in tasks:
+            delta += miss_delta(t.status, models.TaskStatus.PENDING)
             t.is_archived = True
             t.status = models.TaskStatus.PENDING # optional status reset if wanted
         db.commit()
+        invalidate_dashboard_cache(current_user.id)
+        apply_miss_delta(current_user.id, delta)
         return {"message": f"Archived {len(tasks)} tasks."}
     else:
+        deleted_ids = [t.id for t in tasks]
+        delta = sum(miss_delta(t.status, None) for t in tasks)
         for t in tasks:
             db.delete(t)
         db.commit()
+        invalidate_dashboard_cache(current_user.id)
+        apply_miss_delta(current_user.id, delta)
+        due_timer.cancel(*deleted_ids)
         return {"message": f"Deleted {len(tasks)} tasks."}
 
 @router.get("/stats/today")
@@ -208,23 +266,25 @@ def get_productivity_stats(
     current_user: User = Depends(get_current_user)
 ):
     """[PRO-B-40] 오늘 생산성 달성률 조회"""
-    start_of_day, end_of_day = get_today_bounds()
-    
-    total_today = db.query(func.count(models.Task.id)).filter(
-        models.Task.user_id == current_user.id,
-        models.Task.due_date >= start_of_day,
-        models.Task.due_date < end_of_day
-    ).scalar()
-    
-    completed_today = db.query(func.count(models.Task.id)).filter(
-        models.Task.user_id == current_user.id,
-        models.Task.due_date >= start_of_day,
-        models.Task.due_date < end_of_day,
-        models.Task.status == models.TaskStatus.COMPLETED
-    ).scalar()
-    
+    stats = _get_dashboard_stats(db, current_user.id, history_days=0)
     return {
-        "total": total_today,
-        "completed": completed_today,
-        "rate": (completed_today / total_today * 100) if total_today > 0 else 0
+        "total": stats["total"],
+        "completed": stats["completed"],
+        "rate": stats["rate"],
     }
+
+@router.get("/stats/dashboard", response_model=schemas.DashboardStatsResponse)
+def get_dashboard_stats(
+    history_days: int = Query(0, ge=0, le=MAX_HISTORY_DAYS, description="오늘 이전 N일 일자별 집계"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """[PRO-B-40] 대시보드 통합 집계 (오늘 상태별 카운트·활성·과거 미완료 + 선택적 N일 히스토리)"""
+    stats = _get_dashboard_stats(db, current_user.id, history_days)
+    return schemas.DashboardStatsResponse(**stats, timestamp=datetime.now(timezone.utc))
+
+def _get_dashboard_stats(db: Session, user_id: int, history_days: int) -> dict:
+    """캐시를 먼저 확인하고, 미스 시 단일 조건부 집계 쿼리로 계산하여 캐시에 저장한다."""
+    start_of_day, end_of_day = get_today_bounds()
+    stats, cached = load_dashboard(db, user_id, start_of_day, end_of_day, history_days)
+    return {**stats, "cached": cached}
@@ -2,7 +2,7 @@
 Task 도메인 요청/응답 스키마.
 """
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 
 from pydantic import BaseModel, Field
 
@@ -34,6 +34,26 @@ class CumulativeMissCountResponse(BaseModel):
     timestamp: datetime = Field(..., description="조회 시각 (ms 단위 정밀도)")
 
 
+# 다건 miss count 조회 1회당 최대 사용자 수
+MAX_BULK_USERS = 5000
+
+
+class BulkMissCountRequest(BaseModel):
+    """사용자 다건 누적 task_miss 카운트 조회 요청."""
+
+    user_ids: list[str] = Field(..., min_length=1, max_length=MAX_BULK_USERS, description="사용자 식별자 목록")
+
+
+class BulkMissCountResponse(BaseModel):
+    """사용자 다건 누적 task_miss 카운트 응답."""
+
+    miss_counts: dict[str, int] = Field(..., description="user_id → 누적 task_miss 횟수")
+    cache_hits: int = Field(..., description="Redis 캐시에서 조회한 사용자 수")
+    aggregated: int = Field(..., description="DB에서 집계한 사용자 수")
+    execution_time_ms: float
+    timestamp: datetime
+
+
 class TaskMissBatchResultResponse(BaseModel):
     """배치 실행 결과 응답."""
 
@@ -41,6 +61,35 @@ class TaskMissBatchResultResponse(BaseModel):
     execution_time_ms: float = Field(..., description="배치 실행 소요 시간(ms)")
     timestamp: datetime = Field(..., description="배치 실행 시각")
 
+
+class TaskMissBatchMetricsResponse(BaseModel):
+    """배치 실행·청크 처리 시간 지표 응답."""
+
+    batch_mode: str = Field(..., description="배치 실행 모드 (full | incremental)")
+    chunk_size: int = Field(..., description="청크당 최대 전환 건수 (0이면 단일 트랜잭션)")
+    chunk_sleep_ms: int = Field(..., description="청크 사이 대기 시간(ms)")
+    total_runs: int
+    total_chunks: int
+    total_transitioned: int
+    last_run: Optional[dict[str, Any]] = Field(None, description="직전 실행 요약")
+    recent_chunk_latency: Optional[dict[str, Any]] = Field(
+        None,
+        description="최근 청크 처리 시간 분포 (avg/p50/p95/max, ms)",
+    )
+    due_timer: Optional[dict[str, Any]] = Field(None, description="기한 타이머 상태 (모드, 대기 예약 수, 누적 전환 수)")
+    timestamp: datetime
+
+
+class SchedulerLeaderResponse(BaseModel):
+    """task_miss 스케줄러 리더 선출 상태 응답."""
+
+    running: bool = Field(..., description="이 프로세스에서 스케줄러가 실행 중인지 여부")
+    backend: Optional[str] = Field(None, description="리더 선출 백엔드 (redis | postgres | file | none)")
+    leader_id: Optional[str] = Field(None, description="현재 리더 인스턴스 ID (host:pid:suffix)")
+    instance_id: Optional[str] = Field(None, description="응답한 프로세스의 인스턴스 ID")
+    is_leader: bool = Field(..., description="응답한 프로세스가 리더인지 여부")
+    timestamp: datetime
+
 class TaskCreate(BaseModel):
     title: str = Field(..., max_length=255)
     description: Optional[str] = None
@@ -57,3 +106,28 @@ class TaskUpdate(BaseModel):
 class TaskBatchAction(BaseModel):
     task_ids: list[int]
     action: str  # 'archive' or 'delete'
+
+
+class DashboardDayStats(BaseModel):
+    """하루 단위 과업 집계."""
+
+    date: str = Field(..., description="기한 일자 (YYYY-MM-DD)")
+    total: int
+    completed: int
+    missed: int
+
+
+class DashboardStatsResponse(BaseModel):
+    """대시보드 통합 집계 응답. 오늘 범위 카운트는 단일 조건부 집계 쿼리로 계산한다."""
+
+    total: int = Field(..., description="오늘 기한 과업 수")
+    completed: int = Field(..., description="오늘 기한 중 완료")
+    missed: int = Field(..., description="오늘 기한 중 task_miss")
+    in_progress: int = Field(..., description="오늘 기한 중 진행 중")
+    pending: int = Field(..., description="오늘 기한 중 대기")
+    rate: float = Field(..., description="오늘 완료율(%)")
+    active_count: int = Field(..., description="보관되지 않은 전체 과업 수")
+    past_incomplete_count: int = Field(..., description="오늘 이전 기한의 미완료·미보관 과업 수")
+    history: list[DashboardDayStats] = Field(default_factory=list, description="오늘 이전 N일 일자별 집계")
+    cached: bool = Field(False, description="캐시 적중 여부")
+    timestamp: datetime
@@ -0,0 +1,203 @@
+"""
+과업 대시보드 집계 [PRO-B-40].
+오늘 범위 total/completed/missed/in_progress/pending, 활성 과업 수, 과거 미완료 수를
+사용자 과업에 대한 단일 조건부 집계(SUM(CASE ...)) 쿼리로 계산하고,
+history_days > 0 이면 일자별 집계를 GROUP BY 쿼리 1회로 덧붙인다.
+결과는 Redis user:{user_id}:dashboard_stats 해시에 (일자, history_days) 필드로 캐싱하며,
+과업 생성·수정·삭제와 상태 전환(task_miss 배치, 전략 적용, 보관) 시 invalidate_dashboard_cache()로 삭제한다.
+캐시 값에 집계 소요 시간을 함께 저장해 만료 전에 확률적으로 1회 미리 재집계하고(XFetch),
+같은 필드의 동시 미스는 프로세스 내 single-flight로 집계 1회에 합친다 (load_dashboard).
+"""
+import json
+import logging
+import time
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import and_, case, func
+from sqlalchemy.orm import Session
+
+from app.core.redis import get_redis
+from app.core.stampede import SingleFlight, should_refresh_early
+from app.domains.task.models import Task, TaskStatus
+
+logger = logging.getLogger(__name__)
+
+DASHBOARD_CACHE_KEY = "user:{user_id}:dashboard_stats"
+CACHE_TTL_SECONDS = 300
+MAX_HISTORY_DAYS = 90
+# 캐시 값에 함께 저장하는 집계 소요 시간(ms) 필드 (조기 갱신 판정용, 응답에서는 제거)
+_COMPUTE_MS_FIELD = "_compute_ms"
+
+_dashboard_flight: SingleFlight[dict[str, Any]] = SingleFlight()
+
+
+def _count_if(*conditions) -> Any:
+    """조건을 모두 만족하는 행 수 (SUM(CASE WHEN ... THEN 1 ELSE 0 END))."""
+    return func.coalesce(func.sum(case((and_(*conditions), 1), else_=0)), 0)
+
+
+def aggregate_dashboard(
+    db: Session,
+    user_id: int,
+    start_of_day: datetime,
+    end_of_day: datetime,
+    history_days: int = 0,
+) -> dict[str, Any]:
+    """대시보드 집계를 계산한다. history_days는 0~MAX_HISTORY_DAYS 범위로 제한된다."""
+    in_today = and_(Task.due_date >= start_of_day, Task.due_date < end_of_day)
+    row = (
+        db.query(
+            _count_if(in_today),
+            _count_if(in_today, Task.status == TaskStatus.COMPLETED),
+            _count_if(in_today, Task.status == TaskStatus.TASK_MISS),
+            _count_if(in_today, Task.status == TaskStatus.IN_PROGRESS),
+            _count_if(in_today, Task.status == TaskStatus.PENDING),
+            _count_if(Task.is_archived == False),  # noqa: E712
+            _count_if(
+                Task.is_archived == False,  # noqa: E712
+                Task.due_date < start_of_day,
+                Task.status != TaskStatus.COMPLETED,
+            ),
+        )
+        .filter(Task.user_id == user_id)
+        .one()
+    )
+    total, completed, missed, in_progress, pending, active_count, past_incomplete = (int(v) for v in row)
+
+    stats: dict[str, Any] = {
+        "total": total,
+        "completed": completed,
+        "missed": missed,
+        "in_progress": in_progress,
+        "pending": pending,
+        "rate": (completed / total * 100) if total > 0 else 0,
+        "active_count": active_count,
+        "past_incomplete_count": past_incomplete,
+        "history": [],
+    }
+
+    history_days = max(0, min(history_days, MAX_HISTORY_DAYS))
+    if history_days > 0:
+        stats["history"] = _aggregate_history(db, user_id, start_of_day, history_days)
+    return stats
+
+
+def _aggregate_history(db: Session, user_id: int, start_of_day: datetime, days: int) -> list[dict[str, Any]]:
+    """[start_of_day - days, start_of_day) 구간을 기한 일자별로 집계한다. 과업이 없는 날은 0으로 채운다."""
+    day_col = func.date(Task.due_date)
+    rows = (
+        db.query(
+            day_col,
+            func.count(Task.id),
+            _count_if(Task.status == TaskStatus.COMPLETED),
+            _count_if(Task.status == TaskStatus.TASK_MISS),
+        )
+        .filter(
+            Task.user_id == user_id,
+            Task.due_date >= start_of_day - timedelta(days=days),
+            Task.due_date < start_of_day,
+        )
+        .group_by(day_col)
+        .all()
+    )
+    by_day = {str(r[0]): (int(r[1]), int(r[2]), int(r[3])) for r in rows}
+    history = []
+    first_day: date = (start_of_day - timedelta(days=days)).date()
+    for offset in range(days):
+        day = (first_day + timedelta(days=offset)).isoformat()
+        total, completed, missed = by_day.get(day, (0, 0, 0))
+        history.append({"date": day, "total": total, "completed": completed, "missed": missed})
+    return history
+
+
+def _cache_field(start_of_day: datetime, history_days: int) -> str:
+    # 날짜가 바뀌면 다른 필드를 읽으므로 전날 집계가 반환되지 않는다
+    return f"{start_of_day.date().isoformat()}:{history_days}"
+
+
+def get_cached_dashboard(user_id: int, start_of_day: datetime, history_days: int) -> dict[str, Any] | None:
+    """
+    캐시된 집계를 반환한다. 만료가 가까워 조기 갱신 대상으로 뽑힌 호출에는 None을 반환하여
+    해당 호출만 재집계하게 한다 (나머지 호출은 만료 전까지 기존 값을 계속 받는다).
+    """
+    client = get_redis()
+    if client is None:
+        return None
+    key = DASHBOARD_CACHE_KEY.format(user_id=user_id)
+    try:
+        pipe = client.pipeline(transaction=False)
+        pipe.hget(key, _cache_field(start_of_day, history_days))
+        pipe.pttl(key)
+        raw, ttl_ms = pipe.execute()
+        if raw is None:
+            return None
+        stats = json.loads(raw)
+        compute_ms = stats.pop(_COMPUTE_MS_FIELD, 0)
+        if should_refresh_early(ttl_ms, compute_ms):
+            logger.debug("대시보드 캐시 조기 갱신 user=%s (ttl %dms, 집계 %.1fms)", user_id, ttl_ms, compute_ms)
+            return None
+        return stats
+    except Exception:
+        logger.warning("대시보드 캐시 조회 실패 user=%s", user_id, exc_info=True)
+        return None
+
+
+def set_cached_dashboard(
+    user_id: int,
+    start_of_day: datetime,
+    history_days: int,
+    stats: dict[str, Any],
+    compute_ms: float = 0.0,
+) -> None:
+    client = get_redis()
+    if client is None:
+        return
+    key = DASHBOARD_CACHE_KEY.format(user_id=user_id)
+    try:
+        pipe = client.pipeline()
+        pipe.hset(key, _cache_field(start_of_day, history_days), json.dumps({**stats, _COMPUTE_MS_FIELD: compute_ms}))
+        pipe.expire(key, CACHE_TTL_SECONDS)
+        pipe.execute()
+    except Exception:
+        logger.warning("대시보드 캐시 저장 실패 user=%s", user_id, exc_info=True)
+
+
+def load_dashboard(
+    db: Session,
+    user_id: int,
+    start_of_day: datetime,
+    end_of_day: datetime,
+    history_days: int = 0,
+) -> tuple[dict[str, Any], bool]:
+    """
+    캐시를 먼저 확인하고, 미스(또는 조기 갱신) 시 집계하여 캐시에 저장한다.
+    같은 사용자·필드의 동시 미스는 먼저 들어온 요청의 집계 결과를 공유한다.
+    Returns: (집계, cached)
+    """
+    cached = get_cached_dashboard(user_id, start_of_day, history_days)
+    if cached is not None:
+        return cached, True
+
+    def _aggregate() -> dict[str, Any]:
+        start_ns = time.perf_counter_ns()
+        stats = aggregate_dashboard(db, user_id, start_of_day, end_of_day, history_days)
+        compute_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+        set_cached_dashboard(user_id, start_of_day, history_days, stats, compute_ms)
+        return stats
+
+    stats, _ = _dashboard_flight.do(f"{user_id}:{_cache_field(start_of_day, history_days)}", _aggregate)
+    return stats, False
+
+
+def invalidate_dashboard_cache(*user_ids: int | str) -> None:
+    """사용자의 대시보드 캐시를 삭제한다. 과업 변경 후 호출."""
+    if not user_ids:
+        return
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        client.delete(*(DASHBOARD_CACHE_KEY.format(user_id=uid) for uid in user_ids))
+    except Exception:
+        logger.warning("대시보드 캐시 무효화 실패 users=%s", user_ids, exc_info=True)
@@ -0,0 +1,7 @@
+"""
+cache_stats 인프라 패키지.
+2계층 캐시 네임스페이스별 적중률·크기와 무효화 버스 상태 관측 엔드포인트.
+"""
+from app.infrastructure.cache_stats.router import router
+
+__all__ = ["router"]
@@ -0,0 +1,38 @@
+"""
+캐시 관측 API 라우터.
+네임스페이스별 로컬·Redis 적중 수, 적중률, 로컬 계층 크기와 무효화 버스·Redis 브레이커 상태를 반환한다.
+"""
+from datetime import datetime, timezone
+
+from fastapi import APIRouter
+
+from app.core.cache import cache_stats, invalidation_bus
+from app.core.redis import get_redis_stats
+from app.infrastructure.cache_stats.schemas import (
+    CacheNamespaceStats,
+    CacheStatsResponse,
+    InvalidationBusStats,
+    RedisHealthStats,
+)
+
+router = APIRouter()
+
+
+@router.get(
+    "/stats",
+    response_model=CacheStatsResponse,
+    summary="캐시 적중률·무효화 상태 조회",
+)
+def get_cache_stats_endpoint() -> CacheStatsResponse:
+    """CACHE_<NAME>_* TTL 튜닝을 위해 이 워커의 네임스페이스별 누적 지표를 반환한다."""
+    return CacheStatsResponse(
+        namespaces=[CacheNamespaceStats(**stats) for stats in cache_stats()],
+        invalidation=InvalidationBusStats(
+            channel=invalidation_bus.channel,
+            instance_id=invalidation_bus.instance_id,
+            running=invalidation_bus.running,
+            received=invalidation_bus.received,
+        ),
+        redis=RedisHealthStats(**get_redis_stats()),
+        timestamp=datetime.now(timezone.utc),
+    )
@@ -0,0 +1,57 @@
+"""
+캐시 지표 응답 스키마.
+"""
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class CacheNamespaceStats(BaseModel):
+    """네임스페이스 1개의 누적 지표 (프로세스 기준)."""
+
+    name: str
+    ttl_seconds: Optional[int] = Field(None, description="Redis TTL (None: 만료 없음)")
+    local_ttl_seconds: float = Field(..., description="로컬 계층 TTL (0: 로컬 계층 사용 안 함)")
+    local_size: int = Field(..., description="로컬 계층 현재 항목 수")
+    local_hits: int
+    remote_hits: int
+    misses: int
+    writes: int
+    invalidations: int
+    remote_invalidations: int = Field(..., description="다른 프로세스의 알림으로 제거한 로컬 항목 수")
+    errors: int = Field(..., description="Redis 오류 횟수")
+    hit_ratio: Optional[float] = Field(None, description="(local_hits + remote_hits) / 조회 수")
+
+
+class InvalidationBusStats(BaseModel):
+    channel: str
+    instance_id: str
+    running: bool = Field(..., description="구독 스레드 동작 여부")
+    received: int = Field(..., description="다른 프로세스에서 받은 무효화 메시지 수")
+
+
+class RedisPoolStats(BaseModel):
+    max_connections: int
+    created: Optional[int] = Field(None, description="생성된 커넥션 수")
+    in_use: Optional[int] = Field(None, description="사용 중 커넥션 수")
+
+
+class RedisHealthStats(BaseModel):
+    """Redis 서킷 브레이커·헬스 체크·동기 풀 상태."""
+
+    state: str = Field(..., description="closed / open / half_open")
+    consecutive_failures: int
+    opened_total: int = Field(..., description="브레이커가 열린 누적 횟수")
+    short_circuited: int = Field(..., description="브레이커가 열려 Redis 호출 없이 넘긴 횟수")
+    retry_in_seconds: Optional[float] = Field(None, description="다음 시험 호출까지 남은 시간")
+    last_error: Optional[str] = None
+    health_check_running: bool
+    pool: RedisPoolStats
+
+
+class CacheStatsResponse(BaseModel):
+    namespaces: list[CacheNamespaceStats]
+    invalidation: InvalidationBusStats
+    redis: RedisHealthStats
+    timestamp: datetime
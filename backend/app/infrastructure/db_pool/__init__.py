@@ -0,0 +1,7 @@
+"""
+db_pool 인프라 패키지.
+DB 커넥션 풀 사용량·대기 시간 관측 엔드포인트.
+"""
+from app.infrastructure.db_pool.router import router
+
+__all__ = ["router"]
@@ -0,0 +1,29 @@
+"""
+커넥션 풀 관측 API 라우터.
+풀 크기, 사용 중/유휴 커넥션, overflow, 획득 대기 시간을 반환한다.
+"""
+from datetime import datetime, timezone
+
+from fastapi import APIRouter
+
+from app.core.database import get_pool_stats
+from app.infrastructure.db_pool.schemas import PoolStatsItem, PoolStatsResponse
+
+router = APIRouter()
+
+
+@router.get(
+    "/pool-stats",
+    response_model=PoolStatsResponse,
+    response_model_by_alias=True,
+    summary="DB 커넥션 풀 상태 조회",
+)
+def get_pool_stats_endpoint() -> PoolStatsResponse:
+    """DB_POOL_* 설정 튜닝을 위해 현재 풀 사용량과 누적 대기 시간을 반환한다."""
+    stats = get_pool_stats()
+    async_stats = stats.get("async")
+    return PoolStatsResponse(
+        sync=PoolStatsItem(**stats["sync"]),
+        async_=PoolStatsItem(**async_stats) if async_stats else None,
+        timestamp=datetime.now(timezone.utc),
+    )
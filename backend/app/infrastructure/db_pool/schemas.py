@@ -0,0 +1,32 @@
+"""
+커넥션 풀 상태 응답 스키마.
+"""
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class PoolStatsItem(BaseModel):
+    """엔진 1개의 풀 상태."""
+
+    pool_class: str
+    status: str = Field(..., description="SQLAlchemy pool.status() 문자열")
+    size: Optional[int] = Field(None, description="풀 기본 크기 (pool_size)")
+    checked_in: Optional[int] = Field(None, description="유휴 커넥션 수")
+    checked_out: Optional[int] = Field(None, description="사용 중 커넥션 수")
+    overflow: Optional[int] = Field(None, description="현재 overflow 수 (음수면 아직 생성되지 않은 여유분)")
+    checkout_count: Optional[int] = Field(None, description="누적 커넥션 획득 횟수")
+    timeout_count: Optional[int] = Field(None, description="pool_timeout 초과로 실패한 획득 횟수")
+    avg_wait_ms: Optional[float] = Field(None, description="평균 커넥션 획득 대기 시간(ms)")
+    max_wait_ms: Optional[float] = Field(None, description="최대 커넥션 획득 대기 시간(ms)")
+
+
+class PoolStatsResponse(BaseModel):
+    """동기·비동기 엔진 풀 상태 응답."""
+
+    sync: PoolStatsItem
+    async_: Optional[PoolStatsItem] = Field(None, alias="async", description="비동기 엔진 (생성된 경우)")
+    timestamp: datetime
+
+    model_config = {"populate_by_name": True}
@@ -7,7 +7,7 @@ from dataclasses import dataclass
 
 from sqlalchemy import func as sqlfunc
 
-from app.core.database import get_session_factory
+from app.core.database import session_scope
 from app.infrastructure.experiment_config.config import ExperimentConfig
 from app.infrastructure.task_archive.models import TaskArchive
 from app.infrastructure.task_miss.service import TaskMissServiceImpl
@@ -32,8 +32,7 @@ class OperationalValidator:
     def check_archive_limit(user_id: str) -> ValidationResult:
         """사용자의 보관함 레코드 수가 MAX_ARCHIVE_LIMIT을 초과하는지 검증한다."""
         limit = ExperimentConfig.max_archive_limit()
-        session_factory = get_session_factory()
-        with session_factory() as session:
+        with session_scope() as session:
             count = (
                 session.query(sqlfunc.count(TaskArchive.id))
                 .filter(TaskArchive.user_id == user_id)
@@ -6,8 +6,10 @@
 import logging
 from datetime import datetime, timezone
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
+from app.core.pagination import after_cursor, decode_cursor, order_by, split_page
 from app.domains.task.models import Task, TaskStatus
 from app.infrastructure.task_archive.models import TaskArchive, TaskStatusHistory
 
@@ -69,21 +71,35 @@ class ArchiveRepository:
         return history
 
     @staticmethod
-    def get_user_archives(session: Session, user_id: str) -> list[TaskArchive]:
-        """사용자의 보관함 목록을 반환한다."""
-        return (
-            session.query(TaskArchive)
-            .filter(TaskArchive.user_id == user_id)
-            .order_by(TaskArchive.archived_at.desc())
-            .all()
-        )
+    def get_user_archives(
+        session: Session, user_id: str, limit: int, cursor: str | None = None,
+    ) -> tuple[list[TaskArchive], str | None, int]:
+        """
+        사용자의 보관함 목록을 (archived_at, id) 내림차순 keyset 페이지로 반환한다.
+        반환: (페이지, 다음 커서 | None, 사용자의 전체 보관 건수). 잘못된 커서는 InvalidCursorError.
+        """
+        key = (TaskArchive.archived_at, TaskArchive.id)
+        condition = TaskArchive.user_id == user_id
+        query = session.query(TaskArchive).filter(condition)
+        if cursor:
+            query = query.filter(after_cursor(key, decode_cursor(cursor, len(key)), descending=True))
+        rows = query.order_by(*order_by(key, descending=True)).limit(limit + 1).all()
+        total = session.query(func.count(TaskArchive.id)).filter(condition).scalar()
+        return (*split_page(rows, limit, lambda a: (a.archived_at, a.id)), total)
 
     @staticmethod
-    def get_task_history(session: Session, task_id: int) -> list[TaskStatusHistory]:
-        """특정 과업의 상태 변경 이력을 시간순으로 반환한다."""
-        return (
-            session.query(TaskStatusHistory)
-            .filter(TaskStatusHistory.task_id == task_id)
-            .order_by(TaskStatusHistory.changed_at.asc())
-            .all()
-        )
+    def get_task_history(
+        session: Session, task_id: int, limit: int, cursor: str | None = None,
+    ) -> tuple[list[TaskStatusHistory], str | None, int]:
+        """
+        특정 과업의 상태 변경 이력을 (changed_at, id) 시간순 keyset 페이지로 반환한다.
+        반환: (페이지, 다음 커서 | None, 과업의 전체 이력 건수). 잘못된 커서는 InvalidCursorError.
+        """
+        key = (TaskStatusHistory.changed_at, TaskStatusHistory.id)
+        condition = TaskStatusHistory.task_id == task_id
+        query = session.query(TaskStatusHistory).filter(condition)
+        if cursor:
+            query = query.filter(after_cursor(key, decode_cursor(cursor, len(key))))
+        rows = query.order_by(*order_by(key)).limit(limit + 1).all()
+        total = session.query(func.count(TaskStatusHistory.id)).filter(condition).scalar()
+        return (*split_page(rows, limit, lambda h: (h.changed_at, h.id)), total)
@@ -4,8 +4,11 @@
 """
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, HTTPException, Path
+from typing import Optional
 
+from fastapi import APIRouter, HTTPException, Path, Query
+
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, InvalidCursorError
 from app.infrastructure.task_archive.schemas import (
     ArchiveItemResponse,
     ArchiveListResponse,
@@ -60,15 +63,21 @@ def apply_transition(
 )
 def get_user_archives(
     user_id: str = Path(..., description="사용자 식별자"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
 ) -> ArchiveListResponse:
-    """보관함 테이블에서 해당 사용자의 보관된 과업을 조회한다."""
+    """보관함 테이블에서 해당 사용자의 보관된 과업을 최근 보관 순으로 페이지 단위 조회한다. total_count는 전체 보관 건수."""
     service = _get_service()
-    archives = service.get_user_archives(user_id)
+    try:
+        archives, next_cursor, total_count = service.get_user_archives(user_id, limit, cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     items = [ArchiveItemResponse.model_validate(a) for a in archives]
     return ArchiveListResponse(
         user_id=user_id,
-        total_count=len(items),
+        total_count=total_count,
         archives=items,
+        next_cursor=next_cursor,
         timestamp=datetime.now(timezone.utc),
     )
 
@@ -82,14 +91,20 @@ def get_user_archives(
 )
 def get_task_status_history(
     task_id: int = Path(..., description="과업 ID"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
 ) -> StatusHistoryListResponse:
-    """해당 과업의 모든 상태 전환 기록을 시간순으로 반환한다."""
+    """해당 과업의 상태 전환 기록을 시간순으로 페이지 단위 반환한다. total_count는 전체 이력 건수."""
     service = _get_service()
-    history = service.get_task_history(task_id)
+    try:
+        history, next_cursor, total_count = service.get_task_history(task_id, limit, cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     items = [StatusHistoryItemResponse.model_validate(h) for h in history]
     return StatusHistoryListResponse(
         task_id=task_id,
-        total_count=len(items),
+        total_count=total_count,
         history=items,
+        next_cursor=next_cursor,
         timestamp=datetime.now(timezone.utc),
     )
@@ -62,8 +62,9 @@ class ArchiveListResponse(BaseModel):
     """보관함 목록 응답 [PRO-B-23]."""
 
     user_id: str
-    total_count: int
+    total_count: int = Field(..., description="사용자의 전체 보관 건수 (페이지 크기와 무관)")
     archives: list[ArchiveItemResponse] = Field(default_factory=list)
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 null)")
     timestamp: datetime
 
 
@@ -84,6 +85,7 @@ class StatusHistoryListResponse(BaseModel):
     """상태 변경 이력 목록 응답 [PRO-B-23]."""
 
     task_id: int
-    total_count: int
+    total_count: int = Field(..., description="과업의 전체 상태 변경 이력 건수 (페이지 크기와 무관)")
     history: list[StatusHistoryItemResponse] = Field(default_factory=list)
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 null)")
     timestamp: datetime
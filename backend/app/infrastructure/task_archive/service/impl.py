@@ -8,16 +8,17 @@ import logging
 import time
 from datetime import datetime, timezone
 
-from app.core.database import get_session_factory
-from app.core.redis import get_redis
+from app.core.database import session_scope
 from app.domains.task.models import Task, TaskStatus
+from app.domains.task.stats import invalidate_dashboard_cache
+from app.infrastructure.task_miss.counter import apply_miss_delta, miss_delta
+from app.infrastructure.task_miss.due_timer import due_timer
 from app.infrastructure.task_archive.models import TaskArchive, TaskStatusHistory
 from app.infrastructure.task_archive.repository import ArchiveRepository
 from app.infrastructure.task_archive.schemas import StrategyType, TransitionRequest, TransitionResponse
 
 logger = logging.getLogger(__name__)
 
-REDIS_MISS_KEY = "user:{user_id}:miss_count"
 
 # [PRO-B-23] strategy → 전환 대상 상태
 _TRANSITION_MAP: dict[StrategyType, TaskStatus] = {
@@ -33,10 +34,9 @@ class TaskArchiveServiceImpl:
     def apply_transition(self, task_id: int, request: TransitionRequest) -> TransitionResponse:
         start_ns = time.perf_counter_ns()
         now = datetime.now(timezone.utc)
-        session_factory = get_session_factory()
         repo = ArchiveRepository()
 
-        with session_factory() as session:
+        with session_scope() as session:
             task: Task | None = session.get(Task, task_id)
             if task is None:
                 raise ValueError(f"과업을 찾을 수 없습니다: task_id={task_id}")
@@ -45,6 +45,7 @@ class TaskArchiveServiceImpl:
             new_status = _TRANSITION_MAP[request.strategy_select]
             new_status_str = new_status.value
             user_id = task.user_id
+            due_date = task.due_date
             archived = False
 
             # [PRO-B-23] 상태 변경 이력 기록 (전환 전에 기록하여 Archive 삭제 후에도 보존)
@@ -68,6 +69,7 @@ class TaskArchiveServiceImpl:
                 task.is_archived = False
                 if request.new_due_date:
                     task.due_date = request.new_due_date
+                    due_date = task.due_date
 
             elif request.strategy_select == StrategyType.KEEP:
                 task.status = new_status
@@ -76,9 +78,12 @@ class TaskArchiveServiceImpl:
 
             session.flush()
             history_id = history.id
-            session.commit()
 
-        self._invalidate_miss_cache(user_id)
+        self._update_miss_cache(user_id, miss_delta(prev_status, None if archived else new_status))
+        if new_status == TaskStatus.PENDING and not archived:
+            due_timer.schedule(task_id, due_date)
+        else:
+            due_timer.cancel(task_id)
 
         elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
         logger.info(
@@ -103,26 +108,20 @@ class TaskArchiveServiceImpl:
             timestamp=now,
         )
 
-    def get_user_archives(self, user_id: str) -> list[TaskArchive]:
-        session_factory = get_session_factory()
-        with session_factory() as session:
-            archives = ArchiveRepository.get_user_archives(session, user_id)
-            session.expunge_all()
-        return archives
+    def get_user_archives(
+        self, user_id: str, limit: int, cursor: str | None = None,
+    ) -> tuple[list[TaskArchive], str | None, int]:
+        with session_scope() as session:
+            return ArchiveRepository.get_user_archives(session, user_id, limit, cursor)
 
-    def get_task_history(self, task_id: int) -> list[TaskStatusHistory]:
-        session_factory = get_session_factory()
-        with session_factory() as session:
-            history = ArchiveRepository.get_task_history(session, task_id)
-            session.expunge_all()
-        return history
+    def get_task_history(
+        self, task_id: int, limit: int, cursor: str | None = None,
+    ) -> tuple[list[TaskStatusHistory], str | None, int]:
+        with session_scope() as session:
+            return ArchiveRepository.get_task_history(session, task_id, limit, cursor)
 
     @staticmethod
-    def _invalidate_miss_cache(user_id: str) -> None:
-        client = get_redis()
-        if client is None:
-            return
-        try:
-            client.delete(REDIS_MISS_KEY.format(user_id=user_id))
-        except Exception:
-            logger.warning("[PRO-B-23] Redis 캐시 무효화 실패 user=%s", user_id, exc_info=True)
+    def _update_miss_cache(user_id: str, delta: int) -> None:
+        """miss_count 카운터를 증감하고 대시보드 캐시를 삭제한다."""
+        apply_miss_delta(user_id, delta)
+        invalidate_dashboard_cache(user_id)
@@ -15,10 +15,14 @@ class TaskArchiveService(Protocol):
         """전략에 따라 과업 상태를 전환하고, Archive 시 보관함으로 격리한다."""
         ...
 
-    def get_user_archives(self, user_id: str) -> list[TaskArchive]:
-        """사용자의 보관함 과업 목록을 반환한다."""
+    def get_user_archives(
+        self, user_id: str, limit: int, cursor: str | None = None,
+    ) -> tuple[list[TaskArchive], str | None, int]:
+        """사용자의 보관함 과업 목록 한 페이지, 다음 커서, 전체 보관 건수를 반환한다."""
         ...
 
-    def get_task_history(self, task_id: int) -> list[TaskStatusHistory]:
-        """특정 과업의 상태 변경 이력을 반환한다."""
+    def get_task_history(
+        self, task_id: int, limit: int, cursor: str | None = None,
+    ) -> tuple[list[TaskStatusHistory], str | None, int]:
+        """특정 과업의 상태 변경 이력 한 페이지, 다음 커서, 전체 이력 건수를 반환한다."""
         ...
@@ -0,0 +1,73 @@
+"""보관함 목록·상태 변경 이력 조회 단위 테스트 — 커서 페이지와 전체 건수(total_count) [PRO-B-23]."""
+
+from datetime import datetime, timedelta
+
+from app.core.database import session_scope
+from app.infrastructure.task_archive.models import TaskArchive, TaskStatusHistory
+
+BASE = datetime(2026, 1, 1)
+
+
+def _add_archives(user_id: str, n: int, start_id: int = 1) -> None:
+    with session_scope() as session:
+        session.add_all(
+            TaskArchive(
+                original_task_id=start_id + i,
+                title="t",
+                original_status="pending",
+                user_id=user_id,
+                due_date=BASE,
+                task_created_at=BASE,
+                archived_at=BASE + timedelta(minutes=i),
+            )
+            for i in range(n)
+        )
+
+
+def _add_history(task_id: int, n: int) -> None:
+    with session_scope() as session:
+        session.add_all(
+            TaskStatusHistory(
+                task_id=task_id, previous_status="pending", new_status="task_miss", changed_at=BASE + timedelta(minutes=i)
+            )
+            for i in range(n)
+        )
+
+
+def _read_all_pages(client, url: str, limit: int) -> list[dict]:
+    pages, cursor = [], None
+    while True:
+        params = {"limit": limit, **({"cursor": cursor} if cursor else {})}
+        response = client.get(url, params=params)
+        assert response.status_code == 200
+        pages.append(response.json())
+        cursor = pages[-1]["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+def test_archive_total_count_covers_all_pages(client):
+    _add_archives("u1", 7)
+    _add_archives("u2", 2, start_id=100)
+
+    pages = _read_all_pages(client, "/task-archive/users/u1/archives", limit=3)
+
+    assert [len(page["archives"]) for page in pages] == [3, 3, 1]
+    assert [page["total_count"] for page in pages] == [7, 7, 7]
+    archived_at = [item["archived_at"] for page in pages for item in page["archives"]]
+    assert archived_at == sorted(archived_at, reverse=True)
+
+
+def test_history_total_count_covers_all_pages(client):
+    _add_history(1, 5)
+    _add_history(2, 1)
+
+    pages = _read_all_pages(client, "/task-archive/tasks/1/history", limit=2)
+
+    assert [len(page["history"]) for page in pages] == [2, 2, 1]
+    assert [page["total_count"] for page in pages] == [5, 5, 5]
+
+
+def test_empty_listings_have_zero_total(client):
+    assert client.get("/task-archive/users/nobody/archives").json()["total_count"] == 0
+    assert client.get("/task-archive/tasks/404/history").json()["total_count"] == 0
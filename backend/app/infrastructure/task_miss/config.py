@@ -0,0 +1,83 @@
+"""
+task_miss 배치 실행 설정 [PRO-B-10].
+환경 변수로 오버라이드 가능하며, 미설정 시 기본값을 사용한다.
+"""
+import os
+
+BATCH_MODE_FULL = "full"
+BATCH_MODE_INCREMENTAL = "incremental"
+
+DUE_TIMER_OFF = "off"
+DUE_TIMER_MEMORY = "memory"
+DUE_TIMER_REDIS = "redis"
+
+DEFAULT_BATCH_MODE = BATCH_MODE_FULL
+DEFAULT_FULL_SWEEP_EVERY = 60
+DEFAULT_CHUNK_SIZE = 0
+DEFAULT_CHUNK_SLEEP_MS = 50
+DEFAULT_DUE_TIMER = DUE_TIMER_MEMORY
+DEFAULT_RECONCILE_SECONDS = 600
+DEFAULT_DUE_TIMER_HORIZON_HOURS = 24
+DEFAULT_DUE_TIMER_REDIS_POLL_MS = 1000
+DEFAULT_COUNTER_RECONCILE_SECONDS = 3600
+
+
+def get_batch_mode() -> str:
+    """배치 실행 모드 (full | incremental). 알 수 없는 값이면 full."""
+    mode = os.getenv("TASK_MISS_BATCH_MODE", DEFAULT_BATCH_MODE).strip().lower()
+    if mode not in (BATCH_MODE_FULL, BATCH_MODE_INCREMENTAL):
+        return DEFAULT_BATCH_MODE
+    return mode
+
+
+def get_full_sweep_every() -> int:
+    """
+    incremental 모드에서 N회 실행마다 전체 재스캔(정합성 보정)을 1회 수행한다.
+    과거 due_date로 생성·수정된 과업은 watermark 이전 구간에 들어가므로 이 재스캔에서 전환된다.
+    0 이하이면 재스캔하지 않는다.
+    """
+    return int(os.getenv("TASK_MISS_FULL_SWEEP_EVERY", str(DEFAULT_FULL_SWEEP_EVERY)))
+
+
+def get_chunk_size() -> int:
+    """
+    청크 단위 실행 시 한 트랜잭션에서 전환할 최대 과업 수.
+    0 이하이면 청크를 나누지 않고 단일 UPDATE로 처리한다.
+    """
+    return int(os.getenv("TASK_MISS_CHUNK_SIZE", str(DEFAULT_CHUNK_SIZE)))
+
+
+def get_chunk_sleep_ms() -> int:
+    """청크 사이 대기 시간(ms). 다른 writer가 락을 획득할 틈을 준다."""
+    return max(0, int(os.getenv("TASK_MISS_CHUNK_SLEEP_MS", str(DEFAULT_CHUNK_SLEEP_MS))))
+
+
+def get_due_timer_mode() -> str:
+    """
+    기한 타이머 모드 (off | memory | redis). 알 수 없는 값이면 memory.
+    off이면 타이머 없이 주기 스캔만으로 전환한다.
+    """
+    mode = os.getenv("TASK_MISS_DUE_TIMER", DEFAULT_DUE_TIMER).strip().lower()
+    if mode not in (DUE_TIMER_OFF, DUE_TIMER_MEMORY, DUE_TIMER_REDIS):
+        return DEFAULT_DUE_TIMER
+    return mode
+
+
+def get_reconcile_seconds() -> int:
+    """타이머 사용 시 주기 스캔(정합성 보정 스윕) 간격(초)."""
+    return max(60, int(os.getenv("TASK_MISS_RECONCILE_SECONDS", str(DEFAULT_RECONCILE_SECONDS))))
+
+
+def get_due_timer_horizon_hours() -> int:
+    """리더가 시작 시·스윕마다 타이머에 적재하는 예정 과업의 범위(시간)."""
+    return max(1, int(os.getenv("TASK_MISS_DUE_TIMER_HORIZON_HOURS", str(DEFAULT_DUE_TIMER_HORIZON_HOURS))))
+
+
+def get_due_timer_redis_poll_ms() -> int:
+    """redis 모드에서 리더가 만료 항목을 조회하는 주기(ms). 전환 지연의 상한이 된다."""
+    return max(50, int(os.getenv("TASK_MISS_DUE_TIMER_REDIS_POLL_MS", str(DEFAULT_DUE_TIMER_REDIS_POLL_MS))))
+
+
+def get_counter_reconcile_seconds() -> int:
+    """miss_count 카운터를 DB 집계와 대조·보정하는 주기(초)."""
+    return max(60, int(os.getenv("TASK_MISS_COUNTER_RECONCILE_SECONDS", str(DEFAULT_COUNTER_RECONCILE_SECONDS))))
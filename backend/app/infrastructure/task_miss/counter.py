@@ -0,0 +1,96 @@
+"""
+사용자별 누적 miss_count 카운터 [PRO-B-10].
+user:{userId}:miss_count 키를 캐시 만료·삭제 후 재집계하는 대신, 상태를 바꾸는 코드 경로에서
+커밋 직후 INCRBY/DECRBY로 증감하여 유지한다 (TTL 없음).
+
+- 키가 없는 사용자는 증감하지 않는다. 첫 조회 시 DB 집계값을 SET NX로 적재한 뒤부터 증분으로 유지된다.
+- 커밋과 증감 사이의 프로세스 종료·Redis 장애로 생긴 오차는 리더가
+  TASK_MISS_COUNTER_RECONCILE_SECONDS 주기로 DB와 대조하여 보정한다 (reconcile_miss_counts).
+- 2계층 캐시 네임스페이스(miss_count)로 관리하며, 증감·보정 시 다른 프로세스의 로컬 계층은 pub/sub로 무효화된다.
+"""
+import logging
+from itertools import islice
+from typing import Iterable, Mapping
+
+from sqlalchemy import func, select
+
+from app.core.cache import INT, CacheNamespace
+from app.core.database import get_session_factory
+from app.domains.task.models import Task, TaskStatus
+
+logger = logging.getLogger(__name__)
+
+RECONCILE_BATCH_SIZE = 500
+
+# Redis 키는 만료 없음. 로컬 계층은 pub/sub 유실·Redis 장애 시에도 어긋남이 5초를 넘지 않도록 짧게 둔다.
+miss_count_cache: CacheNamespace[int] = CacheNamespace(
+    "miss_count",
+    "user:{id}:miss_count",
+    INT,
+    ttl_seconds=None,
+    local_ttl_seconds=5,
+)
+
+
+def _is_miss(status: TaskStatus | str | None) -> bool:
+    if status is None:
+        return False
+    value = status.value if isinstance(status, TaskStatus) else str(status)
+    return value == TaskStatus.TASK_MISS.value
+
+
+def miss_delta(previous: TaskStatus | str | None, current: TaskStatus | str | None) -> int:
+    """상태 변경에 따른 miss_count 증감 (+1 / 0 / -1). 삭제·보관함 이동은 current=None."""
+    return int(_is_miss(current)) - int(_is_miss(previous))
+
+
+def apply_miss_deltas(deltas: Mapping[int | str, int]) -> None:
+    """사용자별 증감을 파이프라인 1회로 반영한다 (적재된 카운터만). DB 커밋 이후에 호출한다."""
+    miss_count_cache.incr(deltas, only_if_exists=True)
+
+
+def apply_miss_delta(user_id: int | str, delta: int) -> None:
+    apply_miss_deltas({user_id: delta})
+
+
+def drop_miss_counts(*user_ids: int | str) -> None:
+    """카운터를 삭제한다 (회원 탈퇴 등). 다음 조회에서 DB 집계로 다시 적재된다."""
+    miss_count_cache.invalidate(*user_ids)
+
+
+def _count_by_user(user_ids: Iterable[int]) -> dict[int, int]:
+    with get_session_factory()() as session:
+        rows = session.execute(
+            select(Task.user_id, func.count(Task.id))
+            .where(Task.user_id.in_(list(user_ids)), Task.status == TaskStatus.TASK_MISS)
+            .group_by(Task.user_id)
+        ).all()
+    return {row[0]: row[1] for row in rows}
+
+
+def reconcile_miss_counts(batch_size: int = RECONCILE_BATCH_SIZE) -> dict[str, int]:
+    """
+    적재된 카운터를 DB 집계와 대조하여 어긋난 값만 보정한다.
+    키 SCAN → MGET → 사용자 묶음별 GROUP BY 1회 → 값이 그대로인 키만 compare-and-set.
+    Returns: {"checked": 대조한 키 수, "corrected": 보정한 키 수}
+    """
+    checked = corrected = 0
+    try:
+        idents = (ident for ident in miss_count_cache.scan_idents(count=batch_size) if ident.isdigit())
+        while batch := list(islice(idents, batch_size)):
+            cached = {
+                int(ident): value
+                for ident, value in zip(batch, miss_count_cache.get_many(batch, use_local=False))
+                if value is not None
+            }
+            actual = _count_by_user(cached) if cached else {}
+            drift = {uid: actual.get(uid, 0) - value for uid, value in cached.items() if actual.get(uid, 0) != value}
+            if drift:
+                corrected += miss_count_cache.compare_and_set(
+                    [(uid, cached[uid], cached[uid] + diff) for uid, diff in drift.items()]
+                )
+                logger.warning("miss_count 카운터 보정: %s", drift)
+            checked += len(cached)
+    except Exception:
+        logger.warning("miss_count 카운터 보정 실패", exc_info=True)
+    return {"checked": checked, "corrected": corrected}
@@ -0,0 +1,234 @@
+"""
+기한(due_date) 타이머 [PRO-B-10].
+과업 생성·상태 변경·전략 MODIFY 시 due_date를 예약해 두었다가, 기한이 지나는 시점에 해당 과업만 task_miss로 전환한다.
+전환 조건(기한 경과 + 미완료)은 배치와 동일하게 DB에서 다시 확인하므로,
+예약 후 완료·기한 변경된 과업은 타이머가 울려도 전환되지 않는다.
+타이머를 쓰면 TaskMissScheduler의 주기 스캔은 TASK_MISS_RECONCILE_SECONDS 간격의 정합성 보정 스윕으로만 동작한다.
+
+TASK_MISS_DUE_TIMER:
+- memory(기본): 프로세스 내 heap. 각 워커는 자신이 예약한 과업을 직접 전환하고,
+  리더는 시작 시·스윕마다 horizon 안의 예정 과업을 DB에서 적재한다.
+- redis: sorted set(score=기한 epoch). 어느 워커든 ZADD하고, 리더만 만료 항목을 꺼내 전환한다.
+  Redis 사용 불가 시 memory 방식으로 대체한다.
+- off: 타이머 없이 주기 스캔만 사용한다.
+"""
+import heapq
+import logging
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Iterable
+
+from sqlalchemy import select
+
+from app.core.database import get_session_factory
+from app.core.redis import get_redis
+from app.domains.task.models import Task, open_status_clause
+from app.infrastructure.task_miss.config import (
+    DUE_TIMER_OFF,
+    DUE_TIMER_REDIS,
+    get_due_timer_horizon_hours,
+    get_due_timer_mode,
+    get_due_timer_redis_poll_ms,
+)
+
+logger = logging.getLogger(__name__)
+
+DUE_ZSET_KEY = "task_miss:due"
+# 한 번에 전환할 최대 과업 수
+FIRE_BATCH_SIZE = 500
+# 예약이 없을 때의 최대 대기 시간(초)
+IDLE_WAIT_SECONDS = 60.0
+
+
+def _epoch(due_date: datetime) -> float:
+    """배치와 같은 기준으로 naive due_date는 UTC로 간주한다."""
+    if due_date.tzinfo is None:
+        due_date = due_date.replace(tzinfo=timezone.utc)
+    return due_date.timestamp()
+
+
+class DueTimer:
+    """기한 예약 heap(또는 Redis ZSET)과 만료 시 전환을 수행하는 백그라운드 스레드."""
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._heap: list[tuple[float, int]] = []
+        # task_id → 최신 예약 시각. heap에 남은 이전 예약은 꺼낼 때 버린다.
+        self._due: dict[int, float] = {}
+        self._thread: threading.Thread | None = None
+        self._running = False
+        self._leader = False
+        self._fired_total = 0
+
+    # ── 예약 ──────────────────────────────────────────────
+
+    def schedule(self, task_id: int, due_date: datetime) -> None:
+        """과업의 기한을 예약(또는 갱신)한다. 이미 지난 기한이면 즉시 전환 대상이 된다."""
+        self.schedule_many([(task_id, due_date)])
+
+    def schedule_many(self, items: Iterable[tuple[int, datetime]]) -> None:
+        mode = get_due_timer_mode()
+        if mode == DUE_TIMER_OFF:
+            return
+        entries = {task_id: _epoch(due_date) for task_id, due_date in items}
+        if not entries:
+            return
+        if mode == DUE_TIMER_REDIS and self._zadd(entries):
+            return
+        with self._cond:
+            for task_id, ts in entries.items():
+                if self._due.get(task_id) == ts:
+                    continue
+                self._due[task_id] = ts
+                heapq.heappush(self._heap, (ts, task_id))
+            self._cond.notify()
+
+    def cancel(self, *task_ids: int) -> None:
+        """예약을 취소한다 (완료·삭제된 과업)."""
+        if not task_ids or get_due_timer_mode() == DUE_TIMER_OFF:
+            return
+        with self._cond:
+            for task_id in task_ids:
+                self._due.pop(task_id, None)
+        if get_due_timer_mode() == DUE_TIMER_REDIS:
+            client = get_redis()
+            if client is not None:
+                try:
+                    client.zrem(DUE_ZSET_KEY, *[str(t) for t in task_ids])
+                except Exception:
+                    logger.warning("기한 타이머 Redis 취소 실패", exc_info=True)
+
+    def warm(self, now: datetime | None = None) -> int:
+        """
+        [now, now + horizon) 에 기한이 도래하는 미완료 과업을 예약한다. 리더가 시작 시·스윕마다 호출.
+        ix_tasks_open_due_date partial index로 범위 탐색한다. Returns: 적재 건수
+        """
+        if get_due_timer_mode() == DUE_TIMER_OFF:
+            return 0
+        now = now or datetime.now(timezone.utc)
+        until = now + timedelta(hours=get_due_timer_horizon_hours())
+        with get_session_factory()() as session:
+            rows = session.execute(
+                select(Task.id, Task.due_date).where(
+                    Task.due_date >= now, Task.due_date < until, open_status_clause()
+                )
+            ).all()
+        self.schedule_many((row[0], row[1]) for row in rows)
+        logger.info("기한 타이머 적재: %d건 (~%s)", len(rows), until.isoformat(timespec="minutes"))
+        return len(rows)
+
+    # ── 실행 ──────────────────────────────────────────────
+
+    def start(self) -> None:
+        if get_due_timer_mode() == DUE_TIMER_OFF or self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="task-miss-due-timer", daemon=True)
+        self._thread.start()
+        logger.info("기한 타이머 시작 (모드: %s)", get_due_timer_mode())
+
+    def stop(self) -> None:
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def set_leader(self, leader: bool) -> None:
+        """redis 모드에서 만료 항목 조회는 리더만 수행한다."""
+        with self._cond:
+            self._leader = leader
+            self._cond.notify()
+
+    def snapshot(self) -> dict:
+        with self._cond:
+            pending_local = len(self._due)
+        pending_redis = None
+        if get_due_timer_mode() == DUE_TIMER_REDIS:
+            client = get_redis()
+            if client is not None:
+                try:
+                    pending_redis = client.zcard(DUE_ZSET_KEY)
+                except Exception:
+                    pass
+        return {
+            "mode": get_due_timer_mode(),
+            "running": self._running,
+            "leader": self._leader,
+            "pending_local": pending_local,
+            "pending_redis": pending_redis,
+            "fired_total": self._fired_total,
+        }
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                if not self._running:
+                    return
+                self._cond.wait(timeout=self._wait_seconds())
+                if not self._running:
+                    return
+                task_ids = self._pop_local_due()
+            if self._leader and get_due_timer_mode() == DUE_TIMER_REDIS:
+                task_ids += self._pop_redis_due()
+            if task_ids:
+                self._fire(task_ids)
+
+    def _wait_seconds(self) -> float:
+        """다음 로컬 기한까지 남은 시간. redis 모드 리더는 폴링 주기를 넘지 않는다."""
+        wait = IDLE_WAIT_SECONDS
+        while self._heap and self._due.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+        if self._heap:
+            wait = min(wait, self._heap[0][0] - time.time())
+        if self._leader and get_due_timer_mode() == DUE_TIMER_REDIS:
+            wait = min(wait, get_due_timer_redis_poll_ms() / 1000)
+        return max(0.0, wait)
+
+    def _pop_local_due(self) -> list[int]:
+        now = time.time()
+        task_ids: list[int] = []
+        while self._heap and self._heap[0][0] < now and len(task_ids) < FIRE_BATCH_SIZE:
+            ts, task_id = heapq.heappop(self._heap)
+            if self._due.get(task_id) == ts:
+                del self._due[task_id]
+                task_ids.append(task_id)
+        return task_ids
+
+    def _zadd(self, entries: dict[int, float]) -> bool:
+        client = get_redis()
+        if client is None:
+            return False
+        try:
+            client.zadd(DUE_ZSET_KEY, {str(task_id): ts for task_id, ts in entries.items()})
+            return True
+        except Exception:
+            logger.warning("기한 타이머 Redis 예약 실패 — 프로세스 내 타이머로 대체", exc_info=True)
+            return False
+
+    def _pop_redis_due(self) -> list[int]:
+        client = get_redis()
+        if client is None:
+            return []
+        try:
+            members = client.zrangebyscore(DUE_ZSET_KEY, "-inf", f"({time.time()}", start=0, num=FIRE_BATCH_SIZE)
+            if members:
+                client.zrem(DUE_ZSET_KEY, *members)
+            return [int(m) for m in members]
+        except Exception:
+            logger.warning("기한 타이머 Redis 조회 실패", exc_info=True)
+            return []
+
+    def _fire(self, task_ids: list[int]) -> None:
+        from app.infrastructure.task_miss.scheduler import transition_due_tasks
+
+        try:
+            self._fired_total += transition_due_tasks(task_ids)
+        except Exception:
+            # 전환 실패분은 다음 정합성 스윕에서 처리된다
+            logger.exception("기한 타이머 전환 실패: %d건", len(task_ids))
+
+
+due_timer = DueTimer()
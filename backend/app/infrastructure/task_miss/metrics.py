@@ -0,0 +1,73 @@
+"""
+task_miss 배치 실행 지표 [PRO-B-10].
+청크(트랜잭션) 단위 처리 시간을 최근 구간으로 보관하여 청크 크기·대기 시간 튜닝에 활용한다.
+"""
+import threading
+from collections import deque
+from datetime import datetime
+
+RECENT_CHUNK_WINDOW = 500
+
+
+def _percentile(sorted_values: list[float], ratio: float) -> float:
+    index = min(len(sorted_values) - 1, int(round(ratio * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class BatchMetrics:
+    """배치 실행·청크 처리 시간 집계기. 스케줄러 스레드와 API 스레드에서 함께 호출된다."""
+
+    def __init__(self, window: int = RECENT_CHUNK_WINDOW) -> None:
+        self._lock = threading.Lock()
+        self._recent_chunk_ms: deque[float] = deque(maxlen=window)
+        self._total_runs = 0
+        self._total_chunks = 0
+        self._total_transitioned = 0
+        self._last_run: dict | None = None
+
+    def record_run(
+        self,
+        started_at: datetime,
+        scope: str,
+        chunk_latencies_ms: list[float],
+        transitioned: int,
+        total_ms: float,
+    ) -> None:
+        """배치 1회 실행 결과와 청크별 처리 시간을 기록한다."""
+        with self._lock:
+            self._recent_chunk_ms.extend(chunk_latencies_ms)
+            self._total_runs += 1
+            self._total_chunks += len(chunk_latencies_ms)
+            self._total_transitioned += transitioned
+            self._last_run = {
+                "started_at": started_at,
+                "scope": scope,
+                "chunk_count": len(chunk_latencies_ms),
+                "transitioned_count": transitioned,
+                "total_ms": round(total_ms, 3),
+                "max_chunk_ms": round(max(chunk_latencies_ms), 3) if chunk_latencies_ms else None,
+            }
+
+    def snapshot(self) -> dict:
+        """누적 지표와 최근 청크 처리 시간 분포(avg/p50/p95/max)를 반환한다."""
+        with self._lock:
+            recent = sorted(self._recent_chunk_ms)
+            chunk_stats = None
+            if recent:
+                chunk_stats = {
+                    "sample_count": len(recent),
+                    "avg_ms": round(sum(recent) / len(recent), 3),
+                    "p50_ms": round(_percentile(recent, 0.50), 3),
+                    "p95_ms": round(_percentile(recent, 0.95), 3),
+                    "max_ms": round(recent[-1], 3),
+                }
+            return {
+                "total_runs": self._total_runs,
+                "total_chunks": self._total_chunks,
+                "total_transitioned": self._total_transitioned,
+                "last_run": dict(self._last_run) if self._last_run else None,
+                "recent_chunk_latency": chunk_stats,
+            }
+
+
+batch_metrics = BatchMetrics()
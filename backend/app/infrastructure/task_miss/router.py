@@ -1,19 +1,33 @@
 """
 task_miss 인프라 API 라우터 [PRO-B-10].
-사용자별 누적 miss count 조회 및 배치 수동 실행 엔드포인트를 제공한다.
+사용자별·다건 누적 miss count 조회 및 배치 수동 실행 엔드포인트를 제공한다.
 """
 import time
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, Path
+from fastapi import APIRouter, Path, Query
+from fastapi.concurrency import run_in_threadpool
 
-from app.domains.task.schemas import CumulativeMissCountResponse, TaskMissBatchResultResponse
+from app.core.database import is_async_enabled
+
+from app.domains.task.schemas import (
+    BulkMissCountRequest,
+    BulkMissCountResponse,
+    CumulativeMissCountResponse,
+    SchedulerLeaderResponse,
+    TaskMissBatchMetricsResponse,
+    TaskMissBatchResultResponse,
+)
+from app.infrastructure.task_miss.config import get_batch_mode, get_chunk_size, get_chunk_sleep_ms
+from app.infrastructure.task_miss.due_timer import due_timer
+from app.infrastructure.task_miss.metrics import batch_metrics
 from app.infrastructure.task_miss.scheduler import TaskMissScheduler
-from app.infrastructure.task_miss.service import TaskMissServiceImpl
+from app.infrastructure.task_miss.service import TaskMissAsyncServiceImpl, TaskMissServiceImpl
 
 router = APIRouter()
 
 _service: TaskMissServiceImpl | None = None
+_async_service: TaskMissAsyncServiceImpl | None = None
 
 
 def _get_service() -> TaskMissServiceImpl:
@@ -23,17 +37,26 @@ def _get_service() -> TaskMissServiceImpl:
     return _service
 
 
+def _get_async_service() -> TaskMissAsyncServiceImpl:
+    global _async_service
+    if _async_service is None:
+        _async_service = TaskMissAsyncServiceImpl()
+    return _async_service
+
+
 @router.get(
     "/users/{user_id}/miss-count",
     response_model=CumulativeMissCountResponse,
     summary="사용자별 누적 task_miss 카운트 조회",
 )
-def get_cumulative_miss_count(
+async def get_cumulative_miss_count(
     user_id: str = Path(..., description="사용자 식별자"),
 ) -> CumulativeMissCountResponse:
     """사용자의 전체 기간 누적 task_miss 횟수를 Redis 캐시 우선으로 반환한다."""
-    service = _get_service()
-    count, cached = service.get_cumulative_miss_count(user_id)
+    if is_async_enabled():
+        count, cached = await _get_async_service().get_cumulative_miss_count(user_id)
+    else:
+        count, cached = await run_in_threadpool(_get_service().get_cumulative_miss_count, user_id)
     return CumulativeMissCountResponse(
         user_id=user_id,
         cumulative_miss_count=count,
@@ -42,17 +65,44 @@ def get_cumulative_miss_count(
     )
 
 
+@router.post(
+    "/users/miss-count/bulk",
+    response_model=BulkMissCountResponse,
+    summary="사용자 다건 누적 task_miss 카운트 조회",
+)
+async def get_bulk_miss_counts(request: BulkMissCountRequest) -> BulkMissCountResponse:
+    """
+    여러 사용자의 누적 task_miss 횟수를 한 번에 반환한다.
+    Redis MGET 파이프라인으로 조회하고, 미적재 사용자만 GROUP BY 1회로 집계해 파이프라인으로 적재한다.
+    """
+    start_ns = time.perf_counter_ns()
+    if is_async_enabled():
+        results = await _get_async_service().get_cumulative_miss_counts(request.user_ids)
+    else:
+        results = await run_in_threadpool(_get_service().get_cumulative_miss_counts, request.user_ids)
+    cache_hits = sum(1 for _, cached in results.values() if cached)
+    return BulkMissCountResponse(
+        miss_counts={uid: count for uid, (count, _) in results.items()},
+        cache_hits=cache_hits,
+        aggregated=len(results) - cache_hits,
+        execution_time_ms=round((time.perf_counter_ns() - start_ns) / 1_000_000, 3),
+        timestamp=datetime.now(timezone.utc),
+    )
+
+
 @router.post(
     "/users/{user_id}/miss-count/refresh",
     response_model=CumulativeMissCountResponse,
     summary="사용자별 miss count 캐시 강제 갱신",
 )
-def refresh_miss_count_cache(
+async def refresh_miss_count_cache(
     user_id: str = Path(..., description="사용자 식별자"),
 ) -> CumulativeMissCountResponse:
     """DB에서 최신 카운트를 재집계하고 Redis 캐시를 갱신한다."""
-    service = _get_service()
-    count = service.refresh_cache(user_id)
+    if is_async_enabled():
+        count = await _get_async_service().refresh_cache(user_id)
+    else:
+        count = await run_in_threadpool(_get_service().refresh_cache, user_id)
     return CumulativeMissCountResponse(
         user_id=user_id,
         cumulative_miss_count=count,
@@ -66,13 +116,45 @@ def refresh_miss_count_cache(
     response_model=TaskMissBatchResultResponse,
     summary="task_miss 상태 전환 배치 수동 실행",
 )
-def run_batch_now() -> TaskMissBatchResultResponse:
+def run_batch_now(
+    full: bool = Query(True, description="true: 전체 구간 재스캔, false: 설정된 배치 모드(full | incremental)"),
+) -> TaskMissBatchResultResponse:
     """기한 만료 과업을 즉시 task_miss로 전환하는 배치를 1회 실행한다."""
     start_ns = time.perf_counter_ns()
-    transitioned = TaskMissScheduler.run_now()
+    transitioned = TaskMissScheduler.run_now(full=full)
     elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
     return TaskMissBatchResultResponse(
         transitioned_count=transitioned,
         execution_time_ms=round(elapsed_ms, 3),
         timestamp=datetime.now(timezone.utc),
     )
+
+
+@router.get(
+    "/batch/metrics",
+    response_model=TaskMissBatchMetricsResponse,
+    summary="task_miss 배치 청크 처리 지표 조회",
+)
+def get_batch_metrics() -> TaskMissBatchMetricsResponse:
+    """현재 배치 설정과 누적 실행 횟수, 최근 청크 처리 시간 분포, 기한 타이머 상태를 반환한다."""
+    return TaskMissBatchMetricsResponse(
+        batch_mode=get_batch_mode(),
+        chunk_size=get_chunk_size(),
+        chunk_sleep_ms=get_chunk_sleep_ms(),
+        **batch_metrics.snapshot(),
+        due_timer=due_timer.snapshot(),
+        timestamp=datetime.now(timezone.utc),
+    )
+
+
+@router.get(
+    "/scheduler/leader",
+    response_model=SchedulerLeaderResponse,
+    summary="task_miss 스케줄러 리더 조회",
+)
+def get_scheduler_leader() -> SchedulerLeaderResponse:
+    """주기 배치를 실행 중인 리더 프로세스와 응답한 프로세스의 리더 여부를 반환한다."""
+    return SchedulerLeaderResponse(
+        **TaskMissScheduler.leader_status(),
+        timestamp=datetime.now(timezone.utc),
+    )
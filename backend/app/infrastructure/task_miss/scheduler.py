@@ -2,115 +2,410 @@
 기한 만료 과업 자동 감지 및 task_miss 상태 전환 배치 스케줄러 [PRO-B-10].
 APScheduler IntervalTrigger를 사용하여 주기적으로 미완료·기한 초과 과업을 탐색하고 상태를 전환한다.
 전환 시 해당 사용자의 Redis 캐시를 무효화하여 실시간 집계 정합성을 보장한다.
+TASK_MISS_BATCH_MODE=incremental 이면 due_date watermark 이후 구간만 처리하고,
+주기적으로 전체 재스캔을 수행하여 watermark 이전에 생긴 누락분을 보정한다.
+TASK_MISS_CHUNK_SIZE > 0 이면 PK 구간별로 나누어 청크마다 커밋하여 쓰기 락 점유 시간을 제한한다.
+워커가 여러 개인 배포에서는 리더로 선출된 프로세스에서만 주기 작업이 실행된다 (app.core.leader).
+기한 타이머(due_timer)를 사용하면 기한 도래 시점에 개별 과업을 즉시 전환하고,
+주기 스캔은 TASK_MISS_RECONCILE_SECONDS 간격의 정합성 보정 스윕으로 동작한다.
+전환 건수만큼 miss_count 카운터를 증가시키고, TASK_MISS_COUNTER_RECONCILE_SECONDS 주기로 카운터를 DB와 대조한다.
 """
 import logging
+import threading
 import time
+from collections import Counter
 from datetime import datetime, timezone
 
 from apscheduler.schedulers.background import BackgroundScheduler
 from sqlalchemy import update
+from sqlalchemy.orm import Session
 
 from app.core.database import get_session_factory
-from app.core.redis import get_redis
-from app.domains.task.models import Task, TaskStatus
+from app.core.leader import LeaderElector
+from app.domains.task.models import TERMINAL_STATUSES, Task, TaskStatus, open_status_clause
+from app.domains.task.stats import invalidate_dashboard_cache
+from app.infrastructure.task_miss.config import (
+    BATCH_MODE_INCREMENTAL,
+    DUE_TIMER_OFF,
+    get_batch_mode,
+    get_chunk_size,
+    get_chunk_sleep_ms,
+    get_counter_reconcile_seconds,
+    get_due_timer_mode,
+    get_full_sweep_every,
+    get_reconcile_seconds,
+)
+from app.infrastructure.task_miss.counter import apply_miss_deltas, drop_miss_counts, reconcile_miss_counts
+from app.infrastructure.task_miss.due_timer import due_timer
+from app.infrastructure.task_miss.metrics import batch_metrics
 
 logger = logging.getLogger(__name__)
 
 MISS_CHECK_INTERVAL_SECONDS = 60
-REDIS_KEY_PREFIX = "user:{user_id}:miss_count"
 
 
-def _transition_expired_tasks() -> int:
+class _IncrementalState:
+    """incremental 모드의 due_date watermark와 전체 재스캔 주기 카운터. 프로세스 단위로 유지된다."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.watermark: datetime | None = None
+        self.runs_since_full = 0
+
+
+_state = _IncrementalState()
+
+# 이 프로세스에서 실행 중인 스케줄러 (리더 상태 조회용)
+_active_scheduler: "TaskMissScheduler | None" = None
+
+
+def _expired_conditions(now: datetime, since: datetime | None) -> list:
+    """[since, now) 구간에서 기한이 만료된 미완료 과업 조건. since가 None이면 전체 구간."""
+    # 상태 조건은 partial index(ix_tasks_open_due_date)와 일치하도록 상수로 렌더링한다
+    conditions = [Task.due_date < now, open_status_clause()]
+    if since is not None:
+        conditions.append(Task.due_date >= since)
+    return conditions
+
+
+def _transition_window(session: Session, now: datetime, conditions: list) -> tuple[int, dict[str, int]]:
     """
-    due_date < 현재시각 이면서 완료·task_miss가 아닌 과업을 task_miss로 전환한다.
-    전환된 행의 수를 반환하며, 영향받은 사용자의 Redis 캐시를 무효화한다.
+    조건에 맞는 과업을 task_miss로 전환한다.
+    RETURNING을 지원하는 DB는 UPDATE 한 번으로 영향받은 user_id까지 돌려받고,
+    지원하지 않는 DB는 (id, user_id)를 한 번 조회한 뒤 PK 기준으로 UPDATE한다.
+    Returns: (전환 건수, user_id별 전환 건수)
     """
-    start_ns = time.perf_counter_ns()
-    now = datetime.now(timezone.utc)
-    session_factory = get_session_factory()
+    if session.get_bind().dialect.update_returning:
+        rows = session.execute(
+            update(Task)
+            .where(*conditions)
+            .values(status=TaskStatus.TASK_MISS, updated_at=now)
+            .returning(Task.user_id)
+            .execution_options(synchronize_session=False)
+        ).all()
+        return len(rows), dict(Counter(row[0] for row in rows))
 
-    with session_factory() as session:
-        affected_users = (
-            session.query(Task.user_id)
-            .filter(
-                Task.due_date < now,
-                Task.status.notin_([TaskStatus.COMPLETED, TaskStatus.TASK_MISS]),
-            )
-            .distinct()
-            .all()
+    rows = session.query(Task.id, Task.user_id).filter(*conditions).all()
+    if not rows:
+        return 0, {}
+    result = session.execute(
+        update(Task)
+        .where(
+            Task.id.in_([row[0] for row in rows]),
+            Task.status.notin_(TERMINAL_STATUSES),
         )
-        affected_user_ids = [row[0] for row in affected_users]
-
-        if not affected_user_ids:
-            elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
-            logger.info(
-                "[%s] task_miss 전환 대상 없음 (%.3fms)",
-                now.isoformat(timespec="milliseconds"),
-                elapsed_ms,
-            )
-            return 0
+        .values(status=TaskStatus.TASK_MISS, updated_at=now)
+        .execution_options(synchronize_session=False)
+    )
+    per_user = Counter(row[1] for row in rows)
+    if result.rowcount != len(rows):  # type: ignore[union-attr]
+        # 조회와 UPDATE 사이에 다른 요청이 상태를 바꿔 사용자별 건수를 알 수 없으므로 카운터를 재적재 대상으로 돌린다
+        drop_miss_counts(*per_user)
+        per_user = Counter(dict.fromkeys(per_user, 0))
+    return result.rowcount, dict(per_user)  # type: ignore[union-attr]
 
-        result = session.execute(
-            update(Task)
-            .where(
-                Task.due_date < now,
-                Task.status.notin_([TaskStatus.COMPLETED, TaskStatus.TASK_MISS]),
+
+def _run_single(now: datetime, conditions: list) -> tuple[int, list[str], list[float]]:
+    """단일 트랜잭션으로 전체 대상을 전환한다. Returns: (전환 건수, 영향 사용자, 청크 처리 시간 목록)"""
+    chunk_start_ns = time.perf_counter_ns()
+    with get_session_factory()() as session:
+        transitioned, per_user = _transition_window(session, now, conditions)
+        session.commit()
+    _update_redis_cache(per_user)
+    return transitioned, sorted(per_user), [(time.perf_counter_ns() - chunk_start_ns) / 1_000_000]
+
+
+def _run_chunked(
+    now: datetime,
+    conditions: list,
+    chunk_size: int,
+    sleep_ms: int,
+) -> tuple[int, list[str], list[float]]:
+    """
+    PK 오름차순으로 최대 chunk_size건씩 (last_id, upper_id] 구간을 잘라 청크마다 커밋한다.
+    청크 단위로 miss_count 카운터·대시보드 캐시를 갱신하고, 청크 사이에 sleep_ms만큼 쉬어 다른 writer에게 락을 양보한다.
+    Returns: (전환 건수, 영향 사용자, 청크 처리 시간 목록)
+    """
+    session_factory = get_session_factory()
+    transitioned = 0
+    affected: set[str] = set()
+    latencies_ms: list[float] = []
+    last_id = 0
+
+    while True:
+        chunk_start_ns = time.perf_counter_ns()
+        with session_factory() as session:
+            ids = [
+                row[0]
+                for row in session.query(Task.id)
+                .filter(*conditions, Task.id > last_id)
+                .order_by(Task.id.asc())
+                .limit(chunk_size)
+                .all()
+            ]
+            if not ids:
+                break
+            upper_id = ids[-1]
+            chunk_count, chunk_per_user = _transition_window(
+                session, now, [*conditions, Task.id > last_id, Task.id <= upper_id]
             )
-            .values(status=TaskStatus.TASK_MISS, updated_at=now)
+            session.commit()
+
+        _update_redis_cache(chunk_per_user)
+        chunk_ms = (time.perf_counter_ns() - chunk_start_ns) / 1_000_000
+        latencies_ms.append(chunk_ms)
+        transitioned += chunk_count
+        affected.update(chunk_per_user)
+        logger.debug(
+            "task_miss 청크 전환: id (%d, %d] %d건 (%.3fms)",
+            last_id,
+            upper_id,
+            chunk_count,
+            chunk_ms,
         )
-        transitioned = result.rowcount  # type: ignore[union-attr]
-        session.commit()
 
-    _invalidate_redis_cache(affected_user_ids)
+        last_id = upper_id
+        if len(ids) < chunk_size:
+            break
+        if sleep_ms > 0:
+            time.sleep(sleep_ms / 1000)
+
+    return transitioned, sorted(affected), latencies_ms
+
+
+def _run_transition(since: datetime | None) -> tuple[int, datetime]:
+    """
+    전환 구간을 실행하고 커밋한 뒤 miss_count 카운터를 증가시키고 대시보드 캐시를 무효화한다.
+    TASK_MISS_CHUNK_SIZE > 0 이면 청크 단위 트랜잭션으로 나누어 처리한다.
+    Returns: (전환 건수, 기준 시각)
+    """
+    start_ns = time.perf_counter_ns()
+    now = datetime.now(timezone.utc)
+    conditions = _expired_conditions(now, since)
+    chunk_size = get_chunk_size()
+
+    if chunk_size > 0:
+        transitioned, affected_user_ids, chunk_latencies_ms = _run_chunked(
+            now, conditions, chunk_size, get_chunk_sleep_ms()
+        )
+    else:
+        transitioned, affected_user_ids, chunk_latencies_ms = _run_single(now, conditions)
 
     elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+    scope = "full" if since is None else f"since={since.isoformat(timespec='milliseconds')}"
+    batch_metrics.record_run(now, scope, chunk_latencies_ms, transitioned, elapsed_ms)
+
+    if not affected_user_ids:
+        logger.info(
+            "[%s] task_miss 전환 대상 없음 (%s, %.3fms)",
+            now.isoformat(timespec="milliseconds"),
+            scope,
+            elapsed_ms,
+        )
+        return 0, now
+
     logger.info(
-        "[%s] task_miss 전환 완료: %d건, 영향 사용자: %s (%.3fms)",
+        "[%s] task_miss 전환 완료: %d건, 영향 사용자: %s (%s, 청크 %d개, %.3fms)",
         now.isoformat(timespec="milliseconds"),
         transitioned,
         affected_user_ids,
+        scope,
+        len(chunk_latencies_ms),
         elapsed_ms,
     )
+    return transitioned, now
+
+
+def _transition_expired_tasks() -> int:
+    """
+    due_date < 현재시각 이면서 완료·task_miss가 아닌 과업을 task_miss로 전환한다.
+    전환된 행의 수를 반환하며, 영향받은 사용자의 miss_count 카운터·대시보드 캐시를 갱신한다.
+    전체 구간을 처리하므로 incremental 모드의 watermark도 현재 시각으로 맞춘다.
+    """
+    with _state.lock:
+        transitioned, now = _run_transition(since=None)
+        _state.watermark = now
+        _state.runs_since_full = 0
+    return transitioned
+
+
+def _transition_expired_tasks_incremental() -> int:
+    """
+    직전 실행 이후 새로 기한이 만료된 [watermark, now) 구간만 처리한다.
+    watermark가 없거나(첫 실행) 재스캔 주기에 도달하면 전체 구간을 처리한다.
+    """
+    full_sweep_every = get_full_sweep_every()
+    with _state.lock:
+        needs_full = _state.watermark is None or (
+            full_sweep_every > 0 and _state.runs_since_full >= full_sweep_every
+        )
+        if needs_full:
+            transitioned, now = _run_transition(since=None)
+            _state.runs_since_full = 0
+        else:
+            transitioned, now = _run_transition(since=_state.watermark)
+            _state.runs_since_full += 1
+        _state.watermark = now
+    return transitioned
+
+
+def transition_due_tasks(task_ids: list[int]) -> int:
+    """
+    기한 타이머가 만료를 알린 과업 중 실제로 기한이 지났고 미완료인 과업만 전환한다.
+    Returns: 전환 건수
+    """
+    start_ns = time.perf_counter_ns()
+    now = datetime.now(timezone.utc)
+    conditions = [*_expired_conditions(now, None), Task.id.in_(task_ids)]
+    with get_session_factory()() as session:
+        transitioned, per_user = _transition_window(session, now, conditions)
+        session.commit()
+    _update_redis_cache(per_user)
+    elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+    batch_metrics.record_run(now, "timer", [elapsed_ms], transitioned, elapsed_ms)
+    if transitioned:
+        logger.info(
+            "[%s] task_miss 타이머 전환: %d/%d건, 영향 사용자: %s (%.3fms)",
+            now.isoformat(timespec="milliseconds"),
+            transitioned,
+            len(task_ids),
+            sorted(per_user),
+            elapsed_ms,
+        )
     return transitioned
 
 
-def _invalidate_redis_cache(user_ids: list[str]) -> None:
-    """전환된 사용자의 누적 miss_count 캐시를 삭제한다."""
-    client = get_redis()
-    if client is None:
+def _run_scheduled_batch() -> int:
+    """TASK_MISS_BATCH_MODE 설정에 따라 전체/증분 배치를 실행한다."""
+    if get_batch_mode() == BATCH_MODE_INCREMENTAL:
+        return _transition_expired_tasks_incremental()
+    return _transition_expired_tasks()
+
+
+def _update_redis_cache(per_user: dict[str, int]) -> None:
+    """전환된 사용자의 누적 miss_count 카운터를 전환 건수만큼 증가시키고 대시보드 집계 캐시를 삭제한다."""
+    if not per_user:
         return
-    keys = [REDIS_KEY_PREFIX.format(user_id=uid) for uid in user_ids]
-    try:
-        client.delete(*keys)
-        logger.debug("Redis 캐시 무효화: %s", keys)
-    except Exception:
-        logger.warning("Redis 캐시 무효화 실패", exc_info=True)
+    apply_miss_deltas(per_user)
+    invalidate_dashboard_cache(*per_user)
+
+
+def _reconcile_miss_counts() -> dict[str, int]:
+    start_ns = time.perf_counter_ns()
+    result = reconcile_miss_counts()
+    logger.info(
+        "miss_count 카운터 보정: 대조 %d건, 보정 %d건 (%.3fms)",
+        result["checked"],
+        result["corrected"],
+        (time.perf_counter_ns() - start_ns) / 1_000_000,
+    )
+    return result
 
 
 class TaskMissScheduler:
-    """task_miss 상태 전환을 주기적으로 수행하는 스케줄러 래퍼."""
+    """
+    task_miss 상태 전환을 주기적으로 수행하는 스케줄러 래퍼.
+    스케줄러는 일시정지 상태로 시작하고, 이 프로세스가 리더로 선출되면 재개·즉시 1회 실행한다.
+    리더십을 잃으면 다시 일시정지한다.
+    기한 타이머를 쓰면 기본 주기는 MISS_CHECK_INTERVAL_SECONDS 대신 TASK_MISS_RECONCILE_SECONDS가 된다.
+    """
 
-    def __init__(self, interval_seconds: int = MISS_CHECK_INTERVAL_SECONDS) -> None:
+    def __init__(self, interval_seconds: int | None = None) -> None:
         self._scheduler = BackgroundScheduler(daemon=True)
+        if interval_seconds is None:
+            timer_enabled = get_due_timer_mode() != DUE_TIMER_OFF
+            interval_seconds = get_reconcile_seconds() if timer_enabled else MISS_CHECK_INTERVAL_SECONDS
         self._interval = interval_seconds
+        self.elector = LeaderElector(on_elected=self._on_elected, on_revoked=self._on_revoked)
 
     def start(self) -> None:
         self._scheduler.add_job(
-            _transition_expired_tasks,
+            self._run_if_leader,
             trigger="interval",
             seconds=self._interval,
             id="task_miss_transition",
             replace_existing=True,
-            next_run_time=datetime.now(timezone.utc),
+            coalesce=True,
+            max_instances=1,
         )
-        self._scheduler.start()
-        logger.info("TaskMissScheduler 시작 (주기: %ds)", self._interval)
+        self._scheduler.add_job(
+            self._reconcile_if_leader,
+            trigger="interval",
+            seconds=get_counter_reconcile_seconds(),
+            id="task_miss_counter_reconcile",
+            replace_existing=True,
+            coalesce=True,
+            max_instances=1,
+        )
+        self._scheduler.start(paused=True)
+        global _active_scheduler
+        _active_scheduler = self
+        logger.info(
+            "TaskMissScheduler 시작 (주기: %ds, 모드: %s, 기한 타이머: %s)",
+            self._interval,
+            get_batch_mode(),
+            get_due_timer_mode(),
+        )
+        due_timer.start()
+        self.elector.start()
 
     def shutdown(self) -> None:
+        global _active_scheduler
+        if _active_scheduler is self:
+            _active_scheduler = None
+        self.elector.stop()
+        due_timer.stop()
         self._scheduler.shutdown(wait=False)
         logger.info("TaskMissScheduler 종료")
 
+    def _on_elected(self) -> None:
+        due_timer.set_leader(True)
+        self._scheduler.modify_job("task_miss_transition", next_run_time=datetime.now(timezone.utc))
+        self._scheduler.resume()
+
+    def _on_revoked(self) -> None:
+        due_timer.set_leader(False)
+        if self._scheduler.running:
+            self._scheduler.pause()
+
+    def _run_if_leader(self) -> int:
+        # 일시정지 직전에 예약된 실행이 리더십을 잃은 뒤 시작되는 경우를 막는다
+        if not self.elector.is_leader:
+            return 0
+        transitioned = _run_scheduled_batch()
+        # 다음 스윕까지 기한이 도래할 과업을 타이머에 (재)적재한다
+        try:
+            due_timer.warm()
+        except Exception:
+            logger.warning("기한 타이머 적재 실패", exc_info=True)
+        return transitioned
+
+    def _reconcile_if_leader(self) -> dict[str, int]:
+        if not self.elector.is_leader:
+            return {"checked": 0, "corrected": 0}
+        return _reconcile_miss_counts()
+
+    @staticmethod
+    def leader_status() -> dict:
+        """리더 선출 백엔드, 현재 리더, 이 프로세스의 리더 여부. 스케줄러가 실행 중이 아니면 running=False."""
+        scheduler = _active_scheduler
+        if scheduler is None:
+            return {"running": False, "backend": None, "leader_id": None, "instance_id": None, "is_leader": False}
+        elector = scheduler.elector
+        return {
+            "running": True,
+            "backend": elector.backend.name,
+            "leader_id": elector.current_leader(),
+            "instance_id": elector.instance_id,
+            "is_leader": elector.is_leader,
+        }
+
     @staticmethod
-    def run_now() -> int:
-        """즉시 1회 실행하여 전환 건수를 반환한다. API 수동 트리거용."""
-        return _transition_expired_tasks()
+    def run_now(full: bool = True) -> int:
+        """
+        즉시 1회 실행하여 전환 건수를 반환한다. API 수동 트리거용.
+        full=False 이면 스케줄 실행과 동일하게 설정된 배치 모드를 따른다.
+        """
+        if full:
+            return _transition_expired_tasks()
+        return _run_scheduled_batch()
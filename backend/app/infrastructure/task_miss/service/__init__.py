@@ -1,4 +1,5 @@
 """task_miss 서비스 패키지."""
+from app.infrastructure.task_miss.service.async_impl import TaskMissAsyncServiceImpl
 from app.infrastructure.task_miss.service.impl import TaskMissServiceImpl
 
-__all__ = ["TaskMissServiceImpl"]
+__all__ = ["TaskMissAsyncServiceImpl", "TaskMissServiceImpl"]
@@ -0,0 +1,162 @@
+"""
+TaskMiss 비동기 서비스 구현체 [PRO-B-10].
+TaskMissServiceImpl과 동일한 카운터 네임스페이스(miss_count_cache)를 사용하며,
+AsyncSession과 redis.asyncio 클라이언트로 이벤트 루프를 막지 않고 집계한다.
+동시 미스는 이벤트 루프 내 single-flight와 Redis 단기 락으로 집계 1회에 합친다.
+DATABASE_ASYNC_ENABLED=true 일 때 라우터에서 선택된다.
+"""
+import logging
+import time
+from datetime import datetime, timezone
+
+from sqlalchemy import func as sqlfunc
+from sqlalchemy import select
+
+from app.core.database import get_async_session_factory
+from app.core.redis import get_async_redis
+from app.core.stampede import (
+    AsyncSingleFlight,
+    acquire_short_lock_async,
+    release_short_lock_async,
+    wait_for_value_async,
+)
+from app.domains.task.models import Task, TaskStatus
+from app.infrastructure.task_miss.counter import miss_count_cache
+from app.infrastructure.task_miss.service.impl import MISS_COUNT_LOCK_KEY, _chunks, _db_user_ids
+
+logger = logging.getLogger(__name__)
+
+_aggregation_flight: AsyncSingleFlight[int] = AsyncSingleFlight()
+
+
+class TaskMissAsyncServiceImpl:
+    """사용자별 task_miss 누적 횟수 조회 비동기 구현체."""
+
+    async def get_cumulative_miss_count(self, user_id: str) -> tuple[int, bool]:
+        """
+        Redis 카운터를 먼저 확인하고, 없으면 DB에서 집계하여 카운터를 적재한다.
+        Returns: (count, cached)
+        """
+        start_ns = time.perf_counter_ns()
+        now = datetime.now(timezone.utc)
+
+        cached_value = await self._get_from_cache(user_id)
+        if cached_value is not None:
+            elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+            logger.info(
+                "[%s] miss_count 캐시 HIT user=%s count=%d (%.3fms, async)",
+                now.isoformat(timespec="milliseconds"),
+                user_id,
+                cached_value,
+                elapsed_ms,
+            )
+            return cached_value, True
+
+        count, shared = await _aggregation_flight.do(user_id, lambda: self._load_once(user_id))
+
+        elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+        logger.info(
+            "[%s] miss_count %s user=%s count=%d (%.3fms, async)",
+            now.isoformat(timespec="milliseconds"),
+            "동시 집계 공유" if shared else "DB 집계",
+            user_id,
+            count,
+            elapsed_ms,
+        )
+        return count, False
+
+    async def _load_once(self, user_id: str) -> int:
+        """Redis 단기 락 보유자만 집계하고, 나머지는 적재된 값을 기다린다 (TaskMissServiceImpl._load_once와 동일)."""
+        client = await get_async_redis()
+        lock_key = MISS_COUNT_LOCK_KEY.format(user_id=user_id)
+        token = await acquire_short_lock_async(client, lock_key) if client is not None else None
+        if client is not None and token is None:
+            value = await wait_for_value_async(lambda: self._get_from_cache(user_id))
+            if value is not None:
+                return value
+        try:
+            count = await self._aggregate_from_db(user_id)
+            await self._set_cache(user_id, count, only_if_absent=True)
+            return count
+        finally:
+            if token is not None:
+                await release_short_lock_async(client, lock_key, token)
+
+    async def get_cumulative_miss_counts(self, user_ids: list[str]) -> dict[str, tuple[int, bool]]:
+        """여러 사용자의 누적 task_miss 횟수를 한 번에 조회한다. Returns: {user_id: (count, cached)}"""
+        start_ns = time.perf_counter_ns()
+        now = datetime.now(timezone.utc)
+        user_ids = list(dict.fromkeys(user_ids))
+
+        results: dict[str, tuple[int, bool]] = {}
+        for uid, value in zip(user_ids, await self._get_many_from_cache(user_ids)):
+            if value is not None:
+                results[uid] = (value, True)
+
+        missing = [uid for uid in user_ids if uid not in results]
+        if missing:
+            counts = await self._aggregate_many_from_db(missing)
+            await self._set_many_cache(counts)
+            results.update({uid: (counts[uid], False) for uid in missing})
+
+        elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+        logger.info(
+            "[%s] miss_count 다건 조회 users=%d hit=%d aggregated=%d (%.3fms, async)",
+            now.isoformat(timespec="milliseconds"),
+            len(user_ids),
+            len(user_ids) - len(missing),
+            len(missing),
+            elapsed_ms,
+        )
+        return {uid: results[uid] for uid in user_ids}
+
+    async def refresh_cache(self, user_id: str) -> int:
+        """DB에서 최신 카운트를 조회 후 카운터를 덮어쓴다."""
+        count = await self._aggregate_from_db(user_id)
+        await self._set_cache(user_id, count)
+        return count
+
+    @staticmethod
+    async def _aggregate_from_db(user_id: str) -> int:
+        async with get_async_session_factory()() as session:
+            result = await session.scalar(
+                select(sqlfunc.count(Task.id)).where(
+                    Task.user_id == user_id,
+                    Task.status == TaskStatus.TASK_MISS,
+                )
+            )
+        return result or 0
+
+    @staticmethod
+    async def _aggregate_many_from_db(user_ids: list[str]) -> dict[str, int]:
+        counts = dict.fromkeys(user_ids, 0)
+        async with get_async_session_factory()() as session:
+            for chunk in _chunks(user_ids):
+                id_map = _db_user_ids(chunk)
+                if not id_map:
+                    continue
+                rows = (
+                    await session.execute(
+                        select(Task.user_id, sqlfunc.count(Task.id))
+                        .where(Task.user_id.in_(list(id_map)), Task.status == TaskStatus.TASK_MISS)
+                        .group_by(Task.user_id)
+                    )
+                ).all()
+                counts.update({id_map[row[0]]: row[1] for row in rows})
+        return counts
+
+    @staticmethod
+    async def _get_many_from_cache(user_ids: list[str]) -> list[int | None]:
+        return await miss_count_cache.aget_many(user_ids) if user_ids else []
+
+    @staticmethod
+    async def _set_many_cache(counts: dict[str, int]) -> None:
+        await miss_count_cache.aset_many(counts, nx=True)
+
+    @staticmethod
+    async def _get_from_cache(user_id: str) -> int | None:
+        return await miss_count_cache.aget(user_id)
+
+    @staticmethod
+    async def _set_cache(user_id: str, count: int, only_if_absent: bool = False) -> None:
+        await miss_count_cache.aset(user_id, count, nx=only_if_absent)
@@ -1,22 +1,46 @@
 """
 TaskMiss 서비스 구현체 [PRO-B-10].
-사용자별 task_miss 누적 횟수를 DB Aggregation으로 집계하고,
-Redis에 user:{userId}:miss_count 키로 캐싱하여 성능을 최적화한다.
+사용자별 task_miss 누적 횟수를 Redis user:{userId}:miss_count 카운터에서 조회한다.
+카운터는 상태 변경 경로에서 증분으로 유지되므로(app.infrastructure.task_miss.counter),
+DB Aggregation은 카운터가 아직 없는 사용자의 첫 조회와 강제 갱신에서만 수행한다.
+다건 조회(get_cumulative_miss_counts)는 MGET 파이프라인 → 미적재 사용자 GROUP BY 1회 →
+SET NX 파이프라인 적재 순으로, 사용자 수와 무관하게 왕복 횟수를 일정하게 유지한다.
+카운터가 비어 있는 사용자에 대한 동시 조회는 프로세스 내 single-flight와 Redis 단기 락으로
+집계 1회에 합쳐진다 (app.core.stampede).
+카운터 읽기·쓰기는 2계층 캐시 네임스페이스(miss_count_cache)를 거치므로 짧은 로컬 TTL 동안은 Redis 왕복도 없다.
 """
 import logging
 import time
 from datetime import datetime, timezone
 
 from sqlalchemy import func as sqlfunc
+from sqlalchemy import select
 
-from app.core.database import get_session_factory
+from app.core.database import session_scope
 from app.core.redis import get_redis
+from app.core.stampede import SingleFlight, acquire_short_lock, release_short_lock, wait_for_value
 from app.domains.task.models import Task, TaskStatus
+from app.infrastructure.task_miss.counter import miss_count_cache
 
 logger = logging.getLogger(__name__)
 
-REDIS_KEY_PREFIX = "user:{user_id}:miss_count"
-CACHE_TTL_SECONDS = 300
+MISS_COUNT_LOCK_KEY = "user:{user_id}:miss_count:lock"
+
+# 다건 조회 시 MGET·IN 절 1회당 최대 사용자 수
+BULK_CHUNK_SIZE = 1000
+
+
+def _chunks(items: list[str], size: int = BULK_CHUNK_SIZE) -> list[list[str]]:
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def _db_user_ids(user_ids: list[str]) -> dict[int, str]:
+    """tasks.user_id(INTEGER)와 비교할 수 있는 식별자만 추린다. 그 외 식별자는 과업이 없는 것으로 본다."""
+    return {int(uid): uid for uid in user_ids if uid.isdigit()}
+
+
+# 서비스 인스턴스가 여러 개(트리거·실험 서비스 등)여도 집계를 합치도록 모듈 단위로 공유한다
+_aggregation_flight: SingleFlight[int] = SingleFlight()
 
 
 class TaskMissServiceImpl:
@@ -24,7 +48,7 @@ class TaskMissServiceImpl:
 
     def get_cumulative_miss_count(self, user_id: str) -> tuple[int, bool]:
         """
-        Redis 캐시를 먼저 확인하고, 미스 시 DB에서 집계하여 캐시에 저장한다.
+        Redis 카운터를 먼저 확인하고, 없으면 DB에서 집계하여 카운터를 적재한다.
         Returns: (count, cached)
         """
         start_ns = time.perf_counter_ns()
@@ -42,29 +66,79 @@ class TaskMissServiceImpl:
             )
             return cached_value, True
 
-        count = self._aggregate_from_db(user_id)
-        self._set_cache(user_id, count)
+        count, shared = _aggregation_flight.do(user_id, lambda: self._load_once(user_id))
 
         elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
         logger.info(
-            "[%s] miss_count DB 집계 user=%s count=%d (%.3fms)",
+            "[%s] miss_count %s user=%s count=%d (%.3fms)",
             now.isoformat(timespec="milliseconds"),
+            "동시 집계 공유" if shared else "DB 집계",
             user_id,
             count,
             elapsed_ms,
         )
         return count, False
 
+    def _load_once(self, user_id: str) -> int:
+        """
+        Redis 단기 락을 잡은 프로세스만 집계·적재한다.
+        락을 얻지 못하면 보유자가 적재한 값을 기다리고, 락 TTL 안에 채워지지 않으면 직접 집계한다.
+        """
+        client = get_redis()
+        lock_key = MISS_COUNT_LOCK_KEY.format(user_id=user_id)
+        token = acquire_short_lock(client, lock_key) if client is not None else None
+        if client is not None and token is None:
+            value = wait_for_value(lambda: self._get_from_cache(user_id))
+            if value is not None:
+                return value
+        try:
+            count = self._aggregate_from_db(user_id)
+            self._set_cache(user_id, count, only_if_absent=True)
+            return count
+        finally:
+            if token is not None:
+                release_short_lock(client, lock_key, token)
+
+    def get_cumulative_miss_counts(self, user_ids: list[str]) -> dict[str, tuple[int, bool]]:
+        """
+        여러 사용자의 누적 task_miss 횟수를 한 번에 조회한다.
+        Returns: {user_id: (count, cached)} — 입력 순서 유지, 중복 제거
+        """
+        start_ns = time.perf_counter_ns()
+        now = datetime.now(timezone.utc)
+        user_ids = list(dict.fromkeys(user_ids))
+
+        results: dict[str, tuple[int, bool]] = {}
+        for uid, value in zip(user_ids, self._get_many_from_cache(user_ids)):
+            if value is not None:
+                results[uid] = (value, True)
+
+        missing = [uid for uid in user_ids if uid not in results]
+        if missing:
+            counts = self._aggregate_many_from_db(missing)
+            self._set_many_cache(counts)
+            results.update({uid: (counts[uid], False) for uid in missing})
+
+        elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+        logger.info(
+            "[%s] miss_count 다건 조회 users=%d hit=%d aggregated=%d (%.3fms)",
+            now.isoformat(timespec="milliseconds"),
+            len(user_ids),
+            len(user_ids) - len(missing),
+            len(missing),
+            elapsed_ms,
+        )
+        return {uid: results[uid] for uid in user_ids}
+
     def refresh_cache(self, user_id: str) -> int:
-        """DB에서 최신 카운트를 조회 후 캐시를 갱신한다."""
+        """DB에서 최신 카운트를 조회 후 카운터를 덮어쓴다."""
         count = self._aggregate_from_db(user_id)
         self._set_cache(user_id, count)
         return count
 
     @staticmethod
     def _aggregate_from_db(user_id: str) -> int:
-        session_factory = get_session_factory()
-        with session_factory() as session:
+        with session_scope() as session:
             result = (
                 session.query(sqlfunc.count(Task.id))
                 .filter(Task.user_id == user_id, Task.status == TaskStatus.TASK_MISS)
@@ -72,28 +146,40 @@ class TaskMissServiceImpl:
             )
         return result or 0
 
+    @staticmethod
+    def _aggregate_many_from_db(user_ids: list[str]) -> dict[str, int]:
+        """사용자 묶음당 GROUP BY 1회로 집계한다. task_miss가 없는 사용자는 0."""
+        counts = dict.fromkeys(user_ids, 0)
+        with session_scope() as session:
+            for chunk in _chunks(user_ids):
+                id_map = _db_user_ids(chunk)
+                if not id_map:
+                    continue
+                rows = session.execute(
+                    select(Task.user_id, sqlfunc.count(Task.id))
+                    .where(Task.user_id.in_(list(id_map)), Task.status == TaskStatus.TASK_MISS)
+                    .group_by(Task.user_id)
+                ).all()
+                counts.update({id_map[row[0]]: row[1] for row in rows})
+        return counts
+
+    @staticmethod
+    def _get_many_from_cache(user_ids: list[str]) -> list[int | None]:
+        return miss_count_cache.get_many(user_ids) if user_ids else []
+
+    @staticmethod
+    def _set_many_cache(counts: dict[str, int]) -> None:
+        """집계 결과를 SET NX 파이프라인 1회로 적재한다 (그 사이 적재·증감된 카운터는 유지)."""
+        miss_count_cache.set_many(counts, nx=True)
+
     @staticmethod
     def _get_from_cache(user_id: str) -> int | None:
-        client = get_redis()
-        if client is None:
-            return None
-        try:
-            value = client.get(REDIS_KEY_PREFIX.format(user_id=user_id))
-            return int(value) if value is not None else None
-        except Exception:
-            logger.warning("Redis 캐시 조회 실패 user=%s", user_id, exc_info=True)
-            return None
+        return miss_count_cache.get(user_id)
 
     @staticmethod
-    def _set_cache(user_id: str, count: int) -> None:
-        client = get_redis()
-        if client is None:
-            return
-        try:
-            client.setex(
-                REDIS_KEY_PREFIX.format(user_id=user_id),
-                CACHE_TTL_SECONDS,
-                str(count),
-            )
-        except Exception:
-            logger.warning("Redis 캐시 저장 실패 user=%s", user_id, exc_info=True)
+    def _set_cache(user_id: str, count: int, only_if_absent: bool = False) -> None:
+        """
+        카운터를 적재한다 (TTL 없음). only_if_absent=True 이면 SET NX로,
+        집계하는 사이 다른 요청이 먼저 적재·증감한 값을 덮어쓰지 않는다.
+        """
+        miss_count_cache.set(user_id, count, nx=only_if_absent)
@@ -13,10 +13,35 @@ class TaskMissService(Protocol):
         사용자의 누적 task_miss 횟수를 반환한다.
 
         Returns:
-            (count, cached) — count: 누적 횟수, cached: Redis 캐시 적중 여부
+            (count, cached) — count: 누적 횟수, cached: Redis 카운터 적중 여부
+        """
+        ...
+
+    def get_cumulative_miss_counts(self, user_ids: list[str]) -> dict[str, tuple[int, bool]]:
+        """
+        여러 사용자의 누적 task_miss 횟수를 MGET 파이프라인·GROUP BY 1회로 조회한다.
+
+        Returns:
+            {user_id: (count, cached)} — 입력 순서 유지, 중복 제거
         """
         ...
 
     def refresh_cache(self, user_id: str) -> int:
-        """DB에서 최신 카운트를 조회하여 Redis 캐시를 갱신하고 카운트를 반환한다."""
+        """DB에서 최신 카운트를 조회하여 Redis 카운터를 덮어쓰고 카운트를 반환한다."""
+        ...
+
+
+class AsyncTaskMissService(Protocol):
+    """TaskMissService의 비동기 버전. DATABASE_ASYNC_ENABLED=true 일 때 사용된다."""
+
+    async def get_cumulative_miss_count(self, user_id: str) -> tuple[int, bool]:
+        """사용자의 누적 task_miss 횟수와 캐시 적중 여부를 반환한다."""
+        ...
+
+    async def get_cumulative_miss_counts(self, user_ids: list[str]) -> dict[str, tuple[int, bool]]:
+        """여러 사용자의 누적 task_miss 횟수와 캐시 적중 여부를 한 번에 반환한다."""
+        ...
+
+    async def refresh_cache(self, user_id: str) -> int:
+        """DB에서 최신 카운트를 조회하여 Redis 카운터를 덮어쓰고 카운트를 반환한다."""
         ...
@@ -0,0 +1,93 @@
+"""miss_count 카운터 단위 테스트 — 상태 변경 증감, 적재된 키만 증감, 삭제, DB 대조 보정 [PRO-B-10]."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.core.database import session_scope
+from app.domains.auth.models import User
+from app.domains.task.models import Task, TaskStatus
+from app.infrastructure.task_miss.counter import (
+    apply_miss_deltas,
+    drop_miss_counts,
+    miss_count_cache,
+    miss_delta,
+    reconcile_miss_counts,
+)
+from app.infrastructure.task_miss.scheduler import transition_due_tasks
+
+
+def _add_tasks(user_id: int, *statuses: TaskStatus, due_date: datetime | None = None) -> list[int]:
+    due_date = due_date or datetime.now(timezone.utc) + timedelta(days=1)
+    with session_scope() as session:
+        if session.get(User, user_id) is None:
+            session.add(User(id=user_id, email=f"u{user_id}@example.com", name=f"u{user_id}"))
+        tasks = [
+            Task(title="t", status=status, user_id=user_id, due_date=due_date.replace(tzinfo=None))
+            for status in statuses
+        ]
+        session.add_all(tasks)
+        session.flush()
+        return [task.id for task in tasks]
+
+
+@pytest.mark.parametrize(
+    "previous, current, expected",
+    [
+        (TaskStatus.PENDING, TaskStatus.TASK_MISS, 1),
+        (TaskStatus.TASK_MISS, TaskStatus.COMPLETED, -1),
+        (TaskStatus.TASK_MISS, None, -1),
+        ("task_miss", "task_miss", 0),
+        (None, TaskStatus.PENDING, 0),
+        (TaskStatus.PENDING, TaskStatus.COMPLETED, 0),
+    ],
+)
+def test_miss_delta(previous, current, expected):
+    assert miss_delta(previous, current) == expected
+
+
+def test_deltas_apply_only_to_loaded_counters(migrated_db, fake_redis):
+    miss_count_cache.set(1, 3)
+
+    apply_miss_deltas({1: 2, 2: 1, 3: 0})
+
+    assert fake_redis.get(miss_count_cache.key(1)) == "5"
+    assert miss_count_cache.get(1) == 5
+    assert fake_redis.exists(miss_count_cache.key(2)) == 0
+    assert miss_count_cache.get(2) is None
+
+
+def test_drop_miss_counts(migrated_db, fake_redis):
+    miss_count_cache.set_many({1: 4, 2: 1})
+
+    drop_miss_counts(1)
+
+    assert miss_count_cache.get(1) is None
+    assert miss_count_cache.get(2) == 1
+
+
+def test_timer_transition_increments_loaded_counter(migrated_db, fake_redis):
+    past = datetime.now(timezone.utc) - timedelta(minutes=1)
+    task_ids = _add_tasks(1, TaskStatus.PENDING, TaskStatus.IN_PROGRESS, TaskStatus.COMPLETED, due_date=past)
+    miss_count_cache.set(1, 0)
+
+    assert transition_due_tasks(task_ids) == 2
+
+    assert miss_count_cache.get(1, use_local=False) == 2
+
+
+def test_reconcile_corrects_only_drifted_counters(migrated_db, fake_redis):
+    _add_tasks(1, TaskStatus.TASK_MISS, TaskStatus.TASK_MISS, TaskStatus.PENDING)
+    _add_tasks(2, TaskStatus.TASK_MISS)
+    miss_count_cache.set_many({1: 5, 2: 1, 3: 2})
+    fake_redis.set("user:abc:miss_count", "7")
+
+    assert reconcile_miss_counts(batch_size=2) == {"checked": 3, "corrected": 2}
+
+    assert miss_count_cache.get_many([1, 2, 3], use_local=False) == [2, 1, 0]
+    assert fake_redis.get("user:abc:miss_count") == "7"
+    assert reconcile_miss_counts() == {"checked": 3, "corrected": 0}
+
+
+def test_reconcile_without_redis_is_a_no_op(migrated_db):
+    assert reconcile_miss_counts() == {"checked": 0, "corrected": 0}
@@ -0,0 +1,127 @@
+"""기한 타이머 단위 테스트 — 만료 시 전환, 취소·재예약, DB 재확인, off 모드, 적재(warm) [PRO-B-10]."""
+
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.core.database import session_scope
+from app.domains.auth.models import User
+from app.domains.task.models import Task, TaskStatus
+from app.infrastructure.task_miss.due_timer import DueTimer
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _add_task(due_date: datetime, status: TaskStatus = TaskStatus.PENDING) -> int:
+    with session_scope() as session:
+        if session.get(User, 1) is None:
+            session.add(User(id=1, email="u1@example.com", name="u1"))
+        task = Task(title="t", status=status, user_id=1, due_date=due_date.replace(tzinfo=None))
+        session.add(task)
+        session.flush()
+        return task.id
+
+
+def _status(task_id: int) -> TaskStatus:
+    with session_scope() as session:
+        return session.get(Task, task_id).status
+
+
+def _wait_until(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return predicate()
+
+
+@pytest.fixture
+def timer(migrated_db, monkeypatch):
+    monkeypatch.setenv("TASK_MISS_DUE_TIMER", "memory")
+    due_timer = DueTimer()
+    due_timer.start()
+    yield due_timer
+    due_timer.stop()
+
+
+def test_due_task_is_transitioned_when_timer_fires(timer):
+    due = _now() + timedelta(milliseconds=200)
+    task_id = _add_task(due)
+
+    timer.schedule(task_id, due)
+
+    assert _status(task_id) == TaskStatus.PENDING
+    assert _wait_until(lambda: timer.snapshot()["fired_total"] == 1)
+    assert _status(task_id) == TaskStatus.TASK_MISS
+    assert timer.snapshot()["pending_local"] == 0
+
+
+def test_cancelled_task_is_not_fired(timer):
+    due = _now() + timedelta(milliseconds=200)
+    task_id = _add_task(due)
+    timer.schedule(task_id, due)
+
+    timer.cancel(task_id)
+    time.sleep(0.5)
+
+    assert _status(task_id) == TaskStatus.PENDING
+    assert timer.snapshot()["pending_local"] == 0
+    assert timer.snapshot()["fired_total"] == 0
+
+
+def test_rescheduled_task_fires_at_new_due_date_only(timer):
+    first_due = _now() + timedelta(milliseconds=200)
+    task_id = _add_task(first_due)
+    timer.schedule(task_id, first_due)
+
+    timer.schedule(task_id, _now() + timedelta(hours=1))
+    time.sleep(0.5)
+
+    assert _status(task_id) == TaskStatus.PENDING
+    assert timer.snapshot()["pending_local"] == 1
+
+
+def test_fired_task_is_rechecked_against_database(timer):
+    """예약 후 완료된 과업은 타이머가 울려도 전환되지 않는다."""
+    past = _now() - timedelta(seconds=1)
+    completed = _add_task(past, TaskStatus.COMPLETED)
+    missed = _add_task(past)
+
+    timer.schedule_many([(completed, past), (missed, past)])
+
+    assert _wait_until(lambda: timer.snapshot()["fired_total"] == 1)
+    assert _status(missed) == TaskStatus.TASK_MISS
+    assert _status(completed) == TaskStatus.COMPLETED
+
+
+def test_off_mode_does_nothing(migrated_db, monkeypatch):
+    monkeypatch.setenv("TASK_MISS_DUE_TIMER", "off")
+    due_timer = DueTimer()
+    task_id = _add_task(_now() - timedelta(seconds=1))
+
+    due_timer.start()
+    due_timer.schedule(task_id, _now() - timedelta(seconds=1))
+
+    assert due_timer.snapshot()["running"] is False
+    assert due_timer.snapshot()["pending_local"] == 0
+    assert due_timer.warm() == 0
+    assert _status(task_id) == TaskStatus.PENDING
+
+
+def test_warm_loads_open_tasks_within_horizon(migrated_db, monkeypatch):
+    monkeypatch.setenv("TASK_MISS_DUE_TIMER", "memory")
+    monkeypatch.setenv("TASK_MISS_DUE_TIMER_HORIZON_HOURS", "1")
+    now = _now()
+    _add_task(now + timedelta(minutes=10))
+    _add_task(now + timedelta(minutes=20))
+    _add_task(now + timedelta(minutes=30), TaskStatus.COMPLETED)
+    _add_task(now + timedelta(hours=2))
+    _add_task(now - timedelta(minutes=1))
+    due_timer = DueTimer()
+
+    assert due_timer.warm(now) == 2
+    assert due_timer.snapshot()["pending_local"] == 2
@@ -2,12 +2,14 @@
 파라미터 레지스트리 싱글톤 [PRO-B-16].
 DB의 system_parameters 테이블을 인메모리에 캐싱하고,
 TTL 경과 시 자동으로 DB에서 재조회하여 앱 재시작 없이 변경사항을 반영한다.
+force_refresh()는 캐시 무효화 버스로 다른 워커에도 알려, 각 워커가 다음 조회에서 TTL과 무관하게 재조회한다.
 """
 import logging
 import threading
 import time
 from typing import Any
 
+from app.core.cache import invalidation_bus
 from app.core.database import get_session_factory
 from app.infrastructure.task_params.defaults import PARAM_DEFAULTS
 from app.infrastructure.task_params.models import SystemParameter
@@ -15,6 +17,7 @@ from app.infrastructure.task_params.models import SystemParameter
 logger = logging.getLogger(__name__)
 
 CACHE_TTL_SECONDS = 30
+INVALIDATION_NAMESPACE = "task_params"
 
 
 def _cast_value(raw: str, value_type: str) -> Any:
@@ -49,6 +52,7 @@ class ParameterRegistry:
                     inst._cache: dict[str, tuple[Any, str]] = {}
                     inst._last_refresh: float = 0
                     inst._ttl = CACHE_TTL_SECONDS
+                    invalidation_bus.register(INVALIDATION_NAMESPACE, inst._on_remote_invalidate)
                     cls._instance = inst
         return cls._instance
 
@@ -81,8 +85,14 @@ class ParameterRegistry:
         return {k: v[0] for k, v in self._cache.items() if v[1] == category}
 
     def force_refresh(self) -> int:
-        """캐시를 즉시 DB에서 갱신한다. 갱신된 파라미터 수를 반환한다."""
-        return self._load_from_db()
+        """캐시를 즉시 DB에서 갱신하고 다른 워커에도 알린다. 갱신된 파라미터 수를 반환한다."""
+        count = self._load_from_db()
+        invalidation_bus.publish(INVALIDATION_NAMESPACE)
+        return count
+
+    def _on_remote_invalidate(self, _keys: list[str] | None) -> None:
+        """다른 워커에서 파라미터가 변경되었다. 다음 조회에서 DB를 다시 읽는다."""
+        self._last_refresh = 0
 
     def _refresh_if_stale(self) -> None:
         now = time.monotonic()
@@ -7,7 +7,7 @@ import time
 from datetime import datetime, timezone
 from typing import Optional
 
-from app.core.database import get_session_factory
+from app.core.database import session_scope
 from app.infrastructure.task_params.models import SystemParameter
 from app.infrastructure.task_params.registry import ParameterRegistry
 from app.infrastructure.task_params.schemas import ParameterUpdateRequest
@@ -30,30 +30,23 @@ class ParameterServiceImpl:
     """파라미터 CRUD 구현체 [PRO-B-16]."""
 
     def get_all(self) -> list[SystemParameter]:
-        session_factory = get_session_factory()
-        with session_factory() as session:
+        with session_scope() as session:
             params = session.query(SystemParameter).order_by(SystemParameter.category, SystemParameter.key).all()
-            session.expunge_all()
         return params
 
     def get_by_key(self, key: str) -> Optional[SystemParameter]:
-        session_factory = get_session_factory()
-        with session_factory() as session:
+        with session_scope() as session:
             param = session.query(SystemParameter).filter(SystemParameter.key == key).first()
-            if param:
-                session.expunge(param)
         return param
 
     def get_by_category(self, category: str) -> list[SystemParameter]:
-        session_factory = get_session_factory()
-        with session_factory() as session:
+        with session_scope() as session:
             params = (
                 session.query(SystemParameter)
                 .filter(SystemParameter.category == category)
                 .order_by(SystemParameter.key)
                 .all()
             )
-            session.expunge_all()
         return params
 
     def update(self, key: str, request: ParameterUpdateRequest) -> SystemParameter:
@@ -63,9 +56,8 @@ class ParameterServiceImpl:
         """
         start_ns = time.perf_counter_ns()
         now = datetime.now(timezone.utc)
-        session_factory = get_session_factory()
 
-        with session_factory() as session:
+        with session_scope() as session:
             param = session.query(SystemParameter).filter(SystemParameter.key == key).first()
             if param is None:
                 raise ValueError(f"파라미터를 찾을 수 없습니다: key={key}")
@@ -79,9 +71,8 @@ class ParameterServiceImpl:
             if request.description is not None:
                 param.description = request.description
 
-            session.commit()
+            session.flush()
             session.refresh(param)
-            session.expunge(param)
 
         # [PRO-B-16] 레지스트리 캐시 즉시 갱신
         registry = ParameterRegistry()
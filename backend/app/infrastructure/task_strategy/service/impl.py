@@ -9,9 +9,11 @@ from datetime import datetime, timezone
 
 from sqlalchemy import and_
 
-from app.core.database import get_session_factory
-from app.core.redis import get_redis
+from app.core.database import session_scope
 from app.domains.task.models import Task, TaskStatus
+from app.domains.task.stats import invalidate_dashboard_cache
+from app.infrastructure.task_miss.counter import apply_miss_delta, miss_delta
+from app.infrastructure.task_miss.due_timer import due_timer
 from app.infrastructure.task_strategy.schemas import (
     ApplyStrategyRequest,
     ApplyStrategyResponse,
@@ -20,7 +22,6 @@ from app.infrastructure.task_strategy.schemas import (
 
 logger = logging.getLogger(__name__)
 
-REDIS_MISS_KEY = "user:{user_id}:miss_count"
 
 # [PRO-B-21] strategy_select → TaskStatus 매핑
 _STRATEGY_STATUS_MAP: dict[StrategySelect, TaskStatus] = {
@@ -36,9 +37,8 @@ class TaskStrategyServiceImpl:
     def apply_strategy(self, task_id: int, request: ApplyStrategyRequest) -> ApplyStrategyResponse:
         start_ns = time.perf_counter_ns()
         now = datetime.now(timezone.utc)
-        session_factory = get_session_factory()
 
-        with session_factory() as session:
+        with session_scope() as session:
             task: Task | None = session.get(Task, task_id)
             if task is None:
                 raise ValueError(f"과업을 찾을 수 없습니다: task_id={task_id}")
@@ -59,14 +59,19 @@ class TaskStrategyServiceImpl:
             if request.strategy_select == StrategySelect.KEEP:
                 task.is_archived = False
 
-            session.commit()
+            session.flush()
             session.refresh(task)
 
             is_archived = task.is_archived
             current_status = task.status.value if isinstance(task.status, TaskStatus) else str(task.status)
             user_id = task.user_id
+            due_date = task.due_date
 
-        self._invalidate_miss_cache(user_id)
+        self._update_miss_cache(user_id, miss_delta(previous_status, current_status))
+        if current_status == TaskStatus.PENDING.value:
+            due_timer.schedule(task_id, due_date)
+        else:
+            due_timer.cancel(task_id)
 
         elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
         logger.info(
@@ -91,23 +96,17 @@ class TaskStrategyServiceImpl:
 
     def get_active_tasks(self, user_id: str) -> list[Task]:
         """is_archived=False인 과업만 반환하여 보관 과업을 활성 리스트에서 제외한다."""
-        session_factory = get_session_factory()
-        with session_factory() as session:
+        with session_scope() as session:
             tasks = (
                 session.query(Task)
                 .filter(and_(Task.user_id == user_id, Task.is_archived == False))  # noqa: E712
                 .order_by(Task.due_date.asc())
                 .all()
             )
-            session.expunge_all()
         return tasks
 
     @staticmethod
-    def _invalidate_miss_cache(user_id: str) -> None:
-        client = get_redis()
-        if client is None:
-            return
-        try:
-            client.delete(REDIS_MISS_KEY.format(user_id=user_id))
-        except Exception:
-            logger.warning("[PRO-B-21] Redis 캐시 무효화 실패 user=%s", user_id, exc_info=True)
+    def _update_miss_cache(user_id: str, delta: int) -> None:
+        """miss_count 카운터를 증감하고 대시보드 캐시를 삭제한다."""
+        apply_miss_delta(user_id, delta)
+        invalidate_dashboard_cache(user_id)
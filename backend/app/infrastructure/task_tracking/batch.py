@@ -0,0 +1,108 @@
+"""
+행동 이벤트 일괄 변환 [PRO-B-24].
+여러 이벤트를 BehaviorLog로 만들 때 사용자·과업 수와 무관하게 조회를 고정 횟수로 유지한다.
+- 실험 할당: 배치 내 고유 사용자에 대해 SELECT 1회 (+ 미할당 사용자 INSERT 1회)
+- 직전 이벤트: 과업별 마지막 이벤트 캐시(last_event)에서 조회, 캐시에 없는 과업만 MAX(event_at) GROUP BY 1회.
+  마지막 시각보다 이른 이벤트(소급 event_at, 다른 쓰기 경로가 먼저 커밋한 더 최근 이벤트)만
+  event_at 이하의 저장된 마지막 시각을 SELECT 1회로 다시 찾는다. 직전 이벤트는 항상 event_at 이하이다.
+- latency: 과업별로 event_at 순 정렬 후 메모리에서 앞 이벤트와의 간격을 계산
+- 저장: 다중 행 INSERT ... RETURNING id 1회 (insert_behavior_logs)
+- 요약 롤업: (user_id, event_type)별 증분 upsert 1회 (write_behavior_logs)
+"""
+import json
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.infrastructure.task_tracking.experiment import PersistentExperimentAssigner
+from app.infrastructure.task_tracking.last_event import (
+    as_utc,
+    get_last_event_at,
+    latency_ms,
+    stored_event_at_before,
+)
+from app.infrastructure.task_tracking.models import BehaviorLog
+from app.infrastructure.task_tracking.rollup import apply_rollup
+from app.infrastructure.task_tracking.schemas import RecordEventRequest
+
+
+# INSERT 문 1개당 최대 행 수 (바인드 파라미터 수 제한 대비)
+INSERT_CHUNK_SIZE = 1000
+
+_INSERT_COLUMNS = [
+    column.key for column in BehaviorLog.__table__.columns if column.key not in ("id", "created_at")
+]
+
+
+def insert_behavior_logs(session: Session, logs: list[BehaviorLog]) -> None:
+    """
+    로그를 다중 행 INSERT로 저장하고 각 엔티티에 id를 채운다 (세션에는 추가하지 않는다).
+    한 INSERT 문 안에서 자동 증가 id는 VALUES 순서대로 커지므로, 반환된 id를 정렬해 입력 순서에 맞춘다.
+    """
+    for start in range(0, len(logs), INSERT_CHUNK_SIZE):
+        chunk = logs[start:start + INSERT_CHUNK_SIZE]
+        rows = [{key: getattr(log, key) for key in _INSERT_COLUMNS} for log in chunk]
+        ids = sorted(session.scalars(insert(BehaviorLog).values(rows).returning(BehaviorLog.id)))
+        for log, log_id in zip(chunk, ids):
+            log.id = log_id
+
+
+def resolve_event_at(client_event_at: Optional[datetime], received_at: datetime) -> datetime:
+    """클라이언트가 보낸 발생 시각(naive는 UTC)을 쓰되, 없거나 수신 시각보다 미래이면 수신 시각을 쓴다."""
+    if client_event_at is None:
+        return received_at
+    return min(as_utc(client_event_at), received_at)
+
+
+def write_behavior_logs(session: Session, events: list[tuple[RecordEventRequest, datetime]]) -> list[BehaviorLog]:
+    """build_behavior_logs + insert_behavior_logs + 요약 롤업 증분. 커밋과 마지막 이벤트 캐시 갱신은 caller가 한다."""
+    logs = build_behavior_logs(session, events)
+    insert_behavior_logs(session, logs)
+    apply_rollup(session, logs)
+    return logs
+
+
+def build_behavior_logs(session: Session, events: list[tuple[RecordEventRequest, datetime]]) -> list[BehaviorLog]:
+    """
+    (요청, 수신 시각) 목록을 BehaviorLog 엔티티로 변환한다. 입력 순서를 유지하며 저장은 caller가 한다.
+    같은 과업의 이벤트가 배치에 여러 건이면 발생 시각 순으로 이어 붙이고, 각 이벤트의 직전 이벤트는
+    배치 안의 앞 이벤트와 event_at 이하의 저장된 마지막 이벤트 중 늦은 쪽이다.
+    """
+    assignments = PersistentExperimentAssigner.get_or_assign_many(
+        session, [request.user_id for request, _ in events]
+    )
+    last = get_last_event_at(session, (request.task_id for request, _ in events))
+    # 마지막 저장 시각보다 이른 이벤트는 그 시각 이전의 저장된 이벤트가 직전 이벤트다
+    early = [i for i, (request, event_at) in enumerate(events) if _is_before(event_at, last.get(request.task_id))]
+    stored_before = dict(
+        zip(early, stored_event_at_before(session, [(events[i][0].task_id, events[i][1]) for i in early]))
+    )
+
+    logs: list[Optional[BehaviorLog]] = [None] * len(events)
+    chained: dict[int, datetime] = {}
+    for i in sorted(range(len(events)), key=lambda i: (events[i][0].task_id, as_utc(events[i][1]))):
+        request, event_at = events[i]
+        assignment = assignments[request.user_id]
+        stored = stored_before[i] if i in stored_before else last.get(request.task_id)
+        previous_event_at = max(
+            (value for value in (stored, chained.get(request.task_id)) if value is not None), default=None
+        )
+        logs[i] = BehaviorLog(
+            task_id=request.task_id,
+            user_id=request.user_id,
+            event_type=request.event_type.value,
+            experiment_id=assignment.experiment_id,
+            experiment_group=assignment.group,
+            event_at=event_at,
+            previous_event_at=previous_event_at,
+            latency_ms=latency_ms(previous_event_at, event_at),
+            metadata_json=json.dumps(request.metadata, ensure_ascii=False) if request.metadata else None,
+        )
+        chained[request.task_id] = as_utc(event_at)
+    return logs  # type: ignore[return-value]
+
+
+def _is_before(event_at: datetime, last: Optional[datetime]) -> bool:
+    return last is not None and as_utc(event_at) < last
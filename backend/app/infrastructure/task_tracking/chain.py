@@ -0,0 +1,25 @@
+"""
+행동 체인 전체 통계 [PRO-B-24].
+/tasks/{task_id}/chain은 페이지 단위로 이벤트를 반환하지만, total_events·total_latency_ms는
+페이지와 무관하게 과업의 체인 전체를 나타낸다. ix_behavior_logs_task_event 범위에서 COUNT·MIN·MAX 1회로 구한다.
+"""
+from typing import Any, Optional
+
+from sqlalchemy import func, select
+
+from app.infrastructure.task_tracking.last_event import latency_ms
+from app.infrastructure.task_tracking.models import BehaviorLog
+
+
+def chain_totals_stmt(task_id: int):
+    return select(
+        func.count(BehaviorLog.id),
+        func.min(BehaviorLog.event_at),
+        func.max(BehaviorLog.event_at),
+    ).where(BehaviorLog.task_id == task_id)
+
+
+def chain_totals(row: Any) -> tuple[int, Optional[float]]:
+    """chain_totals_stmt 결과 → (전체 이벤트 수, 첫 이벤트~마지막 이벤트 경과 시간). 이벤트가 2건 미만이면 경과 시간은 None."""
+    count, first_at, last_at = row
+    return count, latency_ms(first_at, last_at) if count >= 2 else None
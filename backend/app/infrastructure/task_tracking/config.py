@@ -0,0 +1,80 @@
+"""
+행동 이벤트 적재 설정 [PRO-B-24].
+환경 변수로 오버라이드 가능하며, 미설정 시 기본값을 사용한다.
+"""
+import os
+
+INGEST_DIRECT = "direct"
+INGEST_BUFFERED = "buffered"
+
+ACK_SYNC = "sync"
+ACK_ASYNC = "async"
+
+DEFAULT_INGEST_MODE = INGEST_DIRECT
+DEFAULT_ACK_MODE = ACK_SYNC
+DEFAULT_BUFFER_MAX_SIZE = 10_000
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_FLUSH_INTERVAL_MS = 200
+DEFAULT_ENQUEUE_TIMEOUT_MS = 1000
+DEFAULT_BULK_MAX_EVENTS = 1000
+DEFAULT_FLUSH_RETRIES = 3
+DEFAULT_FLUSH_RETRY_BACKOFF_MS = 100
+
+
+def get_ingest_mode() -> str:
+    """
+    이벤트 적재 방식 (direct | buffered). 알 수 없는 값이면 direct.
+    - direct: 요청마다 조회·INSERT·COMMIT (기존 방식)
+    - buffered: 프로세스 내 큐에 넣고 백그라운드 writer가 여러 건을 한 번에 INSERT
+    """
+    mode = os.getenv("TRACKING_INGEST_MODE", DEFAULT_INGEST_MODE).strip().lower()
+    if mode not in (INGEST_DIRECT, INGEST_BUFFERED):
+        return DEFAULT_INGEST_MODE
+    return mode
+
+
+def get_ack_mode() -> str:
+    """
+    buffered 모드의 응답 시점 (sync | async). 알 수 없는 값이면 sync.
+    - sync: 이벤트가 포함된 배치가 커밋된 뒤 응답 (기존과 같은 응답, 유실 없음)
+    - async: 큐에 넣는 즉시 202 응답. 커밋 전 프로세스가 비정상 종료되면 큐에 남은 이벤트는 유실된다.
+    """
+    mode = os.getenv("TRACKING_ACK_MODE", DEFAULT_ACK_MODE).strip().lower()
+    if mode not in (ACK_SYNC, ACK_ASYNC):
+        return DEFAULT_ACK_MODE
+    return mode
+
+
+def get_buffer_max_size() -> int:
+    """큐 최대 대기 이벤트 수. 가득 차면 요청이 TRACKING_ENQUEUE_TIMEOUT_MS 동안 기다린 뒤 503."""
+    return max(1, int(os.getenv("TRACKING_BUFFER_MAX_SIZE", str(DEFAULT_BUFFER_MAX_SIZE))))
+
+
+def get_batch_size() -> int:
+    """한 번에 INSERT할 최대 이벤트 수."""
+    return max(1, int(os.getenv("TRACKING_BATCH_SIZE", str(DEFAULT_BATCH_SIZE))))
+
+
+def get_flush_interval_ms() -> int:
+    """첫 이벤트가 들어온 뒤 배치가 차지 않아도 flush하기까지의 최대 대기 시간(ms)."""
+    return max(1, int(os.getenv("TRACKING_FLUSH_INTERVAL_MS", str(DEFAULT_FLUSH_INTERVAL_MS))))
+
+
+def get_flush_retries() -> int:
+    """배치 저장 실패(락 대기 초과·연결 끊김 등) 시 배치 전체를 다시 시도하는 횟수. 0이면 재시도 없음."""
+    return max(0, int(os.getenv("TRACKING_FLUSH_RETRIES", str(DEFAULT_FLUSH_RETRIES))))
+
+
+def get_flush_retry_backoff_ms() -> int:
+    """첫 재시도 전 대기 시간(ms). 재시도마다 2배로 늘어난다."""
+    return max(0, int(os.getenv("TRACKING_FLUSH_RETRY_BACKOFF_MS", str(DEFAULT_FLUSH_RETRY_BACKOFF_MS))))
+
+
+def get_enqueue_timeout_ms() -> int:
+    """큐가 가득 찼을 때 요청이 빈자리를 기다리는 최대 시간(ms). 0이면 즉시 거절."""
+    return max(0, int(os.getenv("TRACKING_ENQUEUE_TIMEOUT_MS", str(DEFAULT_ENQUEUE_TIMEOUT_MS))))
+
+
+def get_bulk_max_events() -> int:
+    """POST /task-tracking/events/batch 요청 1회당 최대 이벤트 수. 초과 시 413."""
+    return max(1, int(os.getenv("TRACKING_BULK_MAX_EVENTS", str(DEFAULT_BULK_MAX_EVENTS))))
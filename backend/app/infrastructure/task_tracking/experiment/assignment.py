@@ -3,17 +3,30 @@ DB 영구 실험군 할당 로직 [PRO-B-24].
 SHA-256 해시 기반으로 사용자를 결정론적(deterministic)으로 할당하고,
 결과를 experiment_assignments 테이블에 영구 저장한다.
 이미 할당된 사용자는 DB에서 조회하여 동일 그룹을 반환한다.
+
+- 할당은 한 번 저장되면 바뀌지 않으므로 2계층 캐시 네임스페이스(experiment_assignment)에 두고,
+  캐시에 있는 사용자는 DB를 조회하지 않는다. EXPERIMENT_ASSIGNMENT_CACHE_REDIS=true 이면 Redis 계층을 함께 쓴다.
+- 신규 할당은 INSERT ... ON CONFLICT (user_id) DO NOTHING으로 저장하여, 동시 요청이 같은 사용자를
+  할당해도 UNIQUE 위반 없이 먼저 저장된 행을 따른다.
+- 신규 할당은 호출자의 트랜잭션이 커밋된 뒤에야 확정되므로 캐시에 넣지 않고, 다음 조회에서 DB로 확인한 뒤 적재한다.
 """
 import hashlib
 import logging
 import os
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Iterable, Optional
 
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 
+from app.core.cache import CacheNamespace, JsonSerializer
+from app.core.database import dialect_insert
 from app.infrastructure.task_tracking.models import ExperimentAssignment
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
 logger = logging.getLogger(__name__)
 
 TREATMENT_GROUP = "treatment"
@@ -21,6 +34,27 @@ CONTROL_GROUP = "control"
 DEFAULT_EXPERIMENT_ID = "PRO-B-24-ab-test"
 DEFAULT_RATIO = 50
 
+# 불변 값이므로 TTL은 메모리·Redis 용량 관리용이다
+CACHE_TTL_SECONDS = 7 * 24 * 3600
+CACHE_LOCAL_TTL_SECONDS = 3600
+
+_CACHED_FIELDS = ("experiment_id", "group", "hash_value", "assigned_at")
+
+
+def is_redis_tier_enabled() -> bool:
+    """실험 할당 Redis 2차 캐시 사용 여부 (EXPERIMENT_ASSIGNMENT_CACHE_REDIS)."""
+    return os.getenv("EXPERIMENT_ASSIGNMENT_CACHE_REDIS", "false").lower() in ("true", "1", "yes")
+
+
+assignment_cache: CacheNamespace[dict[str, Any]] = CacheNamespace(
+    "experiment_assignment",
+    "experiment:assignment:{id}",
+    JsonSerializer(datetime_fields=("assigned_at",)),
+    ttl_seconds=CACHE_TTL_SECONDS,
+    local_ttl_seconds=CACHE_LOCAL_TTL_SECONDS,
+    remote_enabled=is_redis_tier_enabled,
+)
+
 
 @dataclass(frozen=True)
 class PersistentAssignmentResult:
@@ -42,38 +76,67 @@ class PersistentExperimentAssigner:
 
     @staticmethod
     def get_or_assign(session: Session, user_id: str) -> PersistentAssignmentResult:
-        """기존 할당이 있으면 조회, 없으면 신규 할당 후 저장한다."""
-        existing = (
-            session.query(ExperimentAssignment)
-            .filter(ExperimentAssignment.user_id == user_id)
-            .first()
-        )
-        if existing is not None:
-            return PersistentAssignmentResult(
-                user_id=existing.user_id,
-                experiment_id=existing.experiment_id,
-                group=existing.group,
-                hash_value=existing.hash_value,
-                assigned_at=existing.assigned_at,
-                newly_assigned=False,
-            )
+        """기존 할당이 있으면 조회(캐시 → DB), 없으면 신규 할당 후 저장한다."""
+        return PersistentExperimentAssigner.get_or_assign_many(session, [user_id])[user_id]
 
+    @staticmethod
+    def get_or_assign_many(session: Session, user_ids: list[str]) -> dict[str, PersistentAssignmentResult]:
+        """
+        캐시에 없는 사용자만 SELECT 1회로 조회하고, 할당이 없는 사용자는 INSERT ... ON CONFLICT DO NOTHING 1회로 저장한다.
+        신규 할당이 없으면 세션에 쓰기를 남기지 않는다 (session_scope가 커밋하지 않는다).
+        """
+        user_ids = list(dict.fromkeys(user_ids))
+        results, missing = _split_cached(user_ids, assignment_cache.get_many(user_ids))
+        if not missing:
+            return results
+
+        found = _from_rows(session.scalars(_select_stmt(missing)))
+        assignment_cache.set_many(_cache_values(found))
+        results.update(found)
+        missing = [user_id for user_id in missing if user_id not in results]
+        if not missing:
+            return results
+
+        new_values = [PersistentExperimentAssigner._new_assignment(user_id) for user_id in missing]
+        inserted = set(session.scalars(_insert_ignore_stmt(session, new_values)))
+        for values in new_values:
+            if values["user_id"] in inserted:
+                results[values["user_id"]] = PersistentExperimentAssigner._from_new(values)
+        lost = [user_id for user_id in missing if user_id not in inserted]
+        if lost:
+            # 동시 요청이 먼저 저장한 할당을 따른다
+            found = _from_rows(session.scalars(_select_stmt(lost)))
+            assignment_cache.set_many(_cache_values(found))
+            results.update(found)
+        return results
+
+    @staticmethod
+    async def get_or_assign_async(session: "AsyncSession", user_id: str) -> PersistentAssignmentResult:
+        """get_or_assign의 AsyncSession 버전. 신규 할당이면(newly_assigned) 호출자가 커밋해야 한다."""
+        cached = await assignment_cache.aget(user_id)
+        if cached is not None:
+            return PersistentAssignmentResult(user_id=user_id, newly_assigned=False, **cached)
+
+        existing = await session.scalar(_select_stmt([user_id]))
+        if existing is None:
+            values = PersistentExperimentAssigner._new_assignment(user_id)
+            if await session.scalar(_insert_ignore_stmt(session, [values])) is not None:
+                return PersistentExperimentAssigner._from_new(values)
+            # 동시 요청이 먼저 저장한 할당을 따른다
+            existing = await session.scalar(_select_stmt([user_id]))
+        result = PersistentExperimentAssigner._from_existing(existing)
+        await assignment_cache.aset_many(_cache_values({user_id: result}))
+        return result
+
+    @staticmethod
+    def _new_assignment(user_id: str) -> dict[str, Any]:
+        """해시 기반으로 그룹을 결정한 신규 할당 행을 만든다. 저장은 caller가 한다."""
         experiment_id = os.getenv("EXPERIMENT_ID", DEFAULT_EXPERIMENT_ID)
         ratio = int(os.getenv("EXPERIMENT_RATIO", str(DEFAULT_RATIO)))
         hash_value = PersistentExperimentAssigner._compute_hash(user_id)
         group = TREATMENT_GROUP if (hash_value % 100) < ratio else CONTROL_GROUP
         now = datetime.now(timezone.utc)
 
-        assignment = ExperimentAssignment(
-            user_id=user_id,
-            experiment_id=experiment_id,
-            group=group,
-            hash_value=hash_value,
-            assigned_at=now,
-        )
-        session.add(assignment)
-        session.flush()
-
         logger.info(
             "[%s][PRO-B-24] 신규 실험 할당 user=%s group=%s hash=%d experiment=%s",
             now.isoformat(timespec="milliseconds"),
@@ -83,17 +146,72 @@ class PersistentExperimentAssigner:
             experiment_id,
         )
 
+        return {
+            "user_id": user_id,
+            "experiment_id": experiment_id,
+            "group": group,
+            "hash_value": hash_value,
+            "assigned_at": now,
+        }
+
+    @staticmethod
+    def _from_existing(existing: ExperimentAssignment) -> PersistentAssignmentResult:
         return PersistentAssignmentResult(
-            user_id=user_id,
-            experiment_id=experiment_id,
-            group=group,
-            hash_value=hash_value,
-            assigned_at=now,
-            newly_assigned=True,
+            user_id=existing.user_id,
+            experiment_id=existing.experiment_id,
+            group=existing.group,
+            hash_value=existing.hash_value,
+            assigned_at=existing.assigned_at,
+            newly_assigned=False,
         )
 
+    @staticmethod
+    def _from_new(values: dict[str, Any]) -> PersistentAssignmentResult:
+        return PersistentAssignmentResult(**values, newly_assigned=True)
+
     @staticmethod
     def _compute_hash(user_id: str) -> int:
         """SHA-256 해시의 마지막 4바이트를 부호 없는 정수로 변환한다."""
         digest = hashlib.sha256(user_id.encode("utf-8")).digest()
         return int.from_bytes(digest[-4:], byteorder="big")
+
+
+def _split_cached(
+    user_ids: list[str], cached: list[Optional[dict[str, Any]]]
+) -> tuple[dict[str, PersistentAssignmentResult], list[str]]:
+    results: dict[str, PersistentAssignmentResult] = {}
+    missing: list[str] = []
+    for user_id, values in zip(user_ids, cached):
+        if values is None:
+            missing.append(user_id)
+        else:
+            results[user_id] = PersistentAssignmentResult(user_id=user_id, newly_assigned=False, **values)
+    return results, missing
+
+
+def _from_rows(rows: Iterable[ExperimentAssignment]) -> dict[str, PersistentAssignmentResult]:
+    return {row.user_id: PersistentExperimentAssigner._from_existing(row) for row in rows}
+
+
+def _cache_values(results: dict[str, PersistentAssignmentResult]) -> dict[str, dict[str, Any]]:
+    """DB에서 읽은(저장이 확정된) 할당만 캐시에 넣는다."""
+    return {user_id: {key: getattr(result, key) for key in _CACHED_FIELDS} for user_id, result in results.items()}
+
+
+def _select_stmt(user_ids: list[str]):
+    return select(ExperimentAssignment).where(ExperimentAssignment.user_id.in_(user_ids))
+
+
+def _insert_ignore_stmt(session: "Session | AsyncSession", values: list[dict[str, Any]]):
+    """
+    이미 할당된 사용자는 건너뛰는 다중 행 INSERT. RETURNING으로 실제로 저장된 user_id만 돌려준다.
+    ON CONFLICT를 지원하지 않는 DB에서는 일반 INSERT로 동작한다 (동시 할당 시 UNIQUE 위반).
+    """
+    stmt = dialect_insert(session.get_bind().dialect.name, ExperimentAssignment)
+    if stmt is None:
+        return insert(ExperimentAssignment).values(values).returning(ExperimentAssignment.user_id)
+    return (
+        stmt.values(values)
+        .on_conflict_do_nothing(index_elements=[ExperimentAssignment.user_id])
+        .returning(ExperimentAssignment.user_id)
+    )
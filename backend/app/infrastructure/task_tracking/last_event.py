@@ -0,0 +1,171 @@
+"""
+과업별 마지막 이벤트 시각 캐시 [PRO-B-24].
+latency_ms·previous_event_at 계산을 위해 이벤트마다 behavior_logs를 조회하는 대신,
+task_id → 마지막 event_at을 2계층 캐시 네임스페이스(last_event_at)에 두고 쓰기 경로에서 갱신한다.
+
+- 조회: 로컬 LRU → Redis → (미스만) ix_behavior_logs_task_event로 MAX(event_at) GROUP BY 1회.
+  DB에서 읽은 값은 SET NX로 적재하여 그 사이 다른 요청이 기록한 더 최근 값을 덮어쓰지 않는다.
+- 갱신: 이벤트가 커밋된 뒤 과업별 가장 최근 event_at을 저장된 값보다 늦을 때만 쓴다 (set_max_many).
+  소급 event_at 이벤트나 동시에 커밋한 다른 요청이 캐시를 과거로 되돌리지 않는다.
+  다른 프로세스의 로컬 계층은 pub/sub로 무효화된다.
+- 이벤트가 한 번도 없는 과업은 적재하지 않는다 (첫 이벤트는 DB 조회 1회).
+- 직전 이벤트는 항상 event_at 이하이다. 마지막 시각이 이벤트보다 늦으면(소급 event_at, 다른 경로가 먼저 커밋한
+  더 최근 이벤트) 캐시 값 대신 DB에서 event_at 이하의 마지막 시각을 읽는다 (stored_event_at_before).
+- Redis 장애 중에는 프로세스별 로컬 계층만 남으므로, 다른 워커가 기록한 이벤트가 보이기까지의 지연을
+  로컬 TTL(기본 10초)로 제한한다.
+"""
+from datetime import datetime, timezone
+from typing import Iterable, Iterator, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.cache import UTC_DATETIME, CacheNamespace
+from app.infrastructure.task_tracking.models import BehaviorLog
+
+DEFAULT_TTL_SECONDS = 24 * 3600
+DEFAULT_LOCAL_TTL_SECONDS = 10
+# SELECT 1개에 묶는 (task_id, event_at) 스칼라 서브쿼리 최대 수
+BEFORE_CHUNK_SIZE = 500
+
+last_event_cache: CacheNamespace[datetime] = CacheNamespace(
+    "last_event_at",
+    "task:{id}:last_event_at",
+    UTC_DATETIME,
+    ttl_seconds=DEFAULT_TTL_SECONDS,
+    local_ttl_seconds=DEFAULT_LOCAL_TTL_SECONDS,
+)
+
+
+def as_utc(value: datetime) -> datetime:
+    """DB에서 읽은 naive datetime은 UTC로 간주한다 (SQLite는 tz 정보를 저장하지 않는다)."""
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+def latency_ms(previous_event_at: Optional[datetime], event_at: datetime) -> Optional[float]:
+    if previous_event_at is None:
+        return None
+    return round((as_utc(event_at) - as_utc(previous_event_at)).total_seconds() * 1000, 3)
+
+
+def _last_event_at_stmt(task_ids: list[int]):
+    return (
+        select(BehaviorLog.task_id, func.max(BehaviorLog.event_at))
+        .where(BehaviorLog.task_id.in_(task_ids))
+        .group_by(BehaviorLog.task_id)
+    )
+
+
+def _stored_before_stmt(pairs: list[tuple[int, datetime]]):
+    """(task_id, t)마다 event_at <= t 인 마지막 event_at. ix_behavior_logs_task_event 범위 조회를 SELECT 1개로 묶는다."""
+    return select(
+        *(
+            select(func.max(BehaviorLog.event_at))
+            .where(BehaviorLog.task_id == task_id, BehaviorLog.event_at <= as_utc(event_at))
+            .scalar_subquery()
+            for task_id, event_at in pairs
+        )
+    )
+
+
+def _chunks(pairs: list[tuple[int, datetime]]) -> Iterator[list[tuple[int, datetime]]]:
+    for start in range(0, len(pairs), BEFORE_CHUNK_SIZE):
+        yield pairs[start:start + BEFORE_CHUNK_SIZE]
+
+
+def stored_event_at_before(session: Session, pairs: list[tuple[int, datetime]]) -> list[Optional[datetime]]:
+    """(task_id, t) 목록 순서대로, DB에 저장된 그 과업의 t 이하 마지막 event_at(UTC). 없으면 None."""
+    found: list[Optional[datetime]] = []
+    for chunk in _chunks(pairs):
+        found.extend(_utc_or_none(value) for value in session.execute(_stored_before_stmt(chunk)).one())
+    return found
+
+
+async def astored_event_at_before(
+    session: AsyncSession, pairs: list[tuple[int, datetime]]
+) -> list[Optional[datetime]]:
+    found: list[Optional[datetime]] = []
+    for chunk in _chunks(pairs):
+        found.extend(_utc_or_none(value) for value in (await session.execute(_stored_before_stmt(chunk))).one())
+    return found
+
+
+def last_event_at_by_task(session: Session, task_ids: list[int]) -> dict[int, datetime]:
+    """DB에서 과업별 마지막 event_at을 읽는다 (캐시를 거치지 않는다)."""
+    if not task_ids:
+        return {}
+    return {row[0]: as_utc(row[1]) for row in session.execute(_last_event_at_stmt(task_ids)).all()}
+
+
+def get_last_event_at(session: Session, task_ids: Iterable[int]) -> dict[int, datetime]:
+    """과업별 마지막 event_at(UTC). 캐시에 없는 과업만 DB에서 읽어 적재한다. 이벤트가 없는 과업은 결과에 없다."""
+    task_ids = list(dict.fromkeys(task_ids))
+    found, missing = _split_cached(task_ids, last_event_cache.get_many(task_ids))
+    if missing:
+        loaded = last_event_at_by_task(session, missing)
+        last_event_cache.set_many(loaded, nx=True)
+        found.update(loaded)
+    return found
+
+
+async def aget_last_event_at(session: AsyncSession, task_ids: Iterable[int]) -> dict[int, datetime]:
+    task_ids = list(dict.fromkeys(task_ids))
+    found, missing = _split_cached(task_ids, await last_event_cache.aget_many(task_ids))
+    if missing:
+        rows = await session.execute(_last_event_at_stmt(missing))
+        loaded = {row[0]: as_utc(row[1]) for row in rows}
+        await last_event_cache.aset_many(loaded, nx=True)
+        found.update(loaded)
+    return found
+
+
+def get_previous_event_at(session: Session, task_id: int, event_at: datetime) -> Optional[datetime]:
+    """단건 이벤트의 직전 이벤트 시각. 캐시의 마지막 시각이 event_at보다 늦으면 DB에서 event_at 이하를 찾는다."""
+    last = get_last_event_at(session, [task_id]).get(task_id)
+    if last is None or last <= as_utc(event_at):
+        return last
+    return stored_event_at_before(session, [(task_id, event_at)])[0]
+
+
+async def aget_previous_event_at(session: AsyncSession, task_id: int, event_at: datetime) -> Optional[datetime]:
+    last = (await aget_last_event_at(session, [task_id])).get(task_id)
+    if last is None or last <= as_utc(event_at):
+        return last
+    return (await astored_event_at_before(session, [(task_id, event_at)]))[0]
+
+
+def remember_last_events(logs: Iterable[BehaviorLog]) -> None:
+    """커밋된 로그로 과업별 마지막 event_at을 갱신한다 (더 늦은 시각일 때만). 커밋 이후에 호출한다."""
+    last_event_cache.set_max_many(_latest_by_task(logs))
+
+
+async def aremember_last_events(logs: Iterable[BehaviorLog]) -> None:
+    await last_event_cache.aset_max_many(_latest_by_task(logs))
+
+
+def _split_cached(
+    task_ids: list[int], cached: list[Optional[datetime]]
+) -> tuple[dict[int, datetime], list[int]]:
+    found = {task_id: value for task_id, value in zip(task_ids, cached) if value is not None}
+    return found, [task_id for task_id, value in zip(task_ids, cached) if value is None]
+
+
+def _utc_or_none(value: Optional[datetime]) -> Optional[datetime]:
+    return as_utc(value) if value is not None else None
+
+
+def _latest_by_task(logs: Iterable[BehaviorLog]) -> dict[int, datetime]:
+    """
+    과업별 가장 최근 시각. 늦게 도착한 이벤트(클라이언트 발생 시각이 직전 이벤트보다 이른 경우)가
+    캐시 값을 과거로 되돌리지 않도록 previous_event_at도 함께 비교한다.
+    """
+    latest: dict[int, datetime] = {}
+    for log in logs:
+        for value in (log.event_at, log.previous_event_at):
+            if value is None:
+                continue
+            value = as_utc(value)
+            if log.task_id not in latest or value > latest[log.task_id]:
+                latest[log.task_id] = value
+    return latest
@@ -1,9 +1,10 @@
 """
 행동 체인 로그 및 실험 할당 모델 [PRO-B-24].
 BehaviorLog: task_id 기준으로 '실패→보관→성공' 과정을 ms 단위로 추적한다.
+BehaviorSummary: 사용자·이벤트 유형별 건수와 latency 합계를 BehaviorLog 쓰기와 함께 증분 유지한다.
 ExperimentAssignment: 사용자별 실험군/대조군 할당을 영구 저장한다.
 """
-from sqlalchemy import Column, DateTime, Float, Integer, String, Text, func
+from sqlalchemy import Column, DateTime, Float, Index, Integer, String, Text, func
 
 from app.core.database import Base
 
@@ -18,7 +19,7 @@ class BehaviorLog(Base):
     __tablename__ = "behavior_logs"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    task_id = Column(Integer, nullable=False, index=True)
+    task_id = Column(Integer, nullable=False)
     user_id = Column(String(64), nullable=False, index=True)
     event_type = Column(String(32), nullable=False, index=True)
     experiment_id = Column(String(64), nullable=False, index=True)
@@ -29,6 +30,29 @@ class BehaviorLog(Base):
     metadata_json = Column(Text, nullable=True)
     created_at = Column(DateTime, nullable=False, server_default=func.now())
 
+    __table_args__ = (
+        # 과업별 직전 이벤트(MAX(event_at))·행동 체인 (event_at, id) 순 조회를 인덱스 범위 탐색으로 처리한다.
+        # task_id 단일 컬럼 조회도 이 인덱스의 앞 키로 처리된다.
+        Index("ix_behavior_logs_task_event", task_id, event_at),
+    )
+
+
+class BehaviorSummary(Base):
+    """
+    사용자·이벤트 유형별 행동 집계 롤업 [PRO-B-24].
+    behavior_logs에 기록하는 트랜잭션 안에서 함께 증분 갱신하여, 사용자 요약을 전체 이력 집계 대신
+    (user_id, event_type) 기본키 범위 조회로 처리한다. 평균 latency = latency_sum / latency_count.
+    """
+
+    __tablename__ = "behavior_summaries"
+
+    user_id = Column(String(64), primary_key=True)
+    event_type = Column(String(32), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+    latency_sum = Column(Float, nullable=False, default=0.0)
+    latency_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=False, server_default=func.now())
+
 
 class ExperimentAssignment(Base):
     """
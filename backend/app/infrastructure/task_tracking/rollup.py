@@ -0,0 +1,172 @@
+"""
+사용자 행동 요약 롤업 [PRO-B-24].
+behavior_logs를 기록하는 트랜잭션 안에서 (user_id, event_type)별 건수·latency 합계를 함께 증분하여,
+/users/{id}/summary가 사용자 전체 이력의 GROUP BY·AVG 대신 behavior_summaries 기본키 범위 조회 1회로 끝나게 한다.
+
+- 증분: 로그 묶음을 (user_id, event_type)별로 합산한 뒤 INSERT ... ON CONFLICT DO UPDATE 1회.
+  키 순서로 정렬하여 동시 트랜잭션 간 행 잠금 순서를 고정한다.
+- 재구축: behavior_logs에서 다시 집계하여 덮어쓴다 (백필·불일치 보정). 실행 중 이벤트 쓰기는 대기한다.
+    python -m app.infrastructure.task_tracking.rollup rebuild [--user-id U ...]
+"""
+import argparse
+import logging
+from datetime import datetime, timezone
+from typing import Any, Iterable, Optional
+
+from sqlalchemy import delete, func, insert, select, text, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.core.database import dialect_insert
+from app.infrastructure.task_tracking.models import BehaviorLog, BehaviorSummary
+
+logger = logging.getLogger(__name__)
+
+# INSERT 문 1개당 최대 행 수 (바인드 파라미터 수 제한 대비)
+UPSERT_CHUNK_SIZE = 1000
+
+
+def rollup_rows(logs: Iterable[BehaviorLog]) -> list[dict[str, Any]]:
+    """로그를 (user_id, event_type)별 증분 행으로 합산한다. 키 순으로 정렬해 반환한다."""
+    now = datetime.now(timezone.utc)
+    rows: dict[tuple[str, str], dict[str, Any]] = {}
+    for log in logs:
+        row = rows.setdefault(
+            (log.user_id, log.event_type),
+            {
+                "user_id": log.user_id,
+                "event_type": log.event_type,
+                "count": 0,
+                "latency_sum": 0.0,
+                "latency_count": 0,
+                "updated_at": now,
+            },
+        )
+        row["count"] += 1
+        if log.latency_ms is not None:
+            row["latency_sum"] += log.latency_ms
+            row["latency_count"] += 1
+    return [rows[key] for key in sorted(rows)]
+
+
+def apply_rollup(session: Session, logs: Iterable[BehaviorLog]) -> None:
+    """로그 묶음만큼 롤업을 증분한다. 로그 INSERT와 같은 트랜잭션에서 호출한다 (커밋은 caller)."""
+    rows = rollup_rows(logs)
+    dialect_name = session.get_bind().dialect.name
+    for start in range(0, len(rows), UPSERT_CHUNK_SIZE):
+        chunk = rows[start:start + UPSERT_CHUNK_SIZE]
+        stmt = dialect_insert(dialect_name, BehaviorSummary)
+        if stmt is None:
+            _apply_without_upsert(session, chunk)
+            continue
+        stmt = stmt.values(chunk)
+        session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[BehaviorSummary.user_id, BehaviorSummary.event_type],
+                set_={
+                    "count": BehaviorSummary.count + stmt.excluded["count"],
+                    "latency_sum": BehaviorSummary.latency_sum + stmt.excluded["latency_sum"],
+                    "latency_count": BehaviorSummary.latency_count + stmt.excluded["latency_count"],
+                    "updated_at": stmt.excluded["updated_at"],
+                },
+            )
+        )
+
+
+def _apply_without_upsert(session: Session, rows: list[dict[str, Any]]) -> None:
+    """ON CONFLICT를 지원하지 않는 DB: 키별 UPDATE, 행이 없으면 INSERT."""
+    for row in rows:
+        result = session.execute(
+            update(BehaviorSummary)
+            .where(BehaviorSummary.user_id == row["user_id"], BehaviorSummary.event_type == row["event_type"])
+            .values(
+                count=BehaviorSummary.count + row["count"],
+                latency_sum=BehaviorSummary.latency_sum + row["latency_sum"],
+                latency_count=BehaviorSummary.latency_count + row["latency_count"],
+                updated_at=row["updated_at"],
+            )
+        )
+        if result.rowcount == 0:
+            session.execute(insert(BehaviorSummary).values(row))
+
+
+def summary_stmt(user_id: str):
+    return select(
+        BehaviorSummary.event_type,
+        BehaviorSummary.count,
+        BehaviorSummary.latency_sum,
+        BehaviorSummary.latency_count,
+    ).where(BehaviorSummary.user_id == user_id)
+
+
+def summarize(rows: Iterable[Any]) -> tuple[dict[str, int], int, Optional[float]]:
+    """summary_stmt 결과 → (이벤트 유형별 건수, 전체 건수, 평균 latency)."""
+    event_counts: dict[str, int] = {}
+    latency_sum = 0.0
+    latency_count = 0
+    for event_type, count, row_latency_sum, row_latency_count in rows:
+        event_counts[event_type] = count
+        latency_sum += row_latency_sum
+        latency_count += row_latency_count
+    avg_latency = round(latency_sum / latency_count, 3) if latency_count else None
+    return event_counts, sum(event_counts.values()), avg_latency
+
+
+def rebuild_rollup(conn: Connection, user_ids: Optional[list[str]] = None) -> int:
+    """
+    behavior_logs에서 롤업을 다시 집계한다 (user_ids가 없으면 전체). caller의 트랜잭션 안에서 실행된다.
+    집계와 교체 사이에 기록된 이벤트가 빠지거나 두 번 더해지지 않도록 먼저 쓰기를 막는다
+    (PostgreSQL: behavior_logs SHARE 잠금, SQLite: DELETE로 쓰기 잠금 획득).
+    Returns: 재구축된 롤업 행 수
+    """
+    if conn.dialect.name == "postgresql":
+        conn.execute(text("LOCK TABLE behavior_logs IN SHARE MODE"))
+
+    purge = delete(BehaviorSummary)
+    aggregate = select(
+        BehaviorLog.user_id,
+        BehaviorLog.event_type,
+        func.count(BehaviorLog.id),
+        func.coalesce(func.sum(BehaviorLog.latency_ms), 0.0),
+        func.count(BehaviorLog.latency_ms),
+        func.now(),
+    ).group_by(BehaviorLog.user_id, BehaviorLog.event_type)
+    if user_ids:
+        purge = purge.where(BehaviorSummary.user_id.in_(user_ids))
+        aggregate = aggregate.where(BehaviorLog.user_id.in_(user_ids))
+
+    conn.execute(purge)
+    conn.execute(
+        insert(BehaviorSummary).from_select(
+            ["user_id", "event_type", "count", "latency_sum", "latency_count", "updated_at"], aggregate
+        )
+    )
+    counted = select(func.count()).select_from(BehaviorSummary)
+    if user_ids:
+        counted = counted.where(BehaviorSummary.user_id.in_(user_ids))
+    rebuilt = conn.execute(counted).scalar() or 0
+    logger.info("[PRO-B-24] 행동 요약 롤업 재구축: %d행 (대상 사용자: %s)", rebuilt, user_ids or "전체")
+    return rebuilt
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="행동 요약 롤업(behavior_summaries) 재구축")
+    sub = parser.add_subparsers(dest="command", required=True)
+    rebuild_parser = sub.add_parser("rebuild", help="behavior_logs에서 롤업을 다시 집계")
+    rebuild_parser.add_argument("--user-id", action="append", default=None, help="대상 사용자 (반복 지정, 기본: 전체)")
+    args = parser.parse_args()
+
+    from app.config.env import load_env
+
+    load_env()
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(name)s — %(message)s")
+
+    from app.core.database import get_engine
+
+    with get_engine().begin() as conn:
+        rebuilt = rebuild_rollup(conn, args.user_id)
+    print(f"재구축 {rebuilt}행")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,25 +2,40 @@
 행동 트래킹 및 실험 분기 API 라우터 [PRO-B-24].
 이벤트 기록, 행동 체인 조회, 실험 할당, 그룹별 API 응답 분기 엔드포인트를 제공한다.
 """
+import asyncio
 from datetime import datetime, timezone
+from typing import Optional, Union
 
-from fastapi import APIRouter, Path
+from fastapi import APIRouter, HTTPException, Path, Query, Response
+from fastapi.concurrency import run_in_threadpool
 
-from app.core.database import get_session_factory
+from app.core.database import is_async_enabled, session_scope
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, InvalidCursorError
+from app.infrastructure.task_tracking.config import get_bulk_max_events
 from app.infrastructure.task_tracking.experiment import PersistentExperimentAssigner
 from app.infrastructure.task_tracking.schemas import (
+    BatchEventResult,
     BehaviorChainResponse,
     BehaviorLogResponse,
     BranchedResponse,
+    EventAcceptedResponse,
+    EventIngestStatsResponse,
     ExperimentInfoResponse,
+    RecordEventBatchRequest,
+    RecordEventBatchResponse,
     RecordEventRequest,
     UserBehaviorSummaryResponse,
 )
-from app.infrastructure.task_tracking.service import BehaviorTrackingServiceImpl
+from app.infrastructure.task_tracking.service import (
+    BehaviorTrackingAsyncServiceImpl,
+    BehaviorTrackingServiceImpl,
+)
+from app.infrastructure.task_tracking.writer import EventBufferFullError, event_writer
 
 router = APIRouter()
 
 _service: BehaviorTrackingServiceImpl | None = None
+_async_service: BehaviorTrackingAsyncServiceImpl | None = None
 
 
 def _get_service() -> BehaviorTrackingServiceImpl:
@@ -30,23 +45,88 @@ def _get_service() -> BehaviorTrackingServiceImpl:
     return _service
 
 
+def _get_async_service() -> BehaviorTrackingAsyncServiceImpl:
+    global _async_service
+    if _async_service is None:
+        _async_service = BehaviorTrackingAsyncServiceImpl()
+    return _async_service
+
+
 # ── 1. 행동 이벤트 기록 ──────────────────────────────────────
 
 @router.post(
     "/events",
-    response_model=BehaviorLogResponse,
+    response_model=Union[BehaviorLogResponse, EventAcceptedResponse],
     summary="[PRO-B-24] 행동 이벤트 기록 (experiment_id 자동 결합)",
+    responses={202: {"model": EventAcceptedResponse}, 503: {"description": "이벤트 버퍼 가득 참"}},
 )
-def record_event(body: RecordEventRequest) -> BehaviorLogResponse:
+async def record_event(body: RecordEventRequest, response: Response) -> BehaviorLogResponse | EventAcceptedResponse:
     """
     과업 이벤트를 기록한다. 직전 이벤트와의 latency(ms)를 자동 계산하고,
     사용자의 Experiment ID를 결합하여 저장한다.
+    TRACKING_INGEST_MODE=buffered 이면 배치 writer를 거치며, TRACKING_ACK_MODE=async 이면 큐에 넣은 즉시 202를 반환한다.
     """
-    service = _get_service()
-    log = service.record_event(body)
+    if event_writer.running:
+        try:
+            future = await run_in_threadpool(event_writer.submit, body)
+        except EventBufferFullError as e:
+            raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+        if future is None:
+            response.status_code = 202
+            return EventAcceptedResponse(
+                task_id=body.task_id,
+                user_id=body.user_id,
+                event_type=body.event_type.value,
+                queued=event_writer.snapshot()["queued"],
+                timestamp=datetime.now(timezone.utc),
+            )
+        log = await asyncio.wrap_future(future)
+    elif is_async_enabled():
+        log = await _get_async_service().record_event(body)
+    else:
+        log = await run_in_threadpool(_get_service().record_event, body)
     return BehaviorLogResponse.model_validate(log)
 
 
+@router.post(
+    "/events/batch",
+    response_model=RecordEventBatchResponse,
+    summary="[PRO-B-24] 행동 이벤트 일괄 기록",
+    responses={413: {"description": "이벤트 수가 TRACKING_BULK_MAX_EVENTS 초과"}},
+)
+async def record_events(body: RecordEventBatchRequest) -> RecordEventBatchResponse:
+    """
+    여러 이벤트를 한 트랜잭션으로 기록한다 (버퍼 writer를 거치지 않는다).
+    고유 사용자의 실험 할당은 한 번에 조회하고, 과업별 latency는 배치 안에서 발생 시각 순으로 계산하며,
+    다중 행 INSERT 1회로 저장한다. results는 요청 events 순서와 같다.
+    """
+    max_events = get_bulk_max_events()
+    if len(body.events) > max_events:
+        raise HTTPException(status_code=413, detail=f"한 번에 최대 {max_events}건까지 기록할 수 있습니다.")
+    if is_async_enabled():
+        logs = await _get_async_service().record_events(body.events)
+    else:
+        logs = await run_in_threadpool(_get_service().record_events, body.events)
+    return RecordEventBatchResponse(
+        recorded=len(logs),
+        results=[
+            BatchEventResult(**BehaviorLogResponse.model_validate(log).model_dump(), index=index)
+            for index, log in enumerate(logs)
+        ],
+        timestamp=datetime.now(timezone.utc),
+    )
+
+
+@router.get(
+    "/ingest/stats",
+    response_model=EventIngestStatsResponse,
+    summary="[PRO-B-24] 이벤트 버퍼 writer 상태 조회",
+)
+def get_ingest_stats() -> EventIngestStatsResponse:
+    """TRACKING_* 버퍼·배치 설정 튜닝을 위해 큐 적재량과 배치 저장 지표를 반환한다."""
+    return EventIngestStatsResponse(**event_writer.snapshot(), timestamp=datetime.now(timezone.utc))
+
+
 # ── 2. 행동 체인 조회 ────────────────────────────────────────
 
 @router.get(
@@ -54,25 +134,34 @@ def record_event(body: RecordEventRequest) -> BehaviorLogResponse:
     response_model=BehaviorChainResponse,
     summary="[PRO-B-24] task_id 기준 행동 체인 조회",
 )
-def get_behavior_chain(
+async def get_behavior_chain(
     task_id: int = Path(..., description="과업 ID"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
 ) -> BehaviorChainResponse:
-    """task_id를 기준으로 실패→보관→성공 과정의 이벤트 체인을 시간순으로 반환한다."""
-    service = _get_service()
-    logs = service.get_behavior_chain(task_id)
+    """
+    task_id를 기준으로 실패→보관→성공 과정의 이벤트 체인을 시간순으로 페이지 단위 반환한다.
+    total_events·total_latency_ms는 페이지가 아닌 체인 전체 기준이다.
+    """
+    try:
+        if is_async_enabled():
+            logs, next_cursor = await _get_async_service().get_behavior_chain(task_id, limit, cursor)
+            total_events, total_latency = await _get_async_service().get_chain_totals(task_id)
+        else:
+            logs, next_cursor = await run_in_threadpool(
+                _get_service().get_behavior_chain, task_id, limit, cursor
+            )
+            total_events, total_latency = await run_in_threadpool(_get_service().get_chain_totals, task_id)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     items = [BehaviorLogResponse.model_validate(log) for log in logs]
 
-    total_latency = None
-    if len(logs) >= 2:
-        first_at = logs[0].event_at
-        last_at = logs[-1].event_at
-        total_latency = round((last_at - first_at).total_seconds() * 1000, 3)
-
     return BehaviorChainResponse(
         task_id=task_id,
-        total_events=len(items),
+        total_events=total_events,
         chain=items,
         total_latency_ms=total_latency,
+        next_cursor=next_cursor,
         timestamp=datetime.now(timezone.utc),
     )
 
@@ -88,10 +177,8 @@ def get_experiment_assignment(
     user_id: str = Path(..., description="사용자 식별자"),
 ) -> ExperimentInfoResponse:
     """사용자의 실험군 할당 정보를 반환한다. 미할당 시 해시 기반으로 신규 할당한다."""
-    session_factory = get_session_factory()
-    with session_factory() as session:
+    with session_scope() as session:
         result = PersistentExperimentAssigner.get_or_assign(session, user_id)
-        session.commit()
     return ExperimentInfoResponse(
         user_id=result.user_id,
         experiment_id=result.experiment_id,
@@ -116,10 +203,8 @@ def get_branched_response(
     실험군(treatment)과 대조군(control)에 서로 다른 응답 payload를 반환한다.
     Feature Flag에 따른 Response Branching 처리의 참조 구현.
     """
-    session_factory = get_session_factory()
-    with session_factory() as session:
+    with session_scope() as session:
         result = PersistentExperimentAssigner.get_or_assign(session, user_id)
-        session.commit()
 
     # [PRO-B-24] 그룹별 응답 분기
     if result.group == "treatment":
@@ -156,12 +241,14 @@ def get_branched_response(
     response_model=UserBehaviorSummaryResponse,
     summary="[PRO-B-24] 사용자 행동 요약 통계",
 )
-def get_user_summary(
+async def get_user_summary(
     user_id: str = Path(..., description="사용자 식별자"),
 ) -> UserBehaviorSummaryResponse:
     """사용자별 이벤트 유형 카운트, 평균 latency, 실험 정보를 요약 반환한다."""
-    service = _get_service()
-    summary = service.get_user_summary(user_id)
+    if is_async_enabled():
+        summary = await _get_async_service().get_user_summary(user_id)
+    else:
+        summary = await run_in_threadpool(_get_service().get_user_summary, user_id)
     return UserBehaviorSummaryResponse(
         user_id=user_id,
         experiment_id=summary["experiment_id"],
@@ -29,6 +29,20 @@ class RecordEventRequest(BaseModel):
     metadata: Optional[dict[str, Any]] = Field(None, description="추가 메타데이터 (JSON)")
 
 
+class BatchEventItem(RecordEventRequest):
+    """일괄 기록 요청의 이벤트 1건 [PRO-B-24]."""
+
+    event_at: Optional[datetime] = Field(
+        None, description="이벤트 발생 시각 (클라이언트 버퍼링 시). 없으면 수신 시각, 미래 시각은 수신 시각으로 보정"
+    )
+
+
+class RecordEventBatchRequest(BaseModel):
+    """행동 이벤트 일괄 기록 요청 [PRO-B-24]."""
+
+    events: list[BatchEventItem] = Field(..., min_length=1, description="기록할 이벤트 목록 (최대 TRACKING_BULK_MAX_EVENTS건)")
+
+
 # -- Responses --
 
 class BehaviorLogResponse(BaseModel):
@@ -48,13 +62,58 @@ class BehaviorLogResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class BatchEventResult(BehaviorLogResponse):
+    """일괄 기록 결과 1건. index는 요청 events 내 위치 [PRO-B-24]."""
+
+    index: int
+
+
+class RecordEventBatchResponse(BaseModel):
+    """행동 이벤트 일괄 기록 응답. results는 요청 순서와 같다 [PRO-B-24]."""
+
+    recorded: int
+    results: list[BatchEventResult] = Field(default_factory=list)
+    timestamp: datetime
+
+
+class EventAcceptedResponse(BaseModel):
+    """버퍼 적재 모드(TRACKING_ACK_MODE=async)에서 큐에 넣은 직후의 응답 [PRO-B-24]."""
+
+    accepted: bool = True
+    task_id: int
+    user_id: str
+    event_type: str
+    queued: int = Field(..., description="현재 저장 대기 중인 이벤트 수")
+    timestamp: datetime
+
+
+class EventIngestStatsResponse(BaseModel):
+    """이벤트 버퍼 writer 상태 [PRO-B-24]."""
+
+    mode: str = Field(..., description="direct | buffered")
+    ack_mode: str = Field(..., description="sync | async")
+    running: bool
+    queued: int = Field(..., description="저장 대기 중인 이벤트 수")
+    capacity: int = Field(..., description="큐 최대 크기")
+    enqueued_total: int
+    written_total: int
+    failed_total: int = Field(..., description="배치 저장 실패로 기록되지 못한 이벤트 수")
+    rejected_total: int = Field(..., description="큐가 가득 차 거절한 요청 수")
+    batches_total: int
+    last_batch_size: int
+    last_flush_ms: Optional[float] = None
+    max_flush_ms: float
+    timestamp: datetime
+
+
 class BehaviorChainResponse(BaseModel):
     """task_id 기준 행동 체인 응답 [PRO-B-24]."""
 
     task_id: int
-    total_events: int
+    total_events: int = Field(..., description="체인 전체 이벤트 수 (페이지 크기와 무관)")
     chain: list[BehaviorLogResponse] = Field(default_factory=list)
-    total_latency_ms: Optional[float] = Field(None, description="첫 이벤트~마지막 이벤트 총 경과 시간(ms)")
+    total_latency_ms: Optional[float] = Field(None, description="체인 전체 첫 이벤트~마지막 이벤트 총 경과 시간(ms)")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 null)")
     timestamp: datetime
 
 
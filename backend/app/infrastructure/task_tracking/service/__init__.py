@@ -1,4 +1,5 @@
 """행동 트래킹 서비스 패키지 [PRO-B-24]."""
+from app.infrastructure.task_tracking.service.async_impl import BehaviorTrackingAsyncServiceImpl
 from app.infrastructure.task_tracking.service.impl import BehaviorTrackingServiceImpl
 
-__all__ = ["BehaviorTrackingServiceImpl"]
+__all__ = ["BehaviorTrackingAsyncServiceImpl", "BehaviorTrackingServiceImpl"]
@@ -0,0 +1,137 @@
+"""
+행동 트래킹 비동기 서비스 구현체 [PRO-B-24].
+BehaviorTrackingServiceImpl과 동일한 규칙(latency_ms 계산, experiment_id 결합)을
+AsyncSession 위에서 수행한다. DATABASE_ASYNC_ENABLED=true 일 때 라우터에서 선택된다.
+"""
+import json
+import logging
+import time
+from datetime import datetime, timezone
+
+from sqlalchemy import select
+
+from app.core.database import get_async_session_factory
+from app.core.pagination import after_cursor, decode_cursor, order_by, split_page
+from app.infrastructure.task_tracking.batch import resolve_event_at, write_behavior_logs
+from app.infrastructure.task_tracking.chain import chain_totals, chain_totals_stmt
+from app.infrastructure.task_tracking.experiment import PersistentExperimentAssigner
+from app.infrastructure.task_tracking.last_event import aget_previous_event_at, aremember_last_events, latency_ms
+from app.infrastructure.task_tracking.models import BehaviorLog
+from app.infrastructure.task_tracking.rollup import apply_rollup, summarize, summary_stmt
+from app.infrastructure.task_tracking.schemas import BatchEventItem, RecordEventRequest
+
+logger = logging.getLogger(__name__)
+
+
+class BehaviorTrackingAsyncServiceImpl:
+    """행동 체인 트래킹 + 실험 결합 비동기 구현체 [PRO-B-24]."""
+
+    async def record_event(self, request: RecordEventRequest) -> BehaviorLog:
+        """
+        이벤트를 기록한다.
+        - 동일 task_id의 직전 이벤트 시각으로 latency_ms를 계산한다 (마지막 이벤트 캐시, 커밋 후 갱신).
+          캐시의 마지막 시각이 수신 시각보다 늦으면 DB에서 수신 시각 이하의 마지막 이벤트를 쓴다.
+        - 사용자 실험 할당 정보를 자동으로 결합한다.
+        """
+        start_ns = time.perf_counter_ns()
+        now = datetime.now(timezone.utc)
+
+        async with get_async_session_factory()() as session:
+            assignment = await PersistentExperimentAssigner.get_or_assign_async(session, request.user_id)
+
+            previous_event_at = await aget_previous_event_at(session, request.task_id, now)
+            latency = latency_ms(previous_event_at, now)
+
+            metadata_str = json.dumps(request.metadata, ensure_ascii=False) if request.metadata else None
+
+            log_entry = BehaviorLog(
+                task_id=request.task_id,
+                user_id=request.user_id,
+                event_type=request.event_type.value,
+                experiment_id=assignment.experiment_id,
+                experiment_group=assignment.group,
+                event_at=now,
+                previous_event_at=previous_event_at,
+                latency_ms=latency,
+                metadata_json=metadata_str,
+            )
+            session.add(log_entry)
+            await session.run_sync(apply_rollup, [log_entry])
+            await session.commit()
+        await aremember_last_events([log_entry])
+
+        elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+        logger.info(
+            "[%s][PRO-B-24] 이벤트 기록 task=%d user=%s event=%s "
+            "experiment=%s group=%s latency=%.3fms (처리: %.3fms, async)",
+            now.isoformat(timespec="milliseconds"),
+            request.task_id,
+            request.user_id,
+            request.event_type.value,
+            assignment.experiment_id,
+            assignment.group,
+            latency or 0,
+            elapsed_ms,
+        )
+        return log_entry
+
+    async def record_events(self, items: list[BatchEventItem]) -> list[BehaviorLog]:
+        """
+        여러 이벤트를 한 트랜잭션으로 기록한다. 반환 순서는 입력 순서와 같다.
+        조회·INSERT 구성은 동기 구현과 같은 write_behavior_logs를 run_sync로 실행한다.
+        """
+        start_ns = time.perf_counter_ns()
+        now = datetime.now(timezone.utc)
+        events = [(item, resolve_event_at(item.event_at, now)) for item in items]
+
+        async with get_async_session_factory()() as session:
+            logs = await session.run_sync(write_behavior_logs, events)
+            await session.commit()
+        await aremember_last_events(logs)
+
+        elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+        logger.info(
+            "[%s][PRO-B-24] 이벤트 일괄 기록 %d건 (과업 %d, 사용자 %d, 처리: %.3fms, async)",
+            now.isoformat(timespec="milliseconds"),
+            len(logs),
+            len({item.task_id for item in items}),
+            len({item.user_id for item in items}),
+            elapsed_ms,
+        )
+        return logs
+
+    async def get_behavior_chain(
+        self, task_id: int, limit: int, cursor: str | None = None,
+    ) -> tuple[list[BehaviorLog], str | None]:
+        """task_id 기준으로 (event_at, id) 시간순 keyset 페이지와 다음 커서를 반환한다."""
+        key = (BehaviorLog.event_at, BehaviorLog.id)
+        stmt = select(BehaviorLog).where(BehaviorLog.task_id == task_id)
+        if cursor:
+            stmt = stmt.where(after_cursor(key, decode_cursor(cursor, len(key))))
+        async with get_async_session_factory()() as session:
+            logs = await session.scalars(stmt.order_by(*order_by(key)).limit(limit + 1))
+            return split_page(list(logs), limit, lambda log: (log.event_at, log.id))
+
+    async def get_chain_totals(self, task_id: int) -> tuple[int, float | None]:
+        """task_id 체인 전체의 이벤트 수와 첫 이벤트~마지막 이벤트 경과 시간(ms)."""
+        async with get_async_session_factory()() as session:
+            return chain_totals((await session.execute(chain_totals_stmt(task_id))).one())
+
+    async def get_user_summary(self, user_id: str) -> dict:
+        """사용자별 이벤트 유형 카운트, 평균 latency, 실험 정보 요약. behavior_summaries 롤업에서 읽는다."""
+        async with get_async_session_factory()() as session:
+            assignment = await PersistentExperimentAssigner.get_or_assign_async(session, user_id)
+
+            event_counts, total, avg_latency = summarize(await session.execute(summary_stmt(user_id)))
+
+            # 조회 전용 트랜잭션은 커밋하지 않고 닫으면서 롤백한다. 신규 할당을 저장한 경우에만 커밋한다.
+            if assignment.newly_assigned:
+                await session.commit()
+
+        return {
+            "experiment_id": assignment.experiment_id,
+            "experiment_group": assignment.group,
+            "total_events": total,
+            "event_type_counts": event_counts,
+            "avg_latency_ms": avg_latency,
+        }
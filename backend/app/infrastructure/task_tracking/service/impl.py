@@ -3,18 +3,22 @@
 모든 과업 이벤트를 BehaviorLog에 기록하며, 이때:
 1. 직전 이벤트와의 시간 간격(latency_ms)을 자동 계산한다.
 2. 사용자의 실험 할당 정보(experiment_id, group)를 자동 결합한다.
+3. 사용자 요약 롤업(behavior_summaries)을 같은 트랜잭션에서 증분한다.
 """
 import json
 import logging
 import time
 from datetime import datetime, timezone
 
-from sqlalchemy import func as sqlfunc
-
-from app.core.database import get_session_factory
+from app.core.database import session_scope
+from app.core.pagination import after_cursor, decode_cursor, order_by, split_page
+from app.infrastructure.task_tracking.batch import resolve_event_at, write_behavior_logs
+from app.infrastructure.task_tracking.chain import chain_totals, chain_totals_stmt
 from app.infrastructure.task_tracking.experiment import PersistentExperimentAssigner
+from app.infrastructure.task_tracking.last_event import get_previous_event_at, latency_ms, remember_last_events
 from app.infrastructure.task_tracking.models import BehaviorLog
-from app.infrastructure.task_tracking.schemas import RecordEventRequest
+from app.infrastructure.task_tracking.rollup import apply_rollup, summarize, summary_stmt
+from app.infrastructure.task_tracking.schemas import BatchEventItem, RecordEventRequest
 
 logger = logging.getLogger(__name__)
 
@@ -25,30 +29,20 @@ class BehaviorTrackingServiceImpl:
     def record_event(self, request: RecordEventRequest) -> BehaviorLog:
         """
         이벤트를 기록한다.
-        - 동일 task_id의 직전 이벤트를 조회하여 latency_ms를 계산한다.
+        - 동일 task_id의 직전 이벤트 시각으로 latency_ms를 계산한다 (마지막 이벤트 캐시, 커밋 후 갱신).
+          캐시의 마지막 시각이 수신 시각보다 늦으면 DB에서 수신 시각 이하의 마지막 이벤트를 쓴다.
         - 사용자 실험 할당 정보를 자동으로 결합한다.
         """
         start_ns = time.perf_counter_ns()
         now = datetime.now(timezone.utc)
-        session_factory = get_session_factory()
 
-        with session_factory() as session:
+        with session_scope() as session:
             # [PRO-B-24] 실험군 할당 조회/생성 (모든 로그에 experiment_id 결합)
             assignment = PersistentExperimentAssigner.get_or_assign(session, request.user_id)
 
-            # [PRO-B-24] 직전 이벤트 조회 → latency 계산
-            prev_log = (
-                session.query(BehaviorLog)
-                .filter(BehaviorLog.task_id == request.task_id)
-                .order_by(BehaviorLog.event_at.desc())
-                .first()
-            )
-
-            previous_event_at = prev_log.event_at if prev_log else None
-            latency_ms = None
-            if previous_event_at is not None:
-                delta = now - previous_event_at
-                latency_ms = round(delta.total_seconds() * 1000, 3)
+            # [PRO-B-24] 직전 이벤트 시각(과업별 마지막 이벤트 캐시, 미스 시 DB) → latency 계산
+            previous_event_at = get_previous_event_at(session, request.task_id, now)
+            latency = latency_ms(previous_event_at, now)
 
             metadata_str = json.dumps(request.metadata, ensure_ascii=False) if request.metadata else None
 
@@ -60,12 +54,13 @@ class BehaviorTrackingServiceImpl:
                 experiment_group=assignment.group,
                 event_at=now,
                 previous_event_at=previous_event_at,
-                latency_ms=latency_ms,
+                latency_ms=latency,
                 metadata_json=metadata_str,
             )
             session.add(log_entry)
-            session.commit()
-            session.refresh(log_entry)
+            session.flush()
+            # [PRO-B-24] 사용자 요약 롤업 증분 (같은 트랜잭션)
+            apply_rollup(session, [log_entry])
 
             elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
             logger.info(
@@ -77,53 +72,61 @@ class BehaviorTrackingServiceImpl:
                 request.event_type.value,
                 assignment.experiment_id,
                 assignment.group,
-                latency_ms or 0,
+                latency or 0,
                 elapsed_ms,
             )
 
-            session.expunge(log_entry)
-
+        remember_last_events([log_entry])
         return log_entry
 
-    def get_behavior_chain(self, task_id: int) -> list[BehaviorLog]:
-        """task_id 기준으로 시간순 행동 체인을 반환한다."""
-        session_factory = get_session_factory()
-        with session_factory() as session:
-            logs = (
-                session.query(BehaviorLog)
-                .filter(BehaviorLog.task_id == task_id)
-                .order_by(BehaviorLog.event_at.asc())
-                .all()
-            )
-            session.expunge_all()
+    def record_events(self, items: list[BatchEventItem]) -> list[BehaviorLog]:
+        """
+        여러 이벤트를 한 트랜잭션으로 기록한다. 반환 순서는 입력 순서와 같다.
+        - 실험 할당: 고유 사용자에 대해 조회 1회, 직전 이벤트: 캐시 미스 과업만 GROUP BY 1회
+        - 같은 과업의 이벤트는 발생 시각 순으로 정렬하여 메모리에서 latency를 계산한다.
+        - 저장: 다중 행 INSERT 1회 (INSERT_CHUNK_SIZE 단위)
+        """
+        start_ns = time.perf_counter_ns()
+        now = datetime.now(timezone.utc)
+        events = [(item, resolve_event_at(item.event_at, now)) for item in items]
+
+        with session_scope() as session:
+            logs = write_behavior_logs(session, events)
+        remember_last_events(logs)
+
+        elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+        logger.info(
+            "[%s][PRO-B-24] 이벤트 일괄 기록 %d건 (과업 %d, 사용자 %d, 처리: %.3fms)",
+            now.isoformat(timespec="milliseconds"),
+            len(logs),
+            len({item.task_id for item in items}),
+            len({item.user_id for item in items}),
+            elapsed_ms,
+        )
         return logs
 
+    def get_behavior_chain(
+        self, task_id: int, limit: int, cursor: str | None = None,
+    ) -> tuple[list[BehaviorLog], str | None]:
+        """task_id 기준으로 (event_at, id) 시간순 keyset 페이지와 다음 커서를 반환한다."""
+        key = (BehaviorLog.event_at, BehaviorLog.id)
+        with session_scope() as session:
+            query = session.query(BehaviorLog).filter(BehaviorLog.task_id == task_id)
+            if cursor:
+                query = query.filter(after_cursor(key, decode_cursor(cursor, len(key))))
+            logs = query.order_by(*order_by(key)).limit(limit + 1).all()
+        return split_page(logs, limit, lambda log: (log.event_at, log.id))
+
+    def get_chain_totals(self, task_id: int) -> tuple[int, float | None]:
+        """task_id 체인 전체의 이벤트 수와 첫 이벤트~마지막 이벤트 경과 시간(ms)."""
+        with session_scope() as session:
+            return chain_totals(session.execute(chain_totals_stmt(task_id)).one())
+
     def get_user_summary(self, user_id: str) -> dict:
-        """사용자별 이벤트 유형 카운트, 평균 latency, 실험 정보 요약."""
-        session_factory = get_session_factory()
-        with session_factory() as session:
+        """사용자별 이벤트 유형 카운트, 평균 latency, 실험 정보 요약. behavior_summaries 롤업에서 읽는다."""
+        with session_scope() as session:
             assignment = PersistentExperimentAssigner.get_or_assign(session, user_id)
-
-            rows = (
-                session.query(
-                    BehaviorLog.event_type,
-                    sqlfunc.count(BehaviorLog.id),
-                )
-                .filter(BehaviorLog.user_id == user_id)
-                .group_by(BehaviorLog.event_type)
-                .all()
-            )
-            event_counts = {row[0]: row[1] for row in rows}
-            total = sum(event_counts.values())
-
-            avg_row = (
-                session.query(sqlfunc.avg(BehaviorLog.latency_ms))
-                .filter(BehaviorLog.user_id == user_id, BehaviorLog.latency_ms.isnot(None))
-                .scalar()
-            )
-            avg_latency = round(float(avg_row), 3) if avg_row is not None else None
-
-            session.commit()
+            event_counts, total, avg_latency = summarize(session.execute(summary_stmt(user_id)))
 
         return {
             "experiment_id": assignment.experiment_id,
@@ -5,7 +5,7 @@
 from typing import Protocol
 
 from app.infrastructure.task_tracking.models import BehaviorLog
-from app.infrastructure.task_tracking.schemas import RecordEventRequest
+from app.infrastructure.task_tracking.schemas import BatchEventItem, RecordEventRequest
 
 
 class BehaviorTrackingService(Protocol):
@@ -15,10 +15,46 @@ class BehaviorTrackingService(Protocol):
         """이벤트를 기록하고 experiment_id를 자동 결합한다."""
         ...
 
-    def get_behavior_chain(self, task_id: int) -> list[BehaviorLog]:
-        """task_id 기준 행동 체인을 시간순으로 반환한다."""
+    def record_events(self, items: list[BatchEventItem]) -> list[BehaviorLog]:
+        """여러 이벤트를 한 트랜잭션으로 기록한다. 입력 순서대로 반환한다."""
+        ...
+
+    def get_behavior_chain(
+        self, task_id: int, limit: int, cursor: str | None = None,
+    ) -> tuple[list[BehaviorLog], str | None]:
+        """task_id 기준 행동 체인 한 페이지(시간순)와 다음 커서를 반환한다."""
+        ...
+
+    def get_chain_totals(self, task_id: int) -> tuple[int, float | None]:
+        """task_id 체인 전체의 이벤트 수와 총 경과 시간(ms)을 반환한다."""
         ...
 
     def get_user_summary(self, user_id: str) -> dict:
         """사용자별 행동 요약 통계를 반환한다."""
         ...
+
+
+class AsyncBehaviorTrackingService(Protocol):
+    """BehaviorTrackingService의 비동기 버전 [PRO-B-24]."""
+
+    async def record_event(self, request: RecordEventRequest) -> BehaviorLog:
+        """이벤트를 기록하고 experiment_id를 자동 결합한다."""
+        ...
+
+    async def record_events(self, items: list[BatchEventItem]) -> list[BehaviorLog]:
+        """여러 이벤트를 한 트랜잭션으로 기록한다. 입력 순서대로 반환한다."""
+        ...
+
+    async def get_behavior_chain(
+        self, task_id: int, limit: int, cursor: str | None = None,
+    ) -> tuple[list[BehaviorLog], str | None]:
+        """task_id 기준 행동 체인 한 페이지(시간순)와 다음 커서를 반환한다."""
+        ...
+
+    async def get_chain_totals(self, task_id: int) -> tuple[int, float | None]:
+        """task_id 체인 전체의 이벤트 수와 총 경과 시간(ms)을 반환한다."""
+        ...
+
+    async def get_user_summary(self, user_id: str) -> dict:
+        """사용자별 행동 요약 통계를 반환한다."""
+        ...
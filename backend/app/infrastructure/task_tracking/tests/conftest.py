@@ -0,0 +1,11 @@
+"""task_tracking 테스트 공통 픽스처."""
+
+import pytest
+
+
+@pytest.fixture(params=["sync", "async"])
+def tracking_client(request, monkeypatch, client):
+    """같은 테스트를 동기 서비스와 비동기 서비스(DATABASE_ASYNC_ENABLED=true) 양쪽으로 실행한다."""
+    if request.param == "async":
+        monkeypatch.setenv("DATABASE_ASYNC_ENABLED", "true")
+    return client
@@ -0,0 +1,80 @@
+"""GET /task-tracking/tasks/{task_id}/chain 단위 테스트 — 커서 페이지와 체인 전체 통계 [PRO-B-24]."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+
+def _write_chain(client, task_id: int, n: int) -> list[dict]:
+    """같은 event_at이 섞인 n건의 체인을 기록한다 (정렬 키 (event_at, id)의 동률 경계 확인용)."""
+    base = datetime.now(timezone.utc) - timedelta(hours=1)
+    events = [
+        {
+            "task_id": task_id,
+            "user_id": "u1",
+            "event_type": "keep",
+            "event_at": (base + timedelta(seconds=i // 3)).isoformat(),
+        }
+        for i in range(n)
+    ]
+    response = client.post("/task-tracking/events/batch", json={"events": events})
+    assert response.status_code == 200
+    return response.json()["results"]
+
+
+def _read_all_pages(client, task_id: int, limit: int) -> list[dict]:
+    pages, cursor = [], None
+    while True:
+        params = {"limit": limit, **({"cursor": cursor} if cursor else {})}
+        body = client.get(f"/task-tracking/tasks/{task_id}/chain", params=params).json()
+        pages.append(body)
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+def test_pages_cover_chain_once_in_order(tracking_client):
+    written = _write_chain(tracking_client, 3, 11)
+
+    pages = _read_all_pages(tracking_client, 3, limit=4)
+
+    assert [len(page["chain"]) for page in pages] == [4, 4, 3]
+    ids = [item["id"] for page in pages for item in page["chain"]]
+    assert sorted(ids) == sorted(r["id"] for r in written)
+    keys = [(item["event_at"], item["id"]) for page in pages for item in page["chain"]]
+    assert keys == sorted(keys)
+
+
+def test_exact_multiple_of_limit_has_no_empty_last_page(tracking_client):
+    _write_chain(tracking_client, 4, 6)
+
+    pages = _read_all_pages(tracking_client, 4, limit=3)
+
+    assert [len(page["chain"]) for page in pages] == [3, 3]
+
+
+def test_totals_describe_whole_chain_on_every_page(tracking_client):
+    written = _write_chain(tracking_client, 5, 9)
+    times = sorted(datetime.fromisoformat(r["event_at"]) for r in written)
+    expected_latency = round((times[-1] - times[0]).total_seconds() * 1000, 3)
+
+    pages = _read_all_pages(tracking_client, 5, limit=2)
+
+    for page in pages:
+        assert page["total_events"] == 9
+        assert page["total_latency_ms"] == pytest.approx(expected_latency, abs=1e-3)
+
+
+def test_empty_and_single_event_chain(tracking_client):
+    empty = tracking_client.get("/task-tracking/tasks/404/chain").json()
+    assert (empty["total_events"], empty["total_latency_ms"], empty["chain"]) == (0, None, [])
+
+    _write_chain(tracking_client, 6, 1)
+    single = tracking_client.get("/task-tracking/tasks/6/chain").json()
+    assert (single["total_events"], single["total_latency_ms"]) == (1, None)
+
+
+def test_invalid_cursor_is_400(tracking_client):
+    response = tracking_client.get("/task-tracking/tasks/1/chain", params={"cursor": "garbage!"})
+
+    assert response.status_code == 400
@@ -0,0 +1,126 @@
+"""POST /task-tracking/events/batch 단위 테스트 — 입력 순서, 크기 제한, 소급·역순 이벤트의 직전 이벤트 [PRO-B-24]."""
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select
+
+from app.core.database import session_scope
+from app.infrastructure.task_tracking.last_event import as_utc, last_event_cache
+from app.infrastructure.task_tracking.models import BehaviorLog
+
+
+def _at(value: str) -> datetime:
+    return as_utc(datetime.fromisoformat(value))
+
+
+def _post_event(client, task_id: int, user_id: str = "u1", event_type: str = "task_miss") -> dict:
+    response = client.post(
+        "/task-tracking/events", json={"task_id": task_id, "user_id": user_id, "event_type": event_type}
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+def _post_batch(client, events: list[dict]) -> list[dict]:
+    response = client.post("/task-tracking/events/batch", json={"events": events})
+    assert response.status_code == 200
+    return response.json()["results"]
+
+
+def assert_chain_is_monotonic() -> None:
+    """저장된 모든 로그의 직전 이벤트가 event_at 이하이고 latency_ms가 0 이상이다."""
+    with session_scope() as session:
+        rows = session.execute(
+            select(BehaviorLog.event_at, BehaviorLog.previous_event_at, BehaviorLog.latency_ms)
+        ).all()
+    for event_at, previous_event_at, latency in rows:
+        if previous_event_at is None:
+            assert latency is None
+            continue
+        assert previous_event_at <= event_at
+        assert latency >= 0
+
+
+def test_batch_results_keep_request_order(tracking_client):
+    """결과는 요청 순서(index)대로 반환되고, 같은 과업은 event_at 순으로 이어진다."""
+    events = [{"task_id": i % 3 + 1, "user_id": f"u{i % 4}", "event_type": "keep"} for i in range(12)]
+    results = _post_batch(tracking_client, events)
+
+    assert [r["index"] for r in results] == list(range(12))
+    assert [r["task_id"] for r in results] == [e["task_id"] for e in events]
+    for task_id in (1, 2, 3):
+        chain = sorted((r for r in results if r["task_id"] == task_id), key=lambda r: r["event_at"])
+        assert chain[0]["previous_event_at"] is None
+        for before, after in zip(chain, chain[1:]):
+            assert after["previous_event_at"] == before["event_at"]
+
+
+def test_batch_over_limit_is_rejected(client, monkeypatch):
+    monkeypatch.setenv("TRACKING_BULK_MAX_EVENTS", "3")
+    events = [{"task_id": 1, "user_id": "u1", "event_type": "keep"}] * 4
+
+    response = client.post("/task-tracking/events/batch", json={"events": events})
+
+    assert response.status_code == 413
+    assert _post_batch(client, events[:3])
+
+
+def test_backdated_events_chain_onto_stored_predecessor(tracking_client):
+    """저장된 마지막 이벤트보다 이른 event_at은 그 시각 이하의 저장된 이벤트에 이어진다."""
+    first = _post_event(tracking_client, 1)
+    second = _post_event(tracking_client, 1)
+    first_at, second_at = _at(first["event_at"]), _at(second["event_at"])
+    between = first_at + (second_at - first_at) / 2
+    long_ago = first_at - timedelta(hours=1)
+
+    results = _post_batch(
+        tracking_client,
+        [
+            {"task_id": 1, "user_id": "u1", "event_type": "keep"},
+            {"task_id": 1, "user_id": "u1", "event_type": "modify", "event_at": between.isoformat()},
+            {"task_id": 1, "user_id": "u1", "event_type": "archive", "event_at": long_ago.isoformat()},
+        ],
+    )
+    now_item, between_item, long_ago_item = results
+
+    assert long_ago_item["previous_event_at"] is None
+    assert long_ago_item["latency_ms"] is None
+    assert _at(between_item["previous_event_at"]) == first_at
+    assert between_item["latency_ms"] >= 0
+    assert _at(now_item["previous_event_at"]) == second_at
+    assert 0 <= now_item["latency_ms"] < 60_000
+    assert_chain_is_monotonic()
+
+    # 소급 이벤트가 마지막 이벤트 캐시를 과거로 되돌리지 않는다
+    after = _post_event(tracking_client, 1)
+    assert after["previous_event_at"] == now_item["event_at"]
+
+
+def test_out_of_order_batch_never_yields_negative_latency(tracking_client):
+    base = datetime.now(timezone.utc) - timedelta(minutes=30)
+    _post_event(tracking_client, 7)
+    offsets = [25, 3, 17, 0, 29, 11]
+    events = [
+        {"task_id": 7, "user_id": "u2", "event_type": "keep", "event_at": (base + timedelta(minutes=m)).isoformat()}
+        for m in offsets
+    ]
+
+    results = _post_batch(tracking_client, events)
+    results += _post_batch(tracking_client, events[::-1])
+
+    for result in results:
+        assert result["latency_ms"] is None or result["latency_ms"] >= 0
+        if result["previous_event_at"] is not None:
+            assert _at(result["previous_event_at"]) <= _at(result["event_at"])
+    assert_chain_is_monotonic()
+
+
+def test_single_event_ignores_cached_time_later_than_now(tracking_client):
+    """다른 경로가 더 늦은 시각을 먼저 커밋했더라도 단건 이벤트는 수신 시각 이하의 직전 이벤트를 쓴다."""
+    first = _post_event(tracking_client, 9)
+    last_event_cache.set(9, datetime.now(timezone.utc) + timedelta(seconds=30))
+
+    second = _post_event(tracking_client, 9)
+
+    assert second["previous_event_at"] == first["event_at"]
+    assert second["latency_ms"] >= 0
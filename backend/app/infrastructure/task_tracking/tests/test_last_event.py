@@ -0,0 +1,79 @@
+"""과업별 마지막 이벤트 시각 캐시 단위 테스트 — 소급 이벤트·동시 쓰기가 캐시를 과거로 되돌리지 않는다 [PRO-B-24]."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.core.cache import UTC_DATETIME
+from app.infrastructure.task_tracking.last_event import as_utc, last_event_cache, remember_last_events
+from app.infrastructure.task_tracking.models import BehaviorLog
+
+
+def _at(value: str) -> datetime:
+    return as_utc(datetime.fromisoformat(value))
+
+
+def _post_event(client, task_id: int) -> dict:
+    response = client.post("/task-tracking/events", json={"task_id": task_id, "user_id": "u1", "event_type": "keep"})
+    assert response.status_code == 200
+    return response.json()
+
+
+def _assert_backdated_batch_keeps_live_chain(client) -> None:
+    first = _post_event(client, 7)
+    response = client.post(
+        "/task-tracking/events/batch",
+        json={"events": [{"task_id": 7, "user_id": "u1", "event_type": "keep", "event_at": "2020-01-01T00:00:00Z"}]},
+    )
+    assert response.status_code == 200
+    assert response.json()["results"][0]["previous_event_at"] is None
+
+    live = _post_event(client, 7)
+
+    assert _at(live["previous_event_at"]) == _at(first["event_at"])
+    assert 0 <= live["latency_ms"] < 60_000
+
+
+def test_backdated_batch_then_live_event(tracking_client):
+    _assert_backdated_batch_keeps_live_chain(tracking_client)
+
+
+def test_backdated_batch_then_live_event_with_redis(tracking_client, fake_redis):
+    _assert_backdated_batch_keeps_live_chain(tracking_client)
+    assert fake_redis.exists(last_event_cache.key(7)) == 1
+
+
+def _remember(task_id: int, event_at: datetime) -> None:
+    remember_last_events([BehaviorLog(task_id=task_id, event_at=event_at)])
+
+
+@pytest.mark.parametrize("redis", [False, True])
+def test_older_write_does_not_rewind_cache(request, redis):
+    """늦게 커밋한 요청이 더 이른 시각을 쓰더라도 캐시는 더 늦은 시각을 유지한다."""
+    if redis:
+        request.getfixturevalue("fake_redis")
+    newer = datetime(2026, 10, 18, 9, 0, 0, tzinfo=timezone.utc)
+
+    _remember(1, newer)
+    _remember(1, newer - timedelta(microseconds=1))
+    _remember(1, datetime(2020, 1, 1))
+
+    assert last_event_cache.get(1) == newer
+    assert last_event_cache.get(1, use_local=False) == (newer if redis else None)
+
+    _remember(1, newer + timedelta(seconds=1))
+    assert last_event_cache.get(1, use_local=False) == (newer + timedelta(seconds=1) if redis else None)
+    assert last_event_cache.get(1) == newer + timedelta(seconds=1)
+
+
+def test_utc_serializer_orders_like_datetimes():
+    kst = timezone(timedelta(hours=9))
+    values = [
+        datetime(2026, 10, 18, 9, 0, 0, tzinfo=kst),
+        datetime(2026, 10, 18, 0, 0, 0, 1, tzinfo=timezone.utc),
+        datetime(2026, 10, 18, 0, 0, 1),
+        datetime(2026, 10, 18, 0, 0, 0, 999999, tzinfo=timezone.utc),
+    ]
+
+    assert sorted(values, key=UTC_DATETIME.dumps) == sorted(values, key=as_utc)
+    assert UTC_DATETIME.loads(UTC_DATETIME.dumps(values[0])) == values[0]
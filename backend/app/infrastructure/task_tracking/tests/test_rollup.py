@@ -0,0 +1,125 @@
+"""behavior_summaries 롤업 단위 테스트 — 쓰기 경로별 증분과 재구축이 behavior_logs 집계와 같은지 [PRO-B-24]."""
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import func, select, text
+
+from app.core.database import get_engine, session_scope
+from app.infrastructure.task_tracking.models import BehaviorLog, BehaviorSummary
+from app.infrastructure.task_tracking.rollup import rebuild_rollup
+
+EVENT_TYPES = ["task_miss", "archive", "keep", "modify", "completed"]
+USERS = ["u0", "u1", "u2"]
+
+
+def _logs_grouped() -> dict[tuple[str, str], tuple[int, float, int]]:
+    """behavior_logs에서 직접 집계한 (user_id, event_type) → (건수, latency 합, latency 건수)."""
+    with session_scope() as session:
+        rows = session.execute(
+            select(
+                BehaviorLog.user_id,
+                BehaviorLog.event_type,
+                func.count(BehaviorLog.id),
+                func.coalesce(func.sum(BehaviorLog.latency_ms), 0.0),
+                func.count(BehaviorLog.latency_ms),
+            ).group_by(BehaviorLog.user_id, BehaviorLog.event_type)
+        ).all()
+    return {(u, e): (c, s, n) for u, e, c, s, n in rows}
+
+
+def _rollup() -> dict[tuple[str, str], tuple[int, float, int]]:
+    with session_scope() as session:
+        rows = session.execute(
+            select(
+                BehaviorSummary.user_id,
+                BehaviorSummary.event_type,
+                BehaviorSummary.count,
+                BehaviorSummary.latency_sum,
+                BehaviorSummary.latency_count,
+            )
+        ).all()
+    return {(u, e): (c, s, n) for u, e, c, s, n in rows}
+
+
+def assert_same_totals(actual: dict, expected: dict) -> None:
+    assert actual.keys() == expected.keys()
+    for key, (count, latency_sum, latency_count) in expected.items():
+        assert actual[key][0] == count, key
+        assert actual[key][1] == pytest.approx(latency_sum, abs=1e-3), key
+        assert actual[key][2] == latency_count, key
+
+
+def _write_events(client) -> None:
+    """단건 + 소급·역순을 섞은 bulk 이벤트를 기록한다."""
+    rng = random.Random(7)
+    for _ in range(15):
+        body = {"task_id": rng.randint(1, 4), "user_id": rng.choice(USERS), "event_type": rng.choice(EVENT_TYPES)}
+        assert client.post("/task-tracking/events", json=body).status_code == 200
+    base = datetime.now(timezone.utc) - timedelta(hours=2)
+    events = []
+    for i in range(40):
+        event = {"task_id": rng.randint(1, 4), "user_id": rng.choice(USERS), "event_type": rng.choice(EVENT_TYPES)}
+        if i % 2:
+            event["event_at"] = (base + timedelta(minutes=rng.randint(0, 150))).isoformat()
+        events.append(event)
+    assert client.post("/task-tracking/events/batch", json={"events": events}).status_code == 200
+
+
+@pytest.fixture(params=["direct", "async", "buffered"])
+def mode_client(request, monkeypatch):
+    if request.param == "async":
+        monkeypatch.setenv("DATABASE_ASYNC_ENABLED", "true")
+    elif request.param == "buffered":
+        monkeypatch.setenv("TRACKING_INGEST_MODE", "buffered")
+        monkeypatch.setenv("TRACKING_ACK_MODE", "sync")
+        monkeypatch.setenv("TRACKING_FLUSH_INTERVAL_MS", "20")
+    return request.getfixturevalue("client")
+
+
+def test_rollup_matches_group_by_after_writes(mode_client):
+    _write_events(mode_client)
+
+    grouped = _logs_grouped()
+    assert_same_totals(_rollup(), grouped)
+    assert all(latency_sum >= 0 for _, latency_sum, _ in grouped.values())
+
+
+def test_summary_endpoint_reads_rollup(mode_client):
+    _write_events(mode_client)
+
+    grouped = _logs_grouped()
+    for user_id in USERS:
+        summary = mode_client.get(f"/task-tracking/users/{user_id}/summary").json()
+        mine = {event_type: v for (u, event_type), v in grouped.items() if u == user_id}
+        latency_sum = sum(v[1] for v in mine.values())
+        latency_count = sum(v[2] for v in mine.values())
+        assert summary["event_type_counts"] == {event_type: v[0] for event_type, v in mine.items()}
+        assert summary["total_events"] == sum(v[0] for v in mine.values())
+        expected_avg = round(latency_sum / latency_count, 3) if latency_count else None
+        assert summary["avg_latency_ms"] == pytest.approx(expected_avg, abs=1e-3)
+
+
+def test_rebuild_matches_incremental_rollup(client):
+    _write_events(client)
+    incremental = _rollup()
+
+    with get_engine().begin() as conn:
+        conn.execute(text("UPDATE behavior_summaries SET count = count + 100, latency_sum = -1"))
+        rebuilt = rebuild_rollup(conn)
+
+    assert rebuilt == len(incremental)
+    assert_same_totals(_rollup(), incremental)
+    assert_same_totals(_rollup(), _logs_grouped())
+
+
+def test_rebuild_only_given_users(client):
+    _write_events(client)
+    incremental = _rollup()
+
+    with get_engine().begin() as conn:
+        conn.execute(text("DELETE FROM behavior_summaries"))
+        rebuild_rollup(conn, ["u1"])
+
+    assert_same_totals(_rollup(), {key: value for key, value in incremental.items() if key[0] == "u1"})
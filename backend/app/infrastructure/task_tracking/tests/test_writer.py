@@ -0,0 +1,207 @@
+"""BehaviorEventWriter 단위 테스트 — 배치 flush, 역압, 종료 시 flush, 저장 실패 재시도·이벤트별 분할, 다른 쓰기 경로와의 직전 이벤트 [PRO-B-24]."""
+
+import threading
+import time
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.exc import OperationalError
+
+from app.core.database import session_scope
+from app.infrastructure.task_tracking import writer as writer_module
+from app.infrastructure.task_tracking.models import BehaviorLog
+from app.infrastructure.task_tracking.schemas import BatchEventItem, RecordEventRequest
+from app.infrastructure.task_tracking.service.impl import BehaviorTrackingServiceImpl
+from app.infrastructure.task_tracking.tests.test_bulk_events import assert_chain_is_monotonic
+from app.infrastructure.task_tracking.writer import BehaviorEventWriter, EventBufferFullError
+
+
+def _event(task_id: int = 1, user_id: str = "u1") -> RecordEventRequest:
+    return RecordEventRequest(task_id=task_id, user_id=user_id, event_type="task_miss")
+
+
+def _stored_count() -> int:
+    with session_scope() as session:
+        return session.scalar(select(func.count(BehaviorLog.id)))
+
+
+@pytest.fixture
+def writer_env(migrated_db, monkeypatch):
+    monkeypatch.setenv("TRACKING_INGEST_MODE", "buffered")
+    monkeypatch.setenv("TRACKING_ACK_MODE", "sync")
+    monkeypatch.setenv("TRACKING_BATCH_SIZE", "100")
+    monkeypatch.setenv("TRACKING_FLUSH_INTERVAL_MS", "10000")
+    monkeypatch.setenv("TRACKING_BUFFER_MAX_SIZE", "1000")
+    monkeypatch.setenv("TRACKING_ENQUEUE_TIMEOUT_MS", "0")
+    return monkeypatch
+
+
+@pytest.fixture
+def writer(writer_env):
+    event_writer = BehaviorEventWriter()
+    yield event_writer
+    event_writer.stop()
+
+
+@pytest.fixture
+def flush_gate(writer_env):
+    """set() 전까지 배치 저장을 멈춘다."""
+    gate = threading.Event()
+    write = writer_module.write_behavior_logs
+
+    def gated_write(*args):
+        gate.wait(timeout=10)
+        return write(*args)
+
+    writer_env.setattr(writer_module, "write_behavior_logs", gated_write)
+    yield gate
+    gate.set()
+
+
+def test_flush_when_batch_is_full(writer, writer_env):
+    writer_env.setenv("TRACKING_BATCH_SIZE", "5")
+    writer.start()
+
+    futures = [writer.submit(_event(task_id=i)) for i in range(5)]
+    logs = [future.result(timeout=5) for future in futures]
+
+    assert len({log.id for log in logs}) == 5
+    assert writer.snapshot()["batches_total"] == 1
+    assert writer.snapshot()["last_batch_size"] == 5
+
+
+def test_flush_when_interval_elapses(writer, writer_env):
+    writer_env.setenv("TRACKING_FLUSH_INTERVAL_MS", "50")
+    writer.start()
+
+    futures = [writer.submit(_event(task_id=i)) for i in range(3)]
+
+    assert all(future.result(timeout=5).id for future in futures)
+    assert writer.snapshot()["written_total"] == 3
+
+
+def test_stop_flushes_queued_events(writer, writer_env):
+    writer_env.setenv("TRACKING_ACK_MODE", "async")
+    writer.start()
+
+    assert all(writer.submit(_event(task_id=i)) is None for i in range(7))
+    writer.stop()
+
+    assert not writer.running
+    assert _stored_count() == 7
+
+
+def test_full_buffer_rejects(writer, writer_env, flush_gate):
+    writer_env.setenv("TRACKING_BATCH_SIZE", "1")
+    writer_env.setenv("TRACKING_BUFFER_MAX_SIZE", "1")
+    writer_env.setenv("TRACKING_ACK_MODE", "async")
+    writer.start()
+
+    writer.submit(_event())  # writer 스레드가 꺼내 gate에서 대기
+    deadline = time.monotonic() + 5
+    while writer.snapshot()["queued"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    writer.submit(_event())  # 큐를 채운다
+
+    with pytest.raises(EventBufferFullError):
+        writer.submit(_event())
+    assert writer.snapshot()["rejected_total"] == 1
+
+    flush_gate.set()
+    writer.stop()
+    assert _stored_count() == 2
+
+
+def test_submit_after_stop_is_rejected(writer):
+    writer.start()
+    writer.stop()
+
+    with pytest.raises(EventBufferFullError):
+        writer.submit(_event())
+
+
+def test_queued_event_flushed_after_newer_bulk_insert(writer, writer_env, flush_gate):
+    """큐에 있던 이벤트가 더 늦은 bulk 이벤트보다 나중에 저장되어도 그 bulk 이벤트에 이어지지 않는다."""
+    writer_env.setenv("TRACKING_BATCH_SIZE", "3")
+    writer_env.setenv("TRACKING_FLUSH_INTERVAL_MS", "50")
+    writer.start()
+    first = writer.submit(_event(task_id=5))
+    flush_gate.set()
+    first.result(timeout=5)
+    flush_gate.clear()
+
+    queued = [writer.submit(_event(task_id=5)) for _ in range(3)]
+    time.sleep(0.01)
+    bulk = BehaviorTrackingServiceImpl().record_events(
+        [BatchEventItem(task_id=5, user_id="u2", event_type="keep") for _ in range(2)]
+    )
+    flush_gate.set()
+    logs = [future.result(timeout=5) for future in queued]
+
+    assert logs[0].previous_event_at == first.result().event_at
+    for log in logs:
+        assert log.latency_ms >= 0
+        assert log.event_at < bulk[0].event_at
+    assert_chain_is_monotonic()
+
+
+@pytest.fixture
+def flaky_write(writer_env):
+    """
+    write_behavior_logs를 감싸 실패를 주입한다.
+    fail_first: 처음 N회 호출은 OperationalError, poison: 이 user_id가 포함된 배치는 항상 실패.
+    """
+    writer_env.setenv("TRACKING_FLUSH_RETRY_BACKOFF_MS", "1")
+    write = writer_module.write_behavior_logs
+    state = {"calls": 0, "fail_first": 0, "poison": None}
+
+    def flaky(session, events):
+        state["calls"] += 1
+        if state["calls"] <= state["fail_first"]:
+            raise OperationalError("INSERT", {}, Exception("database is locked"))
+        if any(request.user_id == state["poison"] for request, _ in events):
+            raise ValueError("bad row")
+        return write(session, events)
+
+    writer_env.setattr(writer_module, "write_behavior_logs", flaky)
+    return state
+
+
+@pytest.mark.parametrize("ack_mode", ["sync", "async"])
+def test_transient_failure_is_retried(writer, writer_env, flaky_write, ack_mode):
+    writer_env.setenv("TRACKING_ACK_MODE", ack_mode)
+    writer_env.setenv("TRACKING_BATCH_SIZE", "4")
+    flaky_write["fail_first"] = 2
+    writer.start()
+
+    futures = [writer.submit(_event(task_id=i)) for i in range(4)]
+    if ack_mode == "sync":
+        assert all(future.result(timeout=5).id for future in futures)
+    writer.stop()
+
+    assert _stored_count() == 4
+    snapshot = writer.snapshot()
+    assert (snapshot["retried_total"], snapshot["failed_total"], snapshot["written_total"]) == (2, 0, 4)
+
+
+@pytest.mark.parametrize("ack_mode", ["sync", "async"])
+def test_bad_event_does_not_fail_its_batch(writer, writer_env, flaky_write, ack_mode):
+    writer_env.setenv("TRACKING_ACK_MODE", ack_mode)
+    writer_env.setenv("TRACKING_BATCH_SIZE", "5")
+    writer_env.setenv("TRACKING_FLUSH_RETRIES", "1")
+    flaky_write["poison"] = "bad"
+    writer.start()
+
+    futures = [writer.submit(_event(task_id=i, user_id="bad" if i == 2 else "u1")) for i in range(5)]
+    if ack_mode == "sync":
+        for i, future in enumerate(futures):
+            if i == 2:
+                with pytest.raises(ValueError):
+                    future.result(timeout=5)
+            else:
+                assert future.result(timeout=5).task_id == i
+    writer.stop()
+
+    assert _stored_count() == 4
+    snapshot = writer.snapshot()
+    assert (snapshot["retried_total"], snapshot["failed_total"], snapshot["written_total"]) == (1, 1, 4)
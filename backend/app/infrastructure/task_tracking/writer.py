@@ -0,0 +1,259 @@
+"""
+행동 이벤트 버퍼 writer [PRO-B-24].
+TRACKING_INGEST_MODE=buffered 이면 /task-tracking/events 요청은 이벤트를 프로세스 내 bounded 큐에 넣고,
+백그라운드 스레드가 TRACKING_BATCH_SIZE건 또는 TRACKING_FLUSH_INTERVAL_MS 중 먼저 도달한 시점에
+모아 둔 이벤트를 트랜잭션 1개(다중 행 INSERT)로 저장한다.
+
+- 수신 시각(event_at)은 큐에 넣는 시점에 정해지므로 flush 지연은 latency_ms에 영향을 주지 않는다.
+  flush 전에 다른 경로가 더 늦은 이벤트를 저장했어도 직전 이벤트는 event_at 이하의 이벤트로 잡힌다.
+- 역압(backpressure): 큐가 가득 차면 요청은 TRACKING_ENQUEUE_TIMEOUT_MS 동안 기다린 뒤 EventBufferFullError(503).
+- 저장 실패 시 배치 전체를 TRACKING_FLUSH_RETRIES회까지 지수 백오프로 다시 시도한다 (일시적 락·연결 오류).
+  그래도 실패하면 이벤트별 트랜잭션으로 나누어 저장하여, 저장할 수 없는 이벤트만 실패시킨다.
+- TRACKING_ACK_MODE=sync 이면 요청은 자신의 배치가 커밋될 때까지 기다려 저장된 로그를 받는다.
+  async 이면 큐에 넣는 즉시 응답한다.
+- 앱 종료(lifespan) 시 stop()이 큐에 남은 이벤트를 모두 flush한 뒤 반환한다.
+"""
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Optional
+
+from app.core.database import session_scope
+from app.infrastructure.task_tracking.batch import write_behavior_logs
+from app.infrastructure.task_tracking.config import (
+    ACK_SYNC,
+    INGEST_BUFFERED,
+    get_ack_mode,
+    get_batch_size,
+    get_buffer_max_size,
+    get_enqueue_timeout_ms,
+    get_flush_interval_ms,
+    get_flush_retries,
+    get_flush_retry_backoff_ms,
+    get_ingest_mode,
+)
+from app.infrastructure.task_tracking.last_event import remember_last_events
+from app.infrastructure.task_tracking.models import BehaviorLog
+from app.infrastructure.task_tracking.schemas import RecordEventRequest
+
+logger = logging.getLogger(__name__)
+
+# 종료 시 남은 이벤트 flush를 기다리는 최대 시간(초)
+STOP_TIMEOUT_SECONDS = 30.0
+# 큐가 비어 있을 때 종료 신호를 확인하는 주기(초)
+IDLE_POLL_SECONDS = 0.5
+
+
+class EventBufferFullError(Exception):
+    """큐가 가득 차 이벤트를 받을 수 없다."""
+
+
+@dataclass
+class _PendingEvent:
+    request: RecordEventRequest
+    event_at: datetime
+    future: Optional[Future] = field(default=None)
+
+
+class BehaviorEventWriter:
+    """bounded 큐 + 배치 INSERT 백그라운드 스레드."""
+
+    def __init__(self) -> None:
+        self._queue: Optional[queue.Queue[_PendingEvent]] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._submit_lock = threading.Lock()
+        self._enqueued_total = 0
+        self._written_total = 0
+        self._failed_total = 0
+        self._retried_total = 0
+        self._rejected_total = 0
+        self._batches_total = 0
+        self._last_batch_size = 0
+        self._last_flush_ms: Optional[float] = None
+        self._max_flush_ms = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if get_ingest_mode() != INGEST_BUFFERED or self._thread is not None:
+            return
+        self._queue = queue.Queue(maxsize=get_buffer_max_size())
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="behavior-event-writer", daemon=True)
+        self._thread.start()
+        logger.info(
+            "[PRO-B-24] 이벤트 writer 시작 (batch=%d, interval=%dms, buffer=%d, ack=%s)",
+            get_batch_size(),
+            get_flush_interval_ms(),
+            get_buffer_max_size(),
+            get_ack_mode(),
+        )
+
+    def stop(self) -> None:
+        """새 이벤트를 받지 않고, 큐에 남은 이벤트를 모두 flush한 뒤 스레드를 종료한다."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join(timeout=STOP_TIMEOUT_SECONDS)
+        if self._thread.is_alive():
+            logger.error("[PRO-B-24] 이벤트 writer 종료 대기 시간 초과 — 대기 이벤트 %d건", self._queue.qsize())
+            return
+        self._thread = None
+        # 종료 신호 직전에 들어온 이벤트가 남았으면 여기서 저장한다
+        while batch := self._collect():
+            self._flush(batch)
+
+    def submit(self, request: RecordEventRequest) -> Optional[Future]:
+        """
+        이벤트를 큐에 넣는다. 블로킹 호출이므로 이벤트 루프에서는 스레드풀로 실행한다.
+        Returns: sync ack이면 커밋 후 BehaviorLog로 완료되는 Future, async ack이면 None
+        Raises: EventBufferFullError
+        """
+        if self._queue is None or self._stop.is_set():
+            raise EventBufferFullError("이벤트 writer가 실행 중이 아닙니다.")
+        pending = _PendingEvent(
+            request=request,
+            event_at=datetime.now(timezone.utc),
+            future=Future() if get_ack_mode() == ACK_SYNC else None,
+        )
+        # 수신 시각 부여와 큐 적재를 한 번에 해야 큐 순서 = event_at 순서가 되어 배치가 시각 순으로 저장된다.
+        # 다른 쓰기 경로(단건·bulk)가 그 사이 더 최근 이벤트를 커밋했더라도 직전 이벤트는
+        # build_behavior_logs가 event_at 이하의 저장된 이벤트로 다시 찾는다
+        deadline = time.monotonic() + get_enqueue_timeout_ms() / 1000
+        if not self._submit_lock.acquire(timeout=get_enqueue_timeout_ms() / 1000):
+            self._reject()
+        try:
+            pending.event_at = datetime.now(timezone.utc)
+            self._queue.put(pending, timeout=max(0.0, deadline - time.monotonic()))
+        except queue.Full:
+            self._reject()
+        finally:
+            self._submit_lock.release()
+        with self._lock:
+            self._enqueued_total += 1
+        return pending.future
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "mode": get_ingest_mode(),
+                "ack_mode": get_ack_mode(),
+                "running": self.running,
+                "queued": self._queue.qsize() if self._queue is not None else 0,
+                "capacity": get_buffer_max_size(),
+                "enqueued_total": self._enqueued_total,
+                "written_total": self._written_total,
+                "failed_total": self._failed_total,
+                "retried_total": self._retried_total,
+                "rejected_total": self._rejected_total,
+                "batches_total": self._batches_total,
+                "last_batch_size": self._last_batch_size,
+                "last_flush_ms": self._last_flush_ms,
+                "max_flush_ms": self._max_flush_ms,
+            }
+
+    def _reject(self) -> None:
+        with self._lock:
+            self._rejected_total += 1
+        raise EventBufferFullError("이벤트 버퍼가 가득 찼습니다.")
+
+    def _run(self) -> None:
+        while True:
+            batch = self._collect()
+            if batch:
+                self._flush(batch)
+            elif self._stop.is_set():
+                return
+
+    def _collect(self) -> list[_PendingEvent]:
+        """첫 이벤트를 기다린 뒤, 배치가 차거나 flush 간격이 지날 때까지 이어서 모은다. 종료 중이면 기다리지 않는다."""
+        batch_size = get_batch_size()
+        try:
+            first = self._queue.get(timeout=IDLE_POLL_SECONDS) if not self._stop.is_set() else self._queue.get_nowait()
+        except queue.Empty:
+            return []
+        batch = [first]
+        deadline = time.monotonic() + get_flush_interval_ms() / 1000
+        while len(batch) < batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                if self._stop.is_set() or remaining <= 0:
+                    batch.append(self._queue.get_nowait())
+                else:
+                    batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _flush(self, batch: list[_PendingEvent]) -> None:
+        start_ns = time.perf_counter_ns()
+        try:
+            logs: list[Optional[BehaviorLog]] = list(self._write_with_retry(batch))
+        except Exception as e:
+            if len(batch) == 1:
+                logs = [self._fail(batch[0], e)]
+            else:
+                logger.exception("[PRO-B-24] 이벤트 배치 저장 실패: %d건 — 이벤트별로 나누어 저장", len(batch))
+                logs = [self._write_one(pending) for pending in batch]
+
+        written = [(pending, log) for pending, log in zip(batch, logs) if log is not None]
+        remember_last_events(log for _, log in written)
+        elapsed_ms = round((time.perf_counter_ns() - start_ns) / 1_000_000, 3)
+        for pending, log in written:
+            if pending.future is not None:
+                pending.future.set_result(log)
+        with self._lock:
+            self._written_total += len(written)
+            self._batches_total += 1
+            self._last_batch_size = len(batch)
+            self._last_flush_ms = elapsed_ms
+            self._max_flush_ms = max(self._max_flush_ms, elapsed_ms)
+        logger.info("[PRO-B-24] 이벤트 배치 저장 %d/%d건 (%.3fms)", len(written), len(batch), elapsed_ms)
+
+    def _write_with_retry(self, batch: list[_PendingEvent]) -> list[BehaviorLog]:
+        """배치를 트랜잭션 1개로 저장한다. 실패하면 지수 백오프로 TRACKING_FLUSH_RETRIES회까지 다시 시도한다."""
+        retries = get_flush_retries()
+        attempt = 0
+        while True:
+            try:
+                with session_scope() as session:
+                    return write_behavior_logs(session, [(p.request, p.event_at) for p in batch])
+            except Exception:
+                if attempt >= retries:
+                    raise
+                delay_ms = get_flush_retry_backoff_ms() * 2 ** attempt
+                attempt += 1
+                logger.warning(
+                    "[PRO-B-24] 이벤트 배치 저장 실패: %d건 — %dms 후 재시도 (%d/%d)",
+                    len(batch), delay_ms, attempt, retries, exc_info=True,
+                )
+                with self._lock:
+                    self._retried_total += 1
+                time.sleep(delay_ms / 1000)
+
+    def _write_one(self, pending: _PendingEvent) -> Optional[BehaviorLog]:
+        try:
+            with session_scope() as session:
+                return write_behavior_logs(session, [(pending.request, pending.event_at)])[0]
+        except Exception as e:
+            return self._fail(pending, e)
+
+    def _fail(self, pending: _PendingEvent, error: Exception) -> None:
+        logger.error(
+            "[PRO-B-24] 이벤트 저장 실패: task_id=%s event_type=%s",
+            pending.request.task_id, pending.request.event_type, exc_info=error,
+        )
+        with self._lock:
+            self._failed_total += 1
+        if pending.future is not None:
+            pending.future.set_exception(error)
+
+event_writer = BehaviorEventWriter()
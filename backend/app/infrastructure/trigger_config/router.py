@@ -8,6 +8,8 @@ from fastapi import APIRouter, HTTPException, Path
 
 from app.infrastructure.trigger_config.schemas import (
     ArchiveLimitCheckResponse,
+    BulkTriggerCheckRequest,
+    BulkTriggerCheckResponse,
     ParameterUpdateRequest,
     ParameterUpdateResponse,
     TriggerCheckResponse,
@@ -62,6 +64,25 @@ def check_trigger(
     return TriggerCheckResponse(**result, timestamp=datetime.now(timezone.utc))
 
 
+@router.post(
+    "/users/trigger-check/bulk",
+    response_model=BulkTriggerCheckResponse,
+    summary="[PRO-B-25] 사용자 다건 트리거 임계치 판정",
+)
+def check_triggers(request: BulkTriggerCheckRequest) -> BulkTriggerCheckResponse:
+    """
+    여러 사용자의 트리거 충족 여부를 한 번에 판정한다.
+    사용자별로 단건 판정을 반복하는 대신 miss_count를 다건 조회 1회로 가져온다.
+    """
+    service = _get_service()
+    results = service.check_triggers(request.user_ids)
+    return BulkTriggerCheckResponse(
+        results=results,
+        triggered_count=sum(1 for r in results if r["triggered"]),
+        timestamp=datetime.now(timezone.utc),
+    )
+
+
 # ── 3. 보관함 상한 검증 ──────────────────────────────────────
 
 @router.get(
@@ -6,6 +6,8 @@ from typing import Any, Optional
 
 from pydantic import BaseModel, Field
 
+from app.domains.task.schemas import MAX_BULK_USERS
+
 
 class TriggerSettingsResponse(BaseModel):
     """[PRO-B-25] 전체 트리거·운영 설정 현황."""
@@ -14,8 +16,8 @@ class TriggerSettingsResponse(BaseModel):
     timestamp: datetime
 
 
-class TriggerCheckResponse(BaseModel):
-    """[PRO-B-25] 사용자 트리거 판정 결과."""
+class TriggerCheckItem(BaseModel):
+    """[PRO-B-25] 사용자 1명의 트리거 판정 결과."""
 
     user_id: str
     miss_count: int
@@ -24,6 +26,25 @@ class TriggerCheckResponse(BaseModel):
     available_strategies: list[str]
     exit_window_seconds: int
     exp_b10_ratio: float
+
+
+class TriggerCheckResponse(TriggerCheckItem):
+    """[PRO-B-25] 사용자 트리거 판정 결과."""
+
+    timestamp: datetime
+
+
+class BulkTriggerCheckRequest(BaseModel):
+    """[PRO-B-25] 다건 트리거 판정 요청."""
+
+    user_ids: list[str] = Field(..., min_length=1, max_length=MAX_BULK_USERS, description="사용자 식별자 목록")
+
+
+class BulkTriggerCheckResponse(BaseModel):
+    """[PRO-B-25] 다건 트리거 판정 결과."""
+
+    results: list[TriggerCheckItem]
+    triggered_count: int
     timestamp: datetime
 
 
@@ -9,7 +9,7 @@ from datetime import datetime, timezone
 
 from sqlalchemy import func as sqlfunc
 
-from app.core.database import get_session_factory
+from app.core.database import session_scope
 from app.infrastructure.task_archive.models import TaskArchive
 from app.infrastructure.task_miss.service import TaskMissServiceImpl
 from app.infrastructure.task_params.models import SystemParameter
@@ -47,9 +47,41 @@ class TriggerConfigServiceImpl:
 
         count, _ = self._miss_service.get_cumulative_miss_count(user_id)
         threshold = TriggerSettings.trigger_miss_threshold()
-        triggered = count >= threshold
+        result = self._build_result(user_id, count, threshold)
+        triggered = result["triggered"]
+
+        elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+        logger.info(
+            "[%s][PRO-B-25] 트리거 판정 user=%s miss=%d threshold=%d triggered=%s (%.3fms)",
+            now.isoformat(timespec="milliseconds"),
+            user_id, count, threshold, triggered, elapsed_ms,
+        )
+        return result
+
+    def check_triggers(self, user_ids: list[str]) -> list[dict]:
+        """
+        [PRO-B-25] 여러 사용자의 트리거 충족 여부를 한 번에 판정한다 (알림 대상 선별용).
+        miss_count는 다건 조회(MGET 파이프라인 + GROUP BY 1회)로 가져온다.
+        """
+        start_ns = time.perf_counter_ns()
+        now = datetime.now(timezone.utc)
+
+        counts = self._miss_service.get_cumulative_miss_counts(user_ids)
+        threshold = TriggerSettings.trigger_miss_threshold()
+        results = [self._build_result(uid, count, threshold) for uid, (count, _) in counts.items()]
 
-        result = {
+        elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+        logger.info(
+            "[%s][PRO-B-25] 트리거 다건 판정 users=%d triggered=%d threshold=%d (%.3fms)",
+            now.isoformat(timespec="milliseconds"),
+            len(results), sum(1 for r in results if r["triggered"]), threshold, elapsed_ms,
+        )
+        return results
+
+    @staticmethod
+    def _build_result(user_id: str, count: int, threshold: int) -> dict:
+        triggered = count >= threshold
+        return {
             "user_id": user_id,
             "miss_count": count,
             "threshold": threshold,
@@ -59,19 +91,10 @@ class TriggerConfigServiceImpl:
             "exp_b10_ratio": TriggerSettings.exp_b10_ratio(),
         }
 
-        elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
-        logger.info(
-            "[%s][PRO-B-25] 트리거 판정 user=%s miss=%d threshold=%d triggered=%s (%.3fms)",
-            now.isoformat(timespec="milliseconds"),
-            user_id, count, threshold, triggered, elapsed_ms,
-        )
-        return result
-
     def check_archive_capacity(self, user_id: str) -> dict:
         """[PRO-B-25] 보관함 적재 가능 여부를 MAX_ARCHIVE_LIMIT 기준으로 검증한다."""
         limit = TriggerSettings.max_archive_limit()
-        session_factory = get_session_factory()
-        with session_factory() as session:
+        with session_scope() as session:
             count = (
                 session.query(sqlfunc.count(TaskArchive.id))
                 .filter(TaskArchive.user_id == user_id)
@@ -96,9 +119,8 @@ class TriggerConfigServiceImpl:
             raise ValueError(f"[PRO-B-25] 변경 불가 파라미터: {key} (허용: {_ALLOWED_KEYS})")
 
         now = datetime.now(timezone.utc)
-        session_factory = get_session_factory()
 
-        with session_factory() as session:
+        with session_scope() as session:
             param = session.query(SystemParameter).filter(SystemParameter.key == key).first()
             if param is None:
                 raise ValueError(f"파라미터를 찾을 수 없습니다: {key}")
@@ -106,7 +128,6 @@ class TriggerConfigServiceImpl:
             old_value = param.value
             param.value = value
             param.updated_at = now
-            session.commit()
 
         TriggerSettings.refresh()
 
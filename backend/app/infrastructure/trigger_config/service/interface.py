@@ -15,6 +15,10 @@ class TriggerConfigService(Protocol):
         """사용자의 트리거 충족 여부를 판정한다."""
         ...
 
+    def check_triggers(self, user_ids: list[str]) -> list[dict]:
+        """여러 사용자의 트리거 충족 여부를 한 번에 판정한다."""
+        ...
+
     def check_archive_capacity(self, user_id: str) -> dict:
         """보관함 적재 가능 여부를 검증한다."""
         ...
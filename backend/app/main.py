@@ -1,6 +1,6 @@
 """
 FastAPI 애플리케이션 진입점.
-시작 시 환경 변수 로드, DB 초기화, 스케줄러 시작을 수행한다.
+시작 시 환경 변수 로드, DB 스키마 버전 확인, 스케줄러 시작을 수행한다.
 """
 import logging
 from contextlib import asynccontextmanager
@@ -20,29 +20,40 @@ logging.basicConfig(
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """앱 시작 시 DB 초기화 → 스케줄러 시작. 종료 시 스케줄러·Redis 정리."""
-    from app.core.database import init_db
-    from app.core.redis import close_redis
+    """
+    앱 시작 시 스키마 버전 확인 → Redis 헬스 체크·스케줄러·캐시 무효화 구독·이벤트 writer 시작.
+    종료 시 이벤트 writer(남은 이벤트 flush)·스케줄러·캐시 무효화 구독·Redis(헬스 체크 포함)·
+    비동기 엔진·해시 워커·HTTP 클라이언트 정리.
+    테이블 생성·인덱스·기본 파라미터 시드는 배포 시 마이그레이션(python -m app.core.migrations upgrade)이 담당한다.
+    """
+    from app.core.cache import invalidation_bus
+    from app.core.database import dispose_async_engine
+    from app.core.http_client import close_http_client, init_http_client
+    from app.core.migrations import ensure_schema
+    from app.core.redis import close_async_redis, close_redis, start_health_check
+    from app.domains.auth.hashing import password_hasher
     from app.infrastructure.task_miss import TaskMissScheduler
+    from app.infrastructure.task_tracking.writer import event_writer
 
-    init_db()
-
-    from app.infrastructure.task_params.defaults import seed_defaults
-    from app.infrastructure.experiment_config.defaults import seed_experiment_config
-    from app.infrastructure.trigger_config.defaults import seed_trigger_config  # [PRO-B-25]
-    from app.core.database import get_session_factory
-    with get_session_factory()() as session:
-        seed_defaults(session)
-        seed_experiment_config(session)
-        seed_trigger_config(session)  # [PRO-B-25]
+    ensure_schema()
+    init_http_client()
+    start_health_check()
 
     scheduler = TaskMissScheduler()
     scheduler.start()
+    invalidation_bus.start()
+    event_writer.start()
 
     yield
 
+    event_writer.stop()
     scheduler.shutdown()
+    invalidation_bus.stop()
     close_redis()
+    await close_async_redis()
+    await dispose_async_engine()
+    await close_http_client()
+    password_hasher.shutdown()
 
 
 app = FastAPI(
@@ -58,6 +69,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 
@@ -72,6 +84,8 @@ from app.infrastructure.task_params import router as task_params_router  # noqa:
 from app.infrastructure.experiment_config import router as experiment_config_router  # noqa: E402
 from app.infrastructure.trigger_config import router as trigger_config_router  # noqa: E402 [PRO-B-25]
 from app.domains.TodayFocus.today_focus import router as today_focus_router  # noqa: E402
+from app.infrastructure.db_pool import router as db_pool_router  # noqa: E402
+from app.infrastructure.cache_stats import router as cache_stats_router  # noqa: E402
 
 app.include_router(
     auth_router,
@@ -131,3 +145,15 @@ app.include_router(  # [PRO-B-25]
     prefix="/trigger-config",
     tags=["trigger-config [PRO-B-25]"],
 )
+
+app.include_router(
+    db_pool_router,
+    prefix="/db",
+    tags=["db-pool"],
+)
+
+app.include_router(
+    cache_stats_router,
+    prefix="/cache",
+    tags=["cache"],
+)
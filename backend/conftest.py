@@ -0,0 +1,85 @@
+"""
+backend 통합 테스트 공통 설정.
+app import 전에 테스트용 환경 변수를 고정한다. Redis는 닿지 않는 주소로 두어
+캐시는 프로세스 로컬 계층만 쓰고, 테스트마다 새 SQLite 파일에 마이그레이션을 적용한다.
+"""
+import os
+
+os.environ.setdefault("JWT_SECRET_KEY", "test-jwt-secret-key-with-enough-length")
+os.environ["REDIS_URL"] = "redis://127.0.0.1:1/0"
+os.environ["REDIS_HEALTH_CHECK_SECONDS"] = "0"
+os.environ["REDIS_CONNECT_TIMEOUT_MS"] = "50"
+os.environ["TASK_MISS_DUE_TIMER"] = "off"
+
+import pytest  # noqa: E402
+
+
+def reset_database() -> None:
+    """엔진·세션 팩토리 싱글톤을 닫고 비운다. 다음 get_engine()이 현재 DATABASE_URL로 다시 만든다."""
+    from app.core import database
+
+    if database._engine is not None:
+        database._engine.dispose()
+    database._engine = None
+    database._SessionLocal = None
+    database._async_engine = None
+    database._AsyncSessionLocal = None
+
+
+def clear_caches() -> None:
+    from app.core.cache.namespace import _registry
+
+    for namespace in _registry.values():
+        namespace.clear_local()
+
+
+@pytest.fixture
+def database_url(tmp_path, monkeypatch) -> str:
+    """테스트 전용 SQLite 파일. 스키마는 lifespan(ensure_schema) 또는 migrate_db 픽스처가 만든다."""
+    url = f"sqlite:///{tmp_path / 'test.db'}"
+    monkeypatch.setenv("DATABASE_URL", url)
+    reset_database()
+    clear_caches()
+    yield url
+    reset_database()
+    clear_caches()
+
+
+@pytest.fixture
+def migrated_db(database_url) -> str:
+    from app.core.migrations import upgrade
+
+    upgrade()
+    return database_url
+
+
+@pytest.fixture
+def client(database_url):
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """
+    같은 fakeredis 서버를 동기·비동기 Redis 클라이언트로 주입한다 (Lua 스크립트는 lupa 필요).
+    브레이커는 닫힌 새 인스턴스로 바꿔, 앞선 테스트의 연결 실패가 이어지지 않게 한다.
+    """
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    from app.core import redis as redis_module
+    from app.core.circuit_breaker import CircuitBreaker
+
+    server = fakeredis.FakeServer()
+    client = fakeredis.FakeRedis(server=server, decode_responses=True)
+    monkeypatch.setattr(redis_module, "_client", client)
+    monkeypatch.setattr(redis_module, "_probe_client", client)
+    monkeypatch.setattr(redis_module, "_async_client", fakeredis.FakeAsyncRedis(server=server, decode_responses=True))
+    monkeypatch.setattr(redis_module, "breaker", CircuitBreaker("redis", failure_threshold=3, reset_seconds=1))
+    clear_caches()
+    yield client
+    clear_caches()